@@ -0,0 +1,34 @@
+"""add_multi_condition_expression
+
+Revision ID: 3e7a9c2d4f61
+Revises: 8c3e5f1a2b7d
+Create Date: 2026-10-16 14:00:00.000000
+
+Multi-condition rules: JSON AND/OR expression of threshold, rate-of-change,
+volume and crossover predicates.
+
+Changes:
+- Adds conditions column to alert_rules
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e7a9c2d4f61'
+down_revision: Union[str, None] = '8c3e5f1a2b7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add multi-condition expression column."""
+    op.add_column('alert_rules', sa.Column('conditions', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove multi-condition expression column."""
+    with op.batch_alter_table('alert_rules', schema=None) as batch_op:
+        batch_op.drop_column('conditions')
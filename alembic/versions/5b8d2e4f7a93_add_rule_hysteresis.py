@@ -0,0 +1,34 @@
+"""add_rule_hysteresis
+
+Revision ID: 5b8d2e4f7a93
+Revises: 3e7a9c2d4f61
+Create Date: 2026-10-16 21:30:00.000000
+
+Hysteresis bands for above/below threshold rules: a fired rule re-arms only
+after price moves back past the threshold by the band.
+
+Changes:
+- Adds hysteresis column to alert_rules
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8d2e4f7a93'
+down_revision: Union[str, None] = '3e7a9c2d4f61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add hysteresis band column."""
+    op.add_column('alert_rules', sa.Column('hysteresis', sa.DECIMAL(precision=12, scale=4), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove hysteresis band column."""
+    with op.batch_alter_table('alert_rules', schema=None) as batch_op:
+        batch_op.drop_column('hysteresis')
@@ -0,0 +1,36 @@
+"""add_crossover_moving_average_fields
+
+Revision ID: 8c3e5f1a2b7d
+Revises: f79e2702f75c
+Create Date: 2026-10-16 12:00:00.000000
+
+Crossover rules: moving average type and the slow period for
+fast-vs-slow moving average crossovers.
+
+Changes:
+- Adds moving_average_type and slow_moving_average_period columns to alert_rules
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3e5f1a2b7d'
+down_revision: Union[str, None] = 'f79e2702f75c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add crossover moving average columns."""
+    op.add_column('alert_rules', sa.Column('moving_average_type', sa.String(length=10), nullable=True))
+    op.add_column('alert_rules', sa.Column('slow_moving_average_period', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove crossover moving average columns."""
+    with op.batch_alter_table('alert_rules', schema=None) as batch_op:
+        batch_op.drop_column('slow_moving_average_period')
+        batch_op.drop_column('moving_average_type')
@@ -14,8 +14,10 @@ from pydantic import BaseModel, Field
 from sqlalchemy import select, func
 
 from ..database.connection import get_db_session
+from ..database.writer import get_database_writer
 from ..models.instruments import Instrument
 from ..models.market_data import MarketData
+from ..services.pipeline_latency import get_pipeline_latency
 
 # Import standardized API components
 from .common.exceptions import StandardAPIError, SystemError
@@ -245,6 +247,8 @@ async def get_health_status() -> dict:
                 "total_rules": total_rules,
                 "last_alert": last_alert.isoformat() if last_alert else None,
                 "historical_data_service": historical_data_health,
+                "database_writer": get_database_writer().get_stats(),
+                "pipeline_latency": get_pipeline_latency().get_stats(),
                 "timestamp": datetime.utcnow().isoformat()
             }
             
@@ -264,6 +268,32 @@ async def get_health_status() -> dict:
         )
 
 
+@router.get("/health/latency", response_model=Dict[str, Any])
+async def get_pipeline_latency_stats(
+    reset: bool = Query(
+        False,
+        description="Clear the histograms after reading them to start a new measurement period"
+    )
+) -> Dict[str, Any]:
+    """
+    Get tick-to-alert latency percentiles per pipeline stage.
+    
+    Each stage reports p50/p90/p99/p99.9 of the time from tick receipt to
+    the end of that stage; the broadcast stage is the end-to-end latency
+    checked against the configured target.
+    """
+    latency = get_pipeline_latency()
+    stats = latency.get_stats()
+    if reset:
+        latency.reset()
+    
+    return {
+        "success": True,
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "latency": stats
+    }
+
+
 @router.get(
     "/health/detailed", 
     response_model=SystemStats,
@@ -8,13 +8,14 @@ including futures, indices, and market internals.
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from ..database.connection import get_db_session
 from ..models.instruments import Instrument, InstrumentType, InstrumentStatus
+from ..services.last_value_cache import get_last_value_cache
 
 router = APIRouter()
 
@@ -45,6 +46,33 @@ class InstrumentUpdate(BaseModel):
     status: Optional[InstrumentStatus] = None
 
 
+class QuoteResponse(BaseModel):
+    """Latest quote for an instrument."""
+    instrument_id: int
+    symbol: str
+    timestamp: Optional[datetime] = None
+    price: Optional[float] = None
+    volume: Optional[float] = None
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    bid_size: Optional[float] = None
+    ask_size: Optional[float] = None
+    open_price: Optional[float] = None
+    high_price: Optional[float] = None
+    low_price: Optional[float] = None
+
+
+class LatestQuotesResponse(BaseModel):
+    """Latest quotes for several instruments."""
+    quotes: List[QuoteResponse]
+    missing: List[int]
+    as_of: datetime
+
+
+# Largest number of instruments per latest-quotes request
+MAX_QUOTE_INSTRUMENTS = 500
+
+
 @router.get("/instruments", response_model=List[InstrumentResponse])
 async def get_instruments(
     type: Optional[InstrumentType] = None,
@@ -95,6 +123,63 @@ async def get_instruments(
         ]
 
 
+@router.get("/instruments/latest-quotes", response_model=LatestQuotesResponse)
+async def get_latest_quotes(
+    instrument_ids: Optional[List[int]] = Query(None, description="Instrument IDs (all cached instruments if omitted)")
+) -> LatestQuotesResponse:
+    """
+    Get the latest quotes for several instruments from the last-value cache.
+    
+    Served from memory without querying the database; instruments that have
+    not ticked since startup are listed as missing.
+    
+    Args:
+        instrument_ids: Instrument IDs to look up (optional).
+    
+    Returns:
+        LatestQuotesResponse: Cached quotes and the IDs without one.
+    
+    Raises:
+        HTTPException: If too many instruments are requested.
+    """
+    cache = get_last_value_cache()
+    
+    if instrument_ids is None:
+        quotes = cache.quotes()
+        missing = []
+    else:
+        if len(instrument_ids) > MAX_QUOTE_INSTRUMENTS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {MAX_QUOTE_INSTRUMENTS} instruments per request"
+            )
+        found = cache.get_many(dict.fromkeys(instrument_ids))
+        quotes = [quote for quote in found.values() if quote is not None]
+        missing = [instrument_id for instrument_id, quote in found.items() if quote is None]
+    
+    return LatestQuotesResponse(
+        quotes=[
+            QuoteResponse(
+                instrument_id=quote.instrument_id,
+                symbol=quote.symbol,
+                timestamp=quote.timestamp,
+                price=quote.price,
+                volume=quote.volume,
+                bid=quote.bid,
+                ask=quote.ask,
+                bid_size=quote.bid_size,
+                ask_size=quote.ask_size,
+                open_price=quote.open_price,
+                high_price=quote.high_price,
+                low_price=quote.low_price,
+            )
+            for quote in quotes
+        ],
+        missing=missing,
+        as_of=datetime.utcnow(),
+    )
+
+
 @router.get("/instruments/{instrument_id}", response_model=InstrumentResponse)
 async def get_instrument(instrument_id: int) -> InstrumentResponse:
     """
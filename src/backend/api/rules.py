@@ -5,17 +5,21 @@ Provides CRUD operations for alert rule management with validation
 and performance optimization for sub-second evaluation.
 """
 
+import json
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy import select, delete
 from sqlalchemy.orm import selectinload
 
 from ..database.connection import get_db_session
-from ..models.alert_rules import AlertRule, RuleType, RuleCondition
+from ..models.alert_rules import AlertRule, RuleType, RuleCondition, MovingAverageType
 from ..models.instruments import Instrument
+from ..services.multi_condition import parse_conditions
+from ..services.rule_events import RuleChangeAction, RuleChangeEvent, get_rule_event_bus
 
 # Import standardized API components
 from .common.exceptions import StandardAPIError, ValidationError, BusinessLogicError
@@ -38,6 +42,10 @@ class AlertRuleResponse(BaseModel):
     description: Optional[str] = None
     time_window_seconds: Optional[int] = None
     moving_average_period: Optional[int] = None
+    moving_average_type: Optional[str] = None
+    slow_moving_average_period: Optional[int] = None
+    conditions: Optional[Dict[str, Any]] = None
+    hysteresis: Optional[float] = None
     cooldown_seconds: int
     last_triggered: Optional[datetime] = None
     created_at: datetime
@@ -54,7 +62,42 @@ class AlertRuleCreate(BaseModel):
     description: Optional[str] = None
     time_window_seconds: Optional[int] = Field(None, ge=1, le=3600)
     moving_average_period: Optional[int] = Field(None, ge=1, le=1000)
+    moving_average_type: Optional[MovingAverageType] = None
+    slow_moving_average_period: Optional[int] = Field(None, ge=2, le=1000)
+    conditions: Optional[Dict[str, Any]] = None
+    hysteresis: Optional[float] = Field(None, gt=0, description="Re-arm band for above/below threshold rules")
     cooldown_seconds: int = Field(60, ge=0, le=3600)
+    
+    @validator('moving_average_period', always=True)
+    def validate_crossover_period(cls, v, values):
+        """Crossover rules need a moving average period."""
+        if values.get('rule_type') == RuleType.CROSSOVER and not v:
+            raise ValueError("moving_average_period is required for crossover rules")
+        return v
+    
+    @validator('slow_moving_average_period')
+    def validate_slow_period(cls, v, values):
+        """Slow moving average must be longer than the fast one."""
+        if v and values.get('moving_average_period') and v <= values['moving_average_period']:
+            raise ValueError("slow_moving_average_period must be greater than moving_average_period")
+        return v
+    
+    @validator('conditions', always=True)
+    def validate_conditions(cls, v, values):
+        """Multi-condition rules need a valid AND/OR expression."""
+        if values.get('rule_type') == RuleType.MULTI_CONDITION and not v:
+            raise ValueError("conditions is required for multi-condition rules")
+        return parse_conditions(v) if v else v
+    
+    @validator('hysteresis')
+    def validate_hysteresis(cls, v, values):
+        """Hysteresis bands apply to above/below threshold rules."""
+        if v is not None and not (
+            values.get('rule_type') == RuleType.THRESHOLD and
+            values.get('condition') in (RuleCondition.ABOVE, RuleCondition.BELOW)
+        ):
+            raise ValueError("hysteresis is only supported for above/below threshold rules")
+        return v
 
 
 class AlertRuleUpdate(BaseModel):
@@ -67,7 +110,54 @@ class AlertRuleUpdate(BaseModel):
     description: Optional[str] = None
     time_window_seconds: Optional[int] = Field(None, ge=1, le=3600)
     moving_average_period: Optional[int] = Field(None, ge=1, le=1000)
+    moving_average_type: Optional[MovingAverageType] = None
+    slow_moving_average_period: Optional[int] = Field(None, ge=2, le=1000)
+    conditions: Optional[Dict[str, Any]] = None
+    hysteresis: Optional[float] = Field(None, gt=0)
     cooldown_seconds: Optional[int] = Field(None, ge=0, le=3600)
+    
+    @validator('conditions')
+    def validate_conditions(cls, v):
+        """Validate the multi-condition expression."""
+        return parse_conditions(v) if v else v
+
+
+# Rule fields an update may change (validated together with AlertRuleCreate)
+_RULE_FIELDS = tuple(name for name in AlertRuleCreate.model_fields if name != "instrument_id")
+
+
+def _validate_rule_update(rule: AlertRule, update_data: Dict[str, Any]) -> None:
+    """
+    Validate an existing rule with an update applied.
+    
+    Runs the creation validators (crossover periods, multi-condition
+    expression, hysteresis applicability) against the merged rule so a
+    partial update cannot leave an invalid rule in the live cache.
+    
+    Args:
+        rule: Rule as currently stored.
+        update_data: Fields being updated.
+    
+    Raises:
+        ValidationError: If the updated rule would be invalid.
+    """
+    merged = {field: getattr(rule, field) for field in _RULE_FIELDS}
+    if merged["conditions"]:
+        merged["conditions"] = json.loads(merged["conditions"])
+    merged.update(update_data)
+    
+    try:
+        AlertRuleCreate(instrument_id=rule.instrument_id, **merged)
+    except PydanticValidationError as e:
+        raise ValidationError(
+            error_code="RULES_009",
+            message="Updated alert rule is invalid",
+            field_errors={
+                ".".join(str(part) for part in error["loc"]): error["msg"]
+                for error in e.errors()
+            },
+            details={"rule_id": rule.id}
+        )
 
 
 @router.get("/rules")
@@ -142,6 +232,10 @@ async def get_alert_rules(
                     "description": rule.description,
                     "time_window_seconds": rule.time_window_seconds,
                     "moving_average_period": rule.moving_average_period,
+                    "moving_average_type": rule.moving_average_type,
+                    "slow_moving_average_period": rule.slow_moving_average_period,
+                    "conditions": json.loads(rule.conditions) if rule.conditions else None,
+                    "hysteresis": float(rule.hysteresis) if rule.hysteresis is not None else None,
                     "cooldown_seconds": rule.cooldown_seconds,
                     "last_triggered": rule.last_triggered.isoformat() if rule.last_triggered else None,
                     "created_at": rule.created_at.isoformat(),
@@ -214,6 +308,10 @@ async def get_alert_rule(rule_id: int) -> dict:
                 "description": rule.description,
                 "time_window_seconds": rule.time_window_seconds,
                 "moving_average_period": rule.moving_average_period,
+                "moving_average_type": rule.moving_average_type,
+                "slow_moving_average_period": rule.slow_moving_average_period,
+                "conditions": json.loads(rule.conditions) if rule.conditions else None,
+                "hysteresis": float(rule.hysteresis) if rule.hysteresis is not None else None,
                 "cooldown_seconds": rule.cooldown_seconds,
                 "last_triggered": rule.last_triggered.isoformat() if rule.last_triggered else None,
                 "created_at": rule.created_at.isoformat(),
@@ -270,6 +368,10 @@ async def create_alert_rule(rule_data: AlertRuleCreate) -> dict:
                 description=rule_data.description,
                 time_window_seconds=rule_data.time_window_seconds,
                 moving_average_period=rule_data.moving_average_period,
+                moving_average_type=rule_data.moving_average_type,
+                slow_moving_average_period=rule_data.slow_moving_average_period,
+                conditions=json.dumps(rule_data.conditions) if rule_data.conditions else None,
+                hysteresis=rule_data.hysteresis,
                 cooldown_seconds=rule_data.cooldown_seconds,
             )
             
@@ -277,6 +379,11 @@ async def create_alert_rule(rule_data: AlertRuleCreate) -> dict:
             await session.commit()
             await session.refresh(rule, ["instrument"])
             
+            # Alert engine picks the new rule up without waiting for a reload
+            get_rule_event_bus().publish(
+                RuleChangeEvent(RuleChangeAction.UPSERTED, rule.id, rule.instrument_id)
+            )
+            
             rule_data = {
                 "id": rule.id,
                 "instrument_id": rule.instrument_id,
@@ -289,6 +396,10 @@ async def create_alert_rule(rule_data: AlertRuleCreate) -> dict:
                 "description": rule.description,
                 "time_window_seconds": rule.time_window_seconds,
                 "moving_average_period": rule.moving_average_period,
+                "moving_average_type": rule.moving_average_type,
+                "slow_moving_average_period": rule.slow_moving_average_period,
+                "conditions": json.loads(rule.conditions) if rule.conditions else None,
+                "hysteresis": float(rule.hysteresis) if rule.hysteresis is not None else None,
                 "cooldown_seconds": rule.cooldown_seconds,
                 "last_triggered": rule.last_triggered.isoformat() if rule.last_triggered else None,
                 "created_at": rule.created_at.isoformat(),
@@ -352,12 +463,19 @@ async def update_alert_rule(
             
             # Update fields
             update_data = rule_update.model_dump(exclude_unset=True)
+            _validate_rule_update(rule, update_data)
             for field, value in update_data.items():
+                if field == "conditions" and value is not None:
+                    value = json.dumps(value)
                 setattr(rule, field, value)
             
             await session.commit()
             await session.refresh(rule)
             
+            get_rule_event_bus().publish(
+                RuleChangeEvent(RuleChangeAction.UPSERTED, rule.id, rule.instrument_id)
+            )
+            
             rule_data = {
                 "id": rule.id,
                 "instrument_id": rule.instrument_id,
@@ -370,6 +488,10 @@ async def update_alert_rule(
                 "description": rule.description,
                 "time_window_seconds": rule.time_window_seconds,
                 "moving_average_period": rule.moving_average_period,
+                "moving_average_type": rule.moving_average_type,
+                "slow_moving_average_period": rule.slow_moving_average_period,
+                "conditions": json.loads(rule.conditions) if rule.conditions else None,
+                "hysteresis": float(rule.hysteresis) if rule.hysteresis is not None else None,
                 "cooldown_seconds": rule.cooldown_seconds,
                 "last_triggered": rule.last_triggered.isoformat() if rule.last_triggered else None,
                 "created_at": rule.created_at.isoformat(),
@@ -431,6 +553,10 @@ async def delete_alert_rule(rule_id: int) -> dict:
             )
             await session.commit()
             
+            get_rule_event_bus().publish(
+                RuleChangeEvent(RuleChangeAction.DELETED, rule_id, rule.instrument_id)
+            )
+            
             # Calculate performance metrics
             processing_time = (datetime.utcnow() - start_time).total_seconds() * 1000
             
@@ -3,15 +3,41 @@ Test API endpoint for broadcasting market data via WebSocket.
 Used to verify UI refresh mechanism during development.
 """
 
+import asyncio
 import random
 from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import structlog
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from ..config import settings
+from ..services.tick_replay import TickReplayEngine
 from ..websocket.realtime import get_websocket_manager
 
+logger = structlog.get_logger()
+
 router = APIRouter()
 
+# Global replay engine instance (set by main.py)
+tick_replay_engine: Optional[TickReplayEngine] = None
+
+# Background replay started by the API (cleared when it finishes)
+_replay_task: Optional[asyncio.Task] = None
+
+
+class TickReplayRequest(BaseModel):
+    """Request model for a tick replay run."""
+    source: str = "market_data"  # "market_data" or "file"
+    path: Optional[str] = None  # Relative to TICK_REPLAY_DIR
+    speed: Optional[float] = 1.0  # None or 0 = max speed
+    symbols: Optional[List[str]] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    limit: Optional[int] = 100000
+
 
 class TestMarketDataRequest(BaseModel):
     """Request model for test market data."""
@@ -157,4 +183,150 @@ async def get_websocket_status():
         }
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get WebSocket status: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to get WebSocket status: {str(e)}")
+
+
+def set_tick_replay_engine(engine: TickReplayEngine) -> None:
+    """
+    Set the global tick replay engine instance.
+    
+    Called by main.py during application startup.
+    
+    Args:
+        engine: TickReplayEngine instance
+    """
+    global tick_replay_engine
+    tick_replay_engine = engine
+
+
+def _get_replay_engine() -> TickReplayEngine:
+    if tick_replay_engine is None:
+        raise HTTPException(status_code=503, detail="Tick replay engine not available")
+    return tick_replay_engine
+
+
+def _clear_replay_task(task: asyncio.Task) -> None:
+    global _replay_task
+    if _replay_task is task:
+        _replay_task = None
+
+
+def _resolve_replay_path(path: str) -> str:
+    """
+    Resolve a requested replay file inside the configured replay directory.
+    
+    Args:
+        path: File or journal directory path relative to TICK_REPLAY_DIR
+        
+    Returns:
+        Resolved absolute path
+    """
+    replay_dir = Path(settings.TICK_REPLAY_DIR).resolve()
+    resolved = (replay_dir / path).resolve()
+    
+    if not resolved.is_relative_to(replay_dir):
+        raise HTTPException(status_code=400, detail="Replay path must be inside the replay directory")
+    if not resolved.exists():
+        raise HTTPException(status_code=404, detail=f"Replay file not found: {path}")
+    return str(resolved)
+
+
+async def _run_replay(engine: TickReplayEngine, request: TickReplayRequest) -> None:
+    try:
+        if not engine.data_ingestion.is_running:
+            await engine.data_ingestion.start_without_streaming()
+        
+        if request.source == "file":
+            await engine.replay_file(request.path, speed=request.speed)
+        else:
+            await engine.replay_database(
+                speed=request.speed,
+                symbols=request.symbols,
+                start=request.start,
+                end=request.end,
+                limit=request.limit
+            )
+    except Exception as e:
+        logger.error(f"Tick replay failed: {e}")
+
+
+@router.post("/tick-replay")
+async def start_tick_replay(request: TickReplayRequest):
+    """
+    Replay recorded ticks through the live ingestion pipeline.
+    
+    Runs in the background; poll /tick-replay/status for results.
+    Disabled unless TICK_REPLAY_API_ENABLED is set, and file replays are
+    restricted to TICK_REPLAY_DIR.
+    
+    Args:
+        request: Replay source, speed and filters
+        
+    Returns:
+        Acceptance message
+    """
+    if not settings.TICK_REPLAY_API_ENABLED:
+        raise HTTPException(status_code=403, detail="Tick replay API is disabled (TICK_REPLAY_API_ENABLED)")
+    
+    global _replay_task
+    engine = _get_replay_engine()
+    
+    # The task reference marks the replay busy before it has started running
+    if engine.is_running or _replay_task is not None:
+        raise HTTPException(status_code=409, detail="A replay is already running")
+    if request.source not in ("market_data", "file"):
+        raise HTTPException(status_code=400, detail=f"Unknown replay source: {request.source}")
+    if request.source == "file":
+        if not request.path:
+            raise HTTPException(status_code=400, detail="File replay requires a path")
+        request.path = _resolve_replay_path(request.path)
+    
+    _replay_task = asyncio.create_task(_run_replay(engine, request))
+    _replay_task.add_done_callback(_clear_replay_task)
+    
+    return {
+        "success": True,
+        "message": f"Tick replay started from {request.path or request.source}",
+        "speed": request.speed or "max"
+    }
+
+
+@router.get("/tick-replay/status")
+async def get_tick_replay_status():
+    """
+    Get tick replay status and last run statistics.
+    
+    Returns:
+        Replay engine status with pipeline metrics
+    """
+    engine = _get_replay_engine()
+    
+    return {
+        "success": True,
+        "status": engine.get_status(),
+        "ingestion": engine.data_ingestion.get_status(),
+        "alerts": engine.alert_engine.get_performance_stats() if engine.alert_engine else None
+    }
+
+
+@router.post("/tick-replay/stop")
+async def stop_tick_replay():
+    """
+    Stop the running tick replay.
+    
+    A replay still starting the ingestion pipeline is cancelled; one that
+    is sending ticks stops after the next message.
+    
+    Returns:
+        Stop confirmation
+    """
+    engine = _get_replay_engine()
+    
+    if engine.is_running:
+        engine.stop()
+    elif _replay_task is not None:
+        _replay_task.cancel()
+    else:
+        raise HTTPException(status_code=409, detail="No tick replay is running")
+    
+    return {"success": True, "message": "Tick replay stop requested"}
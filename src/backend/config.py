@@ -102,20 +102,140 @@ class Settings(BaseSettings):
         default=20,
         description="Database connection pool overflow size"
     )
+    DATABASE_WRITER_ENABLED: bool = Field(
+        default=True,
+        description="Serialize writes through a single group-commit writer connection"
+    )
+    DATABASE_WRITER_COMMIT_INTERVAL_MS: float = Field(
+        default=20.0,
+        description="Maximum time the writer waits to group writes into one commit"
+    )
+    DATABASE_WRITER_MAX_BATCH_ROWS: int = Field(
+        default=5000,
+        description="Rows that trigger a group commit before the interval elapses"
+    )
+    DATABASE_WRITER_MAX_QUEUE_SIZE: int = Field(
+        default=10000,
+        description="Pending write intents before submitters wait for the writer"
+    )
     
     # Performance Configuration
     MAX_WEBSOCKET_CONNECTIONS: int = Field(
         default=10,
         description="Maximum concurrent WebSocket connections"
     )
+    WEBSOCKET_CLIENT_QUEUE_SIZE: int = Field(
+        default=1000,
+        description="Outbound messages queued per WebSocket client before the queue policy applies"
+    )
+    WEBSOCKET_CLIENT_QUEUE_POLICY: str = Field(
+        default="conflate",
+        description="Full client queue handling: drop_oldest, conflate (latest tick per instrument) or disconnect"
+    )
+    WEBSOCKET_CLIENT_MAX_OVERFLOWS: int = Field(
+        default=100,
+        description="Overflowing messages before a client is disconnected under the disconnect policy"
+    )
+    WEBSOCKET_MAX_UPDATES_PER_SECOND: float = Field(
+        default=0.0,
+        description="Default market data updates per second per instrument for each client (0 = uncapped); clients may negotiate their own"
+    )
+    WEBSOCKET_RATE_FLUSH_INTERVAL_MS: int = Field(
+        default=20,
+        description="Timer interval releasing rate-capped market data updates"
+    )
+    WEBSOCKET_TICK_BATCH_INTERVAL_MS: int = Field(
+        default=50,
+        description="Window collected into one market_data_batch frame for clients that opt in with batchTicks"
+    )
+    WEBSOCKET_BINARY_ENABLED: bool = Field(
+        default=True,
+        description="Allow clients to negotiate binary tick and alert frames with the tradeassist.binary.v1 subprotocol"
+    )
+    WEBSOCKET_BUS_ENABLED: bool = Field(
+        default=False,
+        description="Fan out ticks and alerts to every uvicorn worker over a Unix domain socket (required for --workers > 1)"
+    )
+    WEBSOCKET_BUS_SOCKET_PATH: str = Field(
+        default="./data/websocket_bus.sock",
+        description="Unix domain socket served by the worker that owns ingestion"
+    )
+    WEBSOCKET_BUS_LOCK_PATH: str = Field(
+        default="./data/websocket_bus.lock",
+        description="Lock file electing the worker that owns ingestion and alert evaluation"
+    )
+    WEBSOCKET_BUS_MAX_BUFFER_BYTES: int = Field(
+        default=1048576,
+        description="Unsent bytes buffered for a worker before it is dropped and must reconnect"
+    )
     ALERT_EVALUATION_INTERVAL_MS: int = Field(
         default=100,
         description="Alert evaluation interval in milliseconds"
     )
+    ALERT_EVALUATION_WORKERS: int = Field(
+        default=4,
+        description="Alert evaluation workers; ticks are sharded across them by instrument ID"
+    )
+    ALERT_EVALUATION_WORKER_QUEUE_SIZE: int = Field(
+        default=500,
+        description="Pending evaluations per worker before new ones are dropped"
+    )
+    ALERT_EVALUATION_PROCESS_POOL_SIZE: int = Field(
+        default=0,
+        description="Processes for vectorized rule computation on large batches (0 = evaluate in-process)"
+    )
+    ALERT_EVALUATION_PROCESS_POOL_MIN_PAIRS: int = Field(
+        default=20000,
+        description="Smallest (tick, rule) pair count sent to the process pool"
+    )
+    ALERT_LATENCY_TARGET_MS: int = Field(
+        default=500,
+        description="Tick receipt to alert broadcast target; p99 is checked against it in the health API"
+    )
     DATA_INGESTION_BATCH_SIZE: int = Field(
         default=100,
         description="Batch size for data ingestion"
     )
+    DATA_INGESTION_BULK_WRITES: bool = Field(
+        default=True,
+        description="Persist ingestion batches with one multi-row insert instead of per-tick ORM objects"
+    )
+    DATA_INGESTION_QUEUE_POLICY: str = Field(
+        default="conflate",
+        description="Backpressure policy when a symbol's queue slot is full: conflate, drop_oldest or block"
+    )
+    DATA_INGESTION_QUEUE_DEPTH_PER_SYMBOL: int = Field(
+        default=1,
+        description="Pending ticks held per symbol before the backpressure policy applies"
+    )
+    TICK_JOURNAL_ENABLED: bool = Field(
+        default=True,
+        description="Append normalized ticks to a memory-mapped journal before database persistence"
+    )
+    TICK_JOURNAL_DIR: str = Field(
+        default="./data/journal",
+        description="Directory for tick journal segments"
+    )
+    TICK_JOURNAL_SEGMENT_RECORDS: int = Field(
+        default=262144,
+        description="Tick records per journal segment before rotation"
+    )
+    TICK_JOURNAL_MAX_SEGMENTS: int = Field(
+        default=4,
+        description="Journal segments kept on disk, including the active one (0 = keep all as raw tick archive)"
+    )
+    TICK_JOURNAL_FSYNC: bool = Field(
+        default=False,
+        description="Flush journal pages to disk after every append (survives OS crashes, not just process kills)"
+    )
+    PRICE_WINDOW_MAX_POINTS: int = Field(
+        default=50000,
+        description="Maximum ticks buffered per instrument for in-memory rate-of-change lookups"
+    )
+    ALERT_RULES_VERSION_CHECK_SECONDS: float = Field(
+        default=5.0,
+        description="Interval for checking the alert rules table for changes made outside the rules API"
+    )
     
     # Cache Configuration (Redis-compatible for future use)
     CACHE_BACKEND: str = Field(
@@ -176,6 +296,22 @@ class Settings(BaseSettings):
         default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         description="Log message format"
     )
+    LOG_HOT_PATH_SAMPLE_RATE: int = Field(
+        default=100,
+        description="Emit 1 in N info/debug events per hot-path call site"
+    )
+    LOG_HOT_PATH_RATE_LIMIT: float = Field(
+        default=5.0,
+        description="Maximum sampled hot-path events per second per call site"
+    )
+    LOG_HOT_PATH_BURST: int = Field(
+        default=10,
+        description="Token bucket burst size for hot-path events"
+    )
+    LOG_HOT_PATH_SUMMARY_INTERVAL_SECONDS: float = Field(
+        default=10.0,
+        description="Interval for aggregated hot-path event count summaries"
+    )
     
     # Demo mode for testing
     DEMO_MODE: bool = Field(
@@ -183,6 +319,54 @@ class Settings(BaseSettings):
         description="Run in demo mode without real API connections"
     )
     
+    # Local Schwab streaming simulator (replaces the real client when enabled)
+    SCHWAB_SIMULATOR_ENABLED: bool = Field(
+        default=False,
+        description="Stream synthetic level-one quotes instead of connecting to Schwab"
+    )
+    SCHWAB_SIMULATOR_TICKS_PER_SECOND: float = Field(
+        default=1000.0,
+        description="Average simulated ticks per second"
+    )
+    SCHWAB_SIMULATOR_SYMBOL_COUNT: int = Field(
+        default=0,
+        description="Total simulated symbols; synthetic SIM00000-style instruments are registered to pad the instruments (0 = instruments only)"
+    )
+    SCHWAB_SIMULATOR_BURSTINESS: float = Field(
+        default=0.0,
+        description="Coefficient of variation of the per-period tick rate (0 = constant)"
+    )
+    SCHWAB_SIMULATOR_VOLATILITY: float = Field(
+        default=0.0005,
+        description="Per-tick standard deviation of the log-price random walk"
+    )
+    SCHWAB_SIMULATOR_SYMBOL_SKEW: float = Field(
+        default=0.0,
+        description="Zipf exponent for symbol selection (0 = uniform, >1 = few hot symbols)"
+    )
+    SCHWAB_SIMULATOR_SEED: int = Field(
+        default=42,
+        description="Random seed; equal seeds produce identical message sequences"
+    )
+    SCHWAB_SIMULATOR_DISCONNECT_INTERVAL_SECONDS: float = Field(
+        default=0.0,
+        description="Simulated seconds between injected disconnects (0 = never)"
+    )
+    SCHWAB_SIMULATOR_DISCONNECT_DURATION_SECONDS: float = Field(
+        default=5.0,
+        description="Simulated outage length before automatic reconnect"
+    )
+    
+    # Tick Replay API (load testing; writes into market_data and fires alerts)
+    TICK_REPLAY_API_ENABLED: bool = Field(
+        default=False,
+        description="Allow starting tick replays through POST /api/test/tick-replay"
+    )
+    TICK_REPLAY_DIR: str = Field(
+        default="./data/replay",
+        description="Directory file replays are restricted to"
+    )
+    
     # Target Instruments for Real-time Streaming (as strings from env)
     TARGET_FUTURES_STR: str = Field(
         default="ES,NQ,YM,CL,GC",
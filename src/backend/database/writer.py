@@ -0,0 +1,388 @@
+"""
+Single-writer group commit for SQLite.
+
+SQLite allows one writer at a time, so concurrent services opening their own
+write transactions mostly wait on each other's locks. DatabaseWriter is an
+actor that owns one long-lived connection: services submit write intents
+(async callables taking a session) and the writer applies everything queued
+within a commit window in a single transaction. Each caller gets a future
+that resolves once its write is durable.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, List, Optional
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from . import connection
+
+logger = structlog.get_logger()
+
+WriteOperation = Callable[[AsyncSession], Awaitable[Any]]
+
+
+@dataclass
+class WriteIntent:
+    """A queued write and the future resolved when it commits."""
+    operation: WriteOperation
+    rows: int
+    label: str
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class DatabaseWriter:
+    """
+    Actor serializing all database writes through one connection.
+
+    Intents are group-committed every commit_interval_ms or once
+    max_batch_rows rows are pending, whichever comes first. If a group
+    fails, it is rolled back and each intent is retried in its own
+    transaction so one bad write only fails its own caller. Operations
+    must therefore build their statements and ORM objects inside the
+    callable rather than capturing session state.
+
+    If the writer session itself breaks (e.g. rollback fails), every
+    pending intent is failed and the writer stops, so execute_write falls
+    back to direct sessions instead of queueing onto a dead actor.
+    """
+
+    def __init__(
+        self,
+        commit_interval_ms: float = 20.0,
+        max_batch_rows: int = 5000,
+        max_queue_size: int = 10000
+    ):
+        self.commit_interval_seconds = commit_interval_ms / 1000.0
+        self.max_batch_rows = max_batch_rows
+        self.max_queue_size = max_queue_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._connection = None
+        self._session: Optional[AsyncSession] = None
+        self.is_running = False
+
+        # Metrics
+        self.commits = 0
+        self.intents_committed = 0
+        self.intents_failed = 0
+        self.rows_committed = 0
+        self.group_retries = 0
+        self.max_queue_depth = 0
+        self.total_commit_latency_ms = 0.0
+        self.max_commit_latency_ms = 0.0
+        self.total_write_latency_ms = 0.0
+        self.max_write_latency_ms = 0.0
+
+    async def start(self) -> None:
+        """Open the writer connection and start the commit loop."""
+        if self.is_running:
+            return
+        if not connection.engine:
+            raise RuntimeError("Database not initialized. Call init_database() first.")
+
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._connection = await connection.engine.connect()
+        self._session = AsyncSession(
+            bind=self._connection,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+        self.is_running = True
+        self._task = asyncio.create_task(self._run())
+
+        logger.info(
+            "Database writer started",
+            commit_interval_ms=self.commit_interval_seconds * 1000,
+            max_batch_rows=self.max_batch_rows
+        )
+
+    async def stop(self) -> None:
+        """Commit everything still queued, then close the writer connection."""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+        await self._queue.put(None)  # Wake the loop so it drains and exits
+        await self._task
+        self._task = None
+
+        # Already closed if the session broke while draining
+        if self._session is not None:
+            await self._session.close()
+            await self._connection.close()
+            self._session = None
+            self._connection = None
+
+        logger.info("Database writer stopped", **self.get_stats())
+
+    async def submit(
+        self,
+        operation: WriteOperation,
+        rows: int = 1,
+        label: str = "write"
+    ) -> asyncio.Future:
+        """
+        Queue a write intent.
+
+        Waits for queue space when the writer is saturated, which pushes
+        backpressure onto producers instead of growing memory.
+
+        Args:
+            operation: Async callable applying the write to the given session
+            rows: Approximate rows written, counted against max_batch_rows
+            label: Intent label used in error logs
+
+        Returns:
+            asyncio.Future: Resolves to the operation's result after commit
+        """
+        if not self.is_running:
+            raise RuntimeError("Database writer is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        intent = WriteIntent(operation, max(rows, 1), label, future)
+        await self._queue.put(intent)
+        if self._task is not None and self._task.done():
+            # The writer failed while this call waited for queue space
+            self._fail(intent, RuntimeError("Database writer is not running"))
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return future
+
+    async def execute(
+        self,
+        operation: WriteOperation,
+        rows: int = 1,
+        label: str = "write"
+    ) -> Any:
+        """
+        Queue a write intent and wait for it to commit.
+
+        Args:
+            operation: Async callable applying the write to the given session
+            rows: Approximate rows written
+            label: Intent label used in error logs
+
+        Returns:
+            Any: The operation's result
+        """
+        return await (await self.submit(operation, rows, label))
+
+    async def _run(self) -> None:
+        """Collect intents into groups and commit them."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            intent = await self._queue.get()
+            if intent is None:
+                break
+
+            group = [intent]
+            rows = intent.rows
+            deadline = loop.time() + self.commit_interval_seconds
+
+            while rows < self.max_batch_rows:
+                try:
+                    intent = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        intent = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+
+                if intent is None:
+                    stopping = True
+                    break
+                group.append(intent)
+                rows += intent.rows
+
+            if not await self._commit_group_safely(group):
+                return
+
+        # Drain anything queued behind the stop sentinel
+        remaining = []
+        while not self._queue.empty():
+            intent = self._queue.get_nowait()
+            if intent is not None:
+                remaining.append(intent)
+        if remaining:
+            await self._commit_group_safely(remaining)
+
+    async def _commit_group_safely(self, group: List[WriteIntent]) -> bool:
+        """
+        Commit a group, containing errors _commit_group could not handle.
+
+        Returns:
+            bool: False if the writer session is unusable and the writer stopped
+        """
+        try:
+            await self._commit_group(group)
+            return True
+        except Exception as e:
+            for intent in group:
+                if not intent.future.done():
+                    self._fail(intent, e)
+
+        try:
+            await self._session.rollback()
+            self._session.expunge_all()
+            return True
+        except Exception as e:
+            await self._abort(e)
+            return False
+
+    async def _abort(self, error: Exception) -> None:
+        """Stop after an unrecoverable session error, failing every queued intent."""
+        self.is_running = False
+        logger.error("Database writer failed, falling back to direct sessions", error=str(error))
+
+        for resource in (self._session, self._connection):
+            try:
+                await resource.close()
+            except Exception:
+                pass
+        self._session = None
+        self._connection = None
+
+        # Synchronous from here on, so no intent can be queued behind the drain
+        while not self._queue.empty():
+            intent = self._queue.get_nowait()
+            if intent is not None:
+                self._fail(intent, error)
+
+    async def _commit_group(self, group: List[WriteIntent]) -> None:
+        """Apply a group of intents in one transaction and resolve their futures."""
+        session = self._session
+        commit_start = time.perf_counter()
+
+        try:
+            results = [await intent.operation(session) for intent in group]
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            if len(group) == 1:
+                self._fail(group[0], e)
+            else:
+                self.group_retries += 1
+                logger.warning(
+                    f"Group commit of {len(group)} writes failed, retrying individually",
+                    error=str(e)
+                )
+                for intent in group:
+                    await self._commit_group([intent])
+            return
+        finally:
+            session.expunge_all()
+
+        done = time.perf_counter()
+        commit_latency_ms = (done - commit_start) * 1000
+        self.commits += 1
+        self.total_commit_latency_ms += commit_latency_ms
+        self.max_commit_latency_ms = max(self.max_commit_latency_ms, commit_latency_ms)
+
+        for intent, result in zip(group, results):
+            write_latency_ms = (done - intent.enqueued_at) * 1000
+            self.intents_committed += 1
+            self.rows_committed += intent.rows
+            self.total_write_latency_ms += write_latency_ms
+            self.max_write_latency_ms = max(self.max_write_latency_ms, write_latency_ms)
+            if not intent.future.done():
+                intent.future.set_result(result)
+
+    def _fail(self, intent: WriteIntent, error: Exception) -> None:
+        self.intents_failed += 1
+        logger.error(f"Database write failed: {intent.label}", error=str(error))
+        if not intent.future.done():
+            intent.future.set_exception(error)
+            # Already logged; don't warn again for fire-and-forget submitters
+            intent.future.exception()
+
+    def get_stats(self) -> dict:
+        """
+        Get writer statistics.
+
+        Returns:
+            dict: Queue depth, group sizes and commit latency
+        """
+        return {
+            "running": self.is_running,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "max_queue_depth": self.max_queue_depth,
+            "commits": self.commits,
+            "intents_committed": self.intents_committed,
+            "intents_failed": self.intents_failed,
+            "rows_committed": self.rows_committed,
+            "group_retries": self.group_retries,
+            "avg_intents_per_commit": (
+                round(self.intents_committed / self.commits, 2) if self.commits else 0.0
+            ),
+            "avg_commit_latency_ms": (
+                round(self.total_commit_latency_ms / self.commits, 3) if self.commits else 0.0
+            ),
+            "max_commit_latency_ms": round(self.max_commit_latency_ms, 3),
+            "avg_write_latency_ms": (
+                round(self.total_write_latency_ms / self.intents_committed, 3)
+                if self.intents_committed else 0.0
+            ),
+            "max_write_latency_ms": round(self.max_write_latency_ms, 3),
+        }
+
+
+async def execute_write(
+    operation: WriteOperation,
+    session: Optional[AsyncSession] = None,
+    rows: int = 1,
+    label: str = "write"
+) -> Any:
+    """
+    Run a write through the database writer, or directly when it is not running.
+
+    The direct path (tests, scripts, startup before the writer is up) applies
+    the operation to the given session, or a new one, and commits it.
+
+    Args:
+        operation: Async callable applying the write to a session
+        session: Session to use when the writer is not running
+        rows: Approximate rows written
+        label: Intent label used in error logs
+
+    Returns:
+        Any: The operation's result
+    """
+    writer = get_database_writer()
+    if writer.is_running:
+        return await writer.execute(operation, rows, label)
+
+    if session is not None:
+        result = await operation(session)
+        await session.commit()
+        return result
+
+    async with connection.get_db_session() as own_session:
+        result = await operation(own_session)
+        await own_session.commit()
+        return result
+
+
+# Global writer instance
+_database_writer: Optional[DatabaseWriter] = None
+
+
+def get_database_writer() -> DatabaseWriter:
+    """Get the global database writer, configured from settings."""
+    global _database_writer
+    if _database_writer is None:
+        _database_writer = DatabaseWriter(
+            commit_interval_ms=settings.DATABASE_WRITER_COMMIT_INTERVAL_MS,
+            max_batch_rows=settings.DATABASE_WRITER_MAX_BATCH_ROWS,
+            max_queue_size=settings.DATABASE_WRITER_MAX_QUEUE_SIZE,
+        )
+    return _database_writer
@@ -0,0 +1,351 @@
+"""
+Local Schwab Streaming Simulator.
+
+Drop-in replacement for SchwabRealTimeClient that emits level-one streaming
+messages in the exact shape delivered by schwab-package
+({'service': ..., 'content': [{'key': ..., 'LAST_PRICE': ...}, ...]}).
+Output is driven by a seeded RNG on a simulated clock, so a given seed and
+configuration always produce the same message sequence, independent of how
+fast the consumer keeps up.
+"""
+
+import asyncio
+import math
+import random
+import time
+from datetime import datetime
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional
+
+import structlog
+
+from ..config import settings
+
+logger = structlog.get_logger()
+
+
+class SimulatedSchwabClient:
+    """
+    Synthetic level-one quote stream with SchwabRealTimeClient's interface.
+
+    Ticks are generated in fixed periods of simulated time. Per-period tick
+    counts follow a gamma-distributed intensity whose coefficient of
+    variation is the burstiness (0 = constant rate), symbols are drawn with
+    an optional Zipf skew (hot symbols), and prices follow a geometric
+    random walk.
+    """
+
+    def __init__(
+        self,
+        ticks_per_second: float = 1000.0,
+        symbol_count: int = 0,
+        burstiness: float = 0.0,
+        volatility: float = 0.0005,
+        symbol_skew: float = 0.0,
+        symbols_per_message: int = 10,
+        seed: int = 42,
+        period_ms: int = 10,
+        service: str = "LEVELONE_FUTURES",
+        disconnect_interval_seconds: float = 0.0,
+        disconnect_duration_seconds: float = 5.0,
+        auto_reconnect: bool = True,
+        max_ticks: Optional[int] = None
+    ):
+        self.ticks_per_second = ticks_per_second
+        self.symbol_count = symbol_count
+        self.burstiness = burstiness
+        self.volatility = volatility
+        self.symbol_skew = symbol_skew
+        self.symbols_per_message = symbols_per_message
+        self.seed = seed
+        self.period_seconds = period_ms / 1000.0
+        self.service = service
+        self.disconnect_interval_seconds = disconnect_interval_seconds
+        self.disconnect_duration_seconds = disconnect_duration_seconds
+        self.auto_reconnect = auto_reconnect
+        self.max_ticks = max_ticks
+
+        self.data_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
+        self.is_connected = False
+        self.is_streaming = False
+
+        self._rng = random.Random(seed)
+        self._symbols: List[str] = []
+        self._cum_weights: List[float] = []
+        self._prices: Dict[str, float] = {}
+        self._volumes: Dict[str, int] = {}
+        self._carry = 0.0
+        self._sim_time = 0.0
+        self._next_disconnect = disconnect_interval_seconds or math.inf
+        self._reconnect_at: Optional[float] = None
+        self._stream_task: Optional[asyncio.Task] = None
+
+        # Statistics
+        self.messages_sent = 0
+        self.ticks_sent = 0
+        self.disconnects = 0
+        self.reconnects = 0
+        self._start_time: Optional[datetime] = None
+
+    @classmethod
+    def from_settings(cls) -> "SimulatedSchwabClient":
+        """
+        Create a simulator configured from application settings.
+
+        Returns:
+            SimulatedSchwabClient: Configured simulator.
+        """
+        return cls(
+            ticks_per_second=settings.SCHWAB_SIMULATOR_TICKS_PER_SECOND,
+            symbol_count=settings.SCHWAB_SIMULATOR_SYMBOL_COUNT,
+            burstiness=settings.SCHWAB_SIMULATOR_BURSTINESS,
+            volatility=settings.SCHWAB_SIMULATOR_VOLATILITY,
+            symbol_skew=settings.SCHWAB_SIMULATOR_SYMBOL_SKEW,
+            seed=settings.SCHWAB_SIMULATOR_SEED,
+            disconnect_interval_seconds=settings.SCHWAB_SIMULATOR_DISCONNECT_INTERVAL_SECONDS,
+            disconnect_duration_seconds=settings.SCHWAB_SIMULATOR_DISCONNECT_DURATION_SECONDS,
+        )
+
+    @property
+    def _client(self) -> "SimulatedSchwabClient":
+        """Inner client (SchwabRealTimeClient compatibility for reconnects)."""
+        return self
+
+    def set_data_callback(self, callback: Callable[[str, Dict[str, Any]], None]) -> None:
+        """
+        Set callback function for market data updates.
+
+        Args:
+            callback: Function called with (symbol, data) for each message
+        """
+        self.data_callback = callback
+
+    def padding_symbols(self, symbols: List[str]) -> List[str]:
+        """
+        Synthetic symbols configure_symbols adds to reach symbol_count.
+
+        Args:
+            symbols: Symbols that will be streamed
+
+        Returns:
+            List[str]: SIM00000-style symbols (empty if none are needed)
+        """
+        return [f"SIM{index:05d}" for index in range(len(symbols), self.symbol_count)]
+
+    def configure_symbols(self, symbols: List[str]) -> None:
+        """
+        Set the streamed universe and reset the random walk.
+
+        Symbols beyond the requested list are padded with synthetic ones up
+        to symbol_count (see padding_symbols).
+
+        Args:
+            symbols: Symbols to stream
+        """
+        universe = [symbol.upper() for symbol in symbols]
+        universe.extend(self.padding_symbols(universe))
+        if not universe:
+            raise ValueError("Simulator needs at least one symbol")
+
+        self._rng = random.Random(self.seed)
+        self._symbols = universe
+        self._cum_weights = list(accumulate(
+            1.0 / (rank + 1) ** self.symbol_skew for rank in range(len(universe))
+        ))
+        self._prices = {symbol: round(self._rng.uniform(20.0, 5000.0), 2) for symbol in universe}
+        self._volumes = {symbol: 0 for symbol in universe}
+        self._carry = 0.0
+        self._sim_time = 0.0
+        self._next_disconnect = self.disconnect_interval_seconds or math.inf
+        self._reconnect_at = None
+
+    def _period_tick_count(self) -> int:
+        """Number of ticks emitted in the next simulated period."""
+        expected = self.ticks_per_second * self.period_seconds
+        if self.burstiness > 0:
+            shape = 1.0 / (self.burstiness ** 2)
+            expected *= self._rng.gammavariate(shape, 1.0 / shape)
+
+        expected += self._carry
+        count = int(expected)
+        self._carry = expected - count
+        return count
+
+    def _quote(self, symbol: str) -> Dict[str, Any]:
+        """Advance one symbol's random walk and build its content item."""
+        rng = self._rng
+        price = self._prices[symbol] * math.exp(rng.gauss(0.0, self.volatility))
+        price = max(round(price, 2), 0.01)
+        self._prices[symbol] = price
+
+        self._volumes[symbol] += rng.randint(1, 10)
+        half_spread = max(round(price * 0.00005, 2), 0.01)
+        return {
+            "key": symbol,
+            "LAST_PRICE": price,
+            "TOTAL_VOLUME": self._volumes[symbol],
+            "BID_PRICE": round(price - half_spread, 2),
+            "ASK_PRICE": round(price + half_spread, 2),
+            "BID_SIZE": rng.randint(1, 50),
+            "ASK_SIZE": rng.randint(1, 50),
+        }
+
+    def generate_period(self) -> List[Dict[str, Any]]:
+        """
+        Generate the messages for one simulated period.
+
+        Ticks are packed into messages of up to symbols_per_message distinct
+        symbols; a repeated symbol starts a new message, as on the wire.
+
+        Returns:
+            List[Dict]: Streaming messages.
+        """
+        count = self._period_tick_count()
+        if self.max_ticks is not None:
+            count = min(count, self.max_ticks - self.ticks_sent)
+        self._sim_time += self.period_seconds
+        if count <= 0:
+            return []
+
+        messages = []
+        content: List[Dict[str, Any]] = []
+        keys = set()
+        for symbol in self._rng.choices(self._symbols, cum_weights=self._cum_weights, k=count):
+            if symbol in keys or len(content) >= self.symbols_per_message:
+                messages.append({"service": self.service, "content": content})
+                content = []
+                keys = set()
+            content.append(self._quote(symbol))
+            keys.add(symbol)
+        messages.append({"service": self.service, "content": content})
+        return messages
+
+    async def start_streaming(self, symbols: List[str]) -> bool:
+        """
+        Start simulated streaming for specified symbols.
+
+        Args:
+            symbols: List of symbols to stream
+
+        Returns:
+            bool: True if streaming started successfully
+        """
+        self.configure_symbols(symbols)
+        self.is_connected = True
+        self.is_streaming = True
+        self._start_time = datetime.utcnow()
+        self._stream_task = asyncio.create_task(self._stream_loop())
+
+        logger.info(
+            f"Simulated streaming started for {len(self._symbols)} symbols",
+            ticks_per_second=self.ticks_per_second,
+            burstiness=self.burstiness,
+            seed=self.seed
+        )
+        return True
+
+    async def _stream_loop(self) -> None:
+        """Emit messages on the simulated clock, paced to wall time."""
+        wall_start = time.perf_counter()
+
+        while self.is_streaming:
+            if self.max_ticks is not None and self.ticks_sent >= self.max_ticks:
+                break
+
+            if self.is_connected and self._sim_time >= self._next_disconnect:
+                self.inject_disconnect()
+            elif (
+                not self.is_connected and
+                self._reconnect_at is not None and
+                self._sim_time >= self._reconnect_at
+            ):
+                self._reconnect()
+
+            if self.is_connected:
+                for message in self.generate_period():
+                    self.messages_sent += 1
+                    self.ticks_sent += len(message["content"])
+                    if self.data_callback:
+                        try:
+                            self.data_callback(message["content"][0]["key"], message)
+                        except Exception as e:
+                            logger.error(f"Simulator callback error: {e}")
+            else:
+                # Outage passes in simulated time without emitting
+                self._sim_time += self.period_seconds
+
+            delay = self._sim_time - (time.perf_counter() - wall_start)
+            await asyncio.sleep(delay if delay > 0 else 0)
+
+        self.is_streaming = False
+
+    def inject_disconnect(self, duration_seconds: Optional[float] = None) -> None:
+        """
+        Drop the simulated connection.
+
+        Args:
+            duration_seconds: Simulated outage before auto reconnect
+                (defaults to disconnect_duration_seconds)
+        """
+        duration = self.disconnect_duration_seconds if duration_seconds is None else duration_seconds
+        self.is_connected = False
+        self.disconnects += 1
+        self._reconnect_at = self._sim_time + duration if self.auto_reconnect else None
+        self._next_disconnect = (
+            self._sim_time + self.disconnect_interval_seconds
+            if self.disconnect_interval_seconds else math.inf
+        )
+        logger.warning("Simulated Schwab disconnect", duration_seconds=duration, auto_reconnect=self.auto_reconnect)
+
+    def _reconnect(self) -> None:
+        self.is_connected = True
+        self.reconnects += 1
+        self._reconnect_at = None
+        logger.info("Simulated Schwab reconnect")
+
+    async def reconnect_with_backoff(self) -> bool:
+        """
+        Reconnect after a simulated disconnect.
+
+        Returns:
+            bool: True once connected
+        """
+        if not self.is_connected:
+            self._reconnect()
+        return True
+
+    async def stop_streaming(self) -> None:
+        """Stop simulated streaming."""
+        self.is_streaming = False
+        if self._stream_task:
+            await self._stream_task
+            self._stream_task = None
+        self.is_connected = False
+
+    async def close(self) -> None:
+        """Close simulator."""
+        await self.stop_streaming()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get simulator statistics.
+
+        Returns:
+            Dict: Emission counts, rates and connection events
+        """
+        elapsed = (datetime.utcnow() - self._start_time).total_seconds() if self._start_time else 0.0
+        return {
+            "seed": self.seed,
+            "symbols": len(self._symbols),
+            "target_ticks_per_second": self.ticks_per_second,
+            "messages_sent": self.messages_sent,
+            "ticks_sent": self.ticks_sent,
+            "actual_ticks_per_second": round(self.ticks_sent / elapsed, 1) if elapsed > 0 else 0.0,
+            "simulated_seconds": round(self._sim_time, 3),
+            "disconnects": self.disconnects,
+            "reconnects": self.reconnects,
+            "connected": self.is_connected,
+        }
+
+
+__all__ = ["SimulatedSchwabClient"]
@@ -9,7 +9,8 @@ import logging
 import logging.handlers
 import os
 import sys
-from typing import Dict, Any
+import time
+from typing import Callable, Dict, Any, Optional
 
 import structlog
 from structlog.stdlib import LoggerFactory
@@ -87,13 +88,222 @@ def configure_production_logging() -> None:
     logging.getLogger("asyncio").setLevel(logging.WARNING)
     
 
+class _HotPathState:
+    """Per call-site sampling, token bucket and summary window state."""
+    
+    __slots__ = ("seen", "tokens", "last_refill", "window_start", "window_seen", "window_emitted")
+    
+    def __init__(self, burst: int, now: float):
+        self.seen = 0
+        self.tokens = float(burst)
+        self.last_refill = now
+        self.window_start = now
+        self.window_seen = 0
+        self.window_emitted = 0
+
+
+class HotPathLogSampler:
+    """
+    Structlog processor that samples and rate limits hot-path log events.
+    
+    Call sites opt in by passing ``hot_path="<call site>"`` (or ``hot_path=True``
+    to key on the event text). Info/debug events from a call site are kept
+    1 in ``sample_rate`` and then limited by a token bucket; warnings and
+    errors always pass. Every ``summary_interval_seconds`` an aggregated
+    count per call site is logged ("12,430 ticks queued in last 10s").
+    Expired windows are checked on every event, so a call site that goes
+    quiet is still summarized by the next event from anywhere.
+    Events without ``hot_path`` pass through untouched.
+    """
+    
+    ALWAYS_EMIT = frozenset({"warning", "warn", "error", "exception", "critical", "fatal"})
+    
+    def __init__(
+        self,
+        sample_rate: int = 100,
+        rate_per_second: float = 5.0,
+        burst: int = 10,
+        summary_interval_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.sample_rate = max(sample_rate, 1)
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.summary_interval_seconds = summary_interval_seconds
+        self._clock = clock
+        self._states: Dict[Any, _HotPathState] = {}
+        self._overrides: Dict[Any, Dict[str, Any]] = {}
+        self._summary_logger = None
+        # Earliest time any call site's summary window ends
+        self._next_summary_at = float("inf")
+    
+    def register(
+        self,
+        key: str,
+        label: Optional[str] = None,
+        sample_rate: Optional[int] = None,
+        rate_per_second: Optional[float] = None,
+        burst: Optional[int] = None
+    ) -> None:
+        """
+        Register a hot-path call site with a summary label or custom limits.
+        
+        Args:
+            key: Call-site key passed as ``hot_path``
+            label: Summary wording, e.g. "ticks queued"
+            sample_rate: Override 1-in-N sampling for this call site
+            rate_per_second: Override token bucket rate
+            burst: Override token bucket size
+        """
+        self._overrides[key] = {
+            "label": label,
+            "sample_rate": max(sample_rate, 1) if sample_rate else None,
+            "rate_per_second": rate_per_second,
+            "burst": burst,
+        }
+    
+    def _limit(self, key: Any, name: str) -> Any:
+        override = self._overrides.get(key)
+        if override and override[name] is not None:
+            return override[name]
+        return getattr(self, name)
+    
+    def __call__(self, logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+        key = event_dict.get("hot_path")
+        if key is None and not self._states:
+            return event_dict
+        
+        now = self._clock()
+        if now >= self._next_summary_at:
+            self._emit_due_summaries(now)
+        if key is None:
+            return event_dict
+        if key is True:
+            key = event_dict["hot_path"] = event_dict.get("event")
+        
+        state = self._states.get(key)
+        if state is None:
+            state = self._states[key] = _HotPathState(self._limit(key, "burst"), now)
+            self._next_summary_at = min(self._next_summary_at, now + self.summary_interval_seconds)
+        
+        state.seen += 1
+        state.window_seen += 1
+        
+        if method_name in self.ALWAYS_EMIT:
+            state.window_emitted += 1
+            return event_dict
+        
+        if (state.seen - 1) % self._limit(key, "sample_rate"):
+            raise structlog.DropEvent
+        
+        state.tokens = min(
+            float(self._limit(key, "burst")),
+            state.tokens + (now - state.last_refill) * self._limit(key, "rate_per_second")
+        )
+        state.last_refill = now
+        if state.tokens < 1.0:
+            raise structlog.DropEvent
+        
+        state.tokens -= 1.0
+        state.window_emitted += 1
+        return event_dict
+    
+    def _emit_due_summaries(self, now: float) -> None:
+        """Summarize every call site whose window has ended."""
+        # Summaries are logged through structlog and re-enter __call__
+        self._next_summary_at = float("inf")
+        for key, state in list(self._states.items()):
+            if now - state.window_start >= self.summary_interval_seconds:
+                self._emit_summary(key, state, now)
+        self._next_summary_at = min(
+            state.window_start for state in self._states.values()
+        ) + self.summary_interval_seconds
+    
+    def _emit_summary(self, key: Any, state: _HotPathState, now: float) -> None:
+        """Log the aggregated count for a call site and start a new window."""
+        if state.window_seen:
+            if self._summary_logger is None:
+                self._summary_logger = structlog.get_logger("tradeassist.hot_path")
+            label = self._overrides.get(key, {}).get("label") or f"{key} events"
+            self._summary_logger.info(
+                f"{state.window_seen:,} {label} in last {now - state.window_start:.0f}s",
+                hot_path_summary=key,
+                count=state.window_seen,
+                logged=state.window_emitted,
+                suppressed=state.window_seen - state.window_emitted,
+            )
+        state.window_start = now
+        state.window_seen = 0
+        state.window_emitted = 0
+    
+    def flush(self) -> None:
+        """Log pending summaries for every call site (e.g. at shutdown)."""
+        now = self._clock()
+        for key, state in list(self._states.items()):
+            self._emit_summary(key, state, now)
+    
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get per call-site counters.
+        
+        Returns:
+            Dict: Total and current-window counts per call site
+        """
+        return {
+            str(key): {
+                "seen": state.seen,
+                "window_seen": state.window_seen,
+                "window_logged": state.window_emitted,
+            }
+            for key, state in self._states.items()
+        }
+
+
+_hot_path_sampler: Optional[HotPathLogSampler] = None
+
+
+def get_hot_path_sampler() -> HotPathLogSampler:
+    """
+    Get the global hot-path log sampler.
+    
+    Returns:
+        HotPathLogSampler: Sampler configured from settings
+    """
+    global _hot_path_sampler
+    if _hot_path_sampler is None:
+        _hot_path_sampler = HotPathLogSampler(
+            sample_rate=settings.LOG_HOT_PATH_SAMPLE_RATE,
+            rate_per_second=settings.LOG_HOT_PATH_RATE_LIMIT,
+            burst=settings.LOG_HOT_PATH_BURST,
+            summary_interval_seconds=settings.LOG_HOT_PATH_SUMMARY_INTERVAL_SECONDS,
+        )
+    return _hot_path_sampler
+
+
+def register_hot_path(key: str, label: Optional[str] = None, **limits) -> None:
+    """
+    Register a hot-path logging call site.
+    
+    Args:
+        key: Call-site key passed as ``hot_path``
+        label: Summary wording, e.g. "ticks queued"
+        **limits: Optional sample_rate, rate_per_second or burst overrides
+    """
+    get_hot_path_sampler().register(key, label=label, **limits)
+
+
 def configure_structlog() -> None:
     """Configure structlog for structured logging."""
     
+    # Hot-path sampling runs right after the level filter so dropped events
+    # skip the remaining processors and rendering
+    hot_path_sampler = get_hot_path_sampler()
+    
     # Determine processors based on environment
     if settings.DEBUG:
         processors = [
             structlog.stdlib.filter_by_level,
+            hot_path_sampler,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
@@ -105,6 +315,7 @@ def configure_structlog() -> None:
     else:
         processors = [
             structlog.stdlib.filter_by_level,
+            hot_path_sampler,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
@@ -20,9 +20,10 @@ from .api.alerts import router as alerts_router
 from .api.analytics import router as analytics_router
 from .api.auth import router as auth_router
 from .api.historical_data import router as historical_data_router, set_historical_data_service
-from .api.test_market_data import router as test_market_data_router
+from .api.test_market_data import router as test_market_data_router, set_tick_replay_engine
 from .config import settings
 from .database.connection import init_database, close_database
+from .database.writer import get_database_writer
 from .services.data_ingestion import DataIngestionService
 from .services.alert_engine import AlertEngine
 from .services.notification import NotificationService
@@ -30,7 +31,9 @@ from .services.analytics_engine import analytics_engine
 from .services.ml_models import ml_service
 from .services.market_data_processor import market_data_processor
 from .services.historical_data_service import HistoricalDataService
-from .websocket.realtime import router as websocket_router
+from .services.tick_replay import TickReplayEngine
+from .websocket.fanout_bus import UnixSocketFanoutBus
+from .websocket.realtime import router as websocket_router, get_websocket_manager
 
 logger = structlog.get_logger()
 
@@ -52,6 +55,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize database
     await init_database()
     
+    # Start the single writer that group-commits all database writes
+    if settings.DATABASE_WRITER_ENABLED:
+        await get_database_writer().start()
+    
     # Initialize notification service
     notification_service = NotificationService()
     await notification_service.initialize()
@@ -77,18 +84,42 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     performance_monitoring = get_performance_monitoring_service()
     partition_manager = get_partition_manager_service()
     
+    # Register tick replay engine (drives the ingestion callback in load tests)
+    set_tick_replay_engine(TickReplayEngine(data_ingestion, alert_engine))
+    
+    async def start_ingestion_services() -> None:
+        """Start ingestion and alert evaluation (owner worker only)."""
+        # Try to start data ingestion, but don't fail if streaming fails
+        try:
+            await data_ingestion.start()
+            logger.info("Data ingestion service started successfully")
+        except Exception as e:
+            logger.warning(f"Data ingestion service failed to start (streaming issue): {e}")
+            logger.info("Continuing without real-time streaming - historical data will still work")
+        
+        await alert_engine.start()
+    
+    # With several workers, only the fan-out bus owner ingests and evaluates alerts;
+    # a follower that takes over the lock when the owner exits starts them itself
+    fanout_bus = None
+    owns_ingestion = True
+    if settings.WEBSOCKET_BUS_ENABLED:
+        fanout_bus = UnixSocketFanoutBus(
+            get_websocket_manager(),
+            settings.WEBSOCKET_BUS_SOCKET_PATH,
+            settings.WEBSOCKET_BUS_LOCK_PATH,
+            max_buffer_bytes=settings.WEBSOCKET_BUS_MAX_BUFFER_BYTES,
+            on_promoted=start_ingestion_services
+        )
+        owns_ingestion = await fanout_bus.start()
+    
     # Start services in order
     logger.info("Starting core services")
     
-    # Try to start data ingestion, but don't fail if streaming fails
-    try:
-        await data_ingestion.start()
-        logger.info("Data ingestion service started successfully")
-    except Exception as e:
-        logger.warning(f"Data ingestion service failed to start (streaming issue): {e}")
-        logger.info("Continuing without real-time streaming - historical data will still work")
-    
-    await alert_engine.start()
+    if owns_ingestion:
+        await start_ingestion_services()
+    else:
+        logger.info("Ingestion and alert evaluation run in another worker; relaying its broadcasts")
     
     # Start Phase 4 performance services
     logger.info("Starting Phase 4 performance monitoring services")
@@ -108,6 +139,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Shutdown sequence
         logger.info("Shutting down TradeAssist application")
         
+        # A follower stops following first so it cannot be promoted mid-shutdown;
+        # the owner keeps the lock until its ingestion has stopped
+        if fanout_bus is not None and not fanout_bus.is_owner:
+            await fanout_bus.stop()
+        
         # Stop services in reverse order
         # Stop API standardization performance monitoring
         from .services.api_performance_monitor import stop_performance_monitoring
@@ -118,8 +154,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await analytics_engine.stop()
         await alert_engine.stop()
         await data_ingestion.stop()
+        if fanout_bus is not None:
+            await fanout_bus.stop()
         await historical_data_service.stop()
         
+        # Report hot-path log counts suppressed since the last summary
+        from .logging_config import get_hot_path_sampler
+        get_hot_path_sampler().flush()
+        
+        # Commit queued writes before closing the database
+        await get_database_writer().stop()
+        
         # Close database connections
         await close_database()
         
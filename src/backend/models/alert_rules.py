@@ -36,6 +36,12 @@ class RuleCondition(str, Enum):
     VOLUME_ABOVE = "volume_above"
 
 
+class MovingAverageType(str, Enum):
+    """Moving average types for crossover rules."""
+    SMA = "sma"  # Simple moving average
+    EMA = "ema"  # Exponential moving average
+
+
 class AlertRule(Base, TimestampMixin):
     """
     Alert rule definition model.
@@ -110,6 +116,30 @@ class AlertRule(Base, TimestampMixin):
         doc="Period for moving average calculations"
     )
     
+    moving_average_type: Mapped[Optional[MovingAverageType]] = mapped_column(
+        String(10),
+        nullable=True,
+        doc="Moving average type for crossover rules (defaults to SMA)"
+    )
+    
+    slow_moving_average_period: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        nullable=True,
+        doc="Slow moving average period; crossover compares fast vs slow MA when set, price vs MA otherwise"
+    )
+    
+    conditions: Mapped[Optional[str]] = mapped_column(
+        Text,
+        nullable=True,
+        doc="JSON AND/OR expression of predicates for multi-condition rules"
+    )
+    
+    hysteresis: Mapped[Optional[float]] = mapped_column(
+        DECIMAL(12, 4),
+        nullable=True,
+        doc="Re-arm band for above/below threshold rules; after firing, price must move back past threshold -/+ band"
+    )
+    
     # Alert management
     cooldown_seconds: Mapped[int] = mapped_column(
         Integer,
@@ -7,25 +7,40 @@ supporting multiple rule types and real-time alert generation.
 
 import asyncio
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 from decimal import Decimal
 
 import structlog
-from sqlalchemy import select, desc, func
+from sqlalchemy import bindparam, select, desc, func, update
 from sqlalchemy.orm import selectinload
 
 from ..config import settings
 from ..database.connection import get_db_session
 from ..database.decorators import with_db_session, handle_db_errors
+from ..database.writer import get_database_writer
+from ..logging_config import register_hot_path
 from ..models.instruments import Instrument
 from ..models.market_data import MarketData
-from ..models.alert_rules import AlertRule, RuleType, RuleCondition
+from ..models.alert_rules import AlertRule, RuleType, RuleCondition, MovingAverageType
 from ..models.alert_logs import AlertLog, AlertStatus, DeliveryStatus
 from ..websocket.realtime import get_websocket_manager
+from .batch_evaluator import BatchRuleEvaluator
+from .evaluation_workers import EvaluationWorker, shard_for
+from .moving_averages import CrossoverTracker
+from .multi_condition import MultiConditionEvaluator
+from .pipeline_latency import get_pipeline_latency
+from .price_windows import PriceWindowStore, get_price_windows
+from .rule_events import RuleChangeAction, RuleChangeEvent, get_rule_event_bus
+from .threshold_index import ThresholdIndex
+from .tick_normalizer import TickRecord
 
 logger = structlog.get_logger()
 
+# Per-batch firing log (sampled and summarized, see logging_config)
+register_hot_path("alerts.fired", label="alert batches fired")
+
 
 class AlertContext:
     """Context data for alert evaluation and firing."""
@@ -54,7 +69,10 @@ class RuleEvaluator:
     and efficient data access patterns.
     """
     
-    def __init__(self):
+    def __init__(self, price_windows: Optional[PriceWindowStore] = None):
+        # In-memory price history for rate-of-change lookups
+        self.price_windows = price_windows or get_price_windows()
+        
         # Cache for historical data queries
         self._price_history_cache: Dict[Tuple[int, int], List[float]] = {}
         self._cache_max_age = 60  # 1 minute cache TTL
@@ -109,6 +127,10 @@ class RuleEvaluator:
         """
         Evaluate rate-of-change rule.
         
+        The window start price comes from the in-memory price window; the
+        database is only queried while the window doesn't yet cover the
+        rule's time window (right after a cold start).
+        
         Args:
             rule: Alert rule to evaluate.
             current_price: Current market price.
@@ -124,18 +146,24 @@ class RuleEvaluator:
         
         # Get historical price for comparison
         time_ago = datetime.utcnow() - timedelta(seconds=rule.time_window_seconds)
+        window = self.price_windows.get(rule.instrument_id)
         
-        historical_result = await session.execute(
-            select(MarketData.price)
-            .where(
-                MarketData.instrument_id == rule.instrument_id,
-                MarketData.timestamp >= time_ago
+        if window is not None and window.covers(time_ago):
+            self.price_windows.memory_hits += 1
+            historical_price = window.first_at_or_after(time_ago)
+        else:
+            self.price_windows.db_fallbacks += 1
+            historical_result = await session.execute(
+                select(MarketData.price)
+                .where(
+                    MarketData.instrument_id == rule.instrument_id,
+                    MarketData.timestamp >= time_ago
+                )
+                .order_by(MarketData.timestamp)
+                .limit(1)
             )
-            .order_by(MarketData.timestamp)
-            .limit(1)
-        )
+            historical_price = historical_result.scalar()
         
-        historical_price = historical_result.scalar()
         if not historical_price:
             return None
         
@@ -224,16 +252,51 @@ class AlertEngine:
         self.is_running = False
         self.evaluation_queue: asyncio.Queue = asyncio.Queue(maxsize=2000)
         
+        # Evaluation shards; each instrument always goes to the same worker
+        self.workers = [
+            EvaluationWorker(
+                worker_id,
+                self._process_evaluation_batch,
+                queue_size=settings.ALERT_EVALUATION_WORKER_QUEUE_SIZE
+            )
+            for worker_id in range(max(1, settings.ALERT_EVALUATION_WORKERS))
+        ]
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
+        
+        # Fired alerts waiting for WebSocket broadcast
+        self._broadcast_queue: asyncio.Queue = asyncio.Queue(maxsize=5000)
+        self._broadcast_task: Optional[asyncio.Task] = None
+        self.broadcast_batches = 0
+        self.broadcasts_dropped = 0
+        
         # Performance metrics
         self.evaluations_performed = 0
         self.alerts_fired = 0
         self.total_evaluation_time_ms = 0
         self.max_evaluation_time_ms = 0
         
+        # Tick receipt to alert latency (per-stage percentiles in self.latency)
+        self.latency = get_pipeline_latency()
+        self.total_alert_latency_ms = 0.0
+        self.max_alert_latency_ms = 0.0
+        
         # Rule cache for performance
         self._active_rules_cache: Dict[int, List[AlertRule]] = {}
+        self._scanned_rules_cache: Dict[int, List[AlertRule]] = {}
+        self.threshold_index = ThresholdIndex()
+        self.crossovers = CrossoverTracker()
+        self.multi_conditions = MultiConditionEvaluator(self.crossovers, self.evaluator.price_windows)
+        self.batch_evaluator = BatchRuleEvaluator(self.evaluator.price_windows)
         self._cache_last_updated = datetime.min
-        self._cache_ttl = 60  # 60 seconds cache TTL
+        
+        # Rule changes: API events patch the cache, a version check catches the rest
+        self._pending_rule_changes: Dict[int, RuleChangeAction] = {}
+        self._rules_version: Optional[Tuple] = None
+        self._version_checked_at = datetime.min
+        self._version_check_interval = settings.ALERT_RULES_VERSION_CHECK_SECONDS
+        self.rule_changes_applied = 0
+        self.full_reloads = 0
     
     async def start(self) -> None:
         """
@@ -247,12 +310,20 @@ class AlertEngine:
         
         logger.info("Starting alert engine")
         
-        # Load active rules cache
+        # Load active rules cache and follow rule changes from the API
         await self._refresh_rules_cache()
+        get_rule_event_bus().subscribe(self._on_rule_change)
+        
+        # Vectorized rule computation for large batches in separate processes
+        if settings.ALERT_EVALUATION_PROCESS_POOL_SIZE > 0:
+            self._process_pool = ProcessPoolExecutor(max_workers=settings.ALERT_EVALUATION_PROCESS_POOL_SIZE)
         
-        # Start background evaluation loop
+        # Start evaluation workers, the dispatch loop and the alert broadcast loop
         self.is_running = True
-        asyncio.create_task(self._evaluation_loop())
+        for worker in self.workers:
+            worker.start()
+        self._broadcast_task = asyncio.create_task(self._broadcast_loop())
+        self._dispatch_task = asyncio.create_task(self._evaluation_loop())
         
         logger.info("Alert engine started successfully")
     
@@ -267,19 +338,41 @@ class AlertEngine:
         
         logger.info("Stopping alert engine")
         self.is_running = False
+        get_rule_event_bus().unsubscribe(self._on_rule_change)
         
-        # Process remaining evaluations in queue
+        # Stop dispatching, then drain the worker queues and the dispatch queue
+        if self._dispatch_task is not None:
+            await self._dispatch_task
+            self._dispatch_task = None
+        await asyncio.gather(*(worker.stop() for worker in self.workers))
         await self._flush_evaluation_queue()
         
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        
+        # Send alerts still waiting for broadcast
+        if self._broadcast_task is not None:
+            try:
+                await asyncio.wait_for(self._broadcast_queue.join(), timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning(f"Dropping {self._broadcast_queue.qsize()} unsent alert broadcasts on shutdown")
+            self._broadcast_task.cancel()
+            self._broadcast_task = None
+        
         logger.info("Alert engine stopped")
     
-    async def queue_evaluation(self, instrument_id: int, market_data: MarketData) -> None:
+    async def queue_evaluation(
+        self,
+        instrument_id: int,
+        market_data: Union[MarketData, TickRecord]
+    ) -> None:
         """
         Queue market data for alert rule evaluation.
         
         Args:
             instrument_id: Instrument ID for evaluation.
-            market_data: Latest market data.
+            market_data: Latest market data (ORM record or ingestion tick record).
         """
         try:
             evaluation_data = {
@@ -295,45 +388,52 @@ class AlertEngine:
     
     async def _evaluation_loop(self) -> None:
         """
-        Background loop for processing alert rule evaluations.
+        Background loop dispatching queued evaluations to the workers.
         
-        Processes queued evaluations with batch processing and performance
-        optimization to meet sub-500ms latency targets.
+        Routes each tick to its instrument's worker without waiting, so a
+        slow shard never holds up the others, and applies rule changes
+        between dispatch rounds.
         """
-        batch_size = 50  # Process up to 50 evaluations per batch
-        batch_timeout = 0.1  # 100ms batch timeout for low latency
-        
         while self.is_running:
-            batch_evaluations = []
-            batch_start = asyncio.get_event_loop().time()
-            
             try:
-                # Collect batch evaluations
-                while (
-                    len(batch_evaluations) < batch_size and
-                    (asyncio.get_event_loop().time() - batch_start) < batch_timeout
-                ):
-                    try:
-                        evaluation = await asyncio.wait_for(
-                            self.evaluation_queue.get(),
-                            timeout=0.05  # 50ms timeout
-                        )
-                        batch_evaluations.append(evaluation)
-                    except asyncio.TimeoutError:
-                        break
+                try:
+                    evaluation = await asyncio.wait_for(
+                        self.evaluation_queue.get(),
+                        timeout=0.05  # 50ms timeout
+                    )
+                except asyncio.TimeoutError:
+                    evaluation = None
                 
-                # Process batch if we have evaluations
-                if batch_evaluations:
-                    await self._process_evaluation_batch(batch_evaluations)
+                while evaluation is not None:
+                    self._dispatch(evaluation)
+                    evaluation = None if self.evaluation_queue.empty() else self.evaluation_queue.get_nowait()
                 
-                # Refresh rules cache periodically
-                if self._should_refresh_cache():
-                    await self._refresh_rules_cache()
+                # Apply rule changes between dispatch rounds
+                if self._pending_rule_changes:
+                    await self._apply_rule_changes()
+                elif self._should_check_rules_version():
+                    await self._check_rules_version()
                     
             except Exception as e:
                 logger.error(f"Error in alert evaluation loop: {e}")
                 await asyncio.sleep(0.1)  # Brief pause on error
     
+    def _dispatch(self, evaluation: Dict[str, Any]) -> None:
+        """
+        Hand an evaluation to the worker owning its instrument.
+        
+        Args:
+            evaluation: Evaluation data from queue_evaluation.
+        """
+        worker = self.workers[shard_for(evaluation["instrument_id"], len(self.workers))]
+        if not worker.submit(evaluation):
+            logger.warning(f"Alert evaluation worker {worker.worker_id} queue full, dropping evaluation")
+    
+    @property
+    def is_idle(self) -> bool:
+        """Whether no evaluation is queued or in progress."""
+        return self.evaluation_queue.empty() and all(worker.idle for worker in self.workers)
+    
     @with_db_session
     @handle_db_errors("Evaluation batch processing")
     async def _process_evaluation_batch(self, session, batch_evaluations: List[Dict]) -> None:
@@ -345,13 +445,32 @@ class AlertEngine:
             batch_evaluations: List of evaluation data.
         """
         alerts_to_fire = []
+        self.latency.record_ticks("alert_queue", [eval_data["market_data"] for eval_data in batch_evaluations])
         
         for eval_data in batch_evaluations:
             instrument_id = eval_data["instrument_id"]
             market_data = eval_data["market_data"]
             
-            # Get active rules for this instrument
-            rules = self._active_rules_cache.get(instrument_id, [])
+            # ABOVE/BELOW thresholds: only rules crossed since the last tick
+            price = float(market_data.price) if market_data.price else None
+            for rule in self.threshold_index.crossed(instrument_id, price):
+                if not rule.is_in_cooldown():
+                    # Only firing disarms: a crossing during cooldown keeps the rule armed
+                    self.threshold_index.disarm(rule)
+                    alerts_to_fire.append((self._threshold_context(rule, price), market_data))
+            
+            # Crossovers: shared moving averages advance once per tick
+            for rule in self.crossovers.update(instrument_id, price):
+                if not rule.is_in_cooldown():
+                    alerts_to_fire.append((self._crossover_context(rule, price), market_data))
+            
+            # Multi-condition rules: shared predicates evaluated once per tick
+            for rule, met in self.multi_conditions.evaluate(instrument_id, price, market_data.volume):
+                if not rule.is_in_cooldown():
+                    alerts_to_fire.append((self._multi_condition_context(rule, price, met), market_data))
+            
+            # Remaining rule types are evaluated one by one
+            rules = self._scanned_rules_cache.get(instrument_id, [])
             
             # Evaluate each rule
             for rule in rules:
@@ -363,11 +482,122 @@ class AlertEngine:
                 alert_context = await self._evaluate_rule(rule, market_data, session)
                 
                 if alert_context:
-                    alerts_to_fire.append(alert_context)
+                    alerts_to_fire.append((alert_context, market_data))
+        
+        # Level rules (EQUALS, volume, rate-of-change) for the whole batch at once
+        ticks = [(eval_data["instrument_id"], eval_data["market_data"]) for eval_data in batch_evaluations]
+        batch_result = await self.batch_evaluator.evaluate_async(
+            ticks,
+            executor=self._process_pool,
+            min_offload_pairs=settings.ALERT_EVALUATION_PROCESS_POOL_MIN_PAIRS
+        )
+        self.evaluations_performed += batch_result.evaluations
+        
+        for hit in batch_result.hits:
+            if not hit.rule.is_in_cooldown():
+                alert_context = AlertContext(
+                    rule=hit.rule,
+                    current_price=hit.current_price,
+                    trigger_value=hit.trigger_value,
+                    evaluation_time_ms=batch_result.evaluation_time_ms,
+                    additional_data=hit.additional_data
+                )
+                alerts_to_fire.append((alert_context, ticks[hit.tick_index][1]))
+        
+        # Rate-of-change rules whose price window is still cold query the database
+        for tick_index, rule in batch_result.deferred:
+            if rule.is_in_cooldown():
+                continue
+            market_data = ticks[tick_index][1]
+            alert_context = await self._evaluate_rule(rule, market_data, session)
+            if alert_context:
+                alerts_to_fire.append((alert_context, market_data))
+        
+        self.latency.record_ticks("evaluation", [market_data for _, market_data in ticks])
+        
+        # Fire all triggered alerts as one write and one broadcast burst
+        if alerts_to_fire:
+            await self._fire_alerts(alerts_to_fire, session)
+    
+    def _threshold_context(self, rule: AlertRule, price: float) -> AlertContext:
+        """
+        Build the alert context for a threshold rule found by the index.
+        
+        Args:
+            rule: Crossed threshold rule.
+            price: Price that crossed the threshold.
+        
+        Returns:
+            AlertContext: Context for firing the rule.
+        """
+        threshold = float(rule.threshold)
+        return AlertContext(
+            rule=rule,
+            current_price=price,
+            trigger_value=price,
+            evaluation_time_ms=0,
+            additional_data={"threshold": threshold}
+        )
+    
+    def _crossover_context(self, rule: AlertRule, price: float) -> AlertContext:
+        """
+        Build the alert context for a crossover rule.
+        
+        Args:
+            rule: Crossed crossover rule.
+            price: Price of the tick that produced the crossing.
+        
+        Returns:
+            AlertContext: Context for firing the rule.
+        """
+        subject, reference = self.crossovers.current_values(rule, price)
+        return AlertContext(
+            rule=rule,
+            current_price=price,
+            trigger_value=subject,
+            evaluation_time_ms=0,
+            additional_data={
+                "moving_average": reference,
+                "moving_average_type": MovingAverageType(rule.moving_average_type or MovingAverageType.SMA).value,
+                "moving_average_period": rule.moving_average_period,
+                "slow_moving_average_period": rule.slow_moving_average_period,
+            }
+        )
+    
+    def _multi_condition_context(self, rule: AlertRule, price: float, met: List[str]) -> AlertContext:
+        """
+        Build the alert context for a multi-condition rule.
+        
+        Args:
+            rule: Triggered multi-condition rule.
+            price: Price of the tick that satisfied the expression.
+            met: Descriptions of the predicates that were met.
+        
+        Returns:
+            AlertContext: Context for firing the rule.
+        """
+        return AlertContext(
+            rule=rule,
+            current_price=price,
+            trigger_value=price,
+            evaluation_time_ms=0,
+            additional_data={"conditions_met": met}
+        )
+    
+    def _record_alert_latency(self, alert_context: AlertContext, market_data) -> None:
+        """
+        Record latency from tick receipt to alert trigger.
         
-        # Fire all triggered alerts
-        for alert_context in alerts_to_fire:
-            await self._fire_alert(alert_context, session)
+        Args:
+            alert_context: Triggered alert context.
+            market_data: Tick that triggered the alert.
+        """
+        if not market_data.timestamp:
+            return
+        
+        latency_ms = (alert_context.timestamp - market_data.timestamp).total_seconds() * 1000
+        self.total_alert_latency_ms += latency_ms
+        self.max_alert_latency_ms = max(self.max_alert_latency_ms, latency_ms)
     
     async def _evaluate_rule(
         self,
@@ -399,74 +629,175 @@ class AlertEngine:
         elif rule.rule_type == RuleType.VOLUME_SPIKE:
             return await self.evaluator.evaluate_volume_spike_rule(rule, current_volume, session)
         
-        # TODO: Implement crossover and multi-condition rules
+        # Crossovers need moving average history; CrossoverTracker evaluates them per tick
         elif rule.rule_type == RuleType.CROSSOVER:
-            logger.debug(f"Crossover rules not yet implemented for rule {rule.id}")
+            logger.debug(f"Crossover rule {rule.id} is evaluated incrementally, skipping")
             return None
         
+        # Multi-condition rules are compiled; MultiConditionEvaluator evaluates them per tick
         elif rule.rule_type == RuleType.MULTI_CONDITION:
-            logger.debug(f"Multi-condition rules not yet implemented for rule {rule.id}")
+            logger.debug(f"Multi-condition rule {rule.id} is evaluated from its compiled expression, skipping")
             return None
         
         return None
     
-    @handle_db_errors("Alert firing")
     async def _fire_alert(self, alert_context: AlertContext, session) -> None:
         """
-        Fire an alert and log the event.
+        Fire a single alert.
         
         Args:
             alert_context: Context data for the alert.
             session: Database session.
         """
-        rule = alert_context.rule
-    
-        # Create alert log entry
-        alert_log = AlertLog(
-            timestamp=alert_context.timestamp,
-            rule_id=rule.id,
-            instrument_id=rule.instrument_id,
-            trigger_value=alert_context.trigger_value,
-            threshold_value=float(rule.threshold),
-            fired_status=AlertStatus.FIRED,
-            delivery_status=DeliveryStatus.PENDING,
-            evaluation_time_ms=alert_context.evaluation_time_ms,
-            rule_condition=rule.condition.value,
-            alert_message=self._generate_alert_message(alert_context),
-        )
-    
-        session.add(alert_log)
-    
-        # Update rule last triggered time
-        rule.last_triggered = alert_context.timestamp
+        await self._fire_alerts([(alert_context, None)], session)
     
+    @handle_db_errors("Alert firing")
+    async def _fire_alerts(self, alerts: List[Tuple[AlertContext, Any]], session) -> None:
+        """
+        Fire a batch of triggered alerts.
+        
+        Cooldowns are applied to the cached rules immediately. Alert logs
+        and trigger times go to the database writer as one intent, and
+        broadcasts are queued for the broadcast task, so evaluation never
+        waits on database or socket I/O.
+        
+        Args:
+            alerts: (alert context, triggering tick) pairs in firing order.
+            session: Database session (used only when the writer is not running).
+        """
+        fired: List[AlertContext] = []
+        received: List[Optional[datetime]] = []
+        for alert_context, market_data in alerts:
+            rule = alert_context.rule
+            # A rule can trigger on several ticks of one batch
+            if rule.is_in_cooldown():
+                continue
+            
+            # Cached rule drives the cooldown
+            rule.last_triggered = alert_context.timestamp
+            fired.append(alert_context)
+            received.append(market_data.timestamp if market_data is not None else None)
+            if market_data is not None:
+                self._record_alert_latency(alert_context, market_data)
+        
+        if not fired:
+            return
+        
+        log_rows = [
+            dict(
+                timestamp=alert_context.timestamp,
+                rule_id=alert_context.rule.id,
+                instrument_id=alert_context.rule.instrument_id,
+                trigger_value=alert_context.trigger_value,
+                threshold_value=float(alert_context.rule.threshold),
+                fired_status=AlertStatus.FIRED,
+                delivery_status=DeliveryStatus.PENDING,
+                evaluation_time_ms=alert_context.evaluation_time_ms,
+                rule_condition=RuleCondition(alert_context.rule.condition).value,
+                alert_message=self._generate_alert_message(alert_context),
+            )
+            for alert_context in fired
+        ]
+        trigger_times = {
+            alert_context.rule.id: alert_context.timestamp for alert_context in fired
+        }
+        
+        async def write_alerts(write_session) -> None:
+            for fields in log_rows:
+                write_session.add(AlertLog(**fields))
+            # Keep updated_at: firing isn't a rule change for the version check
+            await write_session.execute(
+                update(AlertRule.__table__)
+                .where(AlertRule.__table__.c.id == bindparam("rule_id"))
+                .values(last_triggered=bindparam("triggered_at"), updated_at=AlertRule.__table__.c.updated_at),
+                [
+                    {"rule_id": rule_id, "triggered_at": triggered_at}
+                    for rule_id, triggered_at in trigger_times.items()
+                ]
+            )
+        
+        writer = get_database_writer()
+        if writer.is_running:
+            # Queue the batch; nothing here waits on the commit
+            await writer.submit(write_alerts, rows=len(log_rows), label=f"{len(log_rows)} alert logs")
+        else:
+            await write_alerts(session)
+        
         # Update performance metrics
-        self.alerts_fired += 1
-        self.total_evaluation_time_ms += alert_context.evaluation_time_ms
-        self.max_evaluation_time_ms = max(
-            self.max_evaluation_time_ms,
-            alert_context.evaluation_time_ms
+        self.alerts_fired += len(fired)
+        for alert_context in fired:
+            self.total_evaluation_time_ms += alert_context.evaluation_time_ms
+            self.max_evaluation_time_ms = max(
+                self.max_evaluation_time_ms,
+                alert_context.evaluation_time_ms
+            )
+        
+        # Hand broadcasts to the broadcast task
+        queued_at = datetime.utcnow()
+        for alert_context, fields, received_at in zip(fired, log_rows, received):
+            self.latency.record("fire", received_at, now=queued_at)
+            self._queue_alert_broadcast(alert_context, fields["alert_message"], received_at)
+        
+        logger.info(
+            f"Fired {len(fired)} alerts",
+            rule_ids=[alert_context.rule.id for alert_context in fired],
+            hot_path="alerts.fired"
         )
     
-        # Broadcast alert via WebSocket
-        await self.websocket_manager.broadcast_alert_fired(
-            rule_id=rule.id,
-            instrument_id=rule.instrument_id,
-            symbol=rule.instrument.symbol,  # Assuming instrument is loaded
-            trigger_value=alert_context.trigger_value,
-            threshold_value=float(rule.threshold),
-            condition=rule.condition.value,
-            timestamp=alert_context.timestamp,
-            evaluation_time_ms=alert_context.evaluation_time_ms
-        )
+    def _queue_alert_broadcast(
+        self,
+        alert_context: AlertContext,
+        message: str,
+        received_at: Optional[datetime] = None
+    ) -> None:
+        """
+        Queue an alert for WebSocket broadcast.
+        
+        Args:
+            alert_context: Fired alert context.
+            message: Alert message text.
+            received_at: Receive timestamp of the triggering tick, if known.
+        """
+        rule = alert_context.rule
+        broadcast = {
+            "rule_id": rule.id,
+            "instrument_id": rule.instrument_id,
+            "symbol": rule.instrument.symbol,  # Loaded with the rules cache
+            "trigger_value": alert_context.trigger_value,
+            "threshold_value": float(rule.threshold),
+            "condition": RuleCondition(rule.condition).value,
+            "timestamp": alert_context.timestamp,
+            "evaluation_time_ms": alert_context.evaluation_time_ms,
+            "rule_name": rule.name,
+            "message": message,
+        }
+        try:
+            self._broadcast_queue.put_nowait((broadcast, received_at))
+        except asyncio.QueueFull:
+            self.broadcasts_dropped += 1
+            logger.warning(f"Alert broadcast queue full, dropping broadcast for rule {rule.id}")
     
-        logger.info(
-            f"Alert fired for rule {rule.id}: {rule.instrument.symbol} "
-            f"{rule.condition.value} {rule.threshold} (actual: {alert_context.trigger_value})",
-            rule_id=rule.id,
-            instrument_symbol=rule.instrument.symbol,
-            evaluation_time_ms=alert_context.evaluation_time_ms
-        )
+    async def _broadcast_loop(self) -> None:
+        """
+        Background task sending queued alert broadcasts.
+        
+        Drains everything queued since the last pass in one burst, so a
+        market-wide spike of alerts doesn't hold up evaluation.
+        """
+        while True:
+            broadcasts = [await self._broadcast_queue.get()]
+            while not self._broadcast_queue.empty():
+                broadcasts.append(self._broadcast_queue.get_nowait())
+            
+            for broadcast, received_at in broadcasts:
+                try:
+                    await self.websocket_manager.broadcast_alert_fired(**broadcast)
+                    self.latency.record("broadcast", received_at)
+                except Exception as e:
+                    logger.error(f"Alert broadcast failed for rule {broadcast['rule_id']}: {e}")
+                finally:
+                    self._broadcast_queue.task_done()
+            self.broadcast_batches += 1
     
     def _generate_alert_message(self, alert_context: AlertContext) -> str:
         """
@@ -483,12 +814,12 @@ class AlertEngine:
         if rule.name:
             base_msg = f"Alert: {rule.name}"
         else:
-            base_msg = f"Alert: {rule.instrument.symbol} {rule.rule_type.value}"
+            base_msg = f"Alert: {rule.instrument.symbol} {RuleType(rule.rule_type).value}"
         
         if rule.rule_type == RuleType.THRESHOLD:
             return (
                 f"{base_msg} - Price {alert_context.current_price} "
-                f"{rule.condition.value} threshold {rule.threshold}"
+                f"{RuleCondition(rule.condition).value} threshold {rule.threshold}"
             )
         elif rule.rule_type == RuleType.RATE_OF_CHANGE:
             pct_change = alert_context.additional_data.get("percent_change", 0)
@@ -501,6 +832,19 @@ class AlertEngine:
                 f"{base_msg} - Volume {alert_context.trigger_value} "
                 f"above threshold {rule.threshold}"
             )
+        elif rule.rule_type == RuleType.CROSSOVER:
+            data = alert_context.additional_data
+            average = f"{data['moving_average_period']}-period {data['moving_average_type'].upper()}"
+            if rule.slow_moving_average_period:
+                subject = average
+                average = f"{rule.slow_moving_average_period}-period {data['moving_average_type'].upper()}"
+            else:
+                subject = f"Price {alert_context.current_price}"
+            direction = "above" if rule.condition == RuleCondition.CROSSES_ABOVE else "below"
+            return f"{base_msg} - {subject} crossed {direction} {average} ({data['moving_average']:.4f})"
+        elif rule.rule_type == RuleType.MULTI_CONDITION:
+            met = "; ".join(alert_context.additional_data.get("conditions_met", []))
+            return f"{base_msg} - Conditions met at price {alert_context.current_price}: {met}"
         
         return f"{base_msg} - Triggered at {alert_context.timestamp}"
     
@@ -508,8 +852,11 @@ class AlertEngine:
     @handle_db_errors("Rules cache refresh")
     async def _refresh_rules_cache(self, session) -> None:
         """
-        Refresh the active rules cache for performance optimization.
+        Reload the active rules cache from the database.
         """
+        # Changes published before this read are included in it
+        self._pending_rule_changes.clear()
+        
         # Get all active rules grouped by instrument
         result = await session.execute(
             select(AlertRule)
@@ -527,8 +874,10 @@ class AlertEngine:
                 rules_by_instrument[rule.instrument_id] = []
             rules_by_instrument[rule.instrument_id].append(rule)
         
-        self._active_rules_cache = rules_by_instrument
-        self._cache_last_updated = datetime.utcnow()
+        self._rules_version = await self._fetch_rules_version(session)
+        self._version_checked_at = datetime.utcnow()
+        self.full_reloads += 1
+        self._rebuild_rules_indexes(rules_by_instrument)
         
         total_rules = sum(len(rules) for rules in rules_by_instrument.values())
         logger.debug(
@@ -536,15 +885,118 @@ class AlertEngine:
             f"{len(rules_by_instrument)} instruments"
         )
     
-    def _should_refresh_cache(self) -> bool:
+    def _rebuild_rules_indexes(self, rules_by_instrument: Dict[int, List[AlertRule]]) -> None:
+        """
+        Install a rules cache and rebuild the evaluation structures from it.
+        
+        No database access; evaluation state (last prices, moving averages,
+        expression values) carries over for rules that are still present.
+        
+        Args:
+            rules_by_instrument: Active rules grouped by instrument ID.
+        """
+        self._active_rules_cache = rules_by_instrument
+        remaining = self.multi_conditions.build(self.threshold_index.build(rules_by_instrument))
+        remaining = self.crossovers.build(remaining, self.multi_conditions.crossover_pairs)
+        self._scanned_rules_cache = self.batch_evaluator.build(remaining)
+        self._cache_last_updated = datetime.utcnow()
+        
+        # Size price windows to the longest rate-of-change window per instrument
+        horizons: Dict[int, float] = dict(self.multi_conditions.horizons)
+        for instrument_id, rules in rules_by_instrument.items():
+            for rule in rules:
+                if rule.rule_type == RuleType.RATE_OF_CHANGE and rule.time_window_seconds:
+                    horizons[instrument_id] = max(
+                        horizons.get(instrument_id, 0), rule.time_window_seconds
+                    )
+        self.evaluator.price_windows.configure(horizons)
+    
+    def _on_rule_change(self, event: RuleChangeEvent) -> None:
+        """
+        Record a rule change published by the rules API.
+        
+        Changes are applied by the dispatch loop; the in-memory rebuild is
+        synchronous, so every tick sees one consistent set of rules.
+        
+        Args:
+            event: Rule change event.
+        """
+        self._pending_rule_changes[event.rule_id] = event.action
+    
+    @with_db_session
+    @handle_db_errors("Rule change application")
+    async def _apply_rule_changes(self, session) -> None:
+        """
+        Patch the rules cache with pending rule changes.
+        
+        Only the changed rules are read from the database.
+        """
+        changes = self._pending_rule_changes
+        self._pending_rule_changes = {}
+        
+        upserted_ids = [rule_id for rule_id, action in changes.items() if action == RuleChangeAction.UPSERTED]
+        loaded: List[AlertRule] = []
+        if upserted_ids:
+            result = await session.execute(
+                select(AlertRule)
+                .where(AlertRule.id.in_(upserted_ids), AlertRule.active == True)
+                .options(selectinload(AlertRule.instrument))
+            )
+            loaded = result.scalars().all()
+        
+        rules_by_instrument: Dict[int, List[AlertRule]] = {}
+        for instrument_id, rules in self._active_rules_cache.items():
+            kept = [rule for rule in rules if rule.id not in changes]
+            if kept:
+                rules_by_instrument[instrument_id] = kept
+        for rule in loaded:
+            rules_by_instrument.setdefault(rule.instrument_id, []).append(rule)
+        
+        self._rebuild_rules_indexes(rules_by_instrument)
+        self._rules_version = await self._fetch_rules_version(session)
+        self._version_checked_at = datetime.utcnow()
+        self.rule_changes_applied += len(changes)
+        
+        logger.debug(f"Applied {len(changes)} rule changes to the rules cache")
+    
+    async def _fetch_rules_version(self, session) -> Tuple:
+        """
+        Get a cheap signature of the alert rules table.
+        
+        Args:
+            session: Database session.
+        
+        Returns:
+            Tuple: Rule count and latest update time.
+        """
+        result = await session.execute(
+            select(func.count(AlertRule.id), func.max(AlertRule.updated_at))
+        )
+        return tuple(result.one())
+    
+    @with_db_session
+    @handle_db_errors("Rules version check")
+    async def _check_rules_version(self, session) -> None:
+        """
+        Reload the rules cache if the rules table changed outside the API.
+        """
+        self._version_checked_at = datetime.utcnow()
+        version = await self._fetch_rules_version(session)
+        if version == self._rules_version:
+            return
+        
+        logger.info("Alert rules changed outside the rules API, reloading rules cache")
+        await self._refresh_rules_cache()
+    
+    def _should_check_rules_version(self) -> bool:
         """
-        Check if rules cache should be refreshed.
+        Check if the rules table version is due for a check.
         
         Returns:
-            bool: True if cache needs refresh.
+            bool: True if the version check interval has elapsed.
         """
-        cache_age = (datetime.utcnow() - self._cache_last_updated).total_seconds()
-        return cache_age > self._cache_ttl
+        elapsed = (datetime.utcnow() - self._version_checked_at).total_seconds()
+        return elapsed > self._version_check_interval
     
     async def _flush_evaluation_queue(self) -> None:
         """Process all remaining evaluations in queue during shutdown."""
@@ -582,7 +1034,24 @@ class AlertEngine:
             "alerts_fired": self.alerts_fired,
             "avg_evaluation_time_ms": round(avg_evaluation_time, 2),
             "max_evaluation_time_ms": self.max_evaluation_time_ms,
-            "queue_size": self.evaluation_queue.qsize(),
+            "avg_alert_latency_ms": round(
+                self.total_alert_latency_ms / max(self.alerts_fired, 1), 2
+            ),
+            "max_alert_latency_ms": round(self.max_alert_latency_ms, 2),
+            "pipeline_latency": self.latency.get_stats(),
+            "queue_size": self.evaluation_queue.qsize() + sum(worker.queue.qsize() for worker in self.workers),
+            "workers": [worker.get_stats() for worker in self.workers],
+            "offloaded_batches": self.batch_evaluator.offloaded_batches,
+            "broadcast_queue_size": self._broadcast_queue.qsize(),
+            "broadcast_batches": self.broadcast_batches,
+            "broadcasts_dropped": self.broadcasts_dropped,
             "active_rules_cached": sum(len(rules) for rules in self._active_rules_cache.values()),
             "cache_last_updated": self._cache_last_updated.isoformat(),
+            "rule_changes_applied": self.rule_changes_applied,
+            "full_reloads": self.full_reloads,
+            "price_windows": self.evaluator.price_windows.get_stats(),
+            "threshold_index": self.threshold_index.get_stats(),
+            "vectorized_rules": self.batch_evaluator.rule_count,
+            "crossovers": self.crossovers.get_stats(),
+            "multi_conditions": self.multi_conditions.get_stats(),
         }
\ No newline at end of file
@@ -0,0 +1,345 @@
+"""
+Vectorized Batch Rule Evaluation.
+
+Evaluates level-style alert rules (EQUALS thresholds, volume spikes and
+rate-of-change) for a whole tick batch with NumPy. Cached rules are laid
+out as flat arrays grouped by instrument; a batch expands into (tick, rule)
+pairs, every trigger is computed in a handful of array operations, and
+Python objects are only built for the hits. Very large batches can have
+the array computation run in a process pool.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from ..models.alert_rules import AlertRule, RuleCondition, RuleType
+from .price_windows import PriceWindowStore, get_price_windows
+
+# Rule kind codes
+KIND_EQUALS = 0
+KIND_VOLUME_ABOVE = 1
+KIND_ROC_UP = 2
+KIND_ROC_DOWN = 3
+
+# Price tolerance for EQUALS thresholds (matches RuleEvaluator)
+EQUALS_TOLERANCE = 0.01
+
+
+def rule_kind(rule: AlertRule) -> Optional[int]:
+    """
+    Get the vectorized kind code for a rule.
+
+    Args:
+        rule: Alert rule
+
+    Returns:
+        Optional[int]: Kind code, or None if the rule isn't vectorized
+    """
+    if rule.rule_type == RuleType.THRESHOLD and rule.condition == RuleCondition.EQUALS:
+        return KIND_EQUALS
+    if rule.rule_type == RuleType.VOLUME_SPIKE and rule.condition == RuleCondition.VOLUME_ABOVE:
+        return KIND_VOLUME_ABOVE
+    if rule.rule_type == RuleType.RATE_OF_CHANGE and rule.time_window_seconds:
+        if rule.condition == RuleCondition.PERCENT_CHANGE_UP:
+            return KIND_ROC_UP
+        if rule.condition == RuleCondition.PERCENT_CHANGE_DOWN:
+            return KIND_ROC_DOWN
+    return None
+
+
+class BatchHit(NamedTuple):
+    """A triggered (tick, rule) pair."""
+    rule: AlertRule
+    tick_index: int
+    current_price: float
+    trigger_value: float
+    additional_data: Dict[str, Any]
+
+
+@dataclass
+class BatchResult:
+    """Outcome of evaluating one tick batch."""
+    hits: List[BatchHit] = field(default_factory=list)
+    deferred: List[Tuple[int, AlertRule]] = field(default_factory=list)  # Need a DB lookup
+    evaluations: int = 0
+    evaluation_time_ms: int = 0
+
+
+class _Pairs(NamedTuple):
+    """Per-(tick, rule) arrays for one batch."""
+    tick_index: np.ndarray
+    rule_index: np.ndarray
+    kind: np.ndarray
+    price: np.ndarray
+    volume: np.ndarray
+    threshold: np.ndarray
+    base: np.ndarray  # Rate-of-change window start price (NaN when unknown)
+    needs_db: np.ndarray
+    start_time: float
+
+
+def compute_hits(
+    kind: np.ndarray,
+    price: np.ndarray,
+    volume: np.ndarray,
+    threshold: np.ndarray,
+    base: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute which (tick, rule) pairs trigger.
+
+    Pure array function so it can run in a process pool.
+
+    Args:
+        kind: Rule kind code per pair
+        price: Tick price per pair
+        volume: Tick volume per pair
+        threshold: Rule threshold per pair
+        base: Rate-of-change window start price per pair
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Hit mask and percent change per pair
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct_change = (price - base) / base * 100
+
+    hit = (
+        ((kind == KIND_EQUALS) & (np.abs(price - threshold) < EQUALS_TOLERANCE)) |
+        ((kind == KIND_VOLUME_ABOVE) & (volume > 0) & (volume > threshold)) |
+        ((kind == KIND_ROC_UP) & (pct_change >= threshold)) |
+        ((kind == KIND_ROC_DOWN) & (pct_change <= -threshold))
+    )
+    return hit, pct_change
+
+
+class BatchRuleEvaluator:
+    """
+    NumPy evaluator for level-style rules across a tick batch.
+
+    Rate-of-change base prices come from the in-memory price windows,
+    looked up once per rule per batch. Pairs whose window doesn't yet cover
+    the rule window are returned as deferred for the per-rule path, which
+    falls back to the database.
+    """
+
+    def __init__(self, price_windows: Optional[PriceWindowStore] = None):
+        self.price_windows = price_windows or get_price_windows()
+
+        self._rules: List[AlertRule] = []
+        self._ranges: Dict[int, Tuple[int, int]] = {}
+        self._thresholds = np.empty(0, dtype=np.float64)
+        self._kinds = np.empty(0, dtype=np.int8)
+        self._windows = np.empty(0, dtype=np.float64)
+        self._instrument_ids = np.empty(0, dtype=np.int64)
+        self.offloaded_batches = 0
+
+    def build(self, rules_by_instrument: Dict[int, List[AlertRule]]) -> Dict[int, List[AlertRule]]:
+        """
+        Lay out vectorizable rules as arrays.
+
+        Args:
+            rules_by_instrument: Active rules grouped by instrument ID
+
+        Returns:
+            Dict[int, List[AlertRule]]: Rules not handled here, by instrument
+        """
+        rules: List[AlertRule] = []
+        kinds: List[int] = []
+        ranges: Dict[int, Tuple[int, int]] = {}
+        remaining: Dict[int, List[AlertRule]] = {}
+
+        for instrument_id, instrument_rules in rules_by_instrument.items():
+            start = len(rules)
+            for rule in instrument_rules:
+                kind = rule_kind(rule)
+                if kind is None:
+                    remaining.setdefault(instrument_id, []).append(rule)
+                else:
+                    rules.append(rule)
+                    kinds.append(kind)
+            if len(rules) > start:
+                ranges[instrument_id] = (start, len(rules))
+
+        self._rules = rules
+        self._ranges = ranges
+        self._thresholds = np.array([float(rule.threshold) for rule in rules], dtype=np.float64)
+        self._kinds = np.array(kinds, dtype=np.int8)
+        self._windows = np.array([rule.time_window_seconds or 0 for rule in rules], dtype=np.float64)
+        self._instrument_ids = np.array([rule.instrument_id for rule in rules], dtype=np.int64)
+        return remaining
+
+    @property
+    def rule_count(self) -> int:
+        """Number of vectorized rules."""
+        return len(self._rules)
+
+    def evaluate(self, ticks: List[Tuple[int, Any]], now: Optional[datetime] = None) -> BatchResult:
+        """
+        Evaluate all vectorized rules against a tick batch.
+
+        Args:
+            ticks: (instrument_id, market data) pairs; market data needs
+                price and volume attributes
+            now: Evaluation time for rate-of-change windows (defaults to UTC now)
+
+        Returns:
+            BatchResult: Hits, deferred pairs and evaluation count
+        """
+        pairs = self._expand(ticks, now)
+        if pairs is None:
+            return BatchResult()
+        hit, pct_change = compute_hits(pairs.kind, pairs.price, pairs.volume, pairs.threshold, pairs.base)
+        return self._collect(pairs, hit, pct_change)
+
+    async def evaluate_async(
+        self,
+        ticks: List[Tuple[int, Any]],
+        now: Optional[datetime] = None,
+        executor: Optional[Executor] = None,
+        min_offload_pairs: int = 20000
+    ) -> BatchResult:
+        """
+        Evaluate a tick batch, computing large batches in an executor.
+
+        Pair expansion and hit collection stay in-process; only the
+        trigger computation is shipped, so a process pool spreads big
+        batches across cores without sharing rule or window state.
+
+        Args:
+            ticks: (instrument_id, market data) pairs
+            now: Evaluation time for rate-of-change windows (defaults to UTC now)
+            executor: Executor for compute_hits (e.g. a ProcessPoolExecutor)
+            min_offload_pairs: Smallest (tick, rule) pair count worth offloading
+
+        Returns:
+            BatchResult: Hits, deferred pairs and evaluation count
+        """
+        pairs = self._expand(ticks, now)
+        if pairs is None:
+            return BatchResult()
+
+        args = (pairs.kind, pairs.price, pairs.volume, pairs.threshold, pairs.base)
+        if executor is not None and len(pairs.kind) >= min_offload_pairs:
+            hit, pct_change = await asyncio.get_running_loop().run_in_executor(executor, compute_hits, *args)
+            self.offloaded_batches += 1
+        else:
+            hit, pct_change = compute_hits(*args)
+        return self._collect(pairs, hit, pct_change)
+
+    def _expand(self, ticks: List[Tuple[int, Any]], now: Optional[datetime]) -> Optional["_Pairs"]:
+        """
+        Expand a tick batch into one row per (tick, rule) pair.
+
+        Returns:
+            Optional[_Pairs]: Pair arrays, or None if no rule applies
+        """
+        if not self._rules or not ticks:
+            return None
+
+        start_time = time.perf_counter()
+        tick_count = len(ticks)
+        starts = np.zeros(tick_count, dtype=np.int64)
+        counts = np.zeros(tick_count, dtype=np.int64)
+        prices = np.zeros(tick_count, dtype=np.float64)
+        volumes = np.zeros(tick_count, dtype=np.float64)
+
+        for position, (instrument_id, market_data) in enumerate(ticks):
+            bounds = self._ranges.get(instrument_id)
+            if bounds is not None:
+                starts[position] = bounds[0]
+                counts[position] = bounds[1] - bounds[0]
+            prices[position] = float(market_data.price) if market_data.price else 0.0
+            volumes[position] = float(market_data.volume) if market_data.volume else 0.0
+
+        total = int(counts.sum())
+        if total == 0:
+            return None
+
+        tick_index = np.repeat(np.arange(tick_count), counts)
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        rule_index = np.repeat(starts, counts) + offsets
+        kind = self._kinds[rule_index]
+
+        is_roc = kind >= KIND_ROC_UP
+        base, needs_db = self._base_prices(np.unique(rule_index[is_roc]), now or datetime.utcnow())
+
+        return _Pairs(
+            tick_index=tick_index,
+            rule_index=rule_index,
+            kind=kind,
+            price=prices[tick_index],
+            volume=volumes[tick_index],
+            threshold=self._thresholds[rule_index],
+            base=base[rule_index],
+            needs_db=needs_db[rule_index],
+            start_time=start_time,
+        )
+
+    def _collect(self, pairs: "_Pairs", hit: np.ndarray, pct_change: np.ndarray) -> BatchResult:
+        """Build the batch result from the hit mask."""
+        result = BatchResult(evaluations=len(pairs.kind))
+
+        for pair in np.flatnonzero(hit):
+            rule = self._rules[pairs.rule_index[pair]]
+            pair_kind = pairs.kind[pair]
+            tick_index = int(pairs.tick_index[pair])
+            price = float(pairs.price[pair])
+            if pair_kind == KIND_EQUALS:
+                result.hits.append(BatchHit(
+                    rule, tick_index, price, price,
+                    {"threshold": float(pairs.threshold[pair])}
+                ))
+            elif pair_kind == KIND_VOLUME_ABOVE:
+                result.hits.append(BatchHit(
+                    rule, tick_index, 0.0, float(pairs.volume[pair]),
+                    {"volume_threshold": float(pairs.threshold[pair])}
+                ))
+            else:
+                result.hits.append(BatchHit(
+                    rule, tick_index, price, float(pct_change[pair]),
+                    {
+                        "historical_price": float(pairs.base[pair]),
+                        "percent_change": float(pct_change[pair]),
+                        "time_window_seconds": rule.time_window_seconds,
+                    }
+                ))
+
+        for pair in np.flatnonzero(pairs.needs_db):
+            result.deferred.append((int(pairs.tick_index[pair]), self._rules[pairs.rule_index[pair]]))
+
+        result.evaluation_time_ms = int((time.perf_counter() - pairs.start_time) * 1000)
+        return result
+
+    def _base_prices(self, roc_rules: np.ndarray, now: datetime) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Look up window start prices for rate-of-change rules.
+
+        Args:
+            roc_rules: Indices of rate-of-change rules in this batch
+            now: Evaluation time
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Base price per rule (NaN when
+                unknown) and mask of rules needing a database lookup
+        """
+        base = np.full(len(self._rules), np.nan)
+        needs_db = np.zeros(len(self._rules), dtype=bool)
+
+        for index in roc_rules:
+            window = self.price_windows.get(int(self._instrument_ids[index]))
+            cutoff = now - timedelta(seconds=float(self._windows[index]))
+            if window is not None and window.covers(cutoff):
+                self.price_windows.memory_hits += 1
+                price = window.first_at_or_after(cutoff)
+                if price:
+                    base[index] = price
+            else:
+                needs_db[index] = True
+
+        return base, needs_db
@@ -0,0 +1,213 @@
+"""
+Per-Key Conflating Queue.
+
+Keyed asyncio queue with a bounded slot per key (one per symbol for market
+data) and an explicit backpressure policy, so a hot symbol cannot crowd an
+illiquid symbol's only update out of a shared FIFO.
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from operator import attrgetter
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+
+class BackpressurePolicy(str, Enum):
+    """Behaviour when a key's slot is full."""
+    CONFLATE = "conflate"        # Replace the newest pending item (latest value wins)
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest pending item for the key
+    BLOCK = "block"              # Producer waits for space (put_nowait raises QueueFull)
+
+
+@dataclass
+class KeyStats:
+    """Per-key queue counters."""
+    enqueued: int = 0
+    dequeued: int = 0
+    conflated: int = 0
+    dropped: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert counters to dictionary."""
+        return {
+            "enqueued": self.enqueued,
+            "dequeued": self.dequeued,
+            "conflated": self.conflated,
+            "dropped": self.dropped,
+        }
+
+
+class ConflatingQueue:
+    """
+    Keyed queue with per-key slots and round-robin dequeue.
+
+    Keys with pending items are served in round-robin order, so every key
+    gets a turn regardless of how fast other keys are produced.
+    """
+
+    def __init__(
+        self,
+        policy: BackpressurePolicy = BackpressurePolicy.CONFLATE,
+        depth_per_key: int = 1,
+        key_func: Callable[[Any], Hashable] = attrgetter("symbol")
+    ):
+        if depth_per_key < 1:
+            raise ValueError("depth_per_key must be at least 1")
+
+        self.policy = BackpressurePolicy(policy)
+        self.depth_per_key = depth_per_key
+        self._key_func = key_func
+
+        self._slots: Dict[Hashable, Deque[Any]] = {}
+        self._ready: Deque[Hashable] = deque()  # Keys with pending items, each once
+        self._size = 0
+        self._stats: Dict[Hashable, KeyStats] = {}
+
+        self._has_items = asyncio.Event()
+        self._space_available = asyncio.Event()
+
+    def qsize(self) -> int:
+        """Number of pending items across all keys."""
+        return self._size
+
+    def empty(self) -> bool:
+        """Whether no items are pending."""
+        return self._size == 0
+
+    def _key_stats(self, key: Hashable) -> KeyStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = KeyStats()
+        return stats
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Enqueue an item, applying the backpressure policy if its slot is full.
+
+        Args:
+            item: Item to enqueue.
+
+        Raises:
+            asyncio.QueueFull: Slot full under the BLOCK policy.
+        """
+        key = self._key_func(item)
+        stats = self._key_stats(key)
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._slots[key] = deque()
+
+        if len(slot) >= self.depth_per_key:
+            if self.policy == BackpressurePolicy.CONFLATE:
+                slot[-1] = item
+                stats.conflated += 1
+                return
+            if self.policy == BackpressurePolicy.DROP_OLDEST:
+                slot.popleft()
+                slot.append(item)
+                stats.dropped += 1
+                return
+            stats.dropped += 1
+            raise asyncio.QueueFull
+
+        if not slot:
+            self._ready.append(key)
+        slot.append(item)
+        self._size += 1
+        stats.enqueued += 1
+        self._has_items.set()
+
+    async def put(self, item: Any) -> None:
+        """
+        Enqueue an item, waiting for slot space under the BLOCK policy.
+
+        Args:
+            item: Item to enqueue.
+        """
+        if self.policy == BackpressurePolicy.BLOCK:
+            key = self._key_func(item)
+            while len(self._slots.get(key, ())) >= self.depth_per_key:
+                self._space_available.clear()
+                await self._space_available.wait()
+        self.put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        """
+        Dequeue the next item in round-robin key order.
+
+        Returns:
+            Any: Next pending item.
+
+        Raises:
+            asyncio.QueueEmpty: No items pending.
+        """
+        if not self._ready:
+            raise asyncio.QueueEmpty
+
+        key = self._ready.popleft()
+        slot = self._slots[key]
+        item = slot.popleft()
+        if slot:
+            self._ready.append(key)
+
+        self._size -= 1
+        self._stats[key].dequeued += 1
+        if not self._size:
+            self._has_items.clear()
+        self._space_available.set()
+        return item
+
+    async def get(self) -> Any:
+        """
+        Dequeue the next item, waiting until one is available.
+
+        Returns:
+            Any: Next pending item.
+        """
+        while not self._ready:
+            await self._has_items.wait()
+        return self.get_nowait()
+
+    def drain(self) -> List[Any]:
+        """
+        Remove and return every pending item.
+
+        Returns:
+            List: Pending items in round-robin order.
+        """
+        items = []
+        while self._ready:
+            items.append(self.get_nowait())
+        return items
+
+    def key_stats(self, key: Hashable) -> Optional[Dict[str, int]]:
+        """
+        Get counters for a single key.
+
+        Args:
+            key: Queue key (symbol).
+
+        Returns:
+            Optional[Dict]: Counters or None if the key was never seen.
+        """
+        stats = self._stats.get(key)
+        return stats.to_dict() if stats else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Dict: Policy, depth, totals and per-key counters.
+        """
+        per_key = {str(key): stats.to_dict() for key, stats in self._stats.items()}
+        return {
+            "policy": self.policy.value,
+            "depth_per_key": self.depth_per_key,
+            "size": self._size,
+            "keys": len(self._stats),
+            "conflated": sum(stats.conflated for stats in self._stats.values()),
+            "dropped": sum(stats.dropped for stats in self._stats.values()),
+            "per_key": per_key,
+        }
@@ -6,22 +6,48 @@ validation, and storage in SQLite database with sub-second processing targets.
 """
 
 import asyncio
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 import structlog
-from sqlalchemy import select, update
+from sqlalchemy import case, insert, select, update
 
 from ..config import settings, get_all_instruments
 from ..database.connection import get_db_session
 from ..database.decorators import with_db_session, handle_db_errors
+from ..database.writer import execute_write
 from ..integrations.schwab_client import SchwabRealTimeClient, SchwabAPIError
-from ..models.instruments import Instrument, InstrumentStatus
+from ..integrations.schwab_simulator import SimulatedSchwabClient
+from ..logging_config import register_hot_path
+from ..models.instruments import Instrument, InstrumentStatus, InstrumentType
 from ..models.market_data import MarketData
 from ..websocket.realtime import get_websocket_manager
+from .conflating_queue import ConflatingQueue
+from .last_value_cache import get_last_value_cache
+from .pipeline_latency import get_pipeline_latency
+from .price_windows import get_price_windows
+from .tick_journal import TickJournal
+from .tick_normalizer import TickNormalizer, TickRecord
 
 logger = structlog.get_logger()
 
+# Per-tick and per-batch log call sites (sampled and summarized, see logging_config)
+register_hot_path("ingestion.normalized", label="ticks normalized")
+register_hot_path("ingestion.callback", label="market data callbacks")
+register_hot_path("ingestion.queued", label="ticks queued")
+register_hot_path("ingestion.batch", label="batches started")
+register_hot_path("ingestion.broadcast", label="ticks broadcast")
+register_hot_path("ingestion.batch_complete", label="batches persisted")
+
+# SQLite (>= 3.32) allows up to 32766 bound parameters per statement
+_SQLITE_MAX_VARIABLES = 32766
+_MARKET_DATA_COLUMNS = 11
+_MAX_ROWS_PER_INSERT = _SQLITE_MAX_VARIABLES // _MARKET_DATA_COLUMNS
+
+# Seconds stop() waits for an in-flight batch before cancelling the processing loop
+_PROCESSING_STOP_TIMEOUT = 10.0
+
 
 class DataNormalizer:
     """
@@ -159,7 +185,15 @@ class DataNormalizer:
             if normalized["volume"] is None:
                 normalized["volume"] = 0
             
-            logger.info(f"✅ Successfully normalized data for {symbol}: price={normalized['price']}, volume={normalized['volume']}, bid={normalized['bid']}, ask={normalized['ask']}")
+            logger.info(
+                "✅ Successfully normalized data",
+                symbol=symbol,
+                price=normalized["price"],
+                volume=normalized["volume"],
+                bid=normalized["bid"],
+                ask=normalized["ask"],
+                hot_path="ingestion.normalized"
+            )
             return normalized
             
         except (ValueError, TypeError, KeyError) as e:
@@ -176,22 +210,63 @@ class DataIngestionService:
     """
     
     def __init__(self):
-        self.schwab_client = SchwabRealTimeClient()
+        self.schwab_client = (
+            SimulatedSchwabClient.from_settings()
+            if settings.SCHWAB_SIMULATOR_ENABLED
+            else SchwabRealTimeClient()
+        )
         self.normalizer = DataNormalizer()
+        self.tick_normalizer = TickNormalizer()
         self.websocket_manager = get_websocket_manager()
+        self.price_windows = get_price_windows()
+        self.last_values = get_last_value_cache()
+        self.latency = get_pipeline_latency()
         self.alert_engine = None  # Will be injected during startup
         
         # Service state
         self.is_running = False
         self.instruments_map: Dict[str, int] = {}
         
+        # Ticks dropped for symbols with no active instrument (warned once per symbol)
+        self.unknown_symbol_ticks = 0
+        self._unknown_symbols: Set[str] = set()
+        
         # Performance monitoring
         self.ticks_processed = 0
         self.last_tick_time: Optional[datetime] = None
         self.processing_errors = 0
         
-        # Data processing queue
-        self.data_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        # Batch write throughput (rows/sec including commit)
+        self.rows_written = 0
+        self.write_time_seconds = 0.0
+        self.last_batch_rows_per_second = 0.0
+        
+        # Data processing queue (one slot per symbol, policy applied when full)
+        self.data_queue = ConflatingQueue(
+            policy=settings.DATA_INGESTION_QUEUE_POLICY,
+            depth_per_key=settings.DATA_INGESTION_QUEUE_DEPTH_PER_SYMBOL
+        )
+        
+        # Tick journal written ahead of the database (opened on start)
+        self.tick_journal: Optional[TickJournal] = None
+        if settings.TICK_JOURNAL_ENABLED:
+            self.tick_journal = TickJournal(
+                settings.TICK_JOURNAL_DIR,
+                segment_records=settings.TICK_JOURNAL_SEGMENT_RECORDS,
+                max_segments=settings.TICK_JOURNAL_MAX_SEGMENTS,
+                fsync=settings.TICK_JOURNAL_FSYNC
+            )
+        
+        # Batches whose database write failed: (first seq, last seq, ticks),
+        # seqs None when the batch never made it into the journal
+        self._failed_batches: List[Tuple[Optional[int], Optional[int], List[TickRecord]]] = []
+        
+        # Last raw message normalized (callbacks may repeat a message per symbol)
+        self._last_raw_message: Optional[Dict[str, Any]] = None
+        
+        # Background tasks (awaited or cancelled on stop)
+        self._processing_task: Optional[asyncio.Task] = None
+        self._monitor_task: Optional[asyncio.Task] = None
     
     def set_alert_engine(self, alert_engine) -> None:
         """
@@ -219,6 +294,16 @@ class DataIngestionService:
             # Load instrument mapping from database
             await self._load_instruments_mapping()
             
+            # Simulated symbols need instruments or their ticks are dropped
+            if isinstance(self.schwab_client, SimulatedSchwabClient):
+                padding = self.schwab_client.padding_symbols(list(self.instruments_map))
+                if padding:
+                    await self._register_simulated_instruments(padding)
+                    await self._load_instruments_mapping()
+            
+            # Persist ticks journaled but never committed before the last shutdown
+            await self._replay_tick_journal()
+            
             # Set up Schwab client callback
             self.schwab_client.set_data_callback(self._handle_market_data)
             
@@ -229,8 +314,8 @@ class DataIngestionService:
             if await self.schwab_client.start_streaming(target_symbols):
                 # Start background data processing
                 self.is_running = True
-                asyncio.create_task(self._data_processing_loop())
-                asyncio.create_task(self._connection_monitor())
+                self._processing_task = asyncio.create_task(self._data_processing_loop())
+                self._monitor_task = asyncio.create_task(self._connection_monitor())
                 
                 logger.info(f"Data ingestion service started for {len(target_symbols)} instruments: {target_symbols}")
             else:
@@ -239,8 +324,30 @@ class DataIngestionService:
         except Exception as e:
             logger.error(f"Failed to start data ingestion service: {e}")
             self.is_running = False
+            if self.tick_journal:
+                self.tick_journal.close()
             raise
     
+    async def start_without_streaming(self) -> None:
+        """
+        Start data processing without a Schwab stream.
+        
+        Used by replay and load-testing feeds that call _handle_market_data
+        directly; persistence, broadcasting and alert evaluation run as in
+        live mode.
+        """
+        if self.is_running:
+            logger.warning("Data ingestion service already running")
+            return
+        
+        await self._load_instruments_mapping()
+        await self._replay_tick_journal()
+        
+        self.is_running = True
+        self._processing_task = asyncio.create_task(self._data_processing_loop())
+        
+        logger.info(f"Data ingestion processing started without streaming for {len(self.instruments_map)} instruments")
+    
     async def stop(self) -> None:
         """
         Stop the data ingestion service.
@@ -257,14 +364,36 @@ class DataIngestionService:
         # Stop Schwab streaming
         await self.schwab_client.stop_streaming()
         
+        # Let the in-flight batch finish before flushing and closing the journal
+        await self._stop_background_tasks()
+        
         # Process remaining queued data
         await self._flush_data_queue()
         
+        if self.tick_journal:
+            self.tick_journal.close()
+        
         # Close Schwab client
         await self.schwab_client.close()
         
         logger.info("Data ingestion service stopped")
     
+    async def _stop_background_tasks(self) -> None:
+        """Cancel the connection monitor and wait for the processing loop to exit."""
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            await asyncio.gather(self._monitor_task, return_exceptions=True)
+            self._monitor_task = None
+        
+        if self._processing_task:
+            try:
+                await asyncio.wait_for(self._processing_task, timeout=_PROCESSING_STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("Data processing loop did not stop in time, cancelled")
+            except Exception as e:
+                logger.error(f"Data processing loop failed during shutdown: {e}")
+            self._processing_task = None
+    
     @with_db_session
     @handle_db_errors("Instruments mapping load")
     async def _load_instruments_mapping(self, session) -> None:
@@ -281,28 +410,74 @@ class DataIngestionService:
         
         logger.info(f"Loaded {len(self.instruments_map)} instrument mappings")
     
+    @with_db_session
+    @handle_db_errors("Simulated instruments registration")
+    async def _register_simulated_instruments(self, session, symbols: List[str]) -> None:
+        """
+        Create active instruments for the simulator's synthetic symbols.
+        
+        Existing instruments are reactivated rather than duplicated.
+        
+        Args:
+            session: Database session.
+            symbols: Synthetic symbols to register.
+        """
+        result = await session.execute(
+            select(Instrument.symbol).where(Instrument.symbol.in_(symbols))
+        )
+        existing = set(result.scalars().all())
+        
+        if existing:
+            await session.execute(
+                update(Instrument)
+                .where(Instrument.symbol.in_(existing))
+                .values(status=InstrumentStatus.ACTIVE)
+            )
+        session.add_all(
+            Instrument(
+                symbol=symbol,
+                name=f"Simulated {symbol}",
+                type=InstrumentType.FUTURE,
+                status=InstrumentStatus.ACTIVE
+            )
+            for symbol in symbols if symbol not in existing
+        )
+        
+        logger.info(f"Registered {len(symbols)} simulated instruments")
+    
     def _handle_market_data(self, symbol: str, raw_data: Dict[str, Any]) -> None:
         """
         Handle incoming market data from Schwab API (synchronous callback).
         
+        Normalizes every symbol in the message in one pass; the callback
+        symbol only identifies the message.
+        
         Args:
             symbol: Instrument symbol.
             raw_data: Raw market data from API.
         """
         try:
-            logger.info(f"📈 MARKET DATA CALLBACK: {symbol} - processing data")
+            logger.info("📈 MARKET DATA CALLBACK", symbol=symbol, hot_path="ingestion.callback")
             
-            # Normalize data
-            normalized_data = self.normalizer.normalize_tick_data(symbol, raw_data)
-            if not normalized_data:
+            # Message already normalized for an earlier symbol in its content
+            if raw_data is self._last_raw_message:
                 return
+            self._last_raw_message = raw_data
             
-            # Add to processing queue (non-blocking)
-            try:
-                self.data_queue.put_nowait(normalized_data)
-                logger.info(f"📥 QUEUED: {symbol} - normalized data added to queue")
-            except asyncio.QueueFull:
-                logger.warning("Data queue full, dropping tick data")
+            ticks = self.tick_normalizer.normalize_message(raw_data)
+            
+            # Add to processing queue (non-blocking; the callback cannot wait,
+            # so a full slot under the block policy is counted as a drop)
+            for tick in ticks:
+                try:
+                    self.data_queue.put_nowait(tick)
+                    logger.info("📥 QUEUED", symbol=tick.symbol, hot_path="ingestion.queued")
+                except asyncio.QueueFull:
+                    logger.warning(f"Queue slot full for {tick.symbol}, dropping tick data")
+            
+            # Ticks of one message share its receive timestamp
+            if ticks:
+                self.latency.record("normalize", ticks[0].timestamp, count=len(ticks))
                 
         except Exception as e:
             logger.error(f"Error handling market data for {symbol}: {e}")
@@ -339,84 +514,276 @@ class DataIngestionService:
                 
                 # Process batch if we have data
                 if batch_data:
-                    await self._process_data_batch(batch_data)
+                    await self._persist_batch(batch_data)
                     
             except Exception as e:
                 logger.error(f"Error in data processing loop: {e}")
                 await asyncio.sleep(1)  # Brief pause on error
     
+    async def _persist_batch(self, batch_data: List[TickRecord]) -> None:
+        """
+        Journal a batch, process it, then advance the journal watermark.
+        
+        A batch that fails to journal or persist is kept for retry; the
+        watermark stays below it until it commits.
+        
+        Args:
+            batch_data: List of normalized tick records.
+        """
+        self.latency.record_ticks("queue", batch_data)
+        
+        await self._retry_failed_batches()
+        
+        journal_range = (None, None)
+        try:
+            if self.tick_journal and self.tick_journal.is_open:
+                last_seq = self.tick_journal.append(batch_data)
+                journal_range = (last_seq - len(batch_data) + 1, last_seq)
+            await self._process_data_batch(batch_data)
+        except Exception:
+            self._failed_batches.append((*journal_range, batch_data))
+            raise
+        
+        if journal_range[1] is not None:
+            self.tick_journal.mark_committed(journal_range[1], first_seq=journal_range[0])
+    
+    async def _retry_failed_batches(self) -> None:
+        """
+        Retry batches whose database write failed, oldest first.
+        
+        Retried ticks are stale, so they are stored without WebSocket
+        broadcast or alert evaluation. Stops at the first batch that fails
+        again.
+        """
+        while self._failed_batches:
+            first_seq, last_seq, ticks = self._failed_batches[0]
+            try:
+                await self._process_data_batch(ticks, publish=False)
+            except Exception as e:
+                logger.error(f"Retry of {len(ticks)} ticks failed: {e}")
+                return
+            
+            self._failed_batches.pop(0)
+            if self.tick_journal and last_seq is not None:
+                self.tick_journal.mark_committed(last_seq, first_seq=first_seq)
+            logger.info(f"Persisted {len(ticks)} ticks on retry")
+    
+    async def _replay_tick_journal(self) -> None:
+        """
+        Open the tick journal and persist entries never committed to the database.
+        
+        Replayed ticks are stale, so they are stored without WebSocket
+        broadcast or alert evaluation.
+        """
+        if not self.tick_journal:
+            return
+        
+        self.tick_journal.open()
+        pending = self.tick_journal.uncommitted()
+        if not pending:
+            return
+        
+        logger.warning(f"Replaying {len(pending)} uncommitted ticks from journal")
+        batch_size = settings.DATA_INGESTION_BATCH_SIZE
+        
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            ticks = [tick for _, tick in chunk]
+            try:
+                await self._process_data_batch(ticks, publish=False)
+            except Exception as e:
+                # Keep the rest for retry so live commits cannot skip past them
+                logger.error(f"Tick journal replay failed: {e}")
+                for rest in range(start, len(pending), batch_size):
+                    chunk = pending[rest:rest + batch_size]
+                    self._failed_batches.append(
+                        (chunk[0][0], chunk[-1][0], [tick for _, tick in chunk])
+                    )
+                return
+            self.tick_journal.mark_committed(chunk[-1][0], first_seq=chunk[0][0])
+        
+        logger.info(f"Replayed {len(pending)} ticks from journal")
+    
     @with_db_session
     @handle_db_errors("Data batch processing")
-    async def _process_data_batch(self, session, batch_data: List[Dict[str, Any]]) -> None:
+    async def _process_data_batch(
+        self,
+        session,
+        batch_data: List[TickRecord],
+        publish: bool = True
+    ) -> None:
         """
         Process a batch of market data.
         
+        Persists the batch through the database writer (group-committed
+        with other pending writes), then broadcasts the ticks and queues
+        them for alert evaluation.
+        
         Args:
-            session: Database session.
-            batch_data: List of normalized tick data.
+            session: Database session (used when the writer is not running).
+            batch_data: List of normalized tick records.
+            publish: Broadcast and evaluate alerts after the commit.
         """
-        logger.info(f"🔄 PROCESSING BATCH: {len(batch_data)} items")
+        logger.info("🔄 PROCESSING BATCH", items=len(batch_data), hot_path="ingestion.batch")
         
-        # Create MarketData records
-        market_data_records = []
+        rows: List[Dict[str, Any]] = []
+        accepted: List[Tuple[int, TickRecord]] = []
+        latest_by_instrument: Dict[int, Dict[str, Any]] = {}
         
-        for tick_data in batch_data:
-            symbol = tick_data["symbol"]
-            instrument_id = self.instruments_map.get(symbol)
+        for tick in batch_data:
+            instrument_id = self.instruments_map.get(tick.symbol)
             
             if not instrument_id:
-                logger.warning(f"Unknown instrument symbol: {symbol}")
+                self.unknown_symbol_ticks += 1
+                if tick.symbol not in self._unknown_symbols:
+                    self._unknown_symbols.add(tick.symbol)
+                    logger.warning(f"Unknown instrument symbol: {tick.symbol} (further ticks only counted)")
                 continue
             
-            # Create market data record
-            market_data = MarketData(
-                timestamp=tick_data["timestamp"],
-                instrument_id=instrument_id,
-                price=tick_data["price"],
-                volume=tick_data["volume"],
-                bid=tick_data["bid"],
-                ask=tick_data["ask"],
-                bid_size=tick_data["bid_size"],
-                ask_size=tick_data["ask_size"],
-                open_price=tick_data["open_price"],
-                high_price=tick_data["high_price"],
-                low_price=tick_data["low_price"],
-            )
-            
-            market_data_records.append(market_data)
-            session.add(market_data)
+            row = {
+                "timestamp": tick.timestamp,
+                "instrument_id": instrument_id,
+                "price": tick.price,
+                "volume": tick.volume,
+                "bid": tick.bid,
+                "ask": tick.ask,
+                "bid_size": tick.bid_size,
+                "ask_size": tick.ask_size,
+                "open_price": tick.open_price,
+                "high_price": tick.high_price,
+                "low_price": tick.low_price,
+            }
+            rows.append(row)
+            accepted.append((instrument_id, tick))
             
-            # Update instrument last tick info
-            await session.execute(
-                update(Instrument)
-                .where(Instrument.id == instrument_id)
-                .values(
-                    last_tick=tick_data["timestamp"],
-                    last_price=tick_data["price"]
-                )
-            )
+            # Only the most recent tick per instrument updates the instrument row
+            latest = latest_by_instrument.get(instrument_id)
+            if latest is None or row["timestamp"] >= latest["timestamp"]:
+                latest_by_instrument[instrument_id] = row
+        
+        if not rows:
+            return
+        
+        async def write(write_session) -> None:
+            if settings.DATA_INGESTION_BULK_WRITES:
+                await self._write_batch_bulk(write_session, rows, latest_by_instrument)
+            else:
+                await self._write_batch_orm(write_session, rows)
+        
+        write_start = time.perf_counter()
+        await execute_write(write, session=session, rows=len(rows), label="market data batch")
+        self._record_write_throughput(len(rows), time.perf_counter() - write_start)
+        committed_at = datetime.utcnow()
         
         # Update metrics
-        self.ticks_processed += len(market_data_records)
+        self.ticks_processed += len(accepted)
         self.last_tick_time = datetime.utcnow()
         
+        # Latest quotes, served without querying market_data (stale replayed ticks are ignored)
+        for instrument_id, tick in accepted:
+            self.last_values.update(instrument_id, tick)
+        
+        if not publish:
+            return
+        
+        self.latency.record_ticks("db_commit", [tick for _, tick in accepted], now=committed_at)
+        
+        # Feed rate-of-change price windows with the persisted ticks
+        for instrument_id, tick in accepted:
+            self.price_windows.record(instrument_id, tick.timestamp, tick.price)
+        
         # Broadcast tick updates via WebSocket and trigger alert evaluation
-        for record in market_data_records:
-            logger.info(f"📡 BROADCASTING: {batch_data[market_data_records.index(record)]['symbol']} @ {record.price}")
+        for instrument_id, tick in accepted:
+            logger.info("📡 BROADCASTING", symbol=tick.symbol, price=tick.price, hot_path="ingestion.broadcast")
             await self.websocket_manager.broadcast_tick_update(
-            instrument_id=record.instrument_id,
-                symbol=batch_data[market_data_records.index(record)]["symbol"],
-                price=float(record.price) if record.price else 0.0,
-                volume=record.volume or 0,
-                timestamp=record.timestamp
+                instrument_id=instrument_id,
+                symbol=tick.symbol,
+                price=tick.price,
+                volume=tick.volume,
+                bid=tick.bid,
+                ask=tick.ask,
+                timestamp=tick.timestamp
             )
             
-            # Queue alert evaluation for this market data
+            # Queue alert evaluation for this tick
             if self.alert_engine:
-                await self.alert_engine.queue_evaluation(record.instrument_id, record)
+                await self.alert_engine.queue_evaluation(instrument_id, tick)
+        
+        logger.info(
+            "✅ BATCH COMPLETE",
+            records=len(accepted),
+            rows_per_second=round(self.last_batch_rows_per_second, 1),
+            hot_path="ingestion.batch_complete"
+        )
+    
+    async def _write_batch_bulk(
+        self,
+        session,
+        rows: List[Dict[str, Any]],
+        latest_by_instrument: Dict[int, Dict[str, Any]]
+    ) -> None:
+        """
+        Set-based batch write: one multi-row INSERT and one instrument UPDATE.
+        
+        Args:
+            session: Database session.
+            rows: Market data rows to insert.
+            latest_by_instrument: Latest row per instrument ID.
+        """
+        for start in range(0, len(rows), _MAX_ROWS_PER_INSERT):
+            await session.execute(
+                insert(MarketData).values(rows[start:start + _MAX_ROWS_PER_INSERT])
+            )
+        
+        await session.execute(
+            update(Instrument)
+            .where(Instrument.id.in_(list(latest_by_instrument)))
+            .values(
+                last_tick=case(
+                    {iid: row["timestamp"] for iid, row in latest_by_instrument.items()},
+                    value=Instrument.id
+                ),
+                last_price=case(
+                    {iid: row["price"] for iid, row in latest_by_instrument.items()},
+                    value=Instrument.id
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+    
+    async def _write_batch_orm(self, session, rows: List[Dict[str, Any]]) -> None:
+        """
+        Per-tick ORM write path, kept for throughput comparison.
+        
+        Args:
+            session: Database session.
+            rows: Market data rows to insert.
+        """
+        for row in rows:
+            session.add(MarketData(**row))
+            
+            await session.execute(
+                update(Instrument)
+                .where(Instrument.id == row["instrument_id"])
+                .values(
+                    last_tick=row["timestamp"],
+                    last_price=row["price"]
+                )
+            )
+    
+    def _record_write_throughput(self, row_count: int, elapsed_seconds: float) -> None:
+        """
+        Record batch write throughput metrics.
         
-        if len(market_data_records) > 0:
-            logger.info(f"✅ BATCH COMPLETE: Processed {len(market_data_records)} market data records")
+        Args:
+            row_count: Number of rows written in the batch.
+            elapsed_seconds: Wall time for write and commit.
+        """
+        self.rows_written += row_count
+        self.write_time_seconds += elapsed_seconds
+        self.last_batch_rows_per_second = (
+            row_count / elapsed_seconds if elapsed_seconds > 0 else 0.0
+        )
     
     async def _connection_monitor(self) -> None:
         """
@@ -442,21 +809,16 @@ class DataIngestionService:
     
     async def _flush_data_queue(self) -> None:
         """Process all remaining data in queue during shutdown."""
+        await self._retry_failed_batches()
+        
         if self.data_queue.empty():
             return
         
         logger.info("Flushing remaining data from queue")
-        remaining_data = []
-        
-        while not self.data_queue.empty():
-            try:
-                data = self.data_queue.get_nowait()
-                remaining_data.append(data)
-            except asyncio.QueueEmpty:
-                break
+        remaining_data = self.data_queue.drain()
         
         if remaining_data:
-            await self._process_data_batch(remaining_data)
+            await self._persist_batch(remaining_data)
             logger.info(f"Flushed {len(remaining_data)} remaining data records")
     
     def get_status(self) -> Dict[str, Any]:
@@ -473,5 +835,17 @@ class DataIngestionService:
             "last_tick_time": self.last_tick_time.isoformat() if self.last_tick_time else None,
             "processing_errors": self.processing_errors,
             "queue_size": self.data_queue.qsize(),
+            "queue": self.data_queue.get_stats(),
+            "failed_batches": len(self._failed_batches),
+            "journal": self.tick_journal.get_stats() if self.tick_journal else None,
             "active_instruments": len(self.instruments_map),
+            "unknown_symbol_ticks": self.unknown_symbol_ticks,
+            "normalizer": self.tick_normalizer.get_stats(),
+            "last_value_cache": self.last_values.get_stats(),
+            "write_mode": "bulk" if settings.DATA_INGESTION_BULK_WRITES else "orm",
+            "rows_written": self.rows_written,
+            "avg_rows_per_second": round(
+                self.rows_written / self.write_time_seconds, 1
+            ) if self.write_time_seconds > 0 else 0.0,
+            "last_batch_rows_per_second": round(self.last_batch_rows_per_second, 1),
         }
\ No newline at end of file
@@ -21,6 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
 from ..database.connection import get_db_session
+from ..database.writer import execute_write
 
 logger = structlog.get_logger()
 
@@ -202,8 +203,12 @@ class DataRetentionService:
                         DELETE FROM {category.table_name} 
                         WHERE created_at < :cutoff_date
                     """)
-                    await session.execute(delete_query, {"cutoff_date": cutoff_date})
-                    await session.commit()
+                    await execute_write(
+                        lambda write_session: write_session.execute(delete_query, {"cutoff_date": cutoff_date}),
+                        session=session,
+                        rows=records_to_delete,
+                        label=f"retention cleanup of {category.table_name}"
+                    )
                     
                     result.records_deleted = records_to_delete
                     logger.info(
@@ -0,0 +1,188 @@
+"""
+Sharded Alert Evaluation Workers.
+
+Each worker owns a small queue and evaluates the ticks of the instruments
+hashed to it, so a slow rule or database call only delays its own shard.
+Routing by instrument ID keeps every instrument's ticks in order on a
+single worker, which the per-instrument evaluation state relies on.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+BatchProcessor = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+class EvaluationWorker:
+    """
+    One evaluation shard: a bounded queue and the task draining it.
+
+    Collects up to batch_size evaluations (or whatever arrives within
+    batch_timeout) and hands them to the engine's batch processor.
+    """
+
+    def __init__(
+        self,
+        worker_id: int,
+        process_batch: BatchProcessor,
+        queue_size: int = 500,
+        batch_size: int = 50,
+        batch_timeout: float = 0.05
+    ):
+        self.worker_id = worker_id
+        self.process_batch = process_batch
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight = 0
+
+        # Statistics
+        self.batches = 0
+        self.evaluations = 0
+        self.dropped = 0
+        self.total_batch_ms = 0.0
+        self.max_batch_ms = 0.0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+    def start(self) -> None:
+        """Start the worker task."""
+        if self._running:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the worker and evaluate whatever is still queued."""
+        self._running = False
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+        remaining = self._take(self.queue.qsize())
+        if remaining:
+            await self._process(remaining)
+
+    def submit(self, evaluation: Dict[str, Any]) -> bool:
+        """
+        Queue an evaluation without waiting.
+
+        Args:
+            evaluation: Evaluation data from AlertEngine.queue_evaluation
+
+        Returns:
+            bool: False if the queue was full and the evaluation was dropped
+        """
+        try:
+            self.queue.put_nowait(evaluation)
+            return True
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return False
+
+    async def _run(self) -> None:
+        """Collect and process batches until stopped."""
+        loop = asyncio.get_running_loop()
+
+        while self._running:
+            try:
+                try:
+                    first = await asyncio.wait_for(self.queue.get(), timeout=self.batch_timeout)
+                except asyncio.TimeoutError:
+                    continue
+
+                batch = [first]
+                deadline = loop.time() + self.batch_timeout
+                while len(batch) < self.batch_size:
+                    if not self.queue.empty():
+                        batch.append(self.queue.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), timeout=remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._process(batch)
+
+            except Exception as e:
+                logger.error(f"Error in alert evaluation worker {self.worker_id}: {e}")
+                await asyncio.sleep(0.1)  # Brief pause on error
+
+    def _take(self, count: int) -> List[Dict[str, Any]]:
+        """Dequeue up to count evaluations without waiting."""
+        batch = []
+        while len(batch) < count and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+        return batch
+
+    async def _process(self, batch: List[Dict[str, Any]]) -> None:
+        """Run the batch processor and record latency."""
+        started = datetime.utcnow()
+        for evaluation in batch:
+            queued_at = evaluation.get("queued_at")
+            if queued_at is not None:
+                wait_ms = (started - queued_at).total_seconds() * 1000
+                self.total_wait_ms += wait_ms
+                self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+        start_time = time.perf_counter()
+        self._in_flight += len(batch)
+        try:
+            await self.process_batch(batch)
+        finally:
+            self._in_flight -= len(batch)
+            batch_ms = (time.perf_counter() - start_time) * 1000
+            self.batches += 1
+            self.evaluations += len(batch)
+            self.total_batch_ms += batch_ms
+            self.max_batch_ms = max(self.max_batch_ms, batch_ms)
+
+    @property
+    def idle(self) -> bool:
+        """Whether the worker has nothing queued or in progress."""
+        return self.queue.empty() and not self._in_flight
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get worker statistics.
+
+        Returns:
+            Dict: Queue depth, throughput and latency figures
+        """
+        return {
+            "worker_id": self.worker_id,
+            "queue_size": self.queue.qsize(),
+            "batches": self.batches,
+            "evaluations": self.evaluations,
+            "dropped": self.dropped,
+            "avg_batch_ms": round(self.total_batch_ms / max(self.batches, 1), 3),
+            "max_batch_ms": round(self.max_batch_ms, 3),
+            "avg_queue_wait_ms": round(self.total_wait_ms / max(self.evaluations, 1), 3),
+            "max_queue_wait_ms": round(self.max_wait_ms, 3),
+        }
+
+
+def shard_for(instrument_id: int, shard_count: int) -> int:
+    """
+    Get the worker index for an instrument.
+
+    Args:
+        instrument_id: Instrument ID
+        shard_count: Number of workers
+
+    Returns:
+        int: Worker index in [0, shard_count)
+    """
+    return hash(instrument_id) % shard_count
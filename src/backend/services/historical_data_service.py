@@ -16,6 +16,7 @@ from sqlalchemy import select, and_
 from sqlalchemy.exc import IntegrityError
 
 from ..database.connection import get_db_session
+from ..database.writer import execute_write
 from ..models.historical_data import (
     DataSource, MarketDataBar, DataQuery, DataFrequency
 )
@@ -270,26 +271,31 @@ class HistoricalDataService:
             
         # Basic validation and cleanup
         cleaned_bars = await self.validator.handle_duplicates(bars)
-        stored_count = 0
+        
+        async def write(write_session) -> int:
+            data_source = await self._get_or_create_data_source(write_session, data_source_name)
+            stored = 0
+            
+            for bar_data in cleaned_bars:
+                try:
+                    bar = MarketDataBar(
+                        symbol=symbol, timestamp=bar_data["timestamp"], frequency=frequency,
+                        open_price=Decimal(str(bar_data["open"])), high_price=Decimal(str(bar_data["high"])),
+                        low_price=Decimal(str(bar_data["low"])), close_price=Decimal(str(bar_data["close"])),
+                        volume=int(bar_data.get("volume", 0)), data_source_id=data_source.id
+                    )
+                    write_session.add(bar)
+                    stored += 1
+                except (ValueError, KeyError):
+                    continue
+            return stored
         
         async with get_db_session() as session:
             try:
-                data_source = await self._get_or_create_data_source(session, data_source_name)
-                
-                for bar_data in cleaned_bars:
-                    try:
-                        bar = MarketDataBar(
-                            symbol=symbol, timestamp=bar_data["timestamp"], frequency=frequency,
-                            open_price=Decimal(str(bar_data["open"])), high_price=Decimal(str(bar_data["high"])),
-                            low_price=Decimal(str(bar_data["low"])), close_price=Decimal(str(bar_data["close"])),
-                            volume=int(bar_data.get("volume", 0)), data_source_id=data_source.id
-                        )
-                        session.add(bar)
-                        stored_count += 1
-                    except (ValueError, KeyError):
-                        continue
-                        
-                await session.commit()
+                # Group-committed by the database writer when it is running
+                stored_count = await execute_write(
+                    write, session=session, rows=len(cleaned_bars), label=f"historical bars for {symbol}"
+                )
                 self._total_bars_cached += stored_count
                 return stored_count
                 
@@ -0,0 +1,237 @@
+"""
+Last-Value Cache.
+
+Latest quote per instrument (price, bid/ask and session OHLC), fed by the
+ingestion path after each batch commits. WebSocket subscribers get an
+immediate snapshot from it, and latest-price lookups are answered from
+memory instead of querying market_data for the newest row.
+"""
+
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..models.market_data import MarketData
+
+
+class Quote:
+    """
+    Latest values for one instrument.
+
+    Session open/high/low come from the feed when it sends them and are
+    otherwise tracked from tick prices; a tick from a new UTC day starts a
+    new session.
+    """
+
+    __slots__ = (
+        "instrument_id", "symbol", "timestamp", "price", "volume", "bid", "ask",
+        "bid_size", "ask_size", "session_date", "open_price", "high_price", "low_price",
+    )
+
+    def __init__(self, instrument_id: int, symbol: str):
+        self.instrument_id = instrument_id
+        self.symbol = symbol
+        self.timestamp: Optional[datetime] = None
+        self.price: Optional[float] = None
+        self.volume: Optional[float] = None
+        self.bid: Optional[float] = None
+        self.ask: Optional[float] = None
+        self.bid_size: Optional[float] = None
+        self.ask_size: Optional[float] = None
+        self.session_date: Optional[date] = None
+        self.open_price: Optional[float] = None
+        self.high_price: Optional[float] = None
+        self.low_price: Optional[float] = None
+
+    def apply(self, tick: Any) -> None:
+        """
+        Apply a tick newer than the current values.
+
+        Args:
+            tick: Normalized tick (TickRecord)
+        """
+        session_date = tick.timestamp.date()
+        if session_date != self.session_date:
+            self.session_date = session_date
+            self.open_price = self.high_price = self.low_price = None
+
+        self.symbol = tick.symbol
+        self.timestamp = tick.timestamp
+        self.price = tick.price
+        self.volume = tick.volume
+        if tick.bid is not None:
+            self.bid = tick.bid
+            self.bid_size = tick.bid_size
+        if tick.ask is not None:
+            self.ask = tick.ask
+            self.ask_size = tick.ask_size
+
+        price = tick.price
+        if self.open_price is None:
+            self.open_price = price
+        if price is not None:
+            self.high_price = price if self.high_price is None else max(self.high_price, price)
+            self.low_price = price if self.low_price is None else min(self.low_price, price)
+
+        # Session values sent by the feed take precedence
+        if tick.open_price is not None:
+            self.open_price = tick.open_price
+        if tick.high_price is not None:
+            self.high_price = tick.high_price
+        if tick.low_price is not None:
+            self.low_price = tick.low_price
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the quote as a market data payload.
+
+        Returns:
+            Dict: Quote fields in WebSocket message naming
+        """
+        return {
+            "instrumentId": self.instrument_id,
+            "symbol": self.symbol,
+            "price": self.price,
+            "volume": self.volume,
+            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+            "bid": self.bid,
+            "ask": self.ask,
+            "bidSize": self.bid_size,
+            "askSize": self.ask_size,
+            "openPrice": self.open_price,
+            "highPrice": self.high_price,
+            "lowPrice": self.low_price,
+        }
+
+    def to_market_data(self) -> MarketData:
+        """
+        Get the quote as a transient (not persisted) MarketData record.
+
+        Returns:
+            MarketData: Record with the latest tick values
+        """
+        return MarketData(
+            timestamp=self.timestamp,
+            instrument_id=self.instrument_id,
+            price=self.price,
+            volume=self.volume,
+            bid=self.bid,
+            ask=self.ask,
+            bid_size=self.bid_size,
+            ask_size=self.ask_size,
+            open_price=self.open_price,
+            high_price=self.high_price,
+            low_price=self.low_price,
+        )
+
+
+class LastValueCache:
+    """
+    Latest quote for every instrument that has ticked since startup.
+
+    Ticks older than an instrument's current quote (journal replay,
+    out-of-order batches) are ignored. Misses mean the instrument has not
+    ticked in this process (or its quote was invalidated); callers fall
+    back to the database.
+    """
+
+    def __init__(self):
+        self._quotes: Dict[int, Quote] = {}
+
+        # Counters
+        self.updates = 0
+        self.stale_ticks = 0
+        self.hits = 0
+        self.misses = 0
+
+    def update(self, instrument_id: int, tick: Any) -> None:
+        """
+        Record a tick.
+
+        Args:
+            instrument_id: Instrument ID
+            tick: Normalized tick (TickRecord)
+        """
+        quote = self._quotes.get(instrument_id)
+        if quote is None:
+            quote = self._quotes[instrument_id] = Quote(instrument_id, tick.symbol)
+        elif quote.timestamp is not None and tick.timestamp < quote.timestamp:
+            self.stale_ticks += 1
+            return
+        quote.apply(tick)
+        self.updates += 1
+
+    def get(self, instrument_id: int) -> Optional[Quote]:
+        """
+        Get an instrument's latest quote.
+
+        Args:
+            instrument_id: Instrument ID
+
+        Returns:
+            Optional[Quote]: Quote, or None if the instrument has not ticked
+        """
+        quote = self._quotes.get(instrument_id)
+        if quote is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return quote
+
+    def get_many(self, instrument_ids: Iterable[int]) -> Dict[int, Optional[Quote]]:
+        """
+        Get the latest quotes for several instruments.
+
+        Args:
+            instrument_ids: Instrument IDs
+
+        Returns:
+            Dict[int, Optional[Quote]]: Quote (or None) per instrument ID
+        """
+        return {instrument_id: self.get(instrument_id) for instrument_id in instrument_ids}
+
+    def quotes(self) -> List[Quote]:
+        """Get every cached quote."""
+        return list(self._quotes.values())
+
+    def invalidate(self, instrument_ids: Iterable[int]) -> None:
+        """
+        Drop the quotes of instruments whose latest stored tick may have changed.
+
+        Args:
+            instrument_ids: Instrument IDs
+        """
+        for instrument_id in instrument_ids:
+            self._quotes.pop(instrument_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached quote."""
+        self._quotes.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict: Instrument count and update/lookup counters
+        """
+        lookups = self.hits + self.misses
+        return {
+            "instruments": len(self._quotes),
+            "updates": self.updates,
+            "stale_ticks": self.stale_ticks,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Global last-value cache
+_last_value_cache: Optional[LastValueCache] = None
+
+
+def get_last_value_cache() -> LastValueCache:
+    """Get the global last-value cache."""
+    global _last_value_cache
+    if _last_value_cache is None:
+        _last_value_cache = LastValueCache()
+    return _last_value_cache
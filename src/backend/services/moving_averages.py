@@ -0,0 +1,324 @@
+"""
+Incremental Moving Averages and Crossover Tracking.
+
+Per-instrument SMA/EMA state updated in O(1) per tick, shared by every
+crossover rule that uses the same (instrument, type, period), so hundreds
+of crossover rules cost about as much as the handful of distinct moving
+averages they reference.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from ..models.alert_rules import AlertRule, MovingAverageType, RuleCondition, RuleType
+
+# (moving average type, period); None stands for the raw price
+AverageKey = Tuple[str, int]
+PairKey = Tuple[Optional[AverageKey], AverageKey]
+
+
+class SimpleMovingAverage:
+    """Tick SMA with a running sum over a fixed-length window."""
+
+    __slots__ = ("period", "window", "total")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window: Deque[float] = deque(maxlen=period)
+        self.total = 0.0
+
+    def update(self, price: float) -> Optional[float]:
+        """
+        Add a price.
+
+        Args:
+            price: Tick price
+
+        Returns:
+            Optional[float]: Average, or None until period ticks are seen
+        """
+        if len(self.window) == self.period:
+            self.total -= self.window[0]
+        self.window.append(price)
+        self.total += price
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        """Current average."""
+        if len(self.window) < self.period:
+            return None
+        return self.total / self.period
+
+
+class ExponentialMovingAverage:
+    """Tick EMA seeded with the SMA of the first period ticks."""
+
+    __slots__ = ("period", "alpha", "count", "total", "current")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.count = 0
+        self.total = 0.0
+        self.current: Optional[float] = None
+
+    def update(self, price: float) -> Optional[float]:
+        """
+        Add a price.
+
+        Args:
+            price: Tick price
+
+        Returns:
+            Optional[float]: Average, or None until period ticks are seen
+        """
+        if self.current is not None:
+            self.current += self.alpha * (price - self.current)
+        else:
+            self.count += 1
+            self.total += price
+            if self.count == self.period:
+                self.current = self.total / self.period
+        return self.current
+
+    @property
+    def value(self) -> Optional[float]:
+        """Current average."""
+        return self.current
+
+
+def average_pair(ma_type: Optional[str], period: int, slow_period: Optional[int] = None) -> PairKey:
+    """
+    Get the (subject, reference) moving averages a crossover compares.
+
+    Args:
+        ma_type: Moving average type (defaults to SMA)
+        period: Moving average period (fast period when slow_period is set)
+        slow_period: Slow moving average period, or None to compare price
+
+    Returns:
+        PairKey: Subject average (None for price) and reference average
+    """
+    ma_type = MovingAverageType(ma_type or MovingAverageType.SMA).value
+    if slow_period:
+        return (ma_type, period), (ma_type, slow_period)
+    return None, (ma_type, period)
+
+
+def average_keys(rule: AlertRule) -> PairKey:
+    """
+    Get the (subject, reference) moving averages a crossover rule compares.
+
+    Args:
+        rule: Crossover rule
+
+    Returns:
+        PairKey: Subject average (None for price) and reference average
+    """
+    return average_pair(rule.moving_average_type, rule.moving_average_period, rule.slow_moving_average_period)
+
+
+class InstrumentAverages:
+    """Shared moving averages and crossover pairs for one instrument."""
+
+    __slots__ = ("averages", "pairs", "last_diff", "crossed", "rules_above", "rules_below")
+
+    def __init__(self):
+        self.averages: Dict[AverageKey, Any] = {}
+        self.pairs: List[PairKey] = []
+        self.last_diff: Dict[PairKey, float] = {}
+        self.crossed: Dict[PairKey, int] = {}  # +1 above / -1 below / 0 on the latest tick
+        self.rules_above: Dict[PairKey, List[AlertRule]] = {}
+        self.rules_below: Dict[PairKey, List[AlertRule]] = {}
+
+    def update(self, price: float) -> List[AlertRule]:
+        """
+        Update every average with a tick and collect crossed rules.
+
+        Args:
+            price: Tick price
+
+        Returns:
+            List[AlertRule]: Rules whose subject crossed their reference
+        """
+        values: Dict[Optional[AverageKey], Optional[float]] = {None: price}
+        for key, average in self.averages.items():
+            values[key] = average.update(price)
+
+        triggered: List[AlertRule] = []
+        for pair in self.pairs:
+            self.crossed[pair] = 0
+            subject, reference = values[pair[0]], values[pair[1]]
+            if subject is None or reference is None:
+                continue
+
+            diff = subject - reference
+            previous = self.last_diff.get(pair)
+            self.last_diff[pair] = diff
+            if previous is None:
+                continue
+
+            if previous <= 0 < diff:
+                self.crossed[pair] = 1
+                triggered.extend(self.rules_above.get(pair, ()))
+            elif previous >= 0 > diff:
+                self.crossed[pair] = -1
+                triggered.extend(self.rules_below.get(pair, ()))
+        return triggered
+
+    def pair_values(self, pair: PairKey, price: float) -> Tuple[float, float]:
+        """
+        Get the current subject and reference values of a pair.
+
+        Args:
+            pair: Crossover pair
+            price: Latest tick price
+
+        Returns:
+            Tuple[float, float]: Subject and reference values
+        """
+        subject = price if pair[0] is None else self.averages[pair[0]].value
+        return subject, self.averages[pair[1]].value
+
+
+class CrossoverTracker:
+    """
+    Incremental crossover evaluation for all instruments.
+
+    Rebuilt from the alert engine's rules cache; moving average state and
+    the last subject/reference difference survive rebuilds for averages
+    that are still referenced.
+    """
+
+    def __init__(self):
+        self._instruments: Dict[int, InstrumentAverages] = {}
+        self.crossover_rules = 0
+        self.crossings = 0
+
+    def build(
+        self,
+        rules_by_instrument: Dict[int, List[AlertRule]],
+        extra_pairs: Optional[Dict[int, Set[PairKey]]] = None
+    ) -> Dict[int, List[AlertRule]]:
+        """
+        Set up shared moving averages for crossover rules.
+
+        Args:
+            rules_by_instrument: Active rules grouped by instrument ID
+            extra_pairs: Pairs tracked without a rule of their own (e.g.
+                multi-condition crossover predicates), by instrument ID
+
+        Returns:
+            Dict[int, List[AlertRule]]: Rules not handled here, by instrument
+        """
+        instruments: Dict[int, InstrumentAverages] = {}
+        remaining: Dict[int, List[AlertRule]] = {}
+        crossover_rules = 0
+
+        extra_pairs = extra_pairs or {}
+        for instrument_id in set(rules_by_instrument) | set(extra_pairs):
+            old = self._instruments.get(instrument_id)
+            entry = InstrumentAverages()
+
+            for pair in extra_pairs.get(instrument_id, ()):
+                self._add_pair(entry, old, pair)
+
+            for rule in rules_by_instrument.get(instrument_id, ()):
+                if (
+                    rule.rule_type != RuleType.CROSSOVER or
+                    rule.condition not in (RuleCondition.CROSSES_ABOVE, RuleCondition.CROSSES_BELOW) or
+                    not rule.moving_average_period
+                ):
+                    remaining.setdefault(instrument_id, []).append(rule)
+                    continue
+
+                pair = average_keys(rule)
+                self._add_pair(entry, old, pair)
+                target = entry.rules_above if rule.condition == RuleCondition.CROSSES_ABOVE else entry.rules_below
+                target.setdefault(pair, []).append(rule)
+                crossover_rules += 1
+
+            if entry.pairs:
+                instruments[instrument_id] = entry
+
+        self._instruments = instruments
+        self.crossover_rules = crossover_rules
+        return remaining
+
+    @staticmethod
+    def _add_pair(entry: InstrumentAverages, old: Optional[InstrumentAverages], pair: PairKey) -> None:
+        """Track a pair, reusing averages and state from the previous build."""
+        for key in pair:
+            if key is not None and key not in entry.averages:
+                if old is not None and key in old.averages:
+                    entry.averages[key] = old.averages[key]
+                elif key[0] == MovingAverageType.EMA.value:
+                    entry.averages[key] = ExponentialMovingAverage(key[1])
+                else:
+                    entry.averages[key] = SimpleMovingAverage(key[1])
+
+        if pair not in entry.pairs:
+            entry.pairs.append(pair)
+            if old is not None and pair in old.last_diff:
+                entry.last_diff[pair] = old.last_diff[pair]
+
+    def update(self, instrument_id: int, price: Optional[float]) -> List[AlertRule]:
+        """
+        Feed a tick and get the crossover rules it triggered.
+
+        Args:
+            instrument_id: Instrument ID
+            price: Tick price
+
+        Returns:
+            List[AlertRule]: Triggered rules (cooldown not applied)
+        """
+        entry = self._instruments.get(instrument_id)
+        if entry is None or price is None:
+            return []
+
+        triggered = entry.update(price)
+        self.crossings += len(triggered)
+        return triggered
+
+    def crossing(self, instrument_id: int, pair: PairKey) -> int:
+        """
+        Get a pair's crossing on the latest tick.
+
+        Args:
+            instrument_id: Instrument ID
+            pair: Crossover pair
+
+        Returns:
+            int: 1 if the subject crossed above, -1 if below, 0 otherwise
+        """
+        entry = self._instruments.get(instrument_id)
+        return entry.crossed.get(pair, 0) if entry is not None else 0
+
+    def current_values(self, rule: AlertRule, price: float) -> Tuple[float, float]:
+        """
+        Get a crossover rule's current subject and reference values.
+
+        Args:
+            rule: Crossover rule
+            price: Latest tick price
+
+        Returns:
+            Tuple[float, float]: Subject (price or fast MA) and reference MA
+        """
+        return self._instruments[rule.instrument_id].pair_values(average_keys(rule), price)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get tracker statistics.
+
+        Returns:
+            Dict: Rule, shared average and crossing counts
+        """
+        return {
+            "instruments": len(self._instruments),
+            "crossover_rules": self.crossover_rules,
+            "moving_averages": sum(len(entry.averages) for entry in self._instruments.values()),
+            "crossings": self.crossings,
+        }
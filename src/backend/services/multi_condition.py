@@ -0,0 +1,424 @@
+"""
+Compiled Multi-Condition Rules.
+
+MULTI_CONDITION rules combine threshold, rate-of-change, volume and
+crossover predicates with AND/OR. All of an instrument's rules are
+compiled into one expression DAG: structurally identical predicates and
+sub-expressions become a single node that is evaluated at most once per
+tick, and AND/OR nodes short-circuit with their cheapest children first.
+"""
+
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
+
+import structlog
+
+from ..models.alert_rules import AlertRule, MovingAverageType, RuleCondition, RuleType
+from .moving_averages import CrossoverTracker, PairKey, average_pair
+from .price_windows import PriceWindowStore, get_price_windows
+
+logger = structlog.get_logger()
+
+OPERATORS = ("and", "or")
+
+# Conditions allowed in a predicate, by rule type
+PREDICATE_CONDITIONS = {
+    RuleType.THRESHOLD: (RuleCondition.ABOVE, RuleCondition.BELOW, RuleCondition.EQUALS),
+    RuleType.RATE_OF_CHANGE: (RuleCondition.PERCENT_CHANGE_UP, RuleCondition.PERCENT_CHANGE_DOWN),
+    RuleType.VOLUME_SPIKE: (RuleCondition.VOLUME_ABOVE,),
+    RuleType.CROSSOVER: (RuleCondition.CROSSES_ABOVE, RuleCondition.CROSSES_BELOW),
+}
+
+# Relative predicate cost; cheaper children are evaluated first
+PREDICATE_COST = {
+    RuleType.THRESHOLD: 1,
+    RuleType.VOLUME_SPIKE: 1,
+    RuleType.CROSSOVER: 1,
+    RuleType.RATE_OF_CHANGE: 3,  # Price window bisect
+}
+
+MAX_DEPTH = 8
+
+# Price tolerance for EQUALS thresholds (matches RuleEvaluator)
+EQUALS_TOLERANCE = 0.01
+
+
+def parse_conditions(spec: Union[str, Dict[str, Any]], depth: int = 0) -> Dict[str, Any]:
+    """
+    Validate and normalize a multi-condition expression.
+
+    An expression is either a group, ``{"operator": "and"|"or",
+    "conditions": [...]}``, or a predicate with the single-rule fields:
+    ``rule_type``, ``condition``, ``threshold`` and, where needed,
+    ``time_window_seconds``, ``moving_average_period``,
+    ``moving_average_type`` and ``slow_moving_average_period``.
+
+    Args:
+        spec: Expression as a dict or JSON string
+        depth: Current nesting depth
+
+    Returns:
+        Dict[str, Any]: Normalized expression
+
+    Raises:
+        ValueError: If the expression is malformed
+    """
+    if isinstance(spec, str):
+        try:
+            spec = json.loads(spec)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"conditions is not valid JSON: {e}")
+
+    if not isinstance(spec, dict):
+        raise ValueError("conditions must be an object")
+    if depth > MAX_DEPTH:
+        raise ValueError(f"conditions nested deeper than {MAX_DEPTH} levels")
+
+    if "operator" in spec:
+        operator = str(spec["operator"]).lower()
+        if operator not in OPERATORS:
+            raise ValueError(f"Unknown operator '{spec['operator']}', expected 'and' or 'or'")
+        children = spec.get("conditions")
+        if not isinstance(children, list) or not children:
+            raise ValueError(f"'{operator}' needs a non-empty conditions list")
+        return {
+            "operator": operator,
+            "conditions": [parse_conditions(child, depth + 1) for child in children],
+        }
+
+    try:
+        rule_type = RuleType(spec.get("rule_type"))
+        condition = RuleCondition(spec.get("condition"))
+    except ValueError:
+        raise ValueError(f"Invalid rule_type or condition in {spec}")
+
+    if condition not in PREDICATE_CONDITIONS.get(rule_type, ()):
+        raise ValueError(f"Condition '{condition.value}' is not supported for '{rule_type.value}' predicates")
+
+    predicate: Dict[str, Any] = {"rule_type": rule_type.value, "condition": condition.value}
+
+    if rule_type == RuleType.CROSSOVER:
+        period = spec.get("moving_average_period")
+        slow_period = spec.get("slow_moving_average_period")
+        if not isinstance(period, int) or period < 1:
+            raise ValueError("Crossover predicates need a positive moving_average_period")
+        if slow_period is not None and (not isinstance(slow_period, int) or slow_period <= period):
+            raise ValueError("slow_moving_average_period must be greater than moving_average_period")
+        predicate["moving_average_type"] = MovingAverageType(
+            spec.get("moving_average_type") or MovingAverageType.SMA
+        ).value
+        predicate["moving_average_period"] = period
+        predicate["slow_moving_average_period"] = slow_period
+        return predicate
+
+    threshold = spec.get("threshold")
+    if isinstance(threshold, bool) or not isinstance(threshold, (int, float)) or threshold < 0:
+        raise ValueError(f"'{rule_type.value}' predicates need a non-negative threshold")
+    predicate["threshold"] = float(threshold)
+
+    if rule_type == RuleType.RATE_OF_CHANGE:
+        window = spec.get("time_window_seconds")
+        if not isinstance(window, int) or window < 1:
+            raise ValueError("Rate-of-change predicates need a positive time_window_seconds")
+        predicate["time_window_seconds"] = window
+
+    return predicate
+
+
+class Predicate:
+    """Leaf comparison against the current tick."""
+
+    __slots__ = ("key", "rule_type", "condition", "threshold", "window_seconds", "pair", "cost", "label")
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.rule_type = RuleType(spec["rule_type"])
+        self.condition = RuleCondition(spec["condition"])
+        self.threshold = spec.get("threshold", 0.0)
+        self.window_seconds = spec.get("time_window_seconds")
+        self.pair: Optional[PairKey] = None
+        if self.rule_type == RuleType.CROSSOVER:
+            self.pair = average_pair(
+                spec["moving_average_type"], spec["moving_average_period"], spec["slow_moving_average_period"]
+            )
+        self.key = (self.rule_type, self.condition, self.threshold, self.window_seconds, self.pair)
+        self.cost = PREDICATE_COST[self.rule_type]
+        self.label = self._describe()
+
+    def _describe(self) -> str:
+        """Human-readable predicate for alert messages."""
+        if self.rule_type == RuleType.THRESHOLD:
+            return f"price {self.condition.value} {self.threshold:g}"
+        if self.rule_type == RuleType.VOLUME_SPIKE:
+            return f"volume above {self.threshold:g}"
+        if self.rule_type == RuleType.RATE_OF_CHANGE:
+            direction = "up" if self.condition == RuleCondition.PERCENT_CHANGE_UP else "down"
+            return f"{direction} {self.threshold:g}% in {self.window_seconds}s"
+
+        subject, reference = self.pair
+        direction = "above" if self.condition == RuleCondition.CROSSES_ABOVE else "below"
+        subject_label = "price" if subject is None else f"{subject[1]}-period {subject[0].upper()}"
+        return f"{subject_label} crosses {direction} {reference[1]}-period {reference[0].upper()}"
+
+
+class Expression:
+    """AND/OR over child nodes, ordered cheapest first."""
+
+    __slots__ = ("key", "operator", "children", "cost")
+
+    def __init__(self, operator: str, children: List[int], keys: FrozenSet, cost: int):
+        self.operator = operator
+        self.children = children
+        self.key = (operator, keys)
+        self.cost = cost
+
+
+class InstrumentProgram:
+    """Compiled expression DAG for one instrument's multi-condition rules."""
+
+    __slots__ = ("nodes", "index_by_key", "roots")
+
+    def __init__(self):
+        self.nodes: List[Union[Predicate, Expression]] = []
+        self.index_by_key: Dict[Tuple, int] = {}
+        self.roots: List[Tuple[AlertRule, int]] = []
+
+    def add(self, spec: Dict[str, Any]) -> int:
+        """
+        Compile an expression, reusing existing identical nodes.
+
+        Args:
+            spec: Normalized expression
+
+        Returns:
+            int: Node index of the expression
+        """
+        if "operator" in spec:
+            children = sorted(
+                {self.add(child) for child in spec["conditions"]},
+                key=lambda index: (self.nodes[index].cost, index)
+            )
+            if len(children) == 1:
+                return children[0]
+            node = Expression(
+                spec["operator"],
+                children,
+                frozenset(self.nodes[index].key for index in children),
+                sum(self.nodes[index].cost for index in children)
+            )
+        else:
+            node = Predicate(spec)
+
+        index = self.index_by_key.get(node.key)
+        if index is None:
+            index = len(self.nodes)
+            self.nodes.append(node)
+            self.index_by_key[node.key] = index
+        return index
+
+
+class MultiConditionEvaluator:
+    """
+    Per-tick evaluation of compiled multi-condition rules.
+
+    Rules fire when their expression becomes true (or on the first tick it
+    is true), so a condition that stays satisfied logs one alert rather
+    than one per tick. Rate-of-change predicates read the in-memory price
+    windows and count as false while a window is still cold; crossover
+    predicates read the tick's crossings from the shared CrossoverTracker,
+    which must be updated before evaluate() is called.
+    """
+
+    def __init__(self, crossovers: CrossoverTracker, price_windows: Optional[PriceWindowStore] = None):
+        self.crossovers = crossovers
+        self.price_windows = price_windows or get_price_windows()
+
+        self._programs: Dict[int, InstrumentProgram] = {}
+        self._states: Dict[int, Tuple[Tuple, bool]] = {}  # rule ID -> (root key, last value)
+        self.crossover_pairs: Dict[int, Set[PairKey]] = {}
+        self.horizons: Dict[int, float] = {}
+
+        self.rule_count = 0
+        self.invalid_rules = 0
+        self.predicate_evaluations = 0
+        self.shared_hits = 0
+
+    def build(self, rules_by_instrument: Dict[int, List[AlertRule]]) -> Dict[int, List[AlertRule]]:
+        """
+        Compile multi-condition rules into per-instrument expression DAGs.
+
+        Args:
+            rules_by_instrument: Active rules grouped by instrument ID
+
+        Returns:
+            Dict[int, List[AlertRule]]: Rules not handled here, by instrument
+        """
+        programs: Dict[int, InstrumentProgram] = {}
+        remaining: Dict[int, List[AlertRule]] = {}
+        states: Dict[int, Tuple[Tuple, bool]] = {}
+        crossover_pairs: Dict[int, Set[PairKey]] = {}
+        horizons: Dict[int, float] = {}
+        rule_count = invalid_rules = 0
+
+        for instrument_id, rules in rules_by_instrument.items():
+            program = InstrumentProgram()
+
+            for rule in rules:
+                if rule.rule_type != RuleType.MULTI_CONDITION:
+                    remaining.setdefault(instrument_id, []).append(rule)
+                    continue
+
+                try:
+                    root = program.add(parse_conditions(rule.conditions or ""))
+                except ValueError as e:
+                    invalid_rules += 1
+                    logger.warning(f"Skipping multi-condition rule {rule.id}: {e}")
+                    continue
+
+                program.roots.append((rule, root))
+                rule_count += 1
+                previous = self._states.get(rule.id)
+                if previous is not None and previous[0] == program.nodes[root].key:
+                    states[rule.id] = previous
+
+            for node in program.nodes:
+                if not isinstance(node, Predicate):
+                    continue
+                if node.pair is not None:
+                    crossover_pairs.setdefault(instrument_id, set()).add(node.pair)
+                if node.window_seconds:
+                    horizons[instrument_id] = max(horizons.get(instrument_id, 0), node.window_seconds)
+
+            if program.roots:
+                programs[instrument_id] = program
+
+        self._programs = programs
+        self._states = states
+        self.crossover_pairs = crossover_pairs
+        self.horizons = horizons
+        self.rule_count = rule_count
+        self.invalid_rules = invalid_rules
+        return remaining
+
+    def evaluate(
+        self,
+        instrument_id: int,
+        price: Optional[float],
+        volume: Optional[int] = None,
+        now: Optional[datetime] = None
+    ) -> List[Tuple[AlertRule, List[str]]]:
+        """
+        Evaluate an instrument's multi-condition rules against a tick.
+
+        Args:
+            instrument_id: Instrument ID
+            price: Tick price
+            volume: Tick volume
+            now: Evaluation time for rate-of-change windows (defaults to UTC now)
+
+        Returns:
+            List[Tuple[AlertRule, List[str]]]: Rules that became true, with
+                the predicates that were met
+        """
+        program = self._programs.get(instrument_id)
+        if program is None or price is None:
+            return []
+
+        tick = (instrument_id, price, volume or 0, now or datetime.utcnow())
+        memo: List[Optional[bool]] = [None] * len(program.nodes)
+        triggered: List[Tuple[AlertRule, List[str]]] = []
+
+        for rule, root in program.roots:
+            value = self._evaluate_node(program, root, memo, tick)
+            key = program.nodes[root].key
+            previous = self._states.get(rule.id)
+            self._states[rule.id] = (key, value)
+            if value and not (previous and previous[1]):
+                triggered.append((rule, self._met_predicates(program, root, memo)))
+
+        return triggered
+
+    def _evaluate_node(self, program: InstrumentProgram, index: int, memo: List[Optional[bool]], tick: Tuple) -> bool:
+        """Evaluate a node once per tick, short-circuiting AND/OR."""
+        value = memo[index]
+        if value is not None:
+            self.shared_hits += 1
+            return value
+
+        node = program.nodes[index]
+        if isinstance(node, Predicate):
+            self.predicate_evaluations += 1
+            value = self._evaluate_predicate(node, *tick)
+        elif node.operator == "and":
+            value = all(self._evaluate_node(program, child, memo, tick) for child in node.children)
+        else:
+            value = any(self._evaluate_node(program, child, memo, tick) for child in node.children)
+
+        memo[index] = value
+        return value
+
+    def _evaluate_predicate(self, predicate: Predicate, instrument_id: int, price: float, volume: int, now: datetime) -> bool:
+        """Evaluate a leaf predicate against a tick."""
+        condition = predicate.condition
+
+        if condition == RuleCondition.ABOVE:
+            return price > predicate.threshold
+        if condition == RuleCondition.BELOW:
+            return price < predicate.threshold
+        if condition == RuleCondition.EQUALS:
+            return abs(price - predicate.threshold) < EQUALS_TOLERANCE
+        if condition == RuleCondition.VOLUME_ABOVE:
+            return volume > predicate.threshold
+        if condition == RuleCondition.CROSSES_ABOVE:
+            return self.crossovers.crossing(instrument_id, predicate.pair) > 0
+        if condition == RuleCondition.CROSSES_BELOW:
+            return self.crossovers.crossing(instrument_id, predicate.pair) < 0
+
+        window = self.price_windows.get(instrument_id)
+        cutoff = now - timedelta(seconds=predicate.window_seconds)
+        if window is None or not window.covers(cutoff):
+            return False
+        base = window.first_at_or_after(cutoff)
+        if not base:
+            return False
+
+        pct_change = (price - base) / base * 100
+        if condition == RuleCondition.PERCENT_CHANGE_UP:
+            return pct_change >= predicate.threshold
+        return pct_change <= -predicate.threshold
+
+    def _met_predicates(self, program: InstrumentProgram, index: int, memo: List[Optional[bool]]) -> List[str]:
+        """Collect labels of the true predicates under a node."""
+        node = program.nodes[index]
+        if isinstance(node, Predicate):
+            return [node.label] if memo[index] else []
+
+        labels: List[str] = []
+        for child in node.children:
+            if not memo[child]:
+                continue
+            for label in self._met_predicates(program, child, memo):
+                if label not in labels:
+                    labels.append(label)
+        return labels
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get evaluator statistics.
+
+        Returns:
+            Dict: Rule, node and evaluation counts
+        """
+        nodes = sum(len(program.nodes) for program in self._programs.values())
+        predicates = sum(
+            1 for program in self._programs.values() for node in program.nodes if isinstance(node, Predicate)
+        )
+        return {
+            "instruments": len(self._programs),
+            "multi_condition_rules": self.rule_count,
+            "invalid_rules": self.invalid_rules,
+            "nodes": nodes,
+            "predicates": predicates,
+            "predicate_evaluations": self.predicate_evaluations,
+            "shared_hits": self.shared_hits,
+        }
@@ -20,6 +20,7 @@ from ..models.instruments import Instrument
 from ..database.connection import get_db_session
 from ..database.mixins import SoftDeleteMixin
 from .database_performance import get_performance_monitor
+from .last_value_cache import get_last_value_cache
 
 logger = structlog.get_logger(__name__)
 
@@ -194,14 +195,21 @@ class OptimizedMarketDataRepository:
     async def get_latest_market_data(
         self,
         instrument_ids: List[int],
-        include_inactive: bool = False
+        include_inactive: bool = False,
+        use_cache: bool = True
     ) -> Dict[int, Optional[MarketData]]:
         """
         Get latest market data for multiple instruments efficiently.
         
+        Instruments that ticked since startup are answered from the
+        last-value cache as transient MarketData records and only the rest
+        are queried. soft_delete_market_data invalidates affected
+        instruments, so cached ticks are never soft deleted ones.
+        
         Args:
             instrument_ids: List of instrument IDs
             include_inactive: Whether to include soft deleted records
+            use_cache: Whether to serve cached latest ticks
             
         Returns:
             Dictionary mapping instrument_id to latest MarketData record
@@ -209,9 +217,19 @@ class OptimizedMarketDataRepository:
         start_time_query = time.time()
         result_map: Dict[int, Optional[MarketData]] = {}
         
+        if use_cache:
+            for instrument_id, quote in get_last_value_cache().get_many(instrument_ids).items():
+                if quote is not None:
+                    result_map[instrument_id] = quote.to_market_data()
+            missing_ids = [instrument_id for instrument_id in instrument_ids if instrument_id not in result_map]
+            if not missing_ids:
+                return result_map
+        else:
+            missing_ids = instrument_ids
+        
         try:
             async with get_db_session() as session:
-                for instrument_id in instrument_ids:
+                for instrument_id in missing_ids:
                     # Use optimized query with composite index
                     query = select(MarketData).where(
                         MarketData.instrument_id == instrument_id
@@ -235,12 +253,13 @@ class OptimizedMarketDataRepository:
                     query_type="SELECT_LATEST",
                     table_name="market_data",
                     execution_time_ms=execution_time_ms,
-                    record_count=len(instrument_ids)
+                    record_count=len(missing_ids)
                 )
                 
                 logger.debug(
                     "Latest market data query completed",
                     instrument_count=len(instrument_ids),
+                    cached=len(instrument_ids) - len(missing_ids),
                     records_found=sum(1 for r in result_map.values() if r is not None),
                     execution_time_ms=execution_time_ms
                 )
@@ -277,12 +296,25 @@ class OptimizedMarketDataRepository:
         start_time = time.time()
         deleted_count = 0
         
+        affected_instruments = set()
+        
         try:
             async with get_db_session() as session:
                 # Process in batches for performance
                 for i in range(0, len(record_ids), batch_size):
                     batch_ids = record_ids[i:i + batch_size]
                     
+                    # Instruments whose cached latest tick may be deleted
+                    instruments = await session.execute(
+                        select(MarketData.instrument_id).where(
+                            and_(
+                                MarketData.id.in_(batch_ids),
+                                MarketData.deleted_at.is_(None)
+                            )
+                        ).distinct()
+                    )
+                    affected_instruments.update(instruments.scalars().all())
+                    
                     # Bulk soft delete using update
                     stmt = update(MarketData).where(
                         and_(
@@ -295,6 +327,7 @@ class OptimizedMarketDataRepository:
                     deleted_count += result.rowcount
                 
                 await session.commit()
+                get_last_value_cache().invalidate(affected_instruments)
                 
                 # Track performance
                 execution_time_ms = (time.time() - start_time) * 1000
@@ -0,0 +1,209 @@
+"""
+Tick-to-Alert Pipeline Latency.
+
+Every tick carries its receive timestamp through the pipeline. At the end
+of each stage the time since receipt is recorded into a fixed-memory,
+log-bucketed histogram, so percentiles stay cheap to record and accurate
+to a few percent at any tick rate. Reading the stages in order shows where
+the end-to-end latency is spent.
+"""
+
+import math
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import settings
+
+# Pipeline stages in order; each records milliseconds from tick receipt
+# until the tick (or the alert it triggered) leaves the stage
+PIPELINE_STAGES: Tuple[str, ...] = (
+    "normalize",     # Message normalized and ticks queued for persistence
+    "queue",         # Ticks picked up by the persistence loop
+    "db_commit",     # Tick batch committed
+    "alert_queue",   # Evaluation started by the instrument's worker
+    "evaluation",    # Rules evaluated against the tick
+    "fire",          # Alert logged and queued for broadcast
+    "broadcast",     # Alert queued to subscribed WebSocket clients (end to end)
+)
+
+REPORTED_PERCENTILES: Tuple[Tuple[str, float], ...] = (
+    ("p50_ms", 0.5),
+    ("p90_ms", 0.9),
+    ("p99_ms", 0.99),
+    ("p999_ms", 0.999),
+)
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with a fixed number of buckets.
+
+    Bucket bounds grow geometrically from min_ms to max_ms, so every
+    reported percentile is within half a growth step of the true value.
+    Values outside the range land in the first or last bucket.
+    """
+
+    def __init__(self, min_ms: float = 0.01, max_ms: float = 60000.0, growth: float = 1.05):
+        self.min_ms = min_ms
+        self.growth = growth
+        self._log_growth = math.log(growth)
+        self._bucket_count = int(math.ceil(math.log(max_ms / min_ms) / self._log_growth)) + 1
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all recorded values."""
+        self.counts: List[int] = [0] * self._bucket_count
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_seen_ms: Optional[float] = None
+        self.max_seen_ms = 0.0
+
+    def _bucket(self, value_ms: float) -> int:
+        if value_ms <= self.min_ms:
+            return 0
+        index = int(math.log(value_ms / self.min_ms) / self._log_growth) + 1
+        return min(index, self._bucket_count - 1)
+
+    def record(self, value_ms: float, count: int = 1) -> None:
+        """
+        Record a latency.
+
+        Args:
+            value_ms: Latency in milliseconds
+            count: Number of events with this latency (e.g. ticks of one message)
+        """
+        if count <= 0:
+            return
+        value_ms = max(value_ms, 0.0)
+        self.counts[self._bucket(value_ms)] += count
+        self.count += count
+        self.total_ms += value_ms * count
+        if self.min_seen_ms is None or value_ms < self.min_seen_ms:
+            self.min_seen_ms = value_ms
+        if value_ms > self.max_seen_ms:
+            self.max_seen_ms = value_ms
+
+    def percentile(self, quantile: float) -> float:
+        """
+        Get the latency at a quantile.
+
+        Args:
+            quantile: Quantile in [0, 1]
+
+        Returns:
+            float: Latency in milliseconds (0.0 when nothing was recorded)
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(1, int(math.ceil(quantile * self.count)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                break
+
+        # Out-of-range buckets report the observed extremes
+        if index == 0:
+            return self.min_seen_ms
+        if index == self._bucket_count - 1:
+            return self.max_seen_ms
+
+        # Geometric midpoint of the bucket, clamped to what was observed
+        value = self.min_ms * self.growth ** (index - 0.5)
+        return min(max(value, self.min_seen_ms), self.max_seen_ms)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get histogram summary.
+
+        Returns:
+            Dict: Count, mean, max and reported percentiles in milliseconds
+        """
+        stats = {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / max(self.count, 1), 3),
+            "max_ms": round(self.max_seen_ms, 3),
+        }
+        for name, quantile in REPORTED_PERCENTILES:
+            stats[name] = round(self.percentile(quantile), 3)
+        return stats
+
+
+class PipelineLatency:
+    """
+    One latency histogram per pipeline stage.
+
+    Stages record the time since tick receipt, so alert-side stages
+    (fire, broadcast) only count ticks that triggered an alert.
+    """
+
+    def __init__(self, target_ms: Optional[float] = None):
+        self.target_ms = target_ms if target_ms is not None else settings.ALERT_LATENCY_TARGET_MS
+        self.histograms: Dict[str, LatencyHistogram] = {
+            stage: LatencyHistogram() for stage in PIPELINE_STAGES
+        }
+        self.started_at = datetime.utcnow()
+
+    def record(self, stage: str, received_at: Optional[datetime], now: Optional[datetime] = None, count: int = 1) -> None:
+        """
+        Record a tick leaving a stage.
+
+        Args:
+            stage: Name from PIPELINE_STAGES
+            received_at: Tick receive timestamp (ignored when None)
+            now: Stage end time (defaults to current UTC time)
+            count: Number of ticks sharing this receive timestamp
+        """
+        if received_at is None:
+            return
+        now = now or datetime.utcnow()
+        self.histograms[stage].record((now - received_at).total_seconds() * 1000, count)
+
+    def record_ticks(self, stage: str, ticks: List[Any], now: Optional[datetime] = None) -> None:
+        """
+        Record a batch of ticks leaving a stage at the same time.
+
+        Args:
+            stage: Name from PIPELINE_STAGES
+            ticks: Ticks with a ``timestamp`` receive time
+            now: Stage end time (defaults to current UTC time)
+        """
+        now = now or datetime.utcnow()
+        histogram = self.histograms[stage]
+        for tick in ticks:
+            if tick.timestamp is not None:
+                histogram.record((now - tick.timestamp).total_seconds() * 1000)
+
+    def reset(self) -> None:
+        """Clear every stage histogram."""
+        for histogram in self.histograms.values():
+            histogram.reset()
+        self.started_at = datetime.utcnow()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-stage latency percentiles.
+
+        Returns:
+            Dict: Target, whether the end-to-end p99 meets it, and stage stats in pipeline order
+        """
+        end_to_end = self.histograms[PIPELINE_STAGES[-1]]
+        return {
+            "target_ms": self.target_ms,
+            "within_target": end_to_end.percentile(0.99) <= self.target_ms if end_to_end.count else None,
+            "since": self.started_at.isoformat(),
+            "stages": {stage: self.histograms[stage].get_stats() for stage in PIPELINE_STAGES},
+        }
+
+
+# Global pipeline latency recorder
+_pipeline_latency: Optional[PipelineLatency] = None
+
+
+def get_pipeline_latency() -> PipelineLatency:
+    """Get the global pipeline latency recorder."""
+    global _pipeline_latency
+    if _pipeline_latency is None:
+        _pipeline_latency = PipelineLatency()
+    return _pipeline_latency
@@ -0,0 +1,201 @@
+"""
+Rolling Price Windows.
+
+Per-instrument, time-indexed price buffers fed by the ingestion path so
+rate-of-change rules can look up the price at the start of their window
+without querying market_data. Each buffer is sized to the largest
+time_window_seconds among the instrument's active rate-of-change rules.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from ..config import settings
+
+# Extra history kept beyond the largest rule window, absorbing the delay
+# between a tick's receive time and its evaluation.
+HORIZON_SLACK = timedelta(seconds=1)
+
+
+class PriceWindow:
+    """
+    Time-ordered (timestamp, price) buffer for one instrument.
+
+    Points older than the horizon, or beyond max_points, are evicted from
+    the head. covered_from is the time since which every recorded tick is
+    still held: lookups for earlier cutoffs cannot be answered from memory.
+    """
+
+    __slots__ = ("horizon", "max_points", "times", "prices", "start", "covered_from")
+
+    def __init__(self, horizon_seconds: float, max_points: int = 50000):
+        self.horizon = timedelta(seconds=horizon_seconds) + HORIZON_SLACK
+        self.max_points = max_points
+        self.times: List[datetime] = []
+        self.prices: List[float] = []
+        self.start = 0
+        self.covered_from: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self.times) - self.start
+
+    def append(self, timestamp: datetime, price: float) -> None:
+        """
+        Record a price.
+
+        Args:
+            timestamp: Tick timestamp
+            price: Tick price
+        """
+        times = self.times
+        if len(times) == self.start or timestamp >= times[-1]:
+            times.append(timestamp)
+            self.prices.append(price)
+        else:
+            index = bisect_right(times, timestamp, self.start)
+            times.insert(index, timestamp)
+            self.prices.insert(index, price)
+
+        if self.covered_from is None:
+            self.covered_from = timestamp
+
+        self._evict(times[-1] - self.horizon)
+
+    def _evict(self, limit: datetime) -> None:
+        times = self.times
+        start = bisect_left(times, limit, self.start)
+        overflow = len(times) - start - self.max_points
+        if overflow > 0:
+            start += overflow
+
+        if start == self.start:
+            return
+
+        self.start = start
+        # Everything since the horizon limit (or the oldest point kept after
+        # overflow) has been seen; earlier history now lives only in the DB.
+        self.covered_from = max(self.covered_from, limit if overflow <= 0 else times[start])
+
+        # Compact once the dead head outweighs the live tail
+        if start > 1024 and start * 2 > len(times):
+            del times[:start]
+            del self.prices[:start]
+            self.start = 0
+
+    def covers(self, cutoff: datetime) -> bool:
+        """
+        Check whether a lookup from cutoff can be answered from memory.
+
+        Args:
+            cutoff: Start of the rule window
+
+        Returns:
+            bool: True if no tick at or after cutoff can be missing
+        """
+        return self.covered_from is not None and cutoff >= self.covered_from
+
+    def first_at_or_after(self, cutoff: datetime) -> Optional[float]:
+        """
+        Get the earliest price recorded at or after cutoff.
+
+        Args:
+            cutoff: Start of the rule window
+
+        Returns:
+            Optional[float]: Price, or None if no tick since cutoff
+        """
+        index = bisect_left(self.times, cutoff, self.start)
+        if index == len(self.times):
+            return None
+        return self.prices[index]
+
+
+class PriceWindowStore:
+    """
+    Price windows for instruments with active rate-of-change rules.
+
+    The alert engine configures horizons whenever its rules cache refreshes;
+    ticks for instruments without a window are ignored.
+    """
+
+    def __init__(self, max_points: int = 50000):
+        self.max_points = max_points
+        self._windows: Dict[int, PriceWindow] = {}
+
+        # Lookup counters
+        self.memory_hits = 0
+        self.db_fallbacks = 0
+
+    def configure(self, horizons: Dict[int, float]) -> None:
+        """
+        Set the window horizon per instrument.
+
+        Existing windows keep their history; instruments no longer listed
+        are dropped.
+
+        Args:
+            horizons: Largest rule time window in seconds per instrument ID
+        """
+        windows = {}
+        for instrument_id, horizon_seconds in horizons.items():
+            window = self._windows.get(instrument_id)
+            if window is None:
+                window = PriceWindow(horizon_seconds, self.max_points)
+            else:
+                window.horizon = timedelta(seconds=horizon_seconds) + HORIZON_SLACK
+            windows[instrument_id] = window
+        self._windows = windows
+
+    def record(self, instrument_id: int, timestamp: datetime, price: Optional[float]) -> None:
+        """
+        Record a tick price if the instrument has a window.
+
+        Args:
+            instrument_id: Instrument ID
+            timestamp: Tick timestamp
+            price: Tick price
+        """
+        window = self._windows.get(instrument_id)
+        if window is not None and price is not None:
+            window.append(timestamp, price)
+
+    def get(self, instrument_id: int) -> Optional[PriceWindow]:
+        """
+        Get an instrument's price window.
+
+        Args:
+            instrument_id: Instrument ID
+
+        Returns:
+            Optional[PriceWindow]: Window, or None if not tracked
+        """
+        return self._windows.get(instrument_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get price window statistics.
+
+        Returns:
+            Dict: Window counts, buffered points and lookup counters
+        """
+        lookups = self.memory_hits + self.db_fallbacks
+        return {
+            "instruments": len(self._windows),
+            "points": sum(len(window) for window in self._windows.values()),
+            "memory_hits": self.memory_hits,
+            "db_fallbacks": self.db_fallbacks,
+            "memory_hit_rate": round(self.memory_hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Global price window store
+_price_windows: Optional[PriceWindowStore] = None
+
+
+def get_price_windows() -> PriceWindowStore:
+    """Get the global price window store."""
+    global _price_windows
+    if _price_windows is None:
+        _price_windows = PriceWindowStore(max_points=settings.PRICE_WINDOW_MAX_POINTS)
+    return _price_windows
@@ -22,6 +22,7 @@ from ..models.market_data import MarketData
 from ..models.instruments import Instrument
 from ..models.alert_rules import AlertRule
 from sqlalchemy import select, and_
+from .last_value_cache import get_last_value_cache
 from .market_data_processor import market_data_processor, DataFrequency
 
 logger = logging.getLogger(__name__)
@@ -512,10 +513,18 @@ class RiskCalculator:
         returns = prices.pct_change().dropna()
         return returns
     
+    async def _get_current_price(self, instrument_id: int) -> Optional[float]:
+        """Get current price for an instrument (last-value cache first, then market_data)."""
+        quote = get_last_value_cache().get(instrument_id)
+        if quote is not None and quote.price is not None:
+            return float(quote.price)
+        
+        return await self._get_stored_price(instrument_id)
+    
     @with_db_session
     @handle_db_errors("Current price retrieval")
-    async def _get_current_price(self, session, instrument_id: int) -> Optional[float]:
-        """Get current price for an instrument."""
+    async def _get_stored_price(self, session, instrument_id: int) -> Optional[float]:
+        """Get the latest persisted price for an instrument from market_data."""
         result = await session.execute(
         select(MarketData)
         .where(MarketData.instrument_id == instrument_id)
@@ -0,0 +1,106 @@
+"""
+Alert Rule Change Events.
+
+In-process publish/subscribe for alert rule changes. The rules API
+publishes an event after every committed create, update or delete, and
+the alert engine patches its rules cache from them instead of reloading
+every rule on a timer.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class RuleChangeAction(str, Enum):
+    """Kinds of rule change."""
+    UPSERTED = "upserted"  # Created or updated; reload the row
+    DELETED = "deleted"
+
+
+@dataclass
+class RuleChangeEvent:
+    """A committed change to one alert rule."""
+    action: RuleChangeAction
+    rule_id: int
+    instrument_id: Optional[int] = None
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+
+RuleChangeHandler = Callable[[RuleChangeEvent], None]
+
+
+class RuleEventBus:
+    """
+    Synchronous fan-out of rule change events.
+
+    Handlers run inline in publish() and must only record the change; the
+    subscriber applies it from its own task.
+    """
+
+    def __init__(self):
+        self._handlers: List[RuleChangeHandler] = []
+        self.events_published = 0
+
+    def subscribe(self, handler: RuleChangeHandler) -> None:
+        """
+        Register a handler for rule change events.
+
+        Args:
+            handler: Callable receiving each RuleChangeEvent
+        """
+        if handler not in self._handlers:
+            self._handlers.append(handler)
+
+    def unsubscribe(self, handler: RuleChangeHandler) -> None:
+        """
+        Remove a previously registered handler.
+
+        Args:
+            handler: Handler passed to subscribe()
+        """
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+
+    def publish(self, event: RuleChangeEvent) -> None:
+        """
+        Deliver an event to every handler.
+
+        Args:
+            event: Rule change event
+        """
+        self.events_published += 1
+        for handler in list(self._handlers):
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error(f"Rule change handler failed for rule {event.rule_id}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get bus statistics.
+
+        Returns:
+            Dict: Subscriber and event counts
+        """
+        return {
+            "subscribers": len(self._handlers),
+            "events_published": self.events_published,
+        }
+
+
+# Global rule event bus
+_rule_event_bus: Optional[RuleEventBus] = None
+
+
+def get_rule_event_bus() -> RuleEventBus:
+    """Get the global rule event bus."""
+    global _rule_event_bus
+    if _rule_event_bus is None:
+        _rule_event_bus = RuleEventBus()
+    return _rule_event_bus
@@ -0,0 +1,273 @@
+"""
+Sorted Threshold Index.
+
+Per-instrument sorted arrays of ABOVE and BELOW threshold rules. Each tick
+finds the rules whose threshold lies between the previous and the current
+price with two bisections, so the cost of evaluating threshold rules tracks
+the number of rules crossed rather than the number configured.
+
+Rules with a hysteresis band disarm when they fire and re-arm only once
+the price moves back past the reset level (threshold minus the band for
+ABOVE rules, plus the band for BELOW rules), so a price chopping around
+the threshold fires once instead of after every cooldown. The caller
+disarms a rule once it actually fires, so a crossing swallowed by a
+cooldown leaves the rule armed.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.alert_rules import AlertRule, RuleCondition, RuleType
+
+
+def is_indexable(rule: AlertRule) -> bool:
+    """
+    Check whether a rule is evaluated through the threshold index.
+
+    Args:
+        rule: Alert rule
+
+    Returns:
+        bool: True for ABOVE/BELOW threshold rules
+    """
+    return (
+        rule.rule_type == RuleType.THRESHOLD and
+        rule.condition in (RuleCondition.ABOVE, RuleCondition.BELOW)
+    )
+
+
+def reset_level(rule: AlertRule) -> Optional[float]:
+    """
+    Get the price at which a triggered rule re-arms.
+
+    Args:
+        rule: ABOVE/BELOW threshold rule
+
+    Returns:
+        Optional[float]: Reset price, or None if the rule has no hysteresis band
+    """
+    if not rule.hysteresis:
+        return None
+    band = float(rule.hysteresis)
+    threshold = float(rule.threshold)
+    return threshold - band if rule.condition == RuleCondition.ABOVE else threshold + band
+
+
+def rule_signature(rule: AlertRule) -> Tuple[Any, float, Optional[float]]:
+    """Fields that decide when an indexed rule triggers and re-arms."""
+    return (rule.condition, float(rule.threshold), reset_level(rule))
+
+
+class InstrumentThresholds:
+    """Sorted thresholds, last seen price and disarmed rules for one instrument."""
+
+    __slots__ = (
+        "above_thresholds", "above_rules",
+        "below_thresholds", "below_rules",
+        "pending", "last_price", "disarmed", "suppressed",
+    )
+
+    def __init__(self, rules: List[AlertRule], last_price: Optional[float] = None):
+        above = sorted(
+            (rule for rule in rules if rule.condition == RuleCondition.ABOVE),
+            key=lambda rule: float(rule.threshold)
+        )
+        below = sorted(
+            (rule for rule in rules if rule.condition == RuleCondition.BELOW),
+            key=lambda rule: float(rule.threshold)
+        )
+
+        self.above_thresholds = [float(rule.threshold) for rule in above]
+        self.above_rules = above
+        self.below_thresholds = [float(rule.threshold) for rule in below]
+        self.below_rules = below
+        self.pending: List[AlertRule] = []
+        self.last_price = last_price
+        # Rule ID -> (is ABOVE rule, reset price) for rules waiting to re-arm
+        self.disarmed: Dict[int, Tuple[bool, float]] = {}
+        self.suppressed = 0
+
+    def crossed(self, price: float) -> List[AlertRule]:
+        """
+        Find rules newly triggered by a move to price.
+
+        ABOVE rules fire when the price moves from at or below the threshold
+        to above it, BELOW rules when it moves from at or above to below.
+        Without a previous price, every rule satisfied at price fires.
+        Disarmed rules are skipped until the price reaches their reset level.
+        Triggered rules stay armed until passed to disarm().
+
+        Args:
+            price: Current price
+
+        Returns:
+            List[AlertRule]: Triggered rules
+        """
+        previous = self.last_price
+        self.last_price = price
+
+        if previous is None:
+            triggered = self.above_rules[:bisect_left(self.above_thresholds, price)]
+            triggered += self.below_rules[bisect_right(self.below_thresholds, price):]
+            self.pending = []
+            return self._armed(triggered, price)
+
+        if price > previous:
+            # ABOVE thresholds in [previous, price)
+            triggered = self.above_rules[
+                bisect_left(self.above_thresholds, previous):bisect_left(self.above_thresholds, price)
+            ]
+        elif price < previous:
+            # BELOW thresholds in (price, previous]
+            triggered = self.below_rules[
+                bisect_right(self.below_thresholds, price):bisect_right(self.below_thresholds, previous)
+            ]
+        else:
+            triggered = []
+
+        if self.pending:
+            # Rules added since the last tick are checked against the level once
+            for rule in self.pending:
+                threshold = float(rule.threshold)
+                if (
+                    (rule.condition == RuleCondition.ABOVE and price > threshold) or
+                    (rule.condition == RuleCondition.BELOW and price < threshold)
+                ) and rule not in triggered:
+                    triggered.append(rule)
+            self.pending = []
+
+        return self._armed(triggered, price)
+
+    def _armed(self, triggered: List[AlertRule], price: float) -> List[AlertRule]:
+        """Re-arm rules whose reset level was reached and drop disarmed ones."""
+        if not self.disarmed:
+            return triggered
+
+        for rule_id, (above, reset) in list(self.disarmed.items()):
+            if (price <= reset) if above else (price >= reset):
+                del self.disarmed[rule_id]
+
+        armed = [rule for rule in triggered if rule.id not in self.disarmed]
+        self.suppressed += len(triggered) - len(armed)
+        return armed
+
+    def disarm(self, rule: AlertRule) -> None:
+        """Disarm a fired rule until the price reaches its reset level."""
+        reset = reset_level(rule)
+        if reset is not None:
+            self.disarmed[rule.id] = (rule.condition == RuleCondition.ABOVE, reset)
+
+
+class ThresholdIndex:
+    """
+    Threshold index over all instruments.
+
+    Rebuilt from the alert engine's rules cache. Last prices and disarmed
+    states survive rebuilds so crossings are not lost across refreshes;
+    rules that are new or edited in a rebuild start armed and are checked
+    against the price level on their first tick, matching what a freshly
+    created rule would see.
+    """
+
+    def __init__(self):
+        self._instruments: Dict[int, InstrumentThresholds] = {}
+        self.indexed_rules = 0
+        self.crossings = 0
+
+    def build(self, rules_by_instrument: Dict[int, List[AlertRule]]) -> Dict[int, List[AlertRule]]:
+        """
+        Index ABOVE/BELOW threshold rules.
+
+        Args:
+            rules_by_instrument: Active rules grouped by instrument ID
+
+        Returns:
+            Dict[int, List[AlertRule]]: Rules not handled by the index, by instrument
+        """
+        previous = self._instruments
+        known = {
+            rule.id: rule_signature(rule)
+            for entry in previous.values()
+            for rule in entry.above_rules + entry.below_rules
+        }
+
+        instruments: Dict[int, InstrumentThresholds] = {}
+        remaining: Dict[int, List[AlertRule]] = {}
+        indexed_rules = 0
+
+        for instrument_id, rules in rules_by_instrument.items():
+            indexed = [rule for rule in rules if is_indexable(rule)]
+            others = [rule for rule in rules if not is_indexable(rule)]
+            if others:
+                remaining[instrument_id] = others
+            if not indexed:
+                continue
+
+            old = previous.get(instrument_id)
+            entry = InstrumentThresholds(indexed, old.last_price if old else None)
+            if entry.last_price is not None:
+                entry.pending = [
+                    rule for rule in indexed
+                    if known.get(rule.id) != rule_signature(rule)
+                ]
+            if old is not None:
+                unchanged = {rule.id for rule in indexed if known.get(rule.id) == rule_signature(rule)}
+                entry.disarmed = {
+                    rule_id: state for rule_id, state in old.disarmed.items() if rule_id in unchanged
+                }
+                entry.suppressed = old.suppressed
+            instruments[instrument_id] = entry
+            indexed_rules += len(indexed)
+
+        self._instruments = instruments
+        self.indexed_rules = indexed_rules
+        return remaining
+
+    def crossed(self, instrument_id: int, price: Optional[float]) -> List[AlertRule]:
+        """
+        Find threshold rules triggered by a tick.
+
+        Args:
+            instrument_id: Instrument ID
+            price: Tick price
+
+        Returns:
+            List[AlertRule]: Triggered rules (cooldown not applied; call
+                disarm() for the ones that fire)
+        """
+        entry = self._instruments.get(instrument_id)
+        if entry is None or price is None:
+            return []
+
+        triggered = entry.crossed(price)
+        self.crossings += len(triggered)
+        return triggered
+
+    def disarm(self, rule: AlertRule) -> None:
+        """
+        Disarm a hysteresis rule that fired.
+
+        No-op for rules without a band or no longer indexed.
+
+        Args:
+            rule: Rule returned by crossed() that is being fired
+        """
+        entry = self._instruments.get(rule.instrument_id)
+        if entry is not None:
+            entry.disarm(rule)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Dict: Indexed instrument and rule counts, crossings found and
+                suppressed while disarmed
+        """
+        return {
+            "instruments": len(self._instruments),
+            "indexed_rules": self.indexed_rules,
+            "crossings": self.crossings,
+            "disarmed_rules": sum(len(entry.disarmed) for entry in self._instruments.values()),
+            "suppressed_crossings": sum(entry.suppressed for entry in self._instruments.values()),
+        }
@@ -0,0 +1,336 @@
+"""
+Binary Tick Journal.
+
+Append-only, memory-mapped journal of normalized ticks written before they
+reach SQLite. Records are fixed-width so appends are a single struct pack
+into the mapped segment, and a committed-sequence watermark in the segment
+header tells startup replay which ticks never made it into the database.
+
+Segment layout:
+    header  (64 bytes): magic, version, record size, committed seq, first seq
+    records (128 bytes each): seq, timestamp (us), 9 doubles, null mask, symbol
+"""
+
+import mmap
+import os
+import struct
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import structlog
+
+from .tick_normalizer import TickRecord
+
+logger = structlog.get_logger()
+
+JOURNAL_MAGIC = b"TAJ1"
+JOURNAL_VERSION = 2
+SEGMENT_SUFFIX = ".journal"
+
+# magic, version, record size, committed seq, first seq (padded to 64 bytes)
+_HEADER = struct.Struct("<4sHHQQ")
+HEADER_SIZE = 64
+_COMMITTED_OFFSET = 8
+
+# seq is written last so a record is only visible once fully written
+_SEQ = struct.Struct("<Q")
+_BODY = struct.Struct("<q9dH32s6x")
+_RECORD = struct.Struct("<Qq9dH32s6x")
+RECORD_SIZE = _RECORD.size
+
+# UTF-8 bytes; fits option keys (21 characters)
+SYMBOL_BYTES = 32
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# TickRecord fields after symbol/timestamp; optional ones are tracked in the null mask
+_OPTIONAL_SLOTS = range(2, 9)  # bid .. low_price
+
+
+def _encode(tick: TickRecord) -> Tuple[Any, ...]:
+    """
+    Convert a tick record into journal body fields.
+
+    Raises:
+        ValueError: If the symbol does not fit the symbol field.
+    """
+    symbol = tick.symbol.encode("utf-8")
+    if len(symbol) > SYMBOL_BYTES:
+        raise ValueError(f"Symbol longer than {SYMBOL_BYTES} bytes: {tick.symbol!r}")
+    values = list(tick[2:])
+    mask = 0
+    for slot in _OPTIONAL_SLOTS:
+        if values[slot] is None:
+            mask |= 1 << slot
+            values[slot] = 0.0
+    return (
+        (tick.timestamp - _EPOCH) // _MICROSECOND,
+        *values,
+        mask,
+        symbol,
+    )
+
+
+def _decode(fields: Tuple[Any, ...]) -> Tuple[int, TickRecord]:
+    """Convert unpacked record fields into (seq, tick record)."""
+    seq, timestamp_us = fields[0], fields[1]
+    values: List[Optional[float]] = list(fields[2:11])
+    mask = fields[11]
+    if mask:
+        for slot in _OPTIONAL_SLOTS:
+            if mask & (1 << slot):
+                values[slot] = None
+    symbol = fields[12].rstrip(b"\x00").decode("utf-8")
+    return seq, TickRecord(symbol, _EPOCH + timedelta(microseconds=timestamp_us), *values)
+
+
+def segment_name(first_seq: int) -> str:
+    """File name of the segment starting at a sequence number."""
+    return f"ticks-{first_seq:020d}{SEGMENT_SUFFIX}"
+
+
+def read_segment(path: Path, after_seq: int = 0) -> Iterator[Tuple[int, TickRecord]]:
+    """
+    Read committed-order records from a journal segment file.
+
+    Stops at the first unwritten or out-of-sequence record.
+
+    Args:
+        path: Segment file path.
+        after_seq: Skip records with seq <= after_seq.
+
+    Yields:
+        Tuple[int, TickRecord]: Sequence number and tick record.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    magic, version, record_size, _, first_seq = _HEADER.unpack_from(data, 0)
+    if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION or record_size != RECORD_SIZE:
+        raise ValueError(f"Not a version {JOURNAL_VERSION} tick journal segment: {path}")
+
+    expected = first_seq
+    for fields in _RECORD.iter_unpack(data[HEADER_SIZE:]):
+        if fields[0] != expected:
+            break
+        if expected > after_seq:
+            yield _decode(fields)
+        expected += 1
+
+
+class TickJournal:
+    """
+    Segmented, memory-mapped tick journal.
+
+    Full segments are kept as a compact raw tick archive (optionally bounded
+    by max_segments); the newest segment is the active, mapped one.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_records: int = 262144,
+        max_segments: int = 0,
+        fsync: bool = False
+    ):
+        self.directory = Path(directory)
+        self.segment_records = segment_records
+        self.max_segments = max_segments
+        self.fsync = fsync
+
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._segment_first_seq = 1
+        self._segment_count = 0  # Records written in active segment
+
+        self.next_seq = 1
+        self.committed_seq = 0
+        # Ranges committed out of order, held until the gap below them commits
+        self._committed_ahead: Dict[int, int] = {}
+        self.records_appended = 0
+        self.segments_rotated = 0
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the active segment is mapped."""
+        return self._mmap is not None
+
+    def segments(self) -> List[Path]:
+        """Segment files in sequence order."""
+        return sorted(self.directory.glob(f"ticks-*{SEGMENT_SUFFIX}"))
+
+    def open(self) -> None:
+        """Open (or create) the journal and position after the last record."""
+        if self.is_open:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        segments = self.segments()
+
+        if not segments:
+            self._create_segment(first_seq=1, committed_seq=0)
+            logger.info(f"Created tick journal in {self.directory}")
+            return
+
+        active = segments[-1]
+        with open(active, "rb") as f:
+            _, _, _, committed_seq, first_seq = _HEADER.unpack(f.read(_HEADER.size))
+
+        written = sum(1 for _ in read_segment(active))
+        self._map_segment(active, first_seq)
+        self._segment_count = written
+        self.next_seq = first_seq + written
+        self.committed_seq = committed_seq
+
+        logger.info(
+            f"Opened tick journal at seq {self.next_seq}",
+            committed_seq=committed_seq,
+            segments=len(segments)
+        )
+
+    def close(self) -> None:
+        """Flush and unmap the active segment."""
+        if not self.is_open:
+            return
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.close()
+        self._mmap = None
+        self._file = None
+
+    def _map_segment(self, path: Path, first_seq: int) -> None:
+        size = HEADER_SIZE + self.segment_records * RECORD_SIZE
+        self._file = open(path, "r+b")
+        if os.fstat(self._file.fileno()).st_size < size:
+            self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        self._segment_first_seq = first_seq
+
+    def _create_segment(self, first_seq: int, committed_seq: int) -> None:
+        path = self.directory / segment_name(first_seq)
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, RECORD_SIZE, committed_seq, first_seq))
+        self._map_segment(path, first_seq)
+        self._segment_count = 0
+        self.next_seq = first_seq
+
+    def _rotate(self) -> None:
+        """Seal the full active segment and start a new one."""
+        self.close()
+        self._create_segment(first_seq=self.next_seq, committed_seq=self.committed_seq)
+        self.segments_rotated += 1
+
+        if self.max_segments > 0:
+            segments = self.segments()
+            # Never drop a segment that still holds uncommitted records
+            for index, path in enumerate(segments[:-self.max_segments]):
+                next_first_seq = int(segments[index + 1].stem.split("-")[1])
+                if next_first_seq - 1 > self.committed_seq:
+                    break
+                path.unlink()
+
+    def append(self, ticks: Sequence[TickRecord]) -> int:
+        """
+        Append tick records to the journal.
+
+        Every record is encoded before any is written, so a rejected batch
+        leaves the journal unchanged.
+
+        Args:
+            ticks: Tick records in persistence order.
+
+        Returns:
+            int: Sequence number of the last appended record.
+
+        Raises:
+            ValueError: If a tick cannot be encoded.
+        """
+        bodies = [_encode(tick) for tick in ticks]
+        mm = self._mmap
+        for body in bodies:
+            if self._segment_count >= self.segment_records:
+                self._rotate()
+                mm = self._mmap
+
+            offset = HEADER_SIZE + self._segment_count * RECORD_SIZE
+            _BODY.pack_into(mm, offset + _SEQ.size, *body)
+            _SEQ.pack_into(mm, offset, self.next_seq)
+
+            self._segment_count += 1
+            self.next_seq += 1
+
+        self.records_appended += len(ticks)
+        if self.fsync and ticks:
+            mm.flush()
+        return self.next_seq - 1
+
+    def mark_committed(self, seq: int, first_seq: Optional[int] = None) -> None:
+        """
+        Advance the committed watermark after a database commit.
+
+        The watermark only covers contiguous ranges: a range committed while
+        an earlier one is still uncommitted is held back until the gap
+        below it commits. No-op once the journal is closed.
+
+        Args:
+            seq: Last sequence number persisted to the database.
+            first_seq: First sequence number of the persisted range
+                (defaults to the record after the watermark).
+        """
+        if not self.is_open or seq <= self.committed_seq:
+            return
+        if first_seq is not None and first_seq > self.committed_seq + 1:
+            self._committed_ahead[first_seq] = seq
+            return
+        while seq + 1 in self._committed_ahead:
+            seq = self._committed_ahead.pop(seq + 1)
+        self.committed_seq = seq
+        _SEQ.pack_into(self._mmap, _COMMITTED_OFFSET, seq)
+        if self.fsync:
+            self._mmap.flush(0, mmap.PAGESIZE)
+
+    def read(self, after_seq: int = 0) -> Iterator[Tuple[int, TickRecord]]:
+        """
+        Read journal records across segments.
+
+        Args:
+            after_seq: Skip records with seq <= after_seq.
+
+        Yields:
+            Tuple[int, TickRecord]: Sequence number and tick record.
+        """
+        segments = self.segments()
+        for index, path in enumerate(segments):
+            if index + 1 < len(segments):
+                next_first_seq = int(segments[index + 1].stem.split("-")[1])
+                if next_first_seq - 1 <= after_seq:
+                    continue
+            yield from read_segment(path, after_seq)
+
+    def uncommitted(self) -> List[Tuple[int, TickRecord]]:
+        """
+        Get records appended after the committed watermark.
+
+        Returns:
+            List[Tuple[int, TickRecord]]: Records never committed to the database.
+        """
+        return list(self.read(after_seq=self.committed_seq))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get journal statistics.
+
+        Returns:
+            Dict: Sequence positions, backlog and segment counts.
+        """
+        return {
+            "directory": str(self.directory),
+            "next_seq": self.next_seq,
+            "committed_seq": self.committed_seq,
+            "uncommitted": self.next_seq - 1 - self.committed_seq,
+            "committed_ahead_ranges": len(self._committed_ahead),
+            "records_appended": self.records_appended,
+            "segments": len(self.segments()) if self.directory.exists() else 0,
+            "segments_rotated": self.segments_rotated,
+        }
@@ -0,0 +1,248 @@
+"""
+Compiled Tick Normalizer.
+
+Schema-specialized normalization of Schwab streaming messages into compact
+tick records. Field lookups are compiled once per Schwab service type so the
+per-tick path is a fixed sequence of dict lookups with no logging or string
+formatting.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+
+class TickRecord(NamedTuple):
+    """Compact normalized tick produced by the compiled normalizer."""
+    symbol: str
+    timestamp: datetime
+    price: float
+    volume: float
+    bid: Optional[float]
+    ask: Optional[float]
+    bid_size: Optional[float]
+    ask_size: Optional[float]
+    open_price: Optional[float]
+    high_price: Optional[float]
+    low_price: Optional[float]
+
+
+# Normalized value slots in TickRecord order (after symbol and timestamp)
+NORMALIZED_FIELDS: Tuple[str, ...] = (
+    "price",
+    "volume",
+    "bid",
+    "ask",
+    "bid_size",
+    "ask_size",
+    "open_price",
+    "high_price",
+    "low_price",
+)
+
+# Schwab streaming field names for level-one services
+LEVELONE_FIELD_MAP: Dict[str, str] = {
+    "LAST_PRICE": "price",
+    "TOTAL_VOLUME": "volume",
+    "BID_PRICE": "bid",
+    "ASK_PRICE": "ask",
+    "BID_SIZE": "bid_size",
+    "ASK_SIZE": "ask_size",
+    "OPEN_PRICE": "open_price",
+    "HIGH_PRICE": "high_price",
+    "LOW_PRICE": "low_price",
+}
+
+# Every alias accepted by the legacy DataNormalizer, in its precedence order
+# (later aliases win when several are present)
+GENERIC_FIELD_MAP: List[Tuple[str, str]] = [
+    ("LAST_PRICE", "price"), ("lastPrice", "price"), ("last", "price"), ("price", "price"),
+    ("TOTAL_VOLUME", "volume"), ("volume", "volume"), ("vol", "volume"),
+    ("BID_PRICE", "bid"), ("bid", "bid"), ("bidPrice", "bid"),
+    ("ASK_PRICE", "ask"), ("ask", "ask"), ("askPrice", "ask"),
+    ("BID_SIZE", "bid_size"), ("bidSize", "bid_size"),
+    ("ASK_SIZE", "ask_size"), ("askSize", "ask_size"),
+    ("OPEN_PRICE", "open_price"), ("open", "open_price"), ("openPrice", "open_price"),
+    ("HIGH_PRICE", "high_price"), ("high", "high_price"), ("highPrice", "high_price"),
+    ("LOW_PRICE", "low_price"), ("low", "low_price"), ("lowPrice", "low_price"),
+]
+
+SERVICE_FIELD_MAPS: Dict[str, Dict[str, str]] = {
+    "LEVELONE_EQUITIES": LEVELONE_FIELD_MAP,
+    "LEVELONE_FUTURES": LEVELONE_FIELD_MAP,
+    "LEVELONE_FUTURES_OPTIONS": LEVELONE_FIELD_MAP,
+    "LEVELONE_OPTIONS": LEVELONE_FIELD_MAP,
+    "LEVELONE_FOREX": LEVELONE_FIELD_MAP,
+}
+
+MAX_VALID_PRICE = 1000000
+
+
+class CompiledSchema:
+    """
+    Field extraction plan for one Schwab service type.
+
+    Each normalized slot holds the source keys to try, highest precedence
+    first, so extraction stops at the first present value.
+    """
+
+    __slots__ = ("service", "slot_keys")
+
+    def __init__(self, service: str, field_pairs: List[Tuple[str, str]]):
+        self.service = service
+        keys_by_slot: Dict[str, List[str]] = {name: [] for name in NORMALIZED_FIELDS}
+        for source_key, normalized_field in field_pairs:
+            keys_by_slot[normalized_field].insert(0, source_key)
+
+        self.slot_keys: Tuple[Tuple[int, Tuple[str, ...]], ...] = tuple(
+            (index, tuple(keys_by_slot[name]))
+            for index, name in enumerate(NORMALIZED_FIELDS)
+            if keys_by_slot[name]
+        )
+
+    def build(self, item: Dict[str, Any], timestamp: datetime) -> Optional[TickRecord]:
+        """
+        Build a tick record from one content item.
+
+        Args:
+            item: Content entry ({'key': symbol, FIELD: value, ...}).
+            timestamp: Receive timestamp shared by the whole message.
+
+        Returns:
+            Optional[TickRecord]: Tick record or None if the item has no usable price.
+        """
+        symbol = item.get("key")
+        if not symbol:
+            return None
+
+        get = item.get
+        values: List[Optional[float]] = [None] * len(NORMALIZED_FIELDS)
+        for index, keys in self.slot_keys:
+            for key in keys:
+                value = get(key)
+                if value is not None:
+                    try:
+                        values[index] = float(value)
+                        break
+                    except (TypeError, ValueError):
+                        continue
+
+        price, volume, bid, ask = values[0], values[1], values[2], values[3]
+
+        # Quote-only updates fall back to mid, bid or ask
+        if price is None:
+            if bid is not None and ask is not None:
+                price = (bid + ask) / 2.0
+            elif bid is not None:
+                price = bid
+            elif ask is not None:
+                price = ask
+            else:
+                return None
+
+        if price <= 0 or price > MAX_VALID_PRICE:
+            return None
+
+        return TickRecord(
+            symbol.upper(),
+            timestamp,
+            price,
+            volume if volume is not None else 0,
+            bid,
+            ask,
+            values[4],
+            values[5],
+            values[6],
+            values[7],
+            values[8],
+        )
+
+
+class TickNormalizer:
+    """
+    Batch normalizer for raw Schwab streaming messages.
+
+    Normalizes every symbol in a message's ``content`` array in a single
+    pass using a schema compiled once per service type.
+    """
+
+    def __init__(self):
+        self._schemas: Dict[Optional[str], CompiledSchema] = {}
+        self._generic_schema = CompiledSchema("GENERIC", GENERIC_FIELD_MAP)
+
+        # Counters instead of per-tick logging
+        self.messages_normalized = 0
+        self.ticks_normalized = 0
+        self.ticks_rejected = 0
+
+    def schema_for(self, service: Optional[str]) -> CompiledSchema:
+        """
+        Get (and compile on first use) the schema for a service type.
+
+        Args:
+            service: Schwab service name, e.g. LEVELONE_FUTURES.
+
+        Returns:
+            CompiledSchema: Extraction plan for the service.
+        """
+        schema = self._schemas.get(service)
+        if schema is None:
+            field_map = SERVICE_FIELD_MAPS.get(service)
+            if field_map is None:
+                schema = self._generic_schema
+            else:
+                schema = CompiledSchema(service, list(field_map.items()))
+            self._schemas[service] = schema
+            logger.debug("Compiled tick schema", service=service, schema=schema.service)
+        return schema
+
+    def normalize_message(
+        self,
+        raw_data: Dict[str, Any],
+        timestamp: Optional[datetime] = None
+    ) -> List[TickRecord]:
+        """
+        Normalize every symbol in one raw streaming message.
+
+        Args:
+            raw_data: Raw message ({'service': ..., 'content': [...]}).
+            timestamp: Receive timestamp (defaults to current UTC time).
+
+        Returns:
+            List[TickRecord]: Valid tick records in content order.
+        """
+        content = raw_data.get("content")
+        if not content:
+            return []
+
+        schema = self.schema_for(raw_data.get("service"))
+        timestamp = timestamp or datetime.utcnow()
+        build = schema.build
+
+        ticks = []
+        for item in content:
+            tick = build(item, timestamp)
+            if tick is not None:
+                ticks.append(tick)
+
+        self.messages_normalized += 1
+        self.ticks_normalized += len(ticks)
+        self.ticks_rejected += len(content) - len(ticks)
+        return ticks
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get normalizer counters.
+
+        Returns:
+            Dict: Message, tick and rejection counts plus compiled services.
+        """
+        return {
+            "messages_normalized": self.messages_normalized,
+            "ticks_normalized": self.ticks_normalized,
+            "ticks_rejected": self.ticks_rejected,
+            "compiled_services": sorted(str(service) for service in self._schemas),
+        }
@@ -0,0 +1,466 @@
+"""
+Tick Replay Engine.
+
+Replays recorded ticks from the market_data table or an exported file
+(CSV, JSONL or tick journal) through DataIngestionService._handle_market_data
+as Schwab-shaped streaming messages, at recorded speed, a multiple of it or
+as fast as possible. The live pipeline (persistence, WebSocket broadcast and
+alert evaluation) runs unchanged, so replays should target a test database.
+"""
+
+import asyncio
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import structlog
+from sqlalchemy import select
+
+from ..database.connection import get_db_session
+from ..models.instruments import Instrument
+from ..models.market_data import MarketData
+from .tick_journal import TickJournal, read_segment
+from .tick_normalizer import NORMALIZED_FIELDS, TickRecord
+
+logger = structlog.get_logger()
+
+# Normalized field -> Schwab level-one field used in replayed messages
+_STREAM_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("price", "LAST_PRICE"),
+    ("volume", "TOTAL_VOLUME"),
+    ("bid", "BID_PRICE"),
+    ("ask", "ASK_PRICE"),
+    ("bid_size", "BID_SIZE"),
+    ("ask_size", "ASK_SIZE"),
+    ("open_price", "OPEN_PRICE"),
+    ("high_price", "HIGH_PRICE"),
+    ("low_price", "LOW_PRICE"),
+)
+
+_DRAIN_POLL_SECONDS = 0.05
+# Longer than the ingestion loop's queue poll so an in-flight batch is not missed
+_DRAIN_SETTLE_SECONDS = 0.25
+
+
+def _parse_float(value: Any) -> Optional[float]:
+    """Parse an optional numeric field from an exported file."""
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def _tick_from_mapping(row: Dict[str, Any]) -> TickRecord:
+    """Build a tick record from an exported row (CSV or JSONL)."""
+    timestamp = row["timestamp"]
+    if not isinstance(timestamp, datetime):
+        timestamp = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00"))
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.replace(tzinfo=None)
+
+    values = [_parse_float(row.get(name)) for name in NORMALIZED_FIELDS]
+    if values[1] is None:
+        values[1] = 0.0
+    return TickRecord(str(row["symbol"]).upper(), timestamp, *values)
+
+
+def iter_file_ticks(path: str) -> Iterator[TickRecord]:
+    """
+    Read ticks from an exported file.
+
+    Supported formats by suffix: ``.csv`` and ``.jsonl``/``.ndjson`` with
+    ``symbol``, ``timestamp`` and normalized field columns, ``.journal``
+    segments, or a tick journal directory.
+
+    Args:
+        path: File or journal directory path.
+
+    Yields:
+        TickRecord: Ticks in file order.
+    """
+    source = Path(path)
+
+    if source.is_dir():
+        for _, tick in TickJournal(str(source)).read():
+            yield tick
+    elif source.suffix == ".journal":
+        for _, tick in read_segment(source):
+            yield tick
+    elif source.suffix == ".csv":
+        with open(source, newline="") as f:
+            for row in csv.DictReader(f):
+                yield _tick_from_mapping(row)
+    elif source.suffix in (".jsonl", ".ndjson"):
+        with open(source) as f:
+            for line in f:
+                if line.strip():
+                    yield _tick_from_mapping(json.loads(line))
+    else:
+        raise ValueError(f"Unsupported replay file format: {source.suffix or path}")
+
+
+async def iter_database_ticks(
+    symbols: Optional[List[str]] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    chunk_size: int = 5000
+) -> AsyncIterator[TickRecord]:
+    """
+    Stream recorded ticks from the market_data table in timestamp order.
+
+    Args:
+        symbols: Restrict to these symbols (all when None).
+        start: Earliest tick timestamp.
+        end: Latest tick timestamp.
+        limit: Maximum number of ticks.
+        chunk_size: Rows fetched per round trip.
+
+    Yields:
+        TickRecord: Recorded ticks.
+    """
+    query = (
+        select(
+            Instrument.symbol,
+            MarketData.timestamp,
+            MarketData.price,
+            MarketData.volume,
+            MarketData.bid,
+            MarketData.ask,
+            MarketData.bid_size,
+            MarketData.ask_size,
+            MarketData.open_price,
+            MarketData.high_price,
+            MarketData.low_price,
+        )
+        .join(Instrument, Instrument.id == MarketData.instrument_id)
+        .where(MarketData.price.is_not(None))
+        .order_by(MarketData.timestamp, MarketData.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    if symbols:
+        query = query.where(Instrument.symbol.in_(symbols))
+    if start:
+        query = query.where(MarketData.timestamp >= start)
+    if end:
+        query = query.where(MarketData.timestamp <= end)
+    if limit:
+        query = query.limit(limit)
+
+    async with get_db_session() as session:
+        result = await session.stream(query)
+        async for row in result:
+            yield TickRecord(
+                row.symbol,
+                row.timestamp,
+                float(row.price),
+                float(row.volume or 0),
+                *(float(value) if value is not None else None for value in row[4:]),
+            )
+
+
+async def _as_async(ticks: Iterable[TickRecord]) -> AsyncIterator[TickRecord]:
+    for tick in ticks:
+        yield tick
+
+
+def build_message(ticks: List[TickRecord], service: str) -> Dict[str, Any]:
+    """
+    Build a Schwab level-one streaming message from ticks.
+
+    Args:
+        ticks: Ticks sharing one message (unique symbols).
+        service: Schwab service name.
+
+    Returns:
+        Dict: Message in the shape delivered by the streaming client.
+    """
+    content = []
+    for tick in ticks:
+        item: Dict[str, Any] = {"key": tick.symbol}
+        for name, stream_field in _STREAM_FIELDS:
+            value = getattr(tick, name)
+            if value is not None:
+                item[stream_field] = value
+        content.append(item)
+    return {"service": service, "content": content}
+
+
+@dataclass
+class ReplayStats:
+    """Replay run results."""
+    source: str
+    speed: Optional[float]
+    messages_sent: int = 0
+    ticks_sent: int = 0
+    data_span_seconds: float = 0.0
+    send_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    ticks_persisted: int = 0
+    alerts_fired: int = 0
+    avg_alert_latency_ms: float = 0.0
+    max_alert_latency_ms: float = 0.0  # Alert engine maximum since start
+    drained: bool = False
+    started_at: datetime = field(default_factory=datetime.utcnow)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to dictionary."""
+        return {
+            "source": self.source,
+            "speed": self.speed,
+            "messages_sent": self.messages_sent,
+            "ticks_sent": self.ticks_sent,
+            "data_span_seconds": round(self.data_span_seconds, 3),
+            "send_seconds": round(self.send_seconds, 3),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "ticks_per_second_sent": round(
+                self.ticks_sent / self.send_seconds, 1
+            ) if self.send_seconds > 0 else 0.0,
+            "ticks_persisted": self.ticks_persisted,
+            "ticks_per_second_persisted": round(
+                self.ticks_persisted / self.wall_seconds, 1
+            ) if self.wall_seconds > 0 else 0.0,
+            "alerts_fired": self.alerts_fired,
+            "avg_alert_latency_ms": round(self.avg_alert_latency_ms, 2),
+            "max_alert_latency_ms": round(self.max_alert_latency_ms, 2),
+            "drained": self.drained,
+            "started_at": self.started_at.isoformat(),
+        }
+
+
+class TickReplayEngine:
+    """
+    Drives recorded ticks through the live ingestion pipeline.
+
+    Ticks with the same recorded timestamp are grouped into one message, as
+    the streaming client delivers them. Speed 1.0 reproduces recorded
+    inter-arrival times, N compresses them N times and None (or 0) sends as
+    fast as the event loop allows.
+    """
+
+    def __init__(
+        self,
+        data_ingestion,
+        alert_engine=None,
+        service: str = "LEVELONE_FUTURES",
+        max_speed_yield_every: int = 100
+    ):
+        self.data_ingestion = data_ingestion
+        self.alert_engine = alert_engine or data_ingestion.alert_engine
+        if self.alert_engine and not data_ingestion.alert_engine:
+            data_ingestion.set_alert_engine(self.alert_engine)
+        self.service = service
+        self.max_speed_yield_every = max_speed_yield_every
+
+        self.is_running = False
+        self.last_stats: Optional[ReplayStats] = None
+        self._stop_requested = False
+
+    def stop(self) -> None:
+        """Request the current replay to stop after the next message."""
+        self._stop_requested = True
+
+    async def replay_database(
+        self,
+        speed: Optional[float] = 1.0,
+        symbols: Optional[List[str]] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        drain_timeout: float = 30.0
+    ) -> ReplayStats:
+        """
+        Replay ticks recorded in the market_data table.
+
+        Args:
+            speed: Replay speed multiplier (None or 0 = max speed).
+            symbols: Restrict to these symbols.
+            start: Earliest tick timestamp.
+            end: Latest tick timestamp.
+            limit: Maximum number of ticks.
+            drain_timeout: Seconds to wait for the pipeline to drain.
+
+        Returns:
+            ReplayStats: Replay results.
+        """
+        ticks = iter_database_ticks(symbols=symbols, start=start, end=end, limit=limit)
+        return await self.replay(ticks, speed=speed, source="market_data", drain_timeout=drain_timeout)
+
+    async def replay_file(
+        self,
+        path: str,
+        speed: Optional[float] = 1.0,
+        drain_timeout: float = 30.0
+    ) -> ReplayStats:
+        """
+        Replay ticks from an exported file or tick journal.
+
+        Args:
+            path: CSV, JSONL, journal segment or journal directory.
+            speed: Replay speed multiplier (None or 0 = max speed).
+            drain_timeout: Seconds to wait for the pipeline to drain.
+
+        Returns:
+            ReplayStats: Replay results.
+        """
+        return await self.replay(
+            _as_async(iter_file_ticks(path)), speed=speed, source=path, drain_timeout=drain_timeout
+        )
+
+    async def replay(
+        self,
+        ticks: AsyncIterator[TickRecord],
+        speed: Optional[float] = 1.0,
+        source: str = "custom",
+        drain_timeout: float = 30.0
+    ) -> ReplayStats:
+        """
+        Replay ticks through the ingestion callback.
+
+        Args:
+            ticks: Ticks in recorded timestamp order.
+            speed: Replay speed multiplier (None or 0 = max speed).
+            source: Source description for stats.
+            drain_timeout: Seconds to wait for the pipeline to drain.
+
+        Returns:
+            ReplayStats: Replay results.
+        """
+        if self.is_running:
+            raise RuntimeError("A replay is already running")
+
+        self.is_running = True
+        self._stop_requested = False
+        stats = ReplayStats(source=source, speed=speed or None)
+        self.last_stats = stats
+
+        ingestion = self.data_ingestion
+        ticks_before = ingestion.ticks_processed
+        alerts_before = self._alert_counters()
+
+        logger.info(f"Starting tick replay from {source}", speed=speed or "max")
+        wall_start = time.perf_counter()
+
+        try:
+            first_ts: Optional[datetime] = None
+            last_ts: Optional[datetime] = None
+
+            async for timestamp, message in self._messages(ticks):
+                if self._stop_requested:
+                    break
+
+                if first_ts is None:
+                    first_ts = timestamp
+                last_ts = timestamp
+
+                if speed:
+                    target = (timestamp - first_ts).total_seconds() / speed
+                    delay = target - (time.perf_counter() - wall_start)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif stats.messages_sent % self.max_speed_yield_every == 0:
+                    # Let the processing loops run between bursts
+                    await asyncio.sleep(0)
+
+                ingestion._handle_market_data(message["content"][0]["key"], message)
+                stats.messages_sent += 1
+                stats.ticks_sent += len(message["content"])
+
+            stats.send_seconds = time.perf_counter() - wall_start
+            if first_ts is not None:
+                stats.data_span_seconds = (last_ts - first_ts).total_seconds()
+
+            stats.drained = await self._wait_for_drain(drain_timeout)
+            stats.wall_seconds = time.perf_counter() - wall_start
+            if stats.drained:
+                stats.wall_seconds -= _DRAIN_SETTLE_SECONDS
+            stats.ticks_persisted = ingestion.ticks_processed - ticks_before
+            self._record_alert_stats(stats, alerts_before)
+
+        finally:
+            self.is_running = False
+
+        logger.info(f"Tick replay from {source} complete", **stats.to_dict())
+        return stats
+
+    async def _messages(
+        self,
+        ticks: AsyncIterator[TickRecord]
+    ) -> AsyncIterator[Tuple[datetime, Dict[str, Any]]]:
+        """Group consecutive ticks with equal timestamps into messages."""
+        group: List[TickRecord] = []
+        symbols = set()
+
+        async for tick in ticks:
+            if group and (tick.timestamp != group[0].timestamp or tick.symbol in symbols):
+                yield group[0].timestamp, build_message(group, self.service)
+                group = []
+                symbols.clear()
+            group.append(tick)
+            symbols.add(tick.symbol)
+
+        if group:
+            yield group[0].timestamp, build_message(group, self.service)
+
+    def _alert_counters(self) -> Tuple[int, float]:
+        if not self.alert_engine:
+            return 0, 0.0
+        return self.alert_engine.alerts_fired, self.alert_engine.total_alert_latency_ms
+
+    def _record_alert_stats(self, stats: ReplayStats, before: Tuple[int, float]) -> None:
+        if not self.alert_engine:
+            return
+        fired, latency_ms = self._alert_counters()
+        stats.alerts_fired = fired - before[0]
+        if stats.alerts_fired:
+            stats.avg_alert_latency_ms = (latency_ms - before[1]) / stats.alerts_fired
+            stats.max_alert_latency_ms = self.alert_engine.max_alert_latency_ms
+
+    async def _wait_for_drain(self, timeout: float) -> bool:
+        """
+        Wait until ingestion and alert queues are empty and persistence is idle.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            bool: True if the pipeline drained within the timeout.
+        """
+        deadline = time.perf_counter() + timeout
+        last_processed = -1
+        idle_since: Optional[float] = None
+
+        while time.perf_counter() < deadline:
+            now = time.perf_counter()
+            processed = self.data_ingestion.ticks_processed
+            idle = (
+                self.data_ingestion.data_queue.empty() and
+                (not self.alert_engine or self.alert_engine.is_idle) and
+                processed == last_processed
+            )
+            if not idle:
+                idle_since = None
+            elif idle_since is None:
+                idle_since = now
+            elif now - idle_since >= _DRAIN_SETTLE_SECONDS:
+                return True
+            last_processed = processed
+            await asyncio.sleep(_DRAIN_POLL_SECONDS)
+
+        logger.warning(f"Replay pipeline did not drain within {timeout}s")
+        return False
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get replay engine status.
+
+        Returns:
+            Dict: Running flag and last run statistics.
+        """
+        return {
+            "running": self.is_running,
+            "last_run": self.last_stats.to_dict() if self.last_stats else None,
+        }
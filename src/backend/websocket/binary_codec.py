@@ -0,0 +1,233 @@
+"""
+Binary WebSocket Encoding.
+
+Clients that offer the ``tradeassist.binary.v1`` subprotocol when
+connecting receive ticks and alerts as fixed-layout little-endian binary
+frames instead of JSON text. Control messages (connection status,
+subscription acks, pongs, errors) stay JSON text frames.
+
+Every frame starts with a one-byte frame type:
+
+- TICK (1): one tick record, carrying the MarketDataUpdate fields sent to
+  clients.
+- TICK_BATCH (2): uint16 count followed by that many tick records.
+- ALERT (3): the AlertNotification fields sent to clients.
+
+A tick record is ``<Iqdddd``: instrument ID, timestamp (microseconds since
+the Unix epoch, UTC), price, volume, bid and ask (NaN when missing),
+followed by the symbol as a uint8 length and UTF-8 bytes.
+
+An alert is ``<iIIqddi``: alert ID (-1 when missing), rule ID, instrument
+ID, timestamp, current value, target value and evaluation time in ms (-1
+when missing), followed by symbol, rule name, condition, severity and
+message, each as a uint16 length and UTF-8 bytes.
+"""
+
+import math
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Subprotocol clients offer in Sec-WebSocket-Protocol to receive binary frames
+BINARY_SUBPROTOCOL = "tradeassist.binary.v1"
+
+FRAME_TICK = 1
+FRAME_TICK_BATCH = 2
+FRAME_ALERT = 3
+
+_FRAME_TYPE = struct.Struct("<B")
+_BATCH_HEADER = struct.Struct("<BH")
+_TICK = struct.Struct("<Iqdddd")
+_ALERT = struct.Struct("<BiIIqddi")
+_SHORT_LENGTH = struct.Struct("<B")
+_LENGTH = struct.Struct("<H")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_NAN = float("nan")
+
+
+def _to_micros(value: Union[str, datetime, None]) -> int:
+    """Convert an ISO timestamp (naive = UTC) to microseconds since the epoch."""
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(micros: int) -> str:
+    """Convert microseconds since the epoch to a naive UTC ISO timestamp."""
+    return (_EPOCH + timedelta(microseconds=micros)).replace(tzinfo=None).isoformat()
+
+
+def _optional_float(value: Optional[float]) -> float:
+    return _NAN if value is None else float(value)
+
+
+def _from_optional_float(value: float) -> Optional[float]:
+    return None if math.isnan(value) else value
+
+
+def _short_text(value: Optional[str]) -> bytes:
+    encoded = (value or "").encode("utf-8")[:255]
+    return _SHORT_LENGTH.pack(len(encoded)) + encoded
+
+
+def _text(value: Optional[str]) -> bytes:
+    encoded = (value or "").encode("utf-8")[:65535]
+    return _LENGTH.pack(len(encoded)) + encoded
+
+
+def _read_text(frame: bytes, offset: int, length_format: struct.Struct) -> Tuple[str, int]:
+    (length,) = length_format.unpack_from(frame, offset)
+    offset += length_format.size
+    return frame[offset:offset + length].decode("utf-8"), offset + length
+
+
+def _pack_tick(instrument_id: int, symbol: str, price: float, volume: float,
+               bid: Optional[float], ask: Optional[float], timestamp: Union[str, datetime, None]) -> bytes:
+    return _TICK.pack(
+        instrument_id,
+        _to_micros(timestamp),
+        float(price),
+        float(volume or 0),
+        _optional_float(bid),
+        _optional_float(ask)
+    ) + _short_text(symbol)
+
+
+def _unpack_tick(frame: bytes, offset: int) -> Tuple[Dict[str, Any], int]:
+    instrument_id, micros, price, volume, bid, ask = _TICK.unpack_from(frame, offset)
+    symbol, offset = _read_text(frame, offset + _TICK.size, _SHORT_LENGTH)
+    return {
+        "instrumentId": instrument_id,
+        "symbol": symbol,
+        "price": price,
+        "volume": volume,
+        "timestamp": _from_micros(micros),
+        "bid": _from_optional_float(bid),
+        "ask": _from_optional_float(ask),
+    }, offset
+
+
+def encode_message(message: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Encode an outgoing message as a binary frame.
+
+    Args:
+        message: Message dict as broadcast to JSON clients
+
+    Returns:
+        Optional[bytes]: Binary frame, or None if the message type has no
+            binary layout and should be sent as JSON
+    """
+    message_type = message.get("messageType")
+    data = message.get("data") or {}
+
+    if message_type == "market_data":
+        return _FRAME_TYPE.pack(FRAME_TICK) + _pack_tick(
+            data["instrumentId"], data.get("symbol"), data["price"], data.get("volume"),
+            data.get("bid"), data.get("ask"), data.get("timestamp")
+        )
+
+    if message_type == "market_data_batch":
+        count = min(data["count"], 65535)
+        columns = zip(
+            data["instrumentIds"], data["symbols"], data["prices"], data["volumes"],
+            data["bids"], data["asks"], data["timestamps"]
+        )
+        return _BATCH_HEADER.pack(FRAME_TICK_BATCH, count) + b"".join(
+            _pack_tick(*tick) for _, tick in zip(range(count), columns)
+        )
+
+    if message_type == "alert":
+        alert_id = data.get("alertId")
+        evaluation_time_ms = data.get("evaluationTimeMs")
+        return _ALERT.pack(
+            FRAME_ALERT,
+            -1 if alert_id is None else int(alert_id),
+            data["ruleId"],
+            data["instrumentId"],
+            _to_micros(message.get("timestamp")),
+            float(data["currentValue"]),
+            float(data["targetValue"]),
+            -1 if evaluation_time_ms is None else int(evaluation_time_ms)
+        ) + b"".join(
+            _text(data.get(field)) for field in ("symbol", "ruleName", "condition", "severity", "message")
+        )
+
+    return None
+
+
+def decode_frame(frame: bytes) -> Dict[str, Any]:
+    """
+    Decode a binary frame into the equivalent JSON message.
+
+    Args:
+        frame: Binary frame from encode_message
+
+    Returns:
+        Dict: Message with messageType and data
+
+    Raises:
+        ValueError: If the frame type is unknown
+    """
+    (frame_type,) = _FRAME_TYPE.unpack_from(frame)
+
+    if frame_type == FRAME_TICK:
+        tick, _ = _unpack_tick(frame, _FRAME_TYPE.size)
+        return {"messageType": "market_data", "timestamp": tick["timestamp"], "data": tick}
+
+    if frame_type == FRAME_TICK_BATCH:
+        _, count = _BATCH_HEADER.unpack_from(frame)
+        offset = _BATCH_HEADER.size
+        ticks: List[Dict[str, Any]] = []
+        for _ in range(count):
+            tick, offset = _unpack_tick(frame, offset)
+            ticks.append(tick)
+        return {
+            "messageType": "market_data_batch",
+            "data": {
+                "count": count,
+                "instrumentIds": [tick["instrumentId"] for tick in ticks],
+                "symbols": [tick["symbol"] for tick in ticks],
+                "prices": [tick["price"] for tick in ticks],
+                "volumes": [tick["volume"] for tick in ticks],
+                "bids": [tick["bid"] for tick in ticks],
+                "asks": [tick["ask"] for tick in ticks],
+                "timestamps": [tick["timestamp"] for tick in ticks],
+            },
+        }
+
+    if frame_type == FRAME_ALERT:
+        (_, alert_id, rule_id, instrument_id, micros, current_value,
+         target_value, evaluation_time_ms) = _ALERT.unpack_from(frame)
+        offset = _ALERT.size
+        texts = []
+        for _ in range(5):
+            text, offset = _read_text(frame, offset, _LENGTH)
+            texts.append(text)
+        symbol, rule_name, condition, severity, message = texts
+        return {
+            "messageType": "alert",
+            "timestamp": _from_micros(micros),
+            "data": {
+                "alertId": None if alert_id < 0 else alert_id,
+                "ruleId": rule_id,
+                "instrumentId": instrument_id,
+                "symbol": symbol,
+                "ruleName": rule_name,
+                "condition": condition,
+                "targetValue": target_value,
+                "currentValue": current_value,
+                "severity": severity,
+                "message": message,
+                "evaluationTimeMs": None if evaluation_time_ms < 0 else evaluation_time_ms,
+                "ruleCondition": condition,
+            },
+        }
+
+    raise ValueError(f"Unknown binary frame type: {frame_type}")
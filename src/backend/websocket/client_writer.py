@@ -0,0 +1,255 @@
+"""
+Per-Client WebSocket Writer.
+
+Each connection gets a bounded outbound queue drained by its own writer
+task, so broadcasting is a non-blocking enqueue and a client on a slow
+link only delays its own messages. What happens when a client's queue is
+full is set by the outbound policy.
+
+Clients can also cap keyed updates (market data per instrument) to a
+number per second. Updates arriving faster are held latest-value-wins and
+released by the connection manager's flush timer.
+"""
+
+import asyncio
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Union
+
+import structlog
+from fastapi import WebSocket
+
+logger = structlog.get_logger()
+
+
+class OutboundPolicy(str, Enum):
+    """Behaviour when a client's outbound queue is full."""
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued message
+    CONFLATE = "conflate"        # Replace a queued tick for the same instrument, else drop oldest
+    DISCONNECT = "disconnect"    # Drop the message; evict the client after max_overflows
+
+
+class ClientWriter:
+    """
+    Bounded outbound queue and writer task for one WebSocket client.
+
+    Messages are pre-serialized frames: str is sent as a text frame and
+    bytes (binary-encoded connections) as a binary frame. Frames enqueued with a key
+    (market data ticks use their instrument) can be conflated: under the
+    conflate policy a new frame replaces the queued one for the same key
+    in place, so the client gets the latest value without losing its turn.
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        websocket: WebSocket,
+        on_failure: Callable[[str], None],
+        max_queue_size: int = 1000,
+        policy: OutboundPolicy = OutboundPolicy.CONFLATE,
+        max_overflows: int = 100
+    ):
+        self.client_id = client_id
+        self.websocket = websocket
+        self.on_failure = on_failure
+        self.max_queue_size = max(1, max_queue_size)
+        self.policy = OutboundPolicy(policy)
+        self.max_overflows = max_overflows
+
+        # Queued [key, text] entries; pending maps a key to its queued entry
+        self._queue: Deque[List[Any]] = deque()
+        self._pending: Dict[Hashable, List[Any]] = {}
+        self._has_items = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        # Rate caps: conflation key -> max updates/sec (None key = every keyed message)
+        self.rate_limits: Dict[Optional[Hashable], float] = {}
+        self._last_released: Dict[Hashable, float] = {}
+        self._held: Dict[Hashable, Union[str, bytes]] = {}
+
+        # Statistics
+        self.throttled = 0
+        self.sent = 0
+        self.dropped = 0
+        self.conflated = 0
+        self.overflows = 0
+        self.max_depth = 0
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def close(self) -> None:
+        """Stop the writer task and discard queued messages."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._queue.clear()
+        self._pending.clear()
+        self._held.clear()
+
+    @property
+    def depth(self) -> int:
+        """Number of queued messages."""
+        return len(self._queue)
+
+    def set_rate_limit(self, max_updates_per_second: Optional[float], key: Optional[Hashable] = None) -> None:
+        """
+        Cap how often keyed updates are sent.
+
+        Args:
+            max_updates_per_second: Cap, or None/0 to remove it
+            key: Conflation key to cap, or None for the default cap of every key
+        """
+        if max_updates_per_second:
+            self.rate_limits[key] = float(max_updates_per_second)
+        else:
+            self.rate_limits.pop(key, None)
+
+    def _min_interval(self, key: Hashable) -> Optional[float]:
+        rate = self.rate_limits.get(key, self.rate_limits.get(None))
+        return 1.0 / rate if rate else None
+
+    @property
+    def has_held(self) -> bool:
+        """Whether rate-capped updates are waiting for the flush timer."""
+        return bool(self._held)
+
+    def publish(self, text: Union[str, bytes], key: Optional[Hashable] = None) -> bool:
+        """
+        Queue a message, applying the client's rate cap to keyed updates.
+
+        An update for a key sent less than the cap interval ago is held,
+        replacing any update already held for it, until flush_held().
+
+        Args:
+            text: Serialized frame
+            key: Conflation key (e.g. instrument) or None for messages that are never capped
+
+        Returns:
+            bool: False if the client exceeded max_overflows and should be evicted
+        """
+        if key is None:
+            return self.enqueue(text)
+
+        interval = self._min_interval(key)
+        if interval is None:
+            return self.enqueue(text, key)
+
+        now = time.monotonic()
+        if key not in self._held and now - self._last_released.get(key, float("-inf")) >= interval:
+            self._last_released[key] = now
+            return self.enqueue(text, key)
+
+        if key in self._held:
+            self.throttled += 1
+        self._held[key] = text
+        return True
+
+    def flush_held(self) -> bool:
+        """
+        Queue held updates whose cap interval has elapsed.
+
+        Returns:
+            bool: False if the client exceeded max_overflows and should be evicted
+        """
+        now = time.monotonic()
+        for key in list(self._held):
+            interval = self._min_interval(key)
+            if interval is not None and now - self._last_released.get(key, float("-inf")) < interval:
+                continue
+            self._last_released[key] = now
+            if not self.enqueue(self._held.pop(key), key):
+                return False
+        return True
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Forget the rate cap and held update for a key.
+
+        Args:
+            key: Conflation key
+        """
+        self.rate_limits.pop(key, None)
+        self._held.pop(key, None)
+        self._last_released.pop(key, None)
+
+    def enqueue(self, text: Union[str, bytes], key: Optional[Hashable] = None) -> bool:
+        """
+        Queue a serialized message without waiting.
+
+        Args:
+            text: Serialized frame
+            key: Conflation key (e.g. instrument) or None for messages that are never conflated
+
+        Returns:
+            bool: False if the client exceeded max_overflows and should be evicted
+        """
+        if key is not None and self.policy == OutboundPolicy.CONFLATE:
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry[1] = text
+                self.conflated += 1
+                return True
+
+        if len(self._queue) >= self.max_queue_size:
+            self.overflows += 1
+            if self.policy == OutboundPolicy.DISCONNECT:
+                self.dropped += 1
+                return self.overflows <= self.max_overflows
+            oldest = self._queue.popleft()
+            if oldest[0] is not None and self._pending.get(oldest[0]) is oldest:
+                del self._pending[oldest[0]]
+            self.dropped += 1
+
+        entry = [key, text]
+        self._queue.append(entry)
+        if key is not None:
+            self._pending[key] = entry
+        self.max_depth = max(self.max_depth, len(self._queue))
+        self._has_items.set()
+        return True
+
+    async def _run(self) -> None:
+        """Send queued messages in order until the connection fails."""
+        while True:
+            await self._has_items.wait()
+            while self._queue:
+                key, text = entry = self._queue.popleft()
+                if key is not None and self._pending.get(key) is entry:
+                    del self._pending[key]
+                try:
+                    if isinstance(text, bytes):
+                        await self.websocket.send_bytes(text)
+                    else:
+                        await self.websocket.send_text(text)
+                    self.sent += 1
+                except Exception as e:
+                    logger.warning(f"Failed to send to {self.client_id}: {e}")
+                    self._task = None
+                    self.on_failure(self.client_id)
+                    return
+            self._has_items.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dict: Queue depth and message counters
+        """
+        return {
+            "queue_depth": len(self._queue),
+            "max_queue_depth": self.max_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "conflated": self.conflated,
+            "overflows": self.overflows,
+            "held": len(self._held),
+            "throttled": self.throttled,
+            "rate_limits": {
+                "default" if key is None else str(key): rate for key, rate in self.rate_limits.items()
+            },
+        }
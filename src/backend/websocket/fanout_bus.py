@@ -0,0 +1,333 @@
+"""
+Cross-Worker WebSocket Fan-Out Bus.
+
+With several uvicorn workers, each process has its own ConnectionManager,
+but only one of them may ingest market data and evaluate alerts. Workers
+elect that owner with an exclusive lock on a shared file. The owner serves
+a Unix domain socket and publishes every tick and alert broadcast on it.
+The other workers subscribe and replay the events into their local
+ConnectionManager (and last-value cache), so a client gets the same stream
+whichever worker accepted it.
+
+Followers retry the lock whenever they lose the owner; the one that takes
+it is promoted and starts ingestion and alert evaluation through its
+on_promoted callback. Followers also forward alert rule change events from
+their rules API to the owner, whose alert engine applies them at once.
+
+Frames are a 4-byte big-endian length followed by a JSON event
+``{"kind": "tick" | "alert" | "rule_change", "data": {...}}``. Tick and
+alert events (owner to followers) hold the keyword arguments of the
+matching ConnectionManager broadcast method; rule change events (followers
+to owner) hold the RuleChangeEvent action, rule ID and instrument ID.
+
+A bus is pluggable: the ConnectionManager only calls ``publish(kind,
+data)`` on whatever is set as its ``bus``.
+"""
+
+import asyncio
+import fcntl
+import json
+import os
+import struct
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+import structlog
+
+from ..services.last_value_cache import get_last_value_cache
+from ..services.rule_events import RuleChangeAction, RuleChangeEvent, RuleEventBus, get_rule_event_bus
+from ..services.tick_normalizer import TickRecord
+
+logger = structlog.get_logger()
+
+_LENGTH = struct.Struct(">I")
+
+# Follower reconnect backoff (seconds)
+RECONNECT_MIN_DELAY = 0.5
+RECONNECT_MAX_DELAY = 5.0
+
+
+class UnixSocketFanoutBus:
+    """
+    Tick and alert fan-out between worker processes on one host.
+
+    start() elects the owner. The owner publishes (followers' publish is a
+    no-op) and drops followers whose socket buffer exceeds
+    max_buffer_bytes; a dropped follower reconnects and resumes with the
+    next event. A follower that finds the lock free when reconnecting
+    becomes the owner and awaits on_promoted.
+    """
+
+    def __init__(
+        self,
+        manager: Any,
+        socket_path: str,
+        lock_path: str,
+        max_buffer_bytes: int = 1_048_576,
+        on_promoted: Optional[Callable[[], Awaitable[None]]] = None,
+        rule_events: Optional[RuleEventBus] = None
+    ):
+        self.manager = manager
+        self.socket_path = socket_path
+        self.lock_path = lock_path
+        self.max_buffer_bytes = max_buffer_bytes
+        self.on_promoted = on_promoted
+        self.rule_events = rule_events or get_rule_event_bus()
+
+        self.is_owner = False
+        self._lock_fd: Optional[int] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._followers: Set[asyncio.StreamWriter] = set()
+        self._follow_task: Optional[asyncio.Task] = None
+        self._upstream: Optional[asyncio.StreamWriter] = None  # Follower's connection to the owner
+        self._running = False
+
+        # Statistics
+        self.events_published = 0
+        self.events_received = 0
+        self.dropped_followers = 0
+        self.reconnects = 0
+        self.promotions = 0
+        self.rule_changes_forwarded = 0
+        self.rule_changes_received = 0
+
+    def _acquire_lock(self) -> bool:
+        """Try to take the owner lock without waiting."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.lock_path)), exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._lock_fd = fd
+        return True
+
+    async def start(self) -> bool:
+        """
+        Elect the owner and start serving or following.
+
+        Returns:
+            bool: True if this process owns ingestion and publishes events
+        """
+        self._running = True
+        self.is_owner = self._acquire_lock()
+        self.manager.bus = self
+        self.rule_events.subscribe(self._forward_rule_change)
+
+        if self.is_owner:
+            await self._start_server()
+            logger.info("WebSocket fan-out bus owner", pid=os.getpid(), socket=self.socket_path)
+        else:
+            self._follow_task = asyncio.create_task(self._follow())
+            logger.info("WebSocket fan-out bus follower", pid=os.getpid(), socket=self.socket_path)
+
+        return self.is_owner
+
+    async def _start_server(self) -> None:
+        """Serve followers on the Unix socket (owner only)."""
+        # A socket file left by a crashed owner would block the bind
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = await asyncio.start_unix_server(self._serve_follower, path=self.socket_path)
+
+    async def _try_promote(self) -> bool:
+        """
+        Take over as owner if the previous owner released the lock.
+
+        Returns:
+            bool: True if this process is now the owner
+        """
+        if not self._acquire_lock():
+            return False
+
+        self.is_owner = True
+        self.promotions += 1
+        await self._start_server()
+        logger.warning("WebSocket fan-out bus follower promoted to owner", pid=os.getpid())
+
+        if self.on_promoted is not None:
+            try:
+                await self.on_promoted()
+            except Exception as e:
+                logger.error(f"Starting owner services after promotion failed: {e}")
+        return True
+
+    async def stop(self) -> None:
+        """Stop serving or following and release the owner lock."""
+        self._running = False
+        if self.manager.bus is self:
+            self.manager.bus = None
+        self.rule_events.unsubscribe(self._forward_rule_change)
+
+        if self._follow_task is not None:
+            self._follow_task.cancel()
+            try:
+                await self._follow_task
+            except asyncio.CancelledError:
+                pass
+            self._follow_task = None
+
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._followers):
+                writer.close()
+            self._followers.clear()
+            await self._server.wait_closed()
+            self._server = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+        if self._lock_fd is not None:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+            os.close(self._lock_fd)
+            self._lock_fd = None
+        self.is_owner = False
+
+    def publish(self, kind: str, data: Dict[str, Any]) -> None:
+        """
+        Send an event to every follower without waiting.
+
+        Args:
+            kind: "tick" or "alert"
+            data: Keyword arguments of the matching broadcast method
+        """
+        if not self.is_owner or not self._followers:
+            return
+
+        frame = _encode_frame(kind, data)
+        for writer in list(self._followers):
+            if writer.transport.get_write_buffer_size() > self.max_buffer_bytes:
+                logger.warning("Dropping slow WebSocket fan-out follower")
+                self._followers.discard(writer)
+                self.dropped_followers += 1
+                writer.close()
+                continue
+            writer.write(frame)
+        self.events_published += 1
+
+    async def _serve_follower(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Register a follower connection and apply its rule change events until it closes."""
+        self._followers.add(writer)
+        try:
+            while True:
+                event = await _read_frame(reader)
+                if event["kind"] == "rule_change":
+                    self.rule_changes_received += 1
+                    self._apply_rule_change(event["data"])
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.error(f"Error reading from WebSocket fan-out follower: {e}")
+        finally:
+            self._followers.discard(writer)
+            writer.close()
+
+    async def _follow(self) -> None:
+        """
+        Receive events from the owner, reconnecting when the connection drops.
+
+        Every connection attempt first tries the owner lock, so a follower
+        takes over once the owner exits.
+        """
+        delay = RECONNECT_MIN_DELAY
+        while self._running:
+            if await self._try_promote():
+                return
+
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.socket_path)
+            except OSError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+                continue
+
+            delay = RECONNECT_MIN_DELAY
+            self._upstream = writer
+            try:
+                while True:
+                    event = await _read_frame(reader)
+                    self.events_received += 1
+                    await self._apply(event["kind"], event["data"])
+            except (asyncio.IncompleteReadError, ConnectionError):
+                logger.warning("WebSocket fan-out bus connection lost, reconnecting")
+                self.reconnects += 1
+            except Exception as e:
+                logger.error(f"Error in WebSocket fan-out follower: {e}")
+                self.reconnects += 1
+            finally:
+                self._upstream = None
+                writer.close()
+
+    def _forward_rule_change(self, event: RuleChangeEvent) -> None:
+        """
+        Send a local rule change to the owner's alert engine (follower only).
+
+        Changes made while disconnected are not queued; the owner picks
+        them up from its rules version check.
+
+        Args:
+            event: Rule change published by this worker's rules API
+        """
+        if self.is_owner or self._upstream is None:
+            return
+        self._upstream.write(_encode_frame("rule_change", {
+            "action": event.action.value,
+            "rule_id": event.rule_id,
+            "instrument_id": event.instrument_id,
+        }))
+        self.rule_changes_forwarded += 1
+
+    def _apply_rule_change(self, data: Dict[str, Any]) -> None:
+        """Publish a follower's rule change to this worker's rule event bus."""
+        self.rule_events.publish(RuleChangeEvent(
+            RuleChangeAction(data["action"]), data["rule_id"], data.get("instrument_id")
+        ))
+
+    async def _apply(self, kind: str, data: Dict[str, Any]) -> None:
+        """Replay an owner event into the local ConnectionManager."""
+        if kind == "tick":
+            if data.get("timestamp"):
+                get_last_value_cache().update(data["instrument_id"], TickRecord(
+                    data["symbol"], datetime.fromisoformat(data["timestamp"]), data["price"],
+                    data.get("volume") or 0, data.get("bid"), data.get("ask"),
+                    None, None, None, None, None
+                ))
+            await self.manager.broadcast_tick_update(**data)
+        elif kind == "alert":
+            if data.get("timestamp"):
+                data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+            await self.manager.broadcast_alert_fired(**data)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get bus statistics.
+
+        Returns:
+            Dict: Role, follower count and event counters
+        """
+        return {
+            "role": "owner" if self.is_owner else "follower",
+            "followers": len(self._followers),
+            "events_published": self.events_published,
+            "events_received": self.events_received,
+            "dropped_followers": self.dropped_followers,
+            "reconnects": self.reconnects,
+            "promotions": self.promotions,
+            "rule_changes_forwarded": self.rule_changes_forwarded,
+            "rule_changes_received": self.rule_changes_received,
+        }
+
+
+def _encode_frame(kind: str, data: Dict[str, Any]) -> bytes:
+    """Length-prefixed JSON frame for one event."""
+    body = json.dumps({"kind": kind, "data": data}, default=str).encode("utf-8")
+    return _LENGTH.pack(len(body)) + body
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    """Read one length-prefixed JSON event."""
+    (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+    return json.loads(await reader.readexactly(length))
@@ -64,6 +64,24 @@ class MarketDataMessage(WebSocketMessage):
     data: MarketDataUpdate
 
 
+class MarketDataBatch(BaseModel):
+    """Columnar market data batch payload; index i of every list is one tick."""
+    count: int
+    instrument_ids: List[int]
+    symbols: List[str]
+    prices: List[float]
+    volumes: List[float]
+    bids: List[Optional[float]]
+    asks: List[Optional[float]]
+    timestamps: List[datetime]
+
+
+class MarketDataBatchMessage(WebSocketMessage):
+    """Ticks from one batch interval, for clients subscribed with batchTicks."""
+    message_type: Literal["market_data_batch"] = "market_data_batch"
+    data: MarketDataBatch
+
+
 # =============================================================================
 # ALERT MESSAGES
 # =============================================================================
@@ -303,6 +321,7 @@ IncomingMessage = Union[
 # Outgoing messages (from server to client)
 OutgoingMessage = Union[
     MarketDataMessage,
+    MarketDataBatchMessage,
     AlertMessage,
     AnalyticsMessage,
     TechnicalIndicatorMessage,
@@ -324,6 +343,7 @@ AllMessages = Union[IncomingMessage, OutgoingMessage]
 
 MESSAGE_TYPE_REGISTRY = {
     "market_data": MarketDataMessage,
+    "market_data_batch": MarketDataBatchMessage,
     "alert": AlertMessage,
     "analytics_update": AnalyticsMessage,
     "technical_indicators": TechnicalIndicatorMessage,
@@ -9,24 +9,32 @@ import asyncio
 import json
 import time
 from datetime import datetime
-from typing import Dict, Set, Optional, Any, List
+from typing import Dict, Set, Optional, Any, Hashable, Iterable, List, Union
 
 import structlog
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
 
 from ..config import settings
+from ..services.last_value_cache import get_last_value_cache
 from .message_types import (
     WebSocketMessage as TypedWebSocketMessage, OutgoingMessage,
     MarketDataMessage, MarketDataUpdate, AlertMessage, AlertNotification,
     AnalyticsMessage, AnalyticsUpdate, TechnicalIndicatorMessage, TechnicalIndicatorUpdate,
     ConnectionMessage, ConnectionStatus, ErrorMessage, ErrorDetails
 )
+from .binary_codec import BINARY_SUBPROTOCOL, encode_message
+from .client_writer import ClientWriter, OutboundPolicy
 from .message_handler import MessageHandler
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Subscription types routed per instrument; other message types go to every client
+ROUTED_SUBSCRIPTION_TYPES = ("market_data", "alerts")
+# Subscription type that restores broadcast-to-all for every routed type
+ALL_SUBSCRIPTIONS = "all"
+
 
 class WebSocketMessage(BaseModel):
     """Legacy base model for WebSocket messages - kept for backward compatibility."""
@@ -42,12 +50,59 @@ class ConnectionManager:
     Manages active WebSocket connections for real-time broadcasting
     of market data, alerts, and system status updates with comprehensive
     message validation and performance optimization.
+    
+    Market data and alerts are routed through a reverse subscription
+    index: a client that subscribed to a routed type only receives that
+    type for its instruments. Clients that never subscribed to a type (or
+    subscribed to "all") keep receiving every message of it.
+    
+    Every connection has its own ClientWriter, so broadcasting only
+    enqueues serialized frames and a slow client never delays the others.
+    
+    Clients that opt in with the batchTicks subscribe parameter get their
+    ticks as one columnar market_data_batch frame per batch interval
+    instead of one market_data frame per tick.
+    
+    Clients that negotiate the binary subprotocol at connect time get
+    ticks and alerts as compact binary frames; JSON remains the default.
+    
+    New connections and market data subscriptions get an immediate
+    snapshot of the latest cached quotes instead of waiting for the next
+    tick.
+    
+    With several worker processes, a fan-out bus set as ``bus`` carries
+    tick and alert broadcasts from the worker that owns ingestion to the
+    others.
     """
     
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}  # client_id -> websocket
         self.client_subscriptions: Dict[str, Set[str]] = {}  # client_id -> subscription types
         self.client_heartbeats: Dict[str, datetime] = {}  # client_id -> last heartbeat
+        self.client_writers: Dict[str, ClientWriter] = {}  # client_id -> outbound writer
+        self.evicted_clients = 0
+        
+        # Reverse subscription index: type -> instrument ID (None = all instruments) -> client IDs
+        self._subscribers: Dict[str, Dict[Optional[int], Set[str]]] = {
+            subscription_type: {} for subscription_type in ROUTED_SUBSCRIPTION_TYPES
+        }
+        # Clients receiving every message of a type
+        self._unfiltered_clients: Dict[str, Set[str]] = {
+            subscription_type: set() for subscription_type in ROUTED_SUBSCRIPTION_TYPES
+        }
+        # Routed types each client has subscribed to (and so filters)
+        self._filtered_types: Dict[str, Set[str]] = {}
+        self.routing_metrics = {
+            "routed_messages": 0,
+            "skipped_sends": 0,
+            "batched_ticks": 0,
+            "batch_frames": 0
+        }
+        # Clients receiving market_data_batch frames, and ticks awaiting the next batch
+        self._batch_clients: Set[str] = set()
+        self._tick_batch: List[Dict[str, Any]] = []
+        # Clients that negotiated binary frames
+        self._binary_clients: Set[str] = set()
         self.connection_count = 0
         self.max_connections = settings.MAX_WEBSOCKET_CONNECTIONS
         self.message_handler = MessageHandler()
@@ -59,6 +114,10 @@ class ConnectionManager:
         self.heartbeat_interval = 30  # seconds
         self.heartbeat_timeout = 90   # seconds
         self._heartbeat_task = None
+        self._rate_flush_task = None
+        self._tick_batch_task = None
+        # Cross-worker fan-out bus (see fanout_bus), None when single-process
+        self.bus = None
     
     async def connect(self, websocket: WebSocket, client_id: Optional[str] = None) -> tuple[bool, str]:
         """
@@ -80,9 +139,28 @@ class ConnectionManager:
             client_id = f"client_{self.connection_count + 1}_{int(time.time())}"
         
         try:
-            await websocket.accept()
+            offered = getattr(websocket, "scope", {}).get("subprotocols") or []
+            binary = settings.WEBSOCKET_BINARY_ENABLED and BINARY_SUBPROTOCOL in offered
+            if binary:
+                await websocket.accept(subprotocol=BINARY_SUBPROTOCOL)
+                self._binary_clients.add(client_id)
+            else:
+                await websocket.accept()
             self.active_connections[client_id] = websocket
+            writer = ClientWriter(
+                client_id,
+                websocket,
+                on_failure=self.disconnect,
+                max_queue_size=settings.WEBSOCKET_CLIENT_QUEUE_SIZE,
+                policy=OutboundPolicy(settings.WEBSOCKET_CLIENT_QUEUE_POLICY),
+                max_overflows=settings.WEBSOCKET_CLIENT_MAX_OVERFLOWS
+            )
+            writer.set_rate_limit(settings.WEBSOCKET_MAX_UPDATES_PER_SECOND)
+            self.client_writers[client_id] = writer
+            writer.start()
             self.client_subscriptions[client_id] = set()
+            for unfiltered in self._unfiltered_clients.values():
+                unfiltered.add(client_id)
             self.connection_count += 1
             
             logger.info(f"WebSocket connection accepted for {client_id}. Active connections: {len(self.active_connections)}")
@@ -97,11 +175,13 @@ class ConnectionManager:
                     "connectedAt": datetime.utcnow().isoformat(),
                     "subscriptions": [],
                     "lastHeartbeat": datetime.utcnow().isoformat(),
-                    "connectionQuality": "good"
+                    "connectionQuality": "good",
+                    "encoding": "binary" if binary else "json"
                 }
             }
             
             await self.send_personal_message(websocket, welcome_message)
+            self._send_snapshot(client_id)
             
             # Initialize heartbeat tracking
             self.client_heartbeats[client_id] = datetime.utcnow()
@@ -110,6 +190,10 @@ class ConnectionManager:
             if self._heartbeat_task is None or self._heartbeat_task.done():
                 self._heartbeat_task = asyncio.create_task(self._heartbeat_monitor())
             
+            # Start the rate-cap flush timer if not already running
+            if self._rate_flush_task is None or self._rate_flush_task.done():
+                self._rate_flush_task = asyncio.create_task(self._rate_flush_loop())
+            
             return True, client_id
             
         except Exception as e:
@@ -119,6 +203,9 @@ class ConnectionManager:
                 del self.active_connections[client_id]
             if client_id in self.client_subscriptions:
                 del self.client_subscriptions[client_id]
+            if client_id in self.client_writers:
+                self.client_writers.pop(client_id).close()
+            self._remove_from_index(client_id)
             return False, ""
     
     def disconnect(self, client_id: str) -> None:
@@ -134,6 +221,11 @@ class ConnectionManager:
             del self.client_subscriptions[client_id]
         if client_id in self.client_heartbeats:
             del self.client_heartbeats[client_id]
+        if client_id in self.client_writers:
+            self.client_writers.pop(client_id).close()
+        self._batch_clients.discard(client_id)
+        self._binary_clients.discard(client_id)
+        self._remove_from_index(client_id)
         logger.info(f"Client {client_id} disconnected. Active connections: {len(self.active_connections)}")
     
     def disconnect_websocket(self, websocket: WebSocket) -> None:
@@ -155,15 +247,24 @@ class ConnectionManager:
         """
         Send message to specific WebSocket connection with improved error handling.
         
+        Goes through the client's writer when it has one, so personal
+        messages are never written concurrently with queued broadcasts.
+        
         Args:
             websocket: Target WebSocket connection.
             message: Message to send.
             
         Returns:
-            bool: True if message sent successfully, False otherwise.
+            bool: True if message sent (or queued) successfully, False otherwise.
         """
         try:
             json_message = json.dumps(message, default=str)
+            for writer in self.client_writers.values():
+                if writer.websocket is websocket:
+                    if not writer.enqueue(json_message):
+                        self._evict(writer.client_id)
+                        return False
+                    return True
             await websocket.send_text(json_message)
             return True
         except Exception as e:
@@ -171,48 +272,230 @@ class ConnectionManager:
             self.disconnect_websocket(websocket)
             return False
     
-    async def broadcast(self, message: dict) -> int:
+    def _remove_from_index(self, client_id: str) -> None:
+        """
+        Drop a client from the subscription index.
+        
+        Args:
+            client_id: Client identifier.
+        """
+        self._filtered_types.pop(client_id, None)
+        for unfiltered in self._unfiltered_clients.values():
+            unfiltered.discard(client_id)
+        for by_instrument in self._subscribers.values():
+            for instrument_id in [iid for iid, clients in by_instrument.items() if client_id in clients]:
+                by_instrument[instrument_id].discard(client_id)
+                if not by_instrument[instrument_id]:
+                    del by_instrument[instrument_id]
+    
+    def _subscribe(self, client_id: str, subscription_type: str, instrument_id: Optional[int]) -> None:
         """
-        Broadcast message to all active connections with improved stability.
+        Add a client subscription to the routing index.
+        
+        The first subscription to a routed type switches the client from
+        receiving every message of that type to only its subscriptions.
+        
+        Args:
+            client_id: Client identifier.
+            subscription_type: Subscription type from the client.
+            instrument_id: Instrument ID, or None for every instrument.
+        """
+        if subscription_type == ALL_SUBSCRIPTIONS:
+            for unfiltered in self._unfiltered_clients.values():
+                unfiltered.add(client_id)
+            return
+        
+        if subscription_type not in self._subscribers:
+            return
+        
+        self._filtered_types.setdefault(client_id, set()).add(subscription_type)
+        if ALL_SUBSCRIPTIONS not in self.client_subscriptions.get(client_id, ()):
+            self._unfiltered_clients[subscription_type].discard(client_id)
+        self._subscribers[subscription_type].setdefault(instrument_id, set()).add(client_id)
+    
+    def _unsubscribe(self, client_id: str, subscription_type: str, instrument_id: Optional[int]) -> None:
+        """
+        Remove a client subscription from the routing index.
+        
+        A client stays filtered after unsubscribing; it does not fall back
+        to receiving every message.
+        
+        Args:
+            client_id: Client identifier.
+            subscription_type: Subscription type from the client.
+            instrument_id: Instrument ID, or None for every instrument.
+        """
+        if subscription_type == ALL_SUBSCRIPTIONS:
+            for routed_type in self._filtered_types.get(client_id, ()):
+                self._unfiltered_clients[routed_type].discard(client_id)
+            return
+        
+        clients = self._subscribers.get(subscription_type, {}).get(instrument_id)
+        if clients is not None:
+            clients.discard(client_id)
+            if not clients:
+                del self._subscribers[subscription_type][instrument_id]
+    
+    def subscribed_clients(self, subscription_type: str, instrument_id: int) -> Set[str]:
+        """
+        Get the clients that should receive a message for an instrument.
+        
+        Args:
+            subscription_type: Routed subscription type.
+            instrument_id: Instrument the message is about.
+        
+        Returns:
+            Set[str]: Client IDs subscribed to the instrument or the whole type,
+                plus clients not filtering this type.
+        """
+        by_instrument = self._subscribers[subscription_type]
+        recipients = set(self._unfiltered_clients[subscription_type])
+        recipients.update(by_instrument.get(instrument_id, ()))
+        recipients.update(by_instrument.get(None, ()))
+        return recipients
+    
+    def get_routing_stats(self) -> Dict[str, Any]:
+        """
+        Get subscription routing statistics.
+        
+        Returns:
+            Dict: Per-type subscription counts and routing counters.
+        """
+        return {
+            "subscriptions": {
+                subscription_type: {
+                    "unfiltered_clients": len(self._unfiltered_clients[subscription_type]),
+                    "instruments": len(by_instrument),
+                    "subscriptions": sum(len(clients) for clients in by_instrument.values()),
+                }
+                for subscription_type, by_instrument in self._subscribers.items()
+            },
+            **self.routing_metrics,
+        }
+    
+    async def broadcast(
+        self,
+        message: dict,
+        client_ids: Optional[Iterable[str]] = None,
+        conflation_key: Optional[Hashable] = None
+    ) -> int:
+        """
+        Queue a message for active connections without waiting on sends.
         
         Args:
             message: Message to broadcast.
+            client_ids: Recipients (defaults to every active connection).
+            conflation_key: Key under which a queued copy may be replaced by
+                this message and the client's rate cap applies (the
+                instrument of a tick).
             
         Returns:
-            int: Number of successful broadcasts.
+            int: Number of clients the message was queued for.
         """
         if not self.active_connections:
             return 0
         
-        # Create JSON message once for efficiency
-        json_message = json.dumps(message, default=str)
+        if client_ids is None:
+            targets = list(self.client_writers.values())
+        else:
+            targets = [
+                self.client_writers[client_id]
+                for client_id in client_ids
+                if client_id in self.client_writers
+            ]
+            self.routing_metrics["routed_messages"] += 1
+            self.routing_metrics["skipped_sends"] += len(self.active_connections) - len(targets)
+            if not targets:
+                return 0
         
-        # Send to all connections, remove failed ones
-        disconnected_clients = set()
-        successful_sends = 0
+        # Serialize once per encoding for efficiency
+        frames: Dict[bool, Union[str, bytes]] = {}
         
-        for client_id, websocket in self.active_connections.copy().items():
-            try:
-                await websocket.send_text(json_message)
-                successful_sends += 1
-            except Exception as e:
-                logger.warning(f"Failed to broadcast to {client_id}: {e}")
-                disconnected_clients.add(client_id)
+        # Hand the frame to each client's writer, evict clients that keep overflowing
+        evicted_clients = []
+        queued = 0
+        
+        for writer in targets:
+            binary = writer.client_id in self._binary_clients
+            frame = frames.get(binary)
+            if frame is None:
+                frame = frames[binary] = self._serialize(message, binary)
+            if writer.publish(frame, conflation_key):
+                queued += 1
+            else:
+                evicted_clients.append(writer.client_id)
         
-        # Batch cleanup failed connections
-        if disconnected_clients:
-            for client_id in disconnected_clients:
-                self.disconnect(client_id)
-            logger.info(f"Cleaned up {len(disconnected_clients)} failed connections")
+        for client_id in evicted_clients:
+            self._evict(client_id)
         
         # Update performance metrics
-        self.performance_metrics["messages_sent"] += successful_sends
+        self.performance_metrics["messages_sent"] += queued
+        
+        return queued
+    
+    def _serialize(self, message: dict, binary: bool) -> Union[str, bytes]:
+        """
+        Serialize a message for a client's encoding.
+        
+        Args:
+            message: Message to serialize.
+            binary: Whether the client negotiated binary frames.
+        
+        Returns:
+            Union[str, bytes]: Binary frame, or JSON text for JSON clients
+                and message types without a binary layout.
+        """
+        if binary:
+            frame = encode_message(message)
+            if frame is not None:
+                return frame
+        return json.dumps(message, default=str)
+    
+    def _evict(self, client_id: str) -> None:
+        """
+        Disconnect a client that cannot keep up with its outbound queue.
         
-        return successful_sends
+        Args:
+            client_id: Client identifier.
+        """
+        websocket = self.active_connections.get(client_id)
+        writer = self.client_writers.get(client_id)
+        logger.warning(
+            f"Evicting slow WebSocket client {client_id}",
+            overflows=writer.overflows if writer else None
+        )
+        self.evicted_clients += 1
+        self.disconnect(client_id)
+        if websocket is not None:
+            asyncio.create_task(self._close_websocket(websocket))
+    
+    async def _close_websocket(self, websocket: WebSocket) -> None:
+        """Close an evicted client's socket (1013: try again later)."""
+        try:
+            await websocket.close(code=1013, reason="Slow consumer")
+        except Exception:
+            pass
+    
+    def get_client_queue_stats(self) -> Dict[str, Any]:
+        """
+        Get per-client outbound queue statistics.
+        
+        Returns:
+            Dict: Policy, evictions and each client's writer counters.
+        """
+        return {
+            "binary_clients": len(self._binary_clients),
+            "policy": settings.WEBSOCKET_CLIENT_QUEUE_POLICY,
+            "max_queue_size": settings.WEBSOCKET_CLIENT_QUEUE_SIZE,
+            "evicted_clients": self.evicted_clients,
+            "clients": {
+                client_id: writer.get_stats() for client_id, writer in self.client_writers.items()
+            },
+        }
 
     async def broadcast_tick_update(self, instrument_id: int, symbol: str, price: float, volume: float = 0, bid: float = None, ask: float = None, timestamp: str = None) -> int:
         """
-        Broadcast market data tick update to all connected clients.
+        Send a market data tick update to clients subscribed to the instrument.
         
         Args:
             instrument_id: The instrument identifier
@@ -224,13 +507,45 @@ class ConnectionManager:
             timestamp: Market data timestamp (optional)
             
         Returns:
-            int: Number of successful broadcasts
+            int: Number of clients the tick was queued or batched for
         """
+        if self.bus is not None:
+            self.bus.publish("tick", {
+                "instrument_id": instrument_id,
+                "symbol": symbol,
+                "price": price,
+                "volume": volume,
+                "bid": bid,
+                "ask": ask,
+                "timestamp": timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp
+            })
+        
         if not self.active_connections:
             return 0
-            
-        # Create market data message in expected format
+        
         current_timestamp = timestamp or datetime.utcnow().isoformat()
+        recipients = self.subscribed_clients("market_data", instrument_id)
+        
+        # Opted-in clients get the tick in the next market_data_batch frame
+        batched = 0
+        if self._batch_clients:
+            batch_recipients = recipients & self._batch_clients
+            if batch_recipients:
+                self._tick_batch.append({
+                    "instrumentId": instrument_id,
+                    "symbol": symbol,
+                    "price": price,
+                    "volume": volume,
+                    "bid": bid,
+                    "ask": ask,
+                    "timestamp": current_timestamp
+                })
+                recipients -= batch_recipients
+                batched = len(batch_recipients)
+                if not recipients:
+                    return batched
+        
+        # Create market data message in expected format
         tick_message = {
             "messageType": "market_data",
             "version": "1.0", 
@@ -247,7 +562,72 @@ class ConnectionManager:
             }
         }
         
-        return await self.broadcast(tick_message)
+        return batched + await self.broadcast(
+            tick_message,
+            recipients,
+            conflation_key=instrument_id
+        )
+
+    async def broadcast_alert_fired(self, rule_id: int, instrument_id: int, symbol: str, trigger_value: float, threshold_value: float, condition: str, timestamp: datetime = None, evaluation_time_ms: int = None, alert_id: int = None, rule_name: str = None, message: str = None) -> int:
+        """
+        Send a fired alert notification to clients subscribed to the instrument's alerts.
+
+        Args:
+            rule_id: The alert rule identifier
+            instrument_id: The instrument identifier
+            symbol: The trading symbol
+            trigger_value: Value that triggered the alert
+            threshold_value: Rule threshold
+            condition: Rule condition
+            timestamp: Alert timestamp (optional)
+            evaluation_time_ms: Rule evaluation time (optional)
+            alert_id: Alert log identifier (optional)
+            rule_name: Rule name (optional)
+            message: Alert message (optional)
+
+        Returns:
+            int: Number of successful broadcasts
+        """
+        if self.bus is not None:
+            self.bus.publish("alert", {
+                "rule_id": rule_id,
+                "instrument_id": instrument_id,
+                "symbol": symbol,
+                "trigger_value": trigger_value,
+                "threshold_value": threshold_value,
+                "condition": condition,
+                "timestamp": timestamp.isoformat() if timestamp else None,
+                "evaluation_time_ms": evaluation_time_ms,
+                "alert_id": alert_id,
+                "rule_name": rule_name,
+                "message": message
+            })
+
+        if not self.active_connections:
+            return 0
+
+        alert_timestamp = (timestamp or datetime.utcnow()).isoformat()
+        alert_message = {
+            "messageType": "alert",
+            "version": "1.0",
+            "timestamp": alert_timestamp,
+            "data": {
+                "alertId": alert_id,
+                "ruleId": rule_id,
+                "instrumentId": instrument_id,
+                "symbol": symbol,
+                "ruleName": rule_name or f"Rule {rule_id}",
+                "condition": condition,
+                "targetValue": threshold_value,
+                "currentValue": trigger_value,
+                "severity": "medium",
+                "message": message or f"{symbol} {condition} {threshold_value} (actual: {trigger_value})",
+                "evaluationTimeMs": evaluation_time_ms,
+                "ruleCondition": condition
+            }
+        }
+
+        return await self.broadcast(alert_message, self.subscribed_clients("alerts", instrument_id))
 
     async def broadcast_database_performance(self, metrics: dict) -> int:
         """
@@ -311,8 +691,12 @@ class ConnectionManager:
                 if client_id not in self.client_subscriptions:
                     self.client_subscriptions[client_id] = set()
                 
+                instrument_id = int(instrument_id) if instrument_id else None
                 subscription_key = f"{subscription_type}_{instrument_id}" if instrument_id else subscription_type
+                self._subscribe(client_id, subscription_type, instrument_id)
                 self.client_subscriptions[client_id].add(subscription_key)
+                max_updates_per_second = self._apply_rate_limit(client_id, subscription_type, instrument_id, data)
+                batch_ticks = self._apply_tick_batching(client_id, data)
                 
                 # Send subscription acknowledgment
                 response = {
@@ -323,6 +707,35 @@ class ConnectionManager:
                         "subscriptionType": subscription_type,
                         "instrumentId": instrument_id,
                         "status": "subscribed",
+                        "requestId": request_id,
+                        "maxUpdatesPerSecond": max_updates_per_second,
+                        "batchTicks": batch_ticks
+                    }
+                }
+                await self.send_personal_message(websocket, response)
+                if subscription_type in ("market_data", ALL_SUBSCRIPTIONS):
+                    self._send_snapshot(client_id, instrument_id)
+                
+            elif message_type == "unsubscribe":
+                data = message.get("data", {})
+                subscription_type = data.get("subscriptionType", "")
+                instrument_id = int(data["instrumentId"]) if data.get("instrumentId") else None
+                request_id = data.get("requestId", f"req_{int(time.time())}")
+                
+                subscription_key = f"{subscription_type}_{instrument_id}" if instrument_id else subscription_type
+                self.client_subscriptions.get(client_id, set()).discard(subscription_key)
+                self._unsubscribe(client_id, subscription_type, instrument_id)
+                if subscription_type == "market_data" and instrument_id and client_id in self.client_writers:
+                    self.client_writers[client_id].discard(instrument_id)
+                
+                response = {
+                    "messageType": "subscription_ack",
+                    "version": "1.0",
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "data": {
+                        "subscriptionType": subscription_type,
+                        "instrumentId": instrument_id,
+                        "status": "unsubscribed",
                         "requestId": request_id
                     }
                 }
@@ -358,6 +771,236 @@ class ConnectionManager:
             }
             await self.send_personal_message(websocket, error_response)
 
+    def _apply_rate_limit(
+        self,
+        client_id: str,
+        subscription_type: str,
+        instrument_id: Optional[int],
+        data: dict
+    ) -> Optional[float]:
+        """
+        Apply a maxUpdatesPerSecond negotiated in a subscribe message.
+        
+        A market data subscription for an instrument caps that instrument;
+        any other subscription carrying the parameter sets the client's cap
+        for every instrument. 0 removes the cap.
+        
+        Args:
+            client_id: Client identifier.
+            subscription_type: Subscription type from the client.
+            instrument_id: Subscribed instrument, if any.
+            data: Subscribe message data.
+        
+        Returns:
+            Optional[float]: Cap now in effect for the subscription, if any.
+        """
+        writer = self.client_writers.get(client_id)
+        if writer is None:
+            return None
+        
+        parameters = data.get("parameters") or {}
+        requested = parameters.get("maxUpdatesPerSecond", data.get("maxUpdatesPerSecond"))
+        key = instrument_id if subscription_type == "market_data" and instrument_id else None
+        
+        if requested is not None:
+            requested = float(requested)
+            if requested < 0:
+                raise ValueError("maxUpdatesPerSecond must not be negative")
+            writer.set_rate_limit(requested, key)
+        
+        return writer.rate_limits.get(key, writer.rate_limits.get(None))
+    
+    def _send_snapshot(self, client_id: str, instrument_id: Optional[int] = None) -> int:
+        """
+        Queue the latest cached quotes for a client as market_data messages.
+        
+        Snapshot frames use the instrument's conflation key, so a live tick
+        queued behind one replaces it.
+        
+        Args:
+            client_id: Client identifier.
+            instrument_id: Instrument to snapshot, or None for every cached instrument.
+        
+        Returns:
+            int: Number of quotes queued.
+        """
+        writer = self.client_writers.get(client_id)
+        if writer is None:
+            return 0
+        
+        cache = get_last_value_cache()
+        if instrument_id is None:
+            quotes = cache.quotes()
+        else:
+            quote = cache.get(instrument_id)
+            quotes = [quote] if quote is not None else []
+        
+        binary = client_id in self._binary_clients
+        queued = 0
+        for quote in quotes:
+            data = quote.to_dict()
+            message = {
+                "messageType": "market_data",
+                "version": "1.0",
+                "timestamp": data["timestamp"],
+                "data": data
+            }
+            if not writer.enqueue(self._serialize(message, binary), quote.instrument_id):
+                self._evict(client_id)
+                return queued
+            queued += 1
+        
+        self.performance_metrics["messages_sent"] += queued
+        return queued
+    
+    def _apply_tick_batching(self, client_id: str, data: dict) -> bool:
+        """
+        Apply a batchTicks option from a subscribe message.
+        
+        Args:
+            client_id: Client identifier.
+            data: Subscribe message data.
+        
+        Returns:
+            bool: Whether the client now receives market_data_batch frames.
+        """
+        parameters = data.get("parameters") or {}
+        requested = parameters.get("batchTicks", data.get("batchTicks"))
+        
+        if requested is not None and client_id in self.client_writers:
+            if requested:
+                self._batch_clients.add(client_id)
+                if self._tick_batch_task is None or self._tick_batch_task.done():
+                    self._tick_batch_task = asyncio.create_task(self._tick_batch_loop())
+            else:
+                self._batch_clients.discard(client_id)
+        
+        return client_id in self._batch_clients
+    
+    def _build_tick_batch(self, ticks: List[Dict[str, Any]], binary: bool = False) -> Union[str, bytes]:
+        """
+        Serialize ticks as one columnar market_data_batch frame.
+        
+        Args:
+            ticks: Ticks in arrival order.
+            binary: Whether to build a binary frame.
+        
+        Returns:
+            Union[str, bytes]: Serialized frame.
+        """
+        return self._serialize({
+            "messageType": "market_data_batch",
+            "version": "1.0",
+            "timestamp": datetime.utcnow().isoformat(),
+            "data": {
+                "count": len(ticks),
+                "instrumentIds": [tick["instrumentId"] for tick in ticks],
+                "symbols": [tick["symbol"] for tick in ticks],
+                "prices": [tick["price"] for tick in ticks],
+                "volumes": [tick["volume"] for tick in ticks],
+                "bids": [tick["bid"] for tick in ticks],
+                "asks": [tick["ask"] for tick in ticks],
+                "timestamps": [tick["timestamp"] for tick in ticks]
+            }
+        }, binary)
+    
+    def _flush_tick_batch(self) -> int:
+        """
+        Queue one market_data_batch frame per batching client.
+        
+        Clients with the same market data subscriptions and encoding share
+        a serialized frame. Ticks go out unconflated and uncapped: the batch interval
+        already bounds the frame rate.
+        
+        Returns:
+            int: Number of frames queued.
+        """
+        ticks, self._tick_batch = self._tick_batch, []
+        if not ticks:
+            return 0
+        
+        # Instruments each filtered batching client receives (None = every instrument)
+        unfiltered = self._unfiltered_clients["market_data"]
+        by_instrument = self._subscribers["market_data"]
+        views: Dict[str, Optional[frozenset]] = {}
+        for client_id in self._batch_clients:
+            if client_id in unfiltered or client_id in by_instrument.get(None, ()):
+                views[client_id] = None
+        for instrument_id, clients in by_instrument.items():
+            if instrument_id is None:
+                continue
+            for client_id in clients & self._batch_clients:
+                if client_id not in views or views[client_id] is not None:
+                    views[client_id] = (views.get(client_id) or frozenset()) | {instrument_id}
+        
+        frames: Dict[tuple, Union[str, bytes, None]] = {}
+        evicted_clients = []
+        queued = 0
+        for client_id, view in views.items():
+            writer = self.client_writers.get(client_id)
+            if writer is None:
+                continue
+            frame_key = (view, client_id in self._binary_clients)
+            if frame_key not in frames:
+                selected = ticks if view is None else [tick for tick in ticks if tick["instrumentId"] in view]
+                frames[frame_key] = self._build_tick_batch(selected, frame_key[1]) if selected else None
+            if frames[frame_key] is None:
+                continue
+            if writer.enqueue(frames[frame_key]):
+                queued += 1
+            else:
+                evicted_clients.append(client_id)
+        
+        for client_id in evicted_clients:
+            self._evict(client_id)
+        
+        self.routing_metrics["batched_ticks"] += len(ticks)
+        self.routing_metrics["batch_frames"] += queued
+        self.performance_metrics["messages_sent"] += queued
+        return queued
+    
+    async def _tick_batch_loop(self):
+        """
+        Flush batched ticks every WEBSOCKET_TICK_BATCH_INTERVAL_MS.
+        
+        Runs while any client has tick batching enabled.
+        """
+        interval = settings.WEBSOCKET_TICK_BATCH_INTERVAL_MS / 1000
+        while self._batch_clients:
+            try:
+                await asyncio.sleep(interval)
+                self._flush_tick_batch()
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in WebSocket tick batch loop: {e}")
+        self._tick_batch.clear()
+    
+    async def _rate_flush_loop(self):
+        """
+        Release rate-capped updates held latest-value-wins.
+        
+        Runs while clients are connected; each pass queues held updates
+        whose cap interval has elapsed.
+        """
+        interval = settings.WEBSOCKET_RATE_FLUSH_INTERVAL_MS / 1000
+        while self.active_connections:
+            try:
+                await asyncio.sleep(interval)
+                evicted_clients = [
+                    writer.client_id
+                    for writer in list(self.client_writers.values())
+                    if writer.has_held and not writer.flush_held()
+                ]
+                for client_id in evicted_clients:
+                    self._evict(client_id)
+            
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in WebSocket rate flush loop: {e}")
+    
     async def _heartbeat_monitor(self):
         """
         Monitor client heartbeats and disconnect stale connections.
@@ -477,5 +1120,8 @@ def get_websocket_performance_metrics() -> Dict[str, Any]:
     return {
         "total_connections": len(manager.active_connections),
         "messages_sent": manager.performance_metrics["messages_sent"],
+        "routing": manager.get_routing_stats(),
+        "client_queues": manager.get_client_queue_stats(),
+        "fanout_bus": manager.bus.get_stats() if manager.bus is not None else None,
         "connection_health": manager.get_connection_health_status() if hasattr(manager, 'get_connection_health_status') else {}
     }
\ No newline at end of file
@@ -40,6 +40,23 @@ interface MarketDataMessage extends WebSocketMessage {
   data: MarketDataUpdate;
 }
 
+// Columnar batch: index i of every array is one tick
+interface MarketDataBatch {
+  count: number;
+  instrumentIds: number[];
+  symbols: string[];
+  prices: number[];
+  volumes: number[];
+  bids: (number | null)[];
+  asks: (number | null)[];
+  timestamps: string[];
+}
+
+interface MarketDataBatchMessage extends WebSocketMessage {
+  messageType: 'market_data_batch';
+  data: MarketDataBatch;
+}
+
 // =============================================================================
 // ALERT MESSAGES
 // =============================================================================
@@ -248,6 +265,7 @@ interface PongMessage extends WebSocketMessage {
 // Incoming messages (from server to client)
 export type IncomingMessage = 
   | MarketDataMessage
+  | MarketDataBatchMessage
   | AlertMessage
   | AnalyticsMessage
   | TechnicalIndicatorMessage
@@ -292,6 +310,10 @@ export function isMarketDataMessage(message: IncomingMessage): message is Market
   return message.messageType === 'market_data';
 }
 
+export function isMarketDataBatchMessage(message: IncomingMessage): message is MarketDataBatchMessage {
+  return message.messageType === 'market_data_batch';
+}
+
 export function isAnalyticsMessage(message: IncomingMessage): message is AnalyticsMessage {
   return message.messageType === 'analytics_update';
 }
@@ -424,6 +446,7 @@ export interface WebSocketSubscriptions {
 export type {
   WebSocketMessage,
   MarketDataUpdate,
+  MarketDataBatch,
   AnalyticsUpdate,
   TechnicalIndicatorUpdate,
   PricePredictionUpdate,
@@ -9,11 +9,14 @@ import pytest
 import asyncio
 import time
 import statistics
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List
 
 from src.backend.services.alert_engine import AlertEngine, RuleEvaluator
+from src.backend.services.batch_evaluator import BatchRuleEvaluator
+from src.backend.services.price_windows import PriceWindowStore
 from src.backend.services.data_ingestion import DataNormalizer
+from src.backend.services.tick_normalizer import TickNormalizer, TickRecord
 from src.backend.models.instruments import Instrument, InstrumentType
 from src.backend.models.market_data import MarketData
 from src.backend.models.alert_rules import AlertRule, RuleType, RuleCondition
@@ -156,6 +159,87 @@ class TestAlertEnginePerformance:
         # Should handle 10 rules within 500ms total
         assert total_time < 500, f"Concurrent evaluation took {total_time:.2f}ms, exceeds 500ms"
         assert avg_time < 100, f"Average per rule {avg_time:.2f}ms exceeds 100ms target"
+    
+    @pytest.mark.asyncio
+    async def test_vectorized_batch_vs_per_rule_evaluation(self):
+        """Microbenchmark NumPy batch evaluation against the per-rule coroutine path."""
+        instrument_ids = list(range(1, 11))
+        now = datetime.utcnow()
+        
+        price_windows = PriceWindowStore()
+        price_windows.configure({instrument_id: 300 for instrument_id in instrument_ids})
+        for instrument_id in instrument_ids:
+            price_windows.record(instrument_id, now - timedelta(seconds=600), 4400.0)
+            price_windows.record(instrument_id, now - timedelta(seconds=60), 4500.0)
+        
+        # 200 level-style rules per instrument
+        rules_by_instrument = {}
+        rule_id = 0
+        for instrument_id in instrument_ids:
+            rules = []
+            for i in range(200):
+                rule_id += 1
+                kind = i % 4
+                if kind == 0:
+                    rule_type, condition, threshold, window = RuleType.THRESHOLD, RuleCondition.EQUALS, 4500.0 + i, None
+                elif kind == 1:
+                    rule_type, condition, threshold, window = RuleType.VOLUME_SPIKE, RuleCondition.VOLUME_ABOVE, 1000.0 + i * 10, None
+                elif kind == 2:
+                    rule_type, condition, threshold, window = RuleType.RATE_OF_CHANGE, RuleCondition.PERCENT_CHANGE_UP, 0.5 + i * 0.01, 60 + i
+                else:
+                    rule_type, condition, threshold, window = RuleType.RATE_OF_CHANGE, RuleCondition.PERCENT_CHANGE_DOWN, 0.5 + i * 0.01, 60 + i
+                rules.append(AlertRule(
+                    id=rule_id,
+                    instrument_id=instrument_id,
+                    rule_type=rule_type,
+                    condition=condition,
+                    threshold=threshold,
+                    time_window_seconds=window,
+                ))
+            rules_by_instrument[instrument_id] = rules
+        
+        # Evaluation loop batch: 50 ticks across the instruments
+        batch = [
+            (
+                instrument_ids[n % len(instrument_ids)],
+                TickRecord("/ES", now, 4500.0 + (n % 7) * 10, 1000.0 + n * 20,
+                           None, None, None, None, None, None, None),
+            )
+            for n in range(50)
+        ]
+        evaluations = sum(len(rules_by_instrument[instrument_id]) for instrument_id, _ in batch)
+        rounds = 20
+        
+        engine = AlertEngine()
+        engine.evaluator = RuleEvaluator(price_windows)
+        start_time = time.perf_counter()
+        per_rule_hits = 0
+        for _ in range(rounds):
+            for instrument_id, tick in batch:
+                for rule in rules_by_instrument[instrument_id]:
+                    if await engine._evaluate_rule(rule, tick, None):
+                        per_rule_hits += 1
+        per_rule_time = time.perf_counter() - start_time
+        
+        batch_evaluator = BatchRuleEvaluator(price_windows)
+        batch_evaluator.build(rules_by_instrument)
+        start_time = time.perf_counter()
+        batch_hits = 0
+        for _ in range(rounds):
+            result = batch_evaluator.evaluate(batch, now=now)
+            batch_hits += len(result.hits)
+        batch_time = time.perf_counter() - start_time
+        
+        per_rule_rate = evaluations * rounds / per_rule_time
+        batch_rate = evaluations * rounds / batch_time
+        
+        print(f"Batch Rule Evaluation Microbenchmark ({evaluations} evaluations per batch):")
+        print(f"  Per-rule coroutines: {per_rule_rate:,.0f} evaluations/s")
+        print(f"  Vectorized batch: {batch_rate:,.0f} evaluations/s")
+        print(f"  Speedup: {batch_rate / per_rule_rate:.1f}x")
+        
+        assert batch_hits == per_rule_hits
+        assert batch_time < per_rule_time, "Vectorized evaluation slower than per-rule path"
 
 
 class TestDataIngestionPerformance:
@@ -200,6 +284,56 @@ class TestDataIngestionPerformance:
         assert throughput > 100, f"Throughput {throughput:.1f} ticks/s below 100 ticks/s requirement"
         assert normalized_count == len(raw_data_samples), "Some normalizations failed"
     
+    def test_compiled_normalizer_vs_legacy(self):
+        """Microbenchmark the compiled batch normalizer against DataNormalizer."""
+        symbols = [f"/SYM{i}" for i in range(10)]
+        messages = [
+            {
+                "service": "LEVELONE_FUTURES",
+                "content": [
+                    {
+                        "key": symbol,
+                        "LAST_PRICE": 4500.0 + (n * 0.25),
+                        "TOTAL_VOLUME": 1000 + n,
+                        "BID_PRICE": 4499.75 + (n * 0.25),
+                        "ASK_PRICE": 4500.25 + (n * 0.25),
+                        "BID_SIZE": 10,
+                        "ASK_SIZE": 12,
+                    }
+                    for symbol in symbols
+                ],
+            }
+            for n in range(200)
+        ]
+        tick_count = len(messages) * len(symbols)
+
+        legacy = DataNormalizer()
+        start_time = time.perf_counter()
+        legacy_ticks = 0
+        for message in messages:
+            for symbol in symbols:
+                if legacy.normalize_tick_data(symbol, message):
+                    legacy_ticks += 1
+        legacy_time = time.perf_counter() - start_time
+
+        compiled = TickNormalizer()
+        start_time = time.perf_counter()
+        compiled_ticks = 0
+        for message in messages:
+            compiled_ticks += len(compiled.normalize_message(message))
+        compiled_time = time.perf_counter() - start_time
+
+        legacy_us = legacy_time / tick_count * 1_000_000
+        compiled_us = compiled_time / tick_count * 1_000_000
+
+        print(f"Tick Normalization Microbenchmark ({tick_count} ticks):")
+        print(f"  Legacy DataNormalizer: {legacy_us:.2f} us/tick")
+        print(f"  Compiled TickNormalizer: {compiled_us:.2f} us/tick")
+        print(f"  Speedup: {legacy_us / compiled_us:.1f}x")
+
+        assert legacy_ticks == compiled_ticks == tick_count
+        assert compiled_time < legacy_time, "Compiled normalizer slower than legacy path"
+
     @pytest.mark.asyncio
     async def test_queue_processing_performance(self):
         """Test data queue processing performance."""
@@ -290,7 +424,76 @@ class TestDatabasePerformance:
         # Should insert market data quickly for real-time processing
         assert throughput > 100, f"Insert throughput {throughput:.1f}/s too low for real-time data"
         assert total_time < 5.0, f"Batch insert took {total_time:.3f}s, too slow"
-    
+
+    @pytest.mark.asyncio
+    async def test_ingestion_bulk_write_vs_orm_throughput(self, tmp_path, monkeypatch):
+        """Compare set-based batch writes against the per-tick ORM path."""
+        from unittest.mock import AsyncMock
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+        from src.backend.config import settings
+        from src.backend.database import connection
+        from sqlalchemy.schema import CreateIndex, CreateTable
+        from src.backend.models.instruments import InstrumentStatus
+        from src.backend.services.data_ingestion import DataIngestionService
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'benchmark.db'}")
+        session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        # Only the tables the write path touches (market_data keeps its indexes,
+        # which both write paths maintain)
+        async with engine.begin() as conn:
+            await conn.execute(CreateTable(Instrument.__table__))
+            await conn.execute(CreateTable(MarketData.__table__))
+            for index in MarketData.__table__.indexes:
+                await conn.execute(CreateIndex(index))
+        async with session_maker() as session:
+            instruments = [
+                Instrument(symbol=symbol, name=symbol, type=InstrumentType.FUTURE, status=InstrumentStatus.ACTIVE)
+                for symbol in ("ES", "NQ", "YM")
+            ]
+            session.add_all(instruments)
+            await session.commit()
+        monkeypatch.setattr(connection, "async_session_maker", session_maker)
+        monkeypatch.setattr(settings, "TICK_JOURNAL_ENABLED", False)
+
+        data_ingestion_service = DataIngestionService()
+        data_ingestion_service.websocket_manager = AsyncMock()
+        data_ingestion_service.instruments_map = {
+            instrument.symbol: instrument.id for instrument in instruments
+        }
+        symbols = list(data_ingestion_service.instruments_map)
+
+        def make_batch(batch_number: int) -> List[TickRecord]:
+            return [
+                TickRecord(
+                    symbols[i % len(symbols)], datetime.utcnow(),
+                    4500.0 + batch_number + (i * 0.25), 100 + i,
+                    None, None, None, None, None, None, None,
+                )
+                for i in range(100)
+            ]
+
+        results = {}
+        try:
+            for bulk_writes in (False, True):
+                monkeypatch.setattr(settings, "DATA_INGESTION_BULK_WRITES", bulk_writes)
+                data_ingestion_service.rows_written = 0
+                data_ingestion_service.write_time_seconds = 0.0
+
+                for batch_number in range(10):
+                    await data_ingestion_service._process_data_batch(make_batch(batch_number))
+
+                status = data_ingestion_service.get_status()
+                results[status["write_mode"]] = status["avg_rows_per_second"]
+        finally:
+            await engine.dispose()
+
+        print("Ingestion Batch Write Performance:")
+        print(f"  ORM path: {results['orm']:.1f} rows/second")
+        print(f"  Bulk path: {results['bulk']:.1f} rows/second")
+        print(f"  Speedup: {results['bulk'] / results['orm']:.1f}x")
+
+        assert results["bulk"] > results["orm"], "Bulk write path slower than ORM path"
+
     @pytest.mark.asyncio
     async def test_alert_rule_query_performance(self, test_session, sample_instruments):
         """Test alert rule query performance."""
@@ -347,6 +550,55 @@ class TestDatabasePerformance:
         assert max_time < 100, f"Maximum query time {max_time:.2f}ms exceeds 100ms limit"
 
 
+class TestWebSocketEncodingPerformance:
+    """Performance tests for WebSocket frame encoding."""
+    
+    def test_binary_vs_json_tick_encoding(self):
+        """Compare bytes/tick and encode time/tick for JSON and binary frames."""
+        import json
+        from src.backend.websocket.binary_codec import encode_message
+        
+        tick_count = 20000
+        messages = []
+        for n in range(tick_count):
+            timestamp = (datetime(2030, 1, 1) + timedelta(microseconds=n * 500)).isoformat()
+            messages.append({
+                "messageType": "market_data",
+                "version": "1.0",
+                "timestamp": timestamp,
+                "data": {
+                    "instrumentId": n % 10 + 1,
+                    "symbol": f"/SYM{n % 10}",
+                    "price": 4500.0 + (n % 400) * 0.25,
+                    "volume": 1000 + n,
+                    "timestamp": timestamp,
+                    "bid": 4499.75 + (n % 400) * 0.25,
+                    "ask": 4500.25 + (n % 400) * 0.25,
+                    "changePercent": None
+                }
+            })
+        
+        start_time = time.perf_counter()
+        json_frames = [json.dumps(message, default=str) for message in messages]
+        json_time = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        binary_frames = [encode_message(message) for message in messages]
+        binary_time = time.perf_counter() - start_time
+        
+        json_bytes = sum(len(frame.encode("utf-8")) for frame in json_frames) / tick_count
+        binary_bytes = sum(len(frame) for frame in binary_frames) / tick_count
+        json_us = json_time / tick_count * 1_000_000
+        binary_us = binary_time / tick_count * 1_000_000
+        
+        print(f"WebSocket Tick Encoding Microbenchmark ({tick_count} ticks):")
+        print(f"  JSON: {json_bytes:.1f} bytes/tick, {json_us:.2f} us/tick")
+        print(f"  Binary: {binary_bytes:.1f} bytes/tick, {binary_us:.2f} us/tick")
+        print(f"  Size reduction: {json_bytes / binary_bytes:.1f}x")
+        
+        assert binary_bytes < json_bytes / 3, "Binary ticks not substantially smaller than JSON"
+
+
 class TestMemoryUsagePerformance:
     """Performance tests for memory usage requirements."""
     
@@ -0,0 +1,136 @@
+"""
+Unit tests for hot-path log sampling.
+"""
+
+import structlog
+
+from src.backend.logging_config import HotPathLogSampler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def run(sampler, method_name="info", **event):
+    """Run one event through the sampler; return it or None if dropped."""
+    event.setdefault("event", "📥 QUEUED")
+    try:
+        return sampler(None, method_name, event)
+    except structlog.DropEvent:
+        return None
+
+
+class TestHotPathLogSampler:
+    """Test cases for HotPathLogSampler."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.sampler = HotPathLogSampler(
+            sample_rate=10,
+            rate_per_second=2.0,
+            burst=3,
+            summary_interval_seconds=10.0,
+            clock=self.clock
+        )
+
+    def test_events_without_hot_path_pass_through(self):
+        """Regular events are never sampled."""
+        for _ in range(100):
+            assert run(self.sampler, symbol="/ES") is not None
+
+    def test_sampling_is_per_call_site(self):
+        """One in N events per call site survives sampling."""
+        kept_queued = [run(self.sampler, hot_path="queued") for _ in range(20)]
+        kept_broadcast = [run(self.sampler, hot_path="broadcast") for _ in range(10)]
+
+        assert sum(event is not None for event in kept_queued) == 2
+        assert kept_queued[0] is not None and kept_queued[10] is not None
+        assert sum(event is not None for event in kept_broadcast) == 1
+
+    def test_token_bucket_limits_sampled_events(self):
+        """Sampled events beyond the burst are dropped until tokens refill."""
+        sampler = HotPathLogSampler(sample_rate=1, rate_per_second=2.0, burst=3, clock=self.clock)
+
+        assert sum(run(sampler, hot_path="tick") is not None for _ in range(10)) == 3
+
+        self.clock.now += 1.0
+        assert sum(run(sampler, hot_path="tick") is not None for _ in range(10)) == 2
+
+    def test_warnings_and_errors_always_pass(self):
+        """Error visibility is never sampled away."""
+        sampler = HotPathLogSampler(sample_rate=1000, rate_per_second=0.0, burst=0, clock=self.clock)
+
+        for method_name in ("warning", "error", "exception", "critical"):
+            assert run(sampler, method_name, hot_path="tick") is not None
+        assert run(sampler, "info", hot_path="tick") is None
+
+    def test_register_overrides_limits(self):
+        """Per call-site overrides replace global limits."""
+        self.sampler.register("batch", label="batches persisted", sample_rate=1, burst=100)
+
+        assert all(run(self.sampler, hot_path="batch") is not None for _ in range(50))
+
+    def test_hot_path_true_keys_on_event_text(self):
+        """hot_path=True uses the event text as the call-site key."""
+        run(self.sampler, hot_path=True)
+
+        assert "📥 QUEUED" in self.sampler.get_stats()
+
+    def record_summaries(self):
+        """Capture summary events instead of logging them."""
+        summaries = []
+
+        class SummaryLogger:
+            def info(self, event, **kw):
+                summaries.append((event, kw))
+
+        self.sampler._summary_logger = SummaryLogger()
+        return summaries
+
+    def test_periodic_summary(self):
+        """Aggregated counts are logged once per interval."""
+        summaries = self.record_summaries()
+        self.sampler.register("queued", label="ticks queued")
+
+        for _ in range(12430):
+            run(self.sampler, hot_path="queued")
+        assert summaries == []
+
+        self.clock.now = 10.0
+        run(self.sampler, hot_path="queued")
+
+        event, fields = summaries[0]
+        assert event == "12,430 ticks queued in last 10s"
+        assert fields["count"] == 12430
+        assert fields["suppressed"] == 12430 - fields["logged"]
+        assert self.sampler.get_stats()["queued"]["window_seen"] == 1
+
+        self.sampler.flush()
+        assert summaries[1][1]["count"] == 1
+
+    def test_quiet_call_site_summarized_by_any_event(self):
+        """A burst is reported once its window ends, even if that site goes quiet."""
+        summaries = self.record_summaries()
+        self.sampler.register("queued", label="ticks queued")
+
+        for _ in range(500):
+            run(self.sampler, hot_path="queued")
+        self.clock.now = 5.0
+        run(self.sampler, hot_path="broadcast")
+
+        self.clock.now = 10.0
+        run(self.sampler, symbol="/ES")
+
+        assert [event for event, _ in summaries] == ["500 ticks queued in last 10s"]
+
+        self.clock.now = 15.0
+        run(self.sampler, symbol="/ES")
+
+        assert summaries[1][1]["hot_path_summary"] == "broadcast"
@@ -0,0 +1,127 @@
+"""
+Unit tests for the local Schwab streaming simulator.
+
+Tests message shape, determinism, rate control and disconnect injection.
+"""
+
+import asyncio
+
+import pytest
+
+from src.backend.integrations.schwab_simulator import SimulatedSchwabClient
+from src.backend.services.tick_normalizer import TickNormalizer
+
+
+def collect_periods(client: SimulatedSchwabClient, periods: int) -> list:
+    """Generate messages for a number of simulated periods."""
+    messages = []
+    for _ in range(periods):
+        messages.extend(client.generate_period())
+    return messages
+
+
+class TestSimulatedSchwabClient:
+    """Test cases for SimulatedSchwabClient."""
+
+    def test_message_shape_matches_schwab_stream(self):
+        """Messages carry service and content items keyed by symbol."""
+        client = SimulatedSchwabClient(ticks_per_second=1000, symbols_per_message=5)
+        client.configure_symbols(["/ES", "/NQ", "/YM"])
+
+        messages = collect_periods(client, 5)
+
+        assert messages
+        for message in messages:
+            assert message["service"] == "LEVELONE_FUTURES"
+            keys = [item["key"] for item in message["content"]]
+            assert len(keys) == len(set(keys)) <= 5
+            assert all("LAST_PRICE" in item and "TOTAL_VOLUME" in item for item in message["content"])
+
+        ticks = TickNormalizer().normalize_message(messages[0])
+        assert len(ticks) == len(messages[0]["content"])
+
+    def test_same_seed_same_stream(self):
+        """Equal seeds reproduce the exact message sequence."""
+        streams = []
+        for _ in range(2):
+            client = SimulatedSchwabClient(ticks_per_second=5000, burstiness=0.8, seed=7)
+            client.configure_symbols(["/ES", "/NQ"])
+            streams.append(collect_periods(client, 50))
+
+        other = SimulatedSchwabClient(ticks_per_second=5000, burstiness=0.8, seed=8)
+        other.configure_symbols(["/ES", "/NQ"])
+
+        assert streams[0] == streams[1]
+        assert collect_periods(other, 50) != streams[0]
+
+    def test_average_rate_and_symbol_padding(self):
+        """Tick count over simulated time matches the configured rate."""
+        client = SimulatedSchwabClient(ticks_per_second=20000, symbol_count=100, burstiness=0.5)
+        client.configure_symbols(["/ES"])
+
+        messages = collect_periods(client, 100)  # 1 simulated second
+        ticks = sum(len(message["content"]) for message in messages)
+        symbols = {item["key"] for message in messages for item in message["content"]}
+
+        assert 16000 <= ticks <= 24000
+        assert "/ES" in symbols
+        assert "SIM00099" in symbols
+
+    def test_padding_symbols_fill_symbol_count(self):
+        """Padding covers exactly the symbols missing from symbol_count."""
+        client = SimulatedSchwabClient(symbol_count=4)
+
+        assert client.padding_symbols(["/ES", "/NQ"]) == ["SIM00002", "SIM00003"]
+        assert client.padding_symbols(["/ES", "/NQ", "/YM", "/RTY"]) == []
+
+    def test_symbol_skew_concentrates_on_hot_symbols(self):
+        """Zipf skew sends most ticks to the first symbols."""
+        client = SimulatedSchwabClient(ticks_per_second=10000, symbol_count=50, symbol_skew=1.5)
+        client.configure_symbols(["/ES"])
+
+        items = [item for message in collect_periods(client, 20) for item in message["content"]]
+        hot = sum(1 for item in items if item["key"] == "/ES")
+
+        assert hot / len(items) > 0.3
+
+    @pytest.mark.asyncio
+    async def test_streaming_with_disconnect_injection(self):
+        """Disconnects pause emission and auto reconnect after the outage."""
+        received = []
+        client = SimulatedSchwabClient(
+            ticks_per_second=2000,
+            disconnect_interval_seconds=0.05,
+            disconnect_duration_seconds=0.02,
+            max_ticks=300
+        )
+        client.set_data_callback(lambda symbol, message: received.append((symbol, message)))
+
+        assert await client.start_streaming(["/ES", "/NQ"])
+        await asyncio.wait_for(client._stream_task, timeout=5.0)
+
+        stats = client.get_stats()
+        assert stats["ticks_sent"] == 300
+        assert sum(len(message["content"]) for _, message in received) == 300
+        assert all(symbol == message["content"][0]["key"] for symbol, message in received)
+        assert stats["disconnects"] >= 1
+        assert stats["reconnects"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_manual_reconnect(self):
+        """Without auto reconnect the stream stays down until reconnect_with_backoff()."""
+        client = SimulatedSchwabClient(ticks_per_second=1000, auto_reconnect=False)
+        await client.start_streaming(["/ES"])
+        await asyncio.sleep(0.03)
+
+        client.inject_disconnect()
+        sent = client.ticks_sent
+        await asyncio.sleep(0.05)
+        assert not client.is_connected
+        assert client.ticks_sent == sent
+
+        assert await client._client.reconnect_with_backoff()
+        await asyncio.sleep(0.05)
+        assert client.ticks_sent > sent
+
+        await client.stop_streaming()
+        assert not client.is_streaming
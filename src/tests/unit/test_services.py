@@ -10,7 +10,9 @@ import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timedelta
 
+from src.backend.integrations.schwab_simulator import SimulatedSchwabClient
 from src.backend.services.data_ingestion import DataNormalizer, DataIngestionService
+from src.backend.services.tick_normalizer import TickRecord
 from src.backend.services.alert_engine import AlertEngine, RuleEvaluator, AlertContext
 from src.backend.services.notification import NotificationService, SoundManager, SlackNotifier
 from src.backend.models.instruments import Instrument, InstrumentType
@@ -290,6 +292,66 @@ class TestDataIngestionService:
         # Processing errors should be incremented (though not directly observable)
         assert True  # Test passes if no exception raised
 
+    def test_handle_market_data_multi_symbol_message(self, mock_schwab_client):
+        """Test every symbol in a message is queued exactly once."""
+        service = DataIngestionService()
+        service.schwab_client = mock_schwab_client
+
+        raw_data = {
+            "service": "LEVELONE_FUTURES",
+            "content": [
+                {"key": "ES", "LAST_PRICE": 4525.75},
+                {"key": "NQ", "LAST_PRICE": 15250.25},
+            ],
+        }
+
+        # Callback may fire once per symbol with the same message
+        service._handle_market_data("ES", raw_data)
+        service._handle_market_data("NQ", raw_data)
+
+        queued = [service.data_queue.get_nowait() for _ in range(service.data_queue.qsize())]
+        assert [tick.symbol for tick in queued] == ["ES", "NQ"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_symbols_counted_not_logged_per_tick(self, mock_schwab_client):
+        """Ticks for unmapped symbols are counted with one warning per symbol."""
+        service = DataIngestionService()
+        service.schwab_client = mock_schwab_client
+        ticks = [
+            TickRecord("SIM00001", datetime.utcnow(), 100.0, None, None, None, None, None, None, None, None)
+            for _ in range(3)
+        ]
+
+        with patch('src.backend.database.decorators.get_db_session') as mock_get_session, \
+                patch('src.backend.services.data_ingestion.logger') as mock_logger:
+            mock_get_session.return_value.__aenter__.return_value = AsyncMock()
+            await service._process_data_batch(ticks)
+
+        assert service.unknown_symbol_ticks == 3
+        assert mock_logger.warning.call_count == 1
+        assert service.get_status()["unknown_symbol_ticks"] == 3
+
+    @pytest.mark.asyncio
+    async def test_simulated_instruments_registered_on_start(self):
+        """Padding symbols from the simulator become instruments before streaming."""
+        service = DataIngestionService()
+        service.schwab_client = SimulatedSchwabClient(symbol_count=3)
+        service.schwab_client.start_streaming = AsyncMock(return_value=True)
+        service.tick_journal = None
+        mappings = iter([{"ES": 1}, {"ES": 1, "SIM00001": 2, "SIM00002": 3}])
+
+        async def load_mapping():
+            service.instruments_map = next(mappings)
+
+        service._load_instruments_mapping = load_mapping
+        service._register_simulated_instruments = AsyncMock()
+
+        await service.start()
+        await service.stop()
+
+        service._register_simulated_instruments.assert_awaited_once_with(["SIM00001", "SIM00002"])
+        service.schwab_client.start_streaming.assert_awaited_once_with(["ES", "SIM00001", "SIM00002"])
+
 
 class TestAlertEngine:
     """Test cases for AlertEngine class."""
@@ -0,0 +1,41 @@
+"""
+Unit tests for alert rule update validation.
+
+Tests that partial updates are validated against the merged rule so an
+invalid rule never reaches the live rules cache.
+"""
+
+import pytest
+
+from src.backend.api.common.exceptions import ValidationError
+from src.backend.api.rules import _validate_rule_update
+from src.backend.models.alert_rules import RuleCondition, RuleType
+
+
+class TestRuleUpdateValidation:
+    """Test cases for _validate_rule_update."""
+
+    def test_valid_partial_update(self, make_rule):
+        """Updating only the threshold of a valid rule passes."""
+        _validate_rule_update(make_rule(), {"threshold": 4600.0, "hysteresis": 2.0})
+
+    def test_hysteresis_on_non_threshold_rule_rejected(self, make_rule):
+        """Hysteresis cannot be added to a rule that is not above/below."""
+        rule = make_rule(condition=RuleCondition.CROSSES_ABOVE)
+
+        with pytest.raises(ValidationError) as exc_info:
+            _validate_rule_update(rule, {"hysteresis": 2.0})
+
+        assert "hysteresis" in exc_info.value.error_details["field_errors"]
+
+    def test_slow_period_not_above_fast_period_rejected(self, make_rule):
+        """A crossover slow period must stay above the stored fast period."""
+        rule = make_rule(
+            rule_type=RuleType.CROSSOVER,
+            condition=RuleCondition.CROSSES_ABOVE,
+            moving_average_period=20,
+            slow_moving_average_period=50,
+        )
+
+        with pytest.raises(ValidationError):
+            _validate_rule_update(rule, {"slow_moving_average_period": 10})
@@ -0,0 +1,101 @@
+"""
+Unit tests for the tick replay API safeguards.
+
+Tests that replays require TICK_REPLAY_API_ENABLED, that file replays
+cannot read outside TICK_REPLAY_DIR and that only one replay runs at a time.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import HTTPException
+
+from src.backend.api import test_market_data
+from src.backend.api.test_market_data import TickReplayRequest, start_tick_replay, stop_tick_replay
+
+
+@pytest.fixture
+def replay_dir(tmp_path, monkeypatch):
+    """Enable the replay API with an idle engine and a replay directory."""
+    monkeypatch.setattr(test_market_data.settings, "TICK_REPLAY_API_ENABLED", True)
+    monkeypatch.setattr(test_market_data.settings, "TICK_REPLAY_DIR", str(tmp_path))
+    monkeypatch.setattr(test_market_data, "tick_replay_engine", Mock(is_running=False))
+    monkeypatch.setattr(test_market_data, "_replay_task", None)
+    return tmp_path
+
+
+@pytest.fixture
+def starting_engine(replay_dir, monkeypatch):
+    """An engine whose ingestion pipeline takes a while to start."""
+    started = asyncio.Event()
+    engine = Mock(is_running=False)
+    engine.data_ingestion.is_running = False
+    engine.data_ingestion.start_without_streaming = AsyncMock(side_effect=started.wait)
+    monkeypatch.setattr(test_market_data, "tick_replay_engine", engine)
+    return engine
+
+
+class TestTickReplayApi:
+    """Test cases for POST /api/test/tick-replay."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, replay_dir, monkeypatch):
+        """Replays are rejected unless the API is enabled."""
+        monkeypatch.setattr(test_market_data.settings, "TICK_REPLAY_API_ENABLED", False)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await start_tick_replay(TickReplayRequest())
+
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["../outside.csv", "/etc/passwd"])
+    async def test_path_outside_replay_dir_rejected(self, replay_dir, path):
+        """File paths escaping the replay directory are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            await start_tick_replay(TickReplayRequest(source="file", path=path))
+
+        assert exc_info.value.status_code == 400
+
+    def test_path_resolved_inside_replay_dir(self, replay_dir):
+        """Relative paths resolve against the replay directory."""
+        (replay_dir / "session.csv").write_text("symbol,timestamp,price\n")
+
+        resolved = test_market_data._resolve_replay_path("session.csv")
+
+        assert resolved == str((replay_dir / "session.csv").resolve())
+
+    @pytest.mark.asyncio
+    async def test_second_request_rejected_while_starting(self, starting_engine):
+        """A replay counts as running before its task reaches the engine."""
+        await start_tick_replay(TickReplayRequest())
+
+        with pytest.raises(HTTPException) as exc_info:
+            await start_tick_replay(TickReplayRequest())
+
+        assert exc_info.value.status_code == 409
+        task = test_market_data._replay_task
+        await stop_tick_replay()
+        await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_starting_replay(self, starting_engine):
+        """Stopping before ticks are sent cancels the task and frees the slot."""
+        await start_tick_replay(TickReplayRequest())
+        task = test_market_data._replay_task
+
+        await stop_tick_replay()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert test_market_data._replay_task is None
+        starting_engine.replay_database.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stop_without_replay_rejected(self, replay_dir):
+        """Stopping when nothing is running is reported as a conflict."""
+        with pytest.raises(HTTPException) as exc_info:
+            await stop_tick_replay()
+
+        assert exc_info.value.status_code == 409
@@ -0,0 +1,29 @@
+"""
+Shared fixtures for unit tests.
+
+Provides an in-memory alert rule factory for the rule evaluation and rule
+API tests.
+"""
+
+import pytest
+
+from src.backend.models.alert_rules import AlertRule, RuleCondition, RuleType
+
+
+@pytest.fixture
+def make_rule():
+    """Factory for unsaved alert rules; keyword arguments override the defaults."""
+    def factory(**overrides) -> AlertRule:
+        fields = dict(
+            id=1,
+            instrument_id=1,
+            rule_type=RuleType.THRESHOLD,
+            condition=RuleCondition.ABOVE,
+            threshold=100.0,
+            active=True,
+            cooldown_seconds=60,
+        )
+        fields.update(overrides)
+        return AlertRule(**fields)
+
+    return factory
@@ -0,0 +1,135 @@
+"""
+Unit tests for the single-writer group commit actor.
+
+Runs against a temporary SQLite database to exercise real transactions.
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.backend.database import connection, writer as writer_module
+from src.backend.database.writer import DatabaseWriter, execute_write
+
+
+def insert_value(value: int):
+    """Write intent inserting one row and returning its value."""
+    async def operation(session):
+        await session.execute(text("INSERT INTO items (value) VALUES (:value)"), {"value": value})
+        return value
+    return operation
+
+
+async def count_rows() -> int:
+    async with connection.get_db_session() as session:
+        return (await session.execute(text("SELECT COUNT(*) FROM items"))).scalar()
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """Point the connection module at a temporary database."""
+    path = tmp_path / "writer.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, value INTEGER UNIQUE)")
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    monkeypatch.setattr(connection, "engine", engine)
+    monkeypatch.setattr(connection, "async_session_maker", async_sessionmaker(engine, expire_on_commit=False))
+    return engine
+
+
+class TestDatabaseWriter:
+    """Test cases for DatabaseWriter."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_one_commit(self, database):
+        """Writes submitted within the commit window are committed together."""
+        writer = DatabaseWriter(commit_interval_ms=50)
+        await writer.start()
+
+        results = await asyncio.gather(*(writer.execute(insert_value(i)) for i in range(50)))
+        await writer.stop()
+
+        assert results == list(range(50))
+        assert await count_rows() == 50
+        assert writer.commits == 1
+        assert writer.get_stats()["avg_intents_per_commit"] == 50
+
+    @pytest.mark.asyncio
+    async def test_row_limit_commits_before_interval(self, database):
+        """Reaching max_batch_rows commits without waiting out the interval."""
+        writer = DatabaseWriter(commit_interval_ms=10000, max_batch_rows=10)
+        await writer.start()
+
+        await asyncio.wait_for(
+            asyncio.gather(*(writer.execute(insert_value(i), rows=5) for i in range(4))),
+            timeout=2.0
+        )
+        await writer.stop()
+
+        assert writer.commits == 2
+        assert writer.rows_committed == 20
+
+    @pytest.mark.asyncio
+    async def test_failed_write_only_fails_its_caller(self, database):
+        """A failing group is retried per intent; other writes still commit."""
+        writer = DatabaseWriter(commit_interval_ms=50)
+        await writer.start()
+
+        futures = [await writer.submit(insert_value(value)) for value in (1, 2, 1, 3)]
+        results = await asyncio.gather(*futures, return_exceptions=True)
+        await writer.stop()
+
+        assert results[:2] == [1, 2] and results[3] == 3
+        assert isinstance(results[2], IntegrityError)
+        assert await count_rows() == 3
+        assert writer.group_retries == 1
+        assert writer.intents_failed == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_commits_queued_writes(self, database):
+        """Shutdown commits intents still waiting in the queue."""
+        writer = DatabaseWriter(commit_interval_ms=10000)
+        await writer.start()
+
+        futures = [await writer.submit(insert_value(i)) for i in range(5)]
+        await writer.stop()
+
+        assert all(future.done() for future in futures)
+        assert await count_rows() == 5
+
+    @pytest.mark.asyncio
+    async def test_broken_session_stops_writer(self, database, monkeypatch):
+        """If rollback fails, pending writes fail and execute_write falls back."""
+        writer = DatabaseWriter(commit_interval_ms=50)
+        monkeypatch.setattr(writer_module, "_database_writer", writer)
+        await writer.start()
+        await writer.execute(insert_value(1))
+
+        async def broken_rollback():
+            raise RuntimeError("connection lost")
+
+        monkeypatch.setattr(writer._session, "rollback", broken_rollback)
+        futures = [await writer.submit(insert_value(value)) for value in (1, 2)]
+        results = await asyncio.wait_for(asyncio.gather(*futures, return_exceptions=True), timeout=2.0)
+
+        await asyncio.wait_for(writer._task, timeout=2.0)
+
+        assert all(isinstance(result, Exception) for result in results)
+        assert not writer.is_running
+
+        assert await execute_write(insert_value(3)) == 3
+        assert await count_rows() == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_write_without_writer(self, database, monkeypatch):
+        """Writes fall back to a direct session when the writer isn't running."""
+        monkeypatch.setattr(writer_module, "_database_writer", DatabaseWriter())
+
+        assert await execute_write(insert_value(7)) == 7
+        assert await count_rows() == 1
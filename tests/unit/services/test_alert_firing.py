@@ -0,0 +1,175 @@
+"""
+Unit tests for batched alert firing.
+
+Runs against a temporary SQLite database with the database writer started.
+Also tests that hysteresis rules only disarm when they actually fire.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateTable
+
+from src.backend.database import connection, decorators, writer as writer_module
+from src.backend.database.writer import DatabaseWriter
+from src.backend.models.alert_logs import AlertLog
+from src.backend.models.alert_rules import AlertRule, RuleCondition, RuleType
+from src.backend.models.instruments import Instrument, InstrumentType
+from src.backend.services.alert_engine import AlertContext, AlertEngine
+from src.backend.services.pipeline_latency import PipelineLatency
+
+RULE_UPDATED_AT = datetime(2030, 1, 1)
+
+
+class SlowWebSocketManager:
+    """Records alert broadcasts, each taking a while to send."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.sent = []
+
+    async def broadcast_alert_fired(self, **alert):
+        await asyncio.sleep(self.delay)
+        self.sent.append(alert["rule_id"])
+        return 1
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """Point the connection module at a temporary database with two rules."""
+    path = tmp_path / "alerts.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    with sync_engine.begin() as conn:
+        for table in (Instrument.__table__, AlertRule.__table__, AlertLog.__table__):
+            conn.execute(CreateTable(table))
+        conn.execute(Instrument.__table__.insert().values(
+            id=1, symbol="ES", name="E-mini", type=InstrumentType.FUTURE.value
+        ))
+        for rule_id, cooldown in ((1, 60), (2, 0)):
+            conn.execute(AlertRule.__table__.insert().values(
+                id=rule_id, instrument_id=1, rule_type=RuleType.THRESHOLD.value,
+                condition=RuleCondition.ABOVE.value, threshold=100, active=True,
+                cooldown_seconds=cooldown, created_at=RULE_UPDATED_AT, updated_at=RULE_UPDATED_AT
+            ))
+    sync_engine.dispose()
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    monkeypatch.setattr(connection, "engine", engine)
+    monkeypatch.setattr(connection, "async_session_maker", async_sessionmaker(engine, expire_on_commit=False))
+    monkeypatch.setattr(writer_module, "_database_writer", DatabaseWriter(commit_interval_ms=5))
+    return engine
+
+
+async def load_rules():
+    async with connection.get_db_session() as session:
+        result = await session.execute(
+            select(AlertRule).options(selectinload(AlertRule.instrument)).order_by(AlertRule.id)
+        )
+        return result.scalars().all()
+
+
+def tick():
+    return type("Tick", (), {"timestamp": datetime.utcnow() - timedelta(milliseconds=5)})()
+
+
+class TestBatchedAlertFiring:
+    """Test cases for AlertEngine._fire_alerts."""
+
+    @pytest.mark.asyncio
+    async def test_batch_written_once_and_broadcast_off_path(self, database):
+        """A burst is one writer intent; broadcasts don't block firing."""
+        writer = writer_module.get_database_writer()
+        await writer.start()
+        engine = AlertEngine()
+        engine.websocket_manager = SlowWebSocketManager(delay=0.05)
+        engine.latency = PipelineLatency()
+        engine._broadcast_task = asyncio.create_task(engine._broadcast_loop())
+        cooled, uncooled = await load_rules()
+
+        alerts = [
+            (AlertContext(rule, 101.0 + i, 101.0 + i, 0), tick())
+            for i, rule in enumerate([cooled, uncooled, cooled, uncooled])
+        ]
+        started = asyncio.get_running_loop().time()
+        await engine._fire_alerts(alerts, None)
+        firing_seconds = asyncio.get_running_loop().time() - started
+
+        # Cooldown applied in memory: the second trigger of the 60s rule is skipped
+        assert engine.alerts_fired == 3
+        assert cooled.last_triggered is not None
+        assert firing_seconds < 0.05
+
+        await asyncio.wait_for(engine._broadcast_queue.join(), timeout=2.0)
+        await writer.stop()
+        engine._broadcast_task.cancel()
+
+        assert engine.websocket_manager.sent == [1, 2, 2]
+        stages = engine.latency.get_stats()["stages"]
+        assert stages["fire"]["count"] == 3 and stages["broadcast"]["count"] == 3
+        assert stages["broadcast"]["p50_ms"] > stages["fire"]["p50_ms"]
+        assert writer.intents_committed == 1
+        async with connection.get_db_session() as session:
+            assert (await session.execute(text("SELECT COUNT(*) FROM alert_logs"))).scalar() == 3
+            rows = (await session.execute(
+                text("SELECT last_triggered IS NOT NULL, updated_at FROM alert_rules ORDER BY id")
+            )).all()
+        assert [bool(row[0]) for row in rows] == [True, True]
+        assert all(str(row[1]).startswith("2030-01-01") for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_writes_through_session_without_writer(self, database):
+        """Without the writer, the batch goes into the evaluation session."""
+        engine = AlertEngine()
+        rules = await load_rules()
+
+        async with connection.get_db_session() as session:
+            await engine._fire_alerts([(AlertContext(rules[0], 101.0, 101.0, 0), tick())], session)
+            await session.commit()
+            count = (await session.execute(text("SELECT COUNT(*) FROM alert_logs"))).scalar()
+
+        assert count == 1
+        assert engine._broadcast_queue.qsize() == 1
+
+
+class TestHysteresisCooldown:
+    """Test that cooldowns and hysteresis bands don't combine to lose alerts."""
+
+    @pytest.mark.asyncio
+    async def test_crossing_during_cooldown_fires_after_cooldown(self, monkeypatch):
+        """A crossing swallowed by the cooldown leaves the rule armed for the next one."""
+        @asynccontextmanager
+        async def get_db_session():
+            yield AsyncMock()
+
+        monkeypatch.setattr(decorators, "get_db_session", get_db_session)
+        engine = AlertEngine()
+        engine._fire_alerts = AsyncMock()
+        rule = AlertRule(
+            id=1, instrument_id=1, rule_type=RuleType.THRESHOLD, condition=RuleCondition.ABOVE,
+            threshold=100.0, hysteresis=2.0, cooldown_seconds=60, active=True,
+            last_triggered=datetime.utcnow()
+        )
+        engine._rebuild_rules_indexes({1: [rule]})
+
+        async def evaluate(price):
+            market_data = type("Tick", (), {"price": price, "volume": None, "timestamp": datetime.utcnow()})()
+            engine._fire_alerts.reset_mock()
+            await engine._process_evaluation_batch([{"instrument_id": 1, "market_data": market_data}])
+            if not engine._fire_alerts.called:
+                return []
+            return [context.rule.id for context, _ in engine._fire_alerts.call_args.args[0]]
+
+        await evaluate(99.0)
+        assert await evaluate(100.5) == []  # Crossed during cooldown
+        await evaluate(99.5)  # Dips without reaching the 98.0 reset level
+
+        rule.last_triggered = datetime.utcnow() - timedelta(seconds=61)
+        assert await evaluate(100.5) == [1]
+        assert engine.threshold_index.get_stats()["disarmed_rules"] == 1
@@ -0,0 +1,121 @@
+"""
+Unit tests for vectorized batch rule evaluation.
+
+Checks that the NumPy evaluator triggers exactly the rules the per-rule
+RuleEvaluator path triggers, and defers cold rate-of-change windows.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.backend.models.alert_rules import RuleCondition, RuleType
+from src.backend.services.alert_engine import RuleEvaluator
+from src.backend.services.batch_evaluator import BatchRuleEvaluator
+from src.backend.services.price_windows import PriceWindowStore
+
+
+def tick(price, volume=None):
+    return SimpleNamespace(price=price, volume=volume)
+
+
+class TestBatchRuleEvaluator:
+    """Test cases for BatchRuleEvaluator."""
+
+    @pytest.fixture(autouse=True)
+    def setup_evaluator(self, make_rule):
+        """Set up test fixtures."""
+        self.now = datetime.utcnow()
+        self.store = PriceWindowStore()
+        self.store.configure({1: 60, 2: 60})
+        self.store.record(1, self.now - timedelta(seconds=120), 95.0)
+        self.store.record(1, self.now - timedelta(seconds=30), 100.0)
+        self.store.record(2, self.now - timedelta(seconds=120), 50.0)
+        self.store.record(2, self.now - timedelta(seconds=30), 50.0)
+
+        roc = dict(rule_type=RuleType.RATE_OF_CHANGE, time_window_seconds=60)
+        self.rules = {
+            1: [
+                make_rule(id=1, condition=RuleCondition.EQUALS, threshold=101.0),
+                make_rule(id=2, rule_type=RuleType.VOLUME_SPIKE, condition=RuleCondition.VOLUME_ABOVE, threshold=500),
+                make_rule(id=3, condition=RuleCondition.PERCENT_CHANGE_UP, threshold=1.0, **roc),
+                make_rule(id=4, condition=RuleCondition.PERCENT_CHANGE_DOWN, threshold=1.0, **roc),
+                make_rule(id=5, rule_type=RuleType.CROSSOVER, condition=RuleCondition.CROSSES_ABOVE, threshold=100.0),
+            ],
+            2: [
+                make_rule(id=6, instrument_id=2, condition=RuleCondition.PERCENT_CHANGE_DOWN, threshold=2.0, **roc),
+            ],
+        }
+        self.evaluator = BatchRuleEvaluator(self.store)
+        self.remaining = self.evaluator.build(self.rules)
+
+    def test_unsupported_rules_are_returned(self):
+        """Only level-style rules are vectorized."""
+        assert [rule.id for rule in self.remaining[1]] == [5]
+        assert self.evaluator.rule_count == 5
+
+    @pytest.mark.asyncio
+    async def test_hits_match_per_rule_path(self):
+        """Every (tick, rule) hit matches RuleEvaluator's result."""
+        ticks = [
+            (1, tick(101.005, 100)),
+            (1, tick(98.5, 800)),
+            (2, tick(48.0, None)),
+            (2, tick(49.5, 10)),
+            (3, tick(10.0, 10)),
+        ]
+
+        result = self.evaluator.evaluate(ticks, now=self.now)
+
+        reference = RuleEvaluator(PriceWindowStore())
+        reference.price_windows = self.store
+        expected = set()
+        for index, (instrument_id, market_data) in enumerate(ticks):
+            for rule in self.rules.get(instrument_id, []):
+                if rule.rule_type == RuleType.THRESHOLD:
+                    context = await reference.evaluate_threshold_rule(rule, market_data.price, None)
+                elif rule.rule_type == RuleType.VOLUME_SPIKE:
+                    context = await reference.evaluate_volume_spike_rule(rule, market_data.volume, None)
+                elif rule.rule_type == RuleType.RATE_OF_CHANGE:
+                    context = await reference.evaluate_rate_of_change_rule(rule, market_data.price, None)
+                else:
+                    context = None
+                if context:
+                    expected.add((index, rule.id, round(context.trigger_value, 6)))
+
+        actual = {(hit.tick_index, hit.rule.id, round(hit.trigger_value, 6)) for hit in result.hits}
+        assert actual == expected
+        assert {(0, 1), (0, 3), (1, 2), (1, 4), (2, 6)} == {(i, r) for i, r, _ in actual}
+        assert result.evaluations == 2 * 4 + 2 * 1
+        assert result.deferred == []
+
+    def test_cold_windows_are_deferred(self):
+        """Rate-of-change rules without a covering window go to the DB path."""
+        evaluator = BatchRuleEvaluator(PriceWindowStore())
+        evaluator.build(self.rules)
+
+        result = evaluator.evaluate([(1, tick(101.0, 100))], now=self.now)
+
+        assert sorted(rule.id for _, rule in result.deferred) == [3, 4]
+        assert [hit.rule.id for hit in result.hits] == [1]
+
+    @pytest.mark.asyncio
+    async def test_process_pool_matches_inline(self):
+        """Offloading the array computation gives the same result."""
+        ticks = [(1, tick(101.005, 100)), (1, tick(98.5, 800)), (2, tick(48.0, None))]
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            offloaded = await self.evaluator.evaluate_async(ticks, now=self.now, executor=pool, min_offload_pairs=1)
+        inline = self.evaluator.evaluate(ticks, now=self.now)
+
+        assert self.evaluator.offloaded_batches == 1
+        assert [(hit.tick_index, hit.rule.id, hit.trigger_value) for hit in offloaded.hits] == \
+            [(hit.tick_index, hit.rule.id, hit.trigger_value) for hit in inline.hits]
+
+    def test_empty_batch(self):
+        """No ticks, no work."""
+        result = self.evaluator.evaluate([])
+
+        assert result.hits == [] and result.evaluations == 0
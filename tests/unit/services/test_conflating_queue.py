@@ -0,0 +1,117 @@
+"""
+Unit tests for the per-key conflating queue.
+
+Tests backpressure policies, round-robin fairness between keys and
+per-key counters.
+"""
+
+import asyncio
+
+import pytest
+
+from src.backend.services.conflating_queue import BackpressurePolicy, ConflatingQueue
+from src.backend.services.tick_normalizer import TickRecord
+
+
+def make_tick(symbol: str, price: float) -> TickRecord:
+    """Create a minimal tick record."""
+    return TickRecord(symbol, None, price, 0, None, None, None, None, None, None, None)
+
+
+class TestConflatingQueue:
+    """Test cases for ConflatingQueue."""
+
+    def test_conflate_keeps_latest_value(self):
+        """A full slot is overwritten by the newest tick."""
+        queue = ConflatingQueue(policy=BackpressurePolicy.CONFLATE)
+
+        for price in (1.0, 2.0, 3.0):
+            queue.put_nowait(make_tick("/ES", price))
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait().price == 3.0
+        assert queue.key_stats("/ES") == {"enqueued": 1, "dequeued": 1, "conflated": 2, "dropped": 0}
+
+    def test_drop_oldest_keeps_newest_depth(self):
+        """The oldest pending tick is evicted when the slot is full."""
+        queue = ConflatingQueue(policy="drop_oldest", depth_per_key=2)
+
+        for price in (1.0, 2.0, 3.0):
+            queue.put_nowait(make_tick("/ES", price))
+
+        assert [tick.price for tick in queue.drain()] == [2.0, 3.0]
+        assert queue.key_stats("/ES")["dropped"] == 1
+
+    def test_block_rejects_put_nowait(self):
+        """put_nowait raises QueueFull under the block policy and counts the drop."""
+        queue = ConflatingQueue(policy=BackpressurePolicy.BLOCK)
+        queue.put_nowait(make_tick("/ES", 1.0))
+
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(make_tick("/ES", 2.0))
+
+        assert queue.get_nowait().price == 1.0
+        assert queue.get_stats()["dropped"] == 1
+
+    def test_hot_symbol_cannot_starve_illiquid_symbol(self):
+        """Keys are served round-robin regardless of arrival rate."""
+        queue = ConflatingQueue(policy=BackpressurePolicy.DROP_OLDEST, depth_per_key=3)
+
+        for price in range(100):
+            queue.put_nowait(make_tick("/ES", float(price + 1)))
+        queue.put_nowait(make_tick("/ZB", 110.0))
+
+        first_two = {queue.get_nowait().symbol, queue.get_nowait().symbol}
+
+        assert first_two == {"/ES", "/ZB"}
+        assert queue.qsize() == 2
+        assert queue.key_stats("/ES")["dropped"] == 97
+
+    def test_get_stats(self):
+        """Stats report policy, totals and per-key counters."""
+        queue = ConflatingQueue()
+        queue.put_nowait(make_tick("/ES", 1.0))
+        queue.put_nowait(make_tick("/ES", 2.0))
+        queue.put_nowait(make_tick("/NQ", 3.0))
+
+        stats = queue.get_stats()
+
+        assert stats["policy"] == "conflate"
+        assert stats["size"] == 2
+        assert stats["keys"] == 2
+        assert stats["conflated"] == 1
+        assert stats["per_key"]["/NQ"]["enqueued"] == 1
+
+    def test_invalid_configuration(self):
+        """Unknown policies and non-positive depths are rejected."""
+        with pytest.raises(ValueError):
+            ConflatingQueue(policy="lifo")
+        with pytest.raises(ValueError):
+            ConflatingQueue(depth_per_key=0)
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_item(self):
+        """get() waits until an item is enqueued."""
+        queue = ConflatingQueue()
+
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        queue.put_nowait(make_tick("/ES", 1.0))
+
+        tick = await asyncio.wait_for(getter, timeout=1.0)
+        assert tick.symbol == "/ES"
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_put_blocks_until_space(self):
+        """put() waits for slot space under the block policy."""
+        queue = ConflatingQueue(policy=BackpressurePolicy.BLOCK)
+        queue.put_nowait(make_tick("/ES", 1.0))
+
+        putter = asyncio.create_task(queue.put(make_tick("/ES", 2.0)))
+        await asyncio.sleep(0.01)
+        assert not putter.done()
+
+        assert queue.get_nowait().price == 1.0
+        await asyncio.wait_for(putter, timeout=1.0)
+        assert queue.get_nowait().price == 2.0
@@ -0,0 +1,86 @@
+"""
+Unit tests for sharded alert evaluation workers.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from src.backend.services.evaluation_workers import EvaluationWorker, shard_for
+
+
+def evaluation(instrument_id: int, sequence: int) -> dict:
+    return {"instrument_id": instrument_id, "sequence": sequence, "queued_at": datetime.utcnow()}
+
+
+class TestEvaluationWorkers:
+    """Test cases for EvaluationWorker."""
+
+    @pytest.mark.asyncio
+    async def test_sharding_keeps_instrument_order(self):
+        """Each instrument is handled by one worker, in arrival order."""
+        processed = []
+
+        def recorder(worker_id):
+            async def process(batch):
+                await asyncio.sleep(0)
+                processed.extend((worker_id, item["instrument_id"], item["sequence"]) for item in batch)
+            return process
+
+        workers = [EvaluationWorker(i, recorder(i), batch_size=7, batch_timeout=0.01) for i in range(3)]
+        for worker in workers:
+            worker.start()
+        for sequence in range(50):
+            for instrument_id in range(1, 7):
+                workers[shard_for(instrument_id, len(workers))].submit(evaluation(instrument_id, sequence))
+        await asyncio.gather(*(worker.stop() for worker in workers))
+
+        for instrument_id in range(1, 7):
+            seen = [(worker_id, sequence) for worker_id, iid, sequence in processed if iid == instrument_id]
+            assert [sequence for _, sequence in seen] == list(range(50))
+            assert {worker_id for worker_id, _ in seen} == {shard_for(instrument_id, 3)}
+
+    @pytest.mark.asyncio
+    async def test_slow_shard_does_not_stall_others(self):
+        """A blocked worker leaves the other shards running."""
+        release = asyncio.Event()
+        fast_done = asyncio.Event()
+
+        async def slow(batch):
+            await release.wait()
+
+        async def fast(batch):
+            fast_done.set()
+
+        slow_worker = EvaluationWorker(0, slow, batch_timeout=0.01)
+        fast_worker = EvaluationWorker(1, fast, batch_timeout=0.01)
+        slow_worker.start()
+        fast_worker.start()
+
+        slow_worker.submit(evaluation(1, 0))
+        await asyncio.sleep(0.02)
+        fast_worker.submit(evaluation(2, 0))
+        await asyncio.wait_for(fast_done.wait(), timeout=1.0)
+
+        assert not slow_worker.idle
+        release.set()
+        await asyncio.gather(slow_worker.stop(), fast_worker.stop())
+        assert slow_worker.idle and fast_worker.idle
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_and_stats(self):
+        """Submissions beyond the queue size are dropped and counted."""
+        async def process(batch):
+            pass
+
+        worker = EvaluationWorker(0, process, queue_size=3)
+
+        accepted = [worker.submit(evaluation(1, i)) for i in range(5)]
+        await worker.stop()
+
+        stats = worker.get_stats()
+        assert accepted == [True, True, True, False, False]
+        assert stats["dropped"] == 2
+        assert stats["evaluations"] == 3 and stats["batches"] == 1
+        assert stats["max_queue_wait_ms"] >= 0
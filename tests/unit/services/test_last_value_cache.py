@@ -0,0 +1,105 @@
+"""
+Unit tests for the last-value cache and the lookups it serves.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.backend.api.instruments import get_latest_quotes
+from src.backend.database import decorators
+from src.backend.services import last_value_cache, optimized_market_data_repository
+from src.backend.services.last_value_cache import LastValueCache
+from src.backend.services.optimized_market_data_repository import OptimizedMarketDataRepository
+from src.backend.services.risk_calculator import RiskCalculator
+from src.backend.services.tick_normalizer import TickRecord
+
+SESSION_START = datetime(2030, 1, 2, 14, 30)
+
+
+def tick(price, seconds=0, symbol="ES", bid=None, ask=None, high_price=None):
+    return TickRecord(
+        symbol, SESSION_START + timedelta(seconds=seconds), price, 10.0,
+        bid, ask, 5.0 if bid else None, 6.0 if ask else None, None, high_price, None
+    )
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Replace the global last-value cache with an empty one."""
+    cache = LastValueCache()
+    monkeypatch.setattr(last_value_cache, "_last_value_cache", cache)
+    return cache
+
+
+class TestLastValueCache:
+    """Test cases for LastValueCache."""
+
+    def test_latest_quote_and_session_ohlc(self, cache):
+        """Quotes keep the newest tick, last bid/ask and session OHLC; stale ticks are ignored."""
+        cache.update(1, tick(4500.0, 0, bid=4499.75, ask=4500.25))
+        cache.update(1, tick(4510.0, 1))
+        cache.update(1, tick(4490.0, 2, ask=4490.25))
+        cache.update(1, tick(4600.0, -5))  # Older than the quote (e.g. replayed)
+
+        quote = cache.get(1)
+        assert quote.price == 4490.0 and quote.timestamp == SESSION_START + timedelta(seconds=2)
+        assert (quote.bid, quote.ask, quote.ask_size) == (4499.75, 4490.25, 6.0)
+        assert (quote.open_price, quote.high_price, quote.low_price) == (4500.0, 4510.0, 4490.0)
+        assert cache.get_stats()["stale_ticks"] == 1
+
+        # Feed-supplied session values win; a new day starts a new session
+        cache.update(1, tick(4495.0, 3, high_price=4520.0))
+        assert cache.get(1).high_price == 4520.0
+        cache.update(1, tick(4480.0, 86400))
+        assert (cache.get(1).open_price, cache.get(1).high_price) == (4480.0, 4480.0)
+
+        assert cache.get(2) is None
+        assert cache.get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_latest_lookups_skip_the_database_on_hits(self, cache, monkeypatch):
+        """Repository and REST lookups are answered from memory for cached instruments."""
+        def no_database():
+            raise AssertionError("database queried")
+
+        monkeypatch.setattr(optimized_market_data_repository, "get_db_session", no_database)
+        monkeypatch.setattr(decorators, "get_db_session", no_database)
+        cache.update(1, tick(4500.0))
+        cache.update(2, tick(15000.0, symbol="NQ"))
+
+        records = await OptimizedMarketDataRepository().get_latest_market_data([1, 2])
+        assert {instrument_id: record.price for instrument_id, record in records.items()} == {1: 4500.0, 2: 15000.0}
+
+        assert await RiskCalculator()._get_current_price(2) == 15000.0
+
+        response = await get_latest_quotes([2, 3, 2])
+        assert [quote.symbol for quote in response.quotes] == ["NQ"]
+        assert response.missing == [3]
+
+    @pytest.mark.asyncio
+    async def test_soft_delete_invalidates_cached_quotes(self, cache, monkeypatch):
+        """Soft deleting rows drops the affected instruments' quotes."""
+        session = AsyncMock()
+        session.execute.side_effect = [
+            Mock(**{"scalars.return_value.all.return_value": [1]}),  # Affected instruments
+            Mock(rowcount=1),                                       # Soft delete
+        ]
+
+        @asynccontextmanager
+        async def get_db_session():
+            yield session
+
+        monkeypatch.setattr(optimized_market_data_repository, "get_db_session", get_db_session)
+        cache.update(1, tick(4500.0))
+        cache.update(2, tick(15000.0, symbol="NQ"))
+
+        repository = OptimizedMarketDataRepository()
+        repository.performance_monitor = Mock()
+
+        assert await repository.soft_delete_market_data([42]) == 1
+
+        assert cache.get(1) is None
+        assert cache.get(2).price == 15000.0
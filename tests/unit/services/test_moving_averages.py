@@ -0,0 +1,110 @@
+"""
+Unit tests for incremental moving averages and crossover tracking.
+"""
+
+import numpy as np
+import pytest
+
+from src.backend.models.alert_rules import MovingAverageType, RuleCondition, RuleType
+from src.backend.services.moving_averages import (
+    CrossoverTracker,
+    ExponentialMovingAverage,
+    SimpleMovingAverage,
+)
+
+
+@pytest.fixture
+def make_crossover(make_rule):
+    """Crossover rule factory on top of make_rule."""
+    def factory(rule_id, condition, period, slow_period=None, ma_type=MovingAverageType.SMA):
+        return make_rule(
+            id=rule_id,
+            rule_type=RuleType.CROSSOVER,
+            condition=condition,
+            threshold=0,
+            moving_average_period=period,
+            slow_moving_average_period=slow_period,
+            moving_average_type=ma_type,
+        )
+
+    return factory
+
+
+def feed(tracker, prices, instrument_id=1):
+    """Feed prices; return fired rule IDs per tick."""
+    return [sorted(rule.id for rule in tracker.update(instrument_id, price)) for price in prices]
+
+
+class TestMovingAverages:
+    """Test cases for SMA/EMA state."""
+
+    def test_sma_matches_reference(self):
+        """Running-sum SMA equals the windowed mean."""
+        prices = np.random.default_rng(1).normal(100, 5, 200)
+        sma = SimpleMovingAverage(20)
+
+        values = [sma.update(price) for price in prices]
+
+        assert values[18] is None
+        assert values[19:] == pytest.approx(np.convolve(prices, np.ones(20) / 20, mode="valid"))
+
+    def test_ema_seeded_with_sma(self):
+        """EMA starts from the SMA of the first period ticks, then smooths."""
+        ema = ExponentialMovingAverage(3)
+
+        assert [ema.update(price) for price in (1.0, 2.0)] == [None, None]
+        assert ema.update(3.0) == pytest.approx(2.0)
+        assert ema.update(6.0) == pytest.approx(2.0 + 0.5 * (6.0 - 2.0))
+
+
+class TestCrossoverTracker:
+    """Test cases for CrossoverTracker."""
+
+    def test_price_crosses_sma(self, make_crossover):
+        """Price vs SMA fires once per crossing in the rule's direction."""
+        tracker = CrossoverTracker()
+        tracker.build({1: [
+            make_crossover(1, RuleCondition.CROSSES_ABOVE, 3),
+            make_crossover(2, RuleCondition.CROSSES_BELOW, 3),
+        ]})
+
+        fired = feed(tracker, [12, 10, 8, 9, 12, 13, 8])
+
+        # SMA(3) available from tick 3: diffs -2, 0 (touch), +2.33, +1.67, -3
+        assert fired == [[], [], [], [], [1], [], [2]]
+
+    def test_fast_slow_crossover(self, make_crossover):
+        """Fast MA crossing above the slow MA fires the rule."""
+        tracker = CrossoverTracker()
+        tracker.build({1: [make_crossover(1, RuleCondition.CROSSES_ABOVE, 2, slow_period=4)]})
+
+        fired = feed(tracker, [10, 9, 8, 7, 7, 9, 11])
+
+        assert fired[-2:] == [[1], []]
+
+    def test_rules_share_moving_average_state(self, make_crossover):
+        """Hundreds of rules on the same averages share a few state objects."""
+        rules = [
+            make_crossover(i, RuleCondition.CROSSES_ABOVE if i % 2 else RuleCondition.CROSSES_BELOW,
+                           period=(20, 50)[i % 2], ma_type=(MovingAverageType.SMA, MovingAverageType.EMA)[i % 3 == 0])
+            for i in range(500)
+        ]
+        tracker = CrossoverTracker()
+
+        remaining = tracker.build({1: rules})
+
+        assert remaining == {}
+        assert tracker.get_stats()["crossover_rules"] == 500
+        assert tracker.get_stats()["moving_averages"] == 4
+
+    def test_rebuild_keeps_state_and_skips_other_rules(self, make_rule, make_crossover):
+        """Rebuilding keeps warmed-up averages; non-crossover rules are returned."""
+        threshold = make_rule(id=9, threshold=1)
+        tracker = CrossoverTracker()
+        tracker.build({1: [make_crossover(1, RuleCondition.CROSSES_ABOVE, 3)]})
+        feed(tracker, [10, 10, 10, 9])
+
+        remaining = tracker.build({1: [make_crossover(1, RuleCondition.CROSSES_ABOVE, 3), threshold]})
+
+        assert remaining == {1: [threshold]}
+        assert feed(tracker, [12]) == [[1]]
@@ -0,0 +1,174 @@
+"""
+Unit tests for compiled multi-condition rules.
+
+Tests expression validation, sub-expression sharing, short-circuiting and
+edge-triggered firing.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.backend.models.alert_rules import RuleType
+from src.backend.services.moving_averages import CrossoverTracker
+from src.backend.services.multi_condition import MultiConditionEvaluator, parse_conditions
+from src.backend.services.price_windows import PriceWindowStore
+
+ABOVE_100 = {"rule_type": "threshold", "condition": "above", "threshold": 100}
+BELOW_110 = {"rule_type": "threshold", "condition": "below", "threshold": 110}
+VOLUME_500 = {"rule_type": "volume_spike", "condition": "volume_above", "threshold": 500}
+UP_1PCT = {"rule_type": "rate_of_change", "condition": "percent_change_up", "threshold": 1, "time_window_seconds": 60}
+
+
+@pytest.fixture
+def multi_rule(make_rule):
+    """Multi-condition rule factory on top of make_rule."""
+    def factory(rule_id, conditions):
+        return make_rule(
+            id=rule_id,
+            rule_type=RuleType.MULTI_CONDITION,
+            threshold=0,
+            conditions=json.dumps(conditions),
+        )
+
+    return factory
+
+
+def both(*conditions):
+    return {"operator": "and", "conditions": list(conditions)}
+
+
+def either(*conditions):
+    return {"operator": "or", "conditions": list(conditions)}
+
+
+def ids(triggered):
+    return sorted(rule.id for rule, _ in triggered)
+
+
+class TestParseConditions:
+    """Test cases for expression validation."""
+
+    @pytest.mark.parametrize("spec", [
+        "not json",
+        {"operator": "xor", "conditions": [ABOVE_100]},
+        {"operator": "and", "conditions": []},
+        {"rule_type": "threshold", "condition": "volume_above", "threshold": 1},
+        {"rule_type": "threshold", "condition": "above"},
+        {"rule_type": "rate_of_change", "condition": "percent_change_up", "threshold": 1},
+        {"rule_type": "crossover", "condition": "crosses_above", "moving_average_period": 20,
+         "slow_moving_average_period": 10},
+        {"rule_type": "multi_condition", "condition": "above", "threshold": 1},
+    ])
+    def test_invalid_expressions(self, spec):
+        """Malformed expressions are rejected with ValueError."""
+        with pytest.raises(ValueError):
+            parse_conditions(spec)
+
+    def test_normalizes_expression(self):
+        """Operators are lower-cased and crossover defaults filled in."""
+        spec = parse_conditions(json.dumps({"operator": "AND", "conditions": [
+            ABOVE_100,
+            {"rule_type": "crossover", "condition": "crosses_above", "moving_average_period": 5},
+        ]}))
+
+        assert spec["operator"] == "and"
+        assert spec["conditions"][0]["threshold"] == 100.0
+        assert spec["conditions"][1]["moving_average_type"] == "sma"
+
+
+class TestMultiConditionEvaluator:
+    """Test cases for MultiConditionEvaluator."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.now = datetime.utcnow()
+        self.windows = PriceWindowStore()
+        self.crossovers = CrossoverTracker()
+        self.evaluator = MultiConditionEvaluator(self.crossovers, self.windows)
+
+    def build(self, rules):
+        remaining = self.evaluator.build({1: rules})
+        self.crossovers.build(remaining, self.evaluator.crossover_pairs)
+        return remaining
+
+    def tick(self, price, volume=0):
+        self.crossovers.update(1, price)
+        return self.evaluator.evaluate(1, price, volume, now=self.now)
+
+    def test_fires_when_expression_becomes_true(self, multi_rule):
+        """Rules fire on the transition to true, not on every true tick."""
+        self.build([multi_rule(1, both(ABOVE_100, either(BELOW_110, VOLUME_500)))])
+
+        assert self.tick(99.0) == []
+        triggered = self.tick(105.0)
+        assert ids(triggered) == [1]
+        assert triggered[0][1] == ["price above 100", "price below 110"]
+        assert self.tick(106.0) == []
+        assert self.tick(115.0) == []
+        assert ids(self.tick(115.0, volume=800)) == [1]
+
+    def test_shared_predicates_evaluated_once_per_tick(self, multi_rule):
+        """Identical predicates and sub-expressions across rules compile to one node."""
+        rules = [multi_rule(i, both(ABOVE_100, either(BELOW_110, VOLUME_500))) for i in range(200)]
+        rules.append(multi_rule(200, both(either(VOLUME_500, BELOW_110), ABOVE_100)))
+        self.build(rules)
+
+        triggered = self.tick(105.0)
+
+        stats = self.evaluator.get_stats()
+        assert len(triggered) == 201
+        assert stats["nodes"] == 5
+        assert stats["predicate_evaluations"] == 2
+
+    def test_and_short_circuits_cheapest_first(self, multi_rule):
+        """A false cheap predicate skips the price-window lookup."""
+        self.windows.configure({1: 60})
+        self.build([multi_rule(1, both(UP_1PCT, ABOVE_100))])
+
+        self.tick(90.0)
+
+        assert self.evaluator.get_stats()["predicate_evaluations"] == 1
+
+    def test_rate_of_change_uses_price_windows(self, multi_rule):
+        """Rate-of-change predicates are false while the window is cold."""
+        self.build([multi_rule(1, both(UP_1PCT, ABOVE_100))])
+        self.windows.configure(self.evaluator.horizons)
+
+        assert self.tick(102.0) == []
+
+        self.windows.record(1, self.now - timedelta(seconds=120), 100.0)
+        self.windows.record(1, self.now - timedelta(seconds=30), 100.0)
+        assert ids(self.tick(101.5)) == [1]
+
+    def test_crossover_predicate(self, multi_rule):
+        """Crossover predicates are true only on the crossing tick."""
+        cross = {"rule_type": "crossover", "condition": "crosses_above", "moving_average_period": 3}
+        self.build([multi_rule(1, both(cross, VOLUME_500))])
+
+        fired = [ids(self.tick(price, volume=1000)) for price in (12, 10, 8, 9, 12, 13)]
+
+        assert fired == [[], [], [], [], [1], []]
+        assert self.crossovers.get_stats()["crossover_rules"] == 0
+
+    def test_build_skips_other_and_invalid_rules(self, make_rule, multi_rule):
+        """Non multi-condition rules are returned; invalid expressions are dropped."""
+        threshold = make_rule(id=9, threshold=1)
+        invalid = multi_rule(2, {"operator": "and", "conditions": []})
+
+        remaining = self.build([multi_rule(1, ABOVE_100), invalid, threshold])
+
+        assert remaining == {1: [threshold]}
+        assert self.evaluator.get_stats()["multi_condition_rules"] == 1
+        assert self.evaluator.get_stats()["invalid_rules"] == 1
+
+    def test_rebuild_keeps_state(self, multi_rule):
+        """Rebuilding doesn't re-fire a rule whose expression is still true."""
+        rules = [multi_rule(1, ABOVE_100)]
+        self.build(rules)
+        assert ids(self.tick(105.0)) == [1]
+
+        self.build(rules + [multi_rule(2, ABOVE_100)])
+
+        assert ids(self.tick(106.0)) == [2]
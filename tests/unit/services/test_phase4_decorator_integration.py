@@ -7,6 +7,7 @@ identical behavior while eliminating boilerplate code.
 
 import pytest
 import asyncio
+from contextlib import asynccontextmanager
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
@@ -14,12 +15,29 @@ from typing import List, Dict, Any
 from src.backend.services.alert_engine import AlertEngine, AlertContext
 from src.backend.services.risk_calculator import RiskCalculator
 from src.backend.services.data_ingestion import DataIngestionService
+from src.backend.services.tick_normalizer import TickRecord
 from src.backend.services.ml_models import MLModelsService
 from src.backend.services.notification import NotificationService
+from src.backend.database import decorators
 from src.backend.database.decorators import with_db_session, handle_db_errors
+from src.backend.database.exceptions import DatabaseOperationError
 from src.backend.models.market_data import MarketData
 from src.backend.models.instruments import Instrument
-from src.backend.models.alert_rules import AlertRule
+from src.backend.models.alert_rules import AlertRule, RuleCondition
+
+
+@pytest.fixture
+def inject_session(monkeypatch):
+    """Make with_db_session hand a test's mock session to decorated methods."""
+    def inject(session):
+        @asynccontextmanager
+        async def get_db_session():
+            yield session
+        
+        monkeypatch.setattr(decorators, "get_db_session", get_db_session)
+        return session
+    
+    return inject
 
 
 class TestAlertEngineDecorators:
@@ -34,13 +52,13 @@ class TestAlertEngineDecorators:
         return engine
     
     @pytest.fixture
-    def mock_session(self):
+    def mock_session(self, inject_session):
         """Create mock database session."""
         session = AsyncMock()
         session.execute = AsyncMock()
         session.commit = AsyncMock()
         session.rollback = AsyncMock()
-        return session
+        return inject_session(session)
     
     @pytest.mark.asyncio
     async def test_refresh_rules_cache_uses_decorators(self, alert_engine, mock_session):
@@ -48,10 +66,11 @@ class TestAlertEngineDecorators:
         # Mock database result
         mock_result = Mock()
         mock_result.scalars.return_value.all.return_value = []
+        mock_result.one.return_value = (0, None)
         mock_session.execute.return_value = mock_result
         
         # Call method - session should be injected by decorator
-        await alert_engine._refresh_rules_cache(mock_session)
+        await alert_engine._refresh_rules_cache()
         
         # Verify database operations
         assert mock_session.execute.called
@@ -63,17 +82,17 @@ class TestAlertEngineDecorators:
         batch_data = [
             {
                 "instrument_id": 1,
-                "market_data": Mock(spec=MarketData)
+                "market_data": Mock(spec=MarketData, timestamp=datetime.utcnow(), price=None, volume=None)
             }
         ]
         
         alert_engine._active_rules_cache = {1: []}
         
         # Call method with injected session
-        await alert_engine._process_evaluation_batch(mock_session, batch_data)
+        await alert_engine._process_evaluation_batch(batch_data)
         
         # Should complete without database session management boilerplate
-        assert alert_engine.ticks_processed >= 0  # Method executed
+        assert alert_engine.evaluations_performed >= 0  # Method executed
     
     @pytest.mark.asyncio 
     async def test_fire_alert_error_handling(self, alert_engine, mock_session):
@@ -81,6 +100,10 @@ class TestAlertEngineDecorators:
         mock_context = Mock(spec=AlertContext)
         mock_context.rule = Mock()
         mock_context.rule.id = 1
+        mock_context.rule.instrument_id = 1
+        mock_context.rule.threshold = 100.0
+        mock_context.rule.condition = RuleCondition.ABOVE
+        mock_context.rule.is_in_cooldown.return_value = False
         mock_context.rule.instrument = Mock()
         mock_context.rule.instrument.symbol = "AAPL"
         mock_context.timestamp = datetime.utcnow()
@@ -89,11 +112,11 @@ class TestAlertEngineDecorators:
         
         alert_engine.websocket_manager = AsyncMock()
         
-        # Should not raise exception due to error handling decorator
+        # Not decorated itself; _fire_alerts carries the error handling
         await alert_engine._fire_alert(mock_context, mock_session)
         
         # Verify session operations
-        assert mock_session.add.called
+        assert mock_session.execute.called
 
 
 class TestRiskCalculatorDecorators:
@@ -105,16 +128,16 @@ class TestRiskCalculatorDecorators:
         return RiskCalculator()
     
     @pytest.fixture
-    def mock_session(self):
+    def mock_session(self, inject_session):
         """Create mock database session."""
         session = AsyncMock()
         session.execute = AsyncMock()
         session.scalar_one_or_none = AsyncMock()
-        return session
+        return inject_session(session)
     
     @pytest.mark.asyncio
-    async def test_get_current_price_uses_decorators(self, risk_calculator, mock_session):
-        """Test that _get_current_price uses database decorators."""
+    async def test_get_stored_price_uses_decorators(self, risk_calculator, mock_session):
+        """Test that _get_stored_price uses database decorators."""
         # Mock database result
         mock_record = Mock()
         mock_record.price = 150.50
@@ -122,7 +145,7 @@ class TestRiskCalculatorDecorators:
         mock_result.scalar_one_or_none.return_value = mock_record
         mock_session.execute.return_value = mock_result
         
-        price = await risk_calculator._get_current_price(mock_session, 1)
+        price = await risk_calculator._get_stored_price(1)
         
         assert price == 150.50
         assert mock_session.execute.called
@@ -140,7 +163,7 @@ class TestRiskCalculatorDecorators:
         mock_result.scalars.return_value.all.return_value = mock_records
         mock_session.execute.return_value = mock_result
         
-        returns = await risk_calculator._get_returns_from_db(mock_session, 1, 5)
+        returns = await risk_calculator._get_returns_from_db(1, 5)
         
         assert returns is not None
         assert mock_session.execute.called
@@ -158,13 +181,13 @@ class TestDataIngestionServiceDecorators:
         return service
     
     @pytest.fixture 
-    def mock_session(self):
+    def mock_session(self, inject_session):
         """Create mock database session."""
         session = AsyncMock()
         session.execute = AsyncMock()
         session.add = AsyncMock()
         session.commit = AsyncMock()
-        return session
+        return inject_session(session)
     
     @pytest.mark.asyncio
     async def test_load_instruments_mapping_uses_decorators(self, data_ingestion, mock_session):
@@ -174,7 +197,7 @@ class TestDataIngestionServiceDecorators:
         mock_result.all.return_value = [(1, "AAPL"), (2, "MSFT")]
         mock_session.execute.return_value = mock_result
         
-        await data_ingestion._load_instruments_mapping(mock_session)
+        await data_ingestion._load_instruments_mapping()
         
         assert len(data_ingestion.instruments_map) == 2
         assert data_ingestion.instruments_map["AAPL"] == 1
@@ -187,25 +210,31 @@ class TestDataIngestionServiceDecorators:
         data_ingestion.websocket_manager.broadcast_tick_update = AsyncMock()
         
         batch_data = [
-            {
-                "symbol": "AAPL",
-                "timestamp": datetime.utcnow(),
-                "price": 150.0,
-                "volume": 1000,
-                "bid": 149.5,
-                "ask": 150.5,
-                "bid_size": 100,
-                "ask_size": 200,
-                "open_price": 149.0,
-                "high_price": 151.0,
-                "low_price": 148.0
-            }
+            TickRecord(
+                symbol="AAPL",
+                timestamp=datetime.utcnow(),
+                price=150.0,
+                volume=1000,
+                bid=149.5,
+                ask=150.5,
+                bid_size=100,
+                ask_size=200,
+                open_price=149.0,
+                high_price=151.0,
+                low_price=148.0
+            )
         ]
         
-        await data_ingestion._process_data_batch(mock_session, batch_data)
+        with patch("src.backend.services.data_ingestion.settings.DATA_INGESTION_BULK_WRITES", True):
+            await data_ingestion._process_data_batch(batch_data)
         
-        assert mock_session.add.called
-        assert mock_session.execute.called  # For instrument updates
+        # One multi-row insert and one instrument update, no per-tick ORM adds
+        assert not mock_session.add.called
+        assert mock_session.execute.call_count == 2
+        insert_stmt = mock_session.execute.call_args_list[0].args[0]
+        assert insert_stmt.table.name == "market_data"
+        assert mock_session.commit.called
+        data_ingestion.websocket_manager.broadcast_tick_update.assert_awaited_once()
 
 
 class TestMLModelsServiceDecorators:
@@ -217,11 +246,11 @@ class TestMLModelsServiceDecorators:
         return MLModelsService()
     
     @pytest.fixture
-    def mock_session(self):
+    def mock_session(self, inject_session):
         """Create mock database session."""
         session = AsyncMock()
         session.execute = AsyncMock()
-        return session
+        return inject_session(session)
     
     @pytest.mark.asyncio
     async def test_get_market_data_for_prediction_uses_decorators(self, ml_service, mock_session):
@@ -243,7 +272,7 @@ class TestMLModelsServiceDecorators:
         mock_result.scalars.return_value.all.return_value = mock_records
         mock_session.execute.return_value = mock_result
         
-        df = await ml_service._get_market_data_for_prediction(mock_session, 1, 24)
+        df = await ml_service._get_market_data_for_prediction(1, 24)
         
         assert df is not None
         assert len(df) == 2
@@ -261,11 +290,9 @@ class TestDecoratorErrorHandling:
         async def failing_method():
             raise Exception("Test database error")
         
-        # Should not raise exception due to decorator
-        result = await failing_method()
-        
-        # Error should be handled gracefully
-        assert result is None
+        # Errors are logged and re-raised as DatabaseOperationError
+        with pytest.raises(DatabaseOperationError):
+            await failing_method()
     
     @pytest.mark.asyncio
     async def test_with_db_session_decorator_injects_session(self):
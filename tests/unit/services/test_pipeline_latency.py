@@ -0,0 +1,67 @@
+"""
+Unit tests for tick-to-alert pipeline latency histograms.
+"""
+
+from datetime import datetime, timedelta
+
+from src.backend.services.pipeline_latency import (
+    PIPELINE_STAGES, LatencyHistogram, PipelineLatency
+)
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    def test_percentiles_within_bucket_precision(self):
+        """Reported percentiles are within a few percent of the exact values."""
+        histogram = LatencyHistogram()
+        values = [i * 0.1 for i in range(1, 100001)]  # 0.1ms .. 10s
+        for value in values:
+            histogram.record(value)
+
+        for quantile in (0.5, 0.9, 0.99, 0.999):
+            exact = values[int(quantile * len(values)) - 1]
+            assert abs(histogram.percentile(quantile) - exact) / exact < 0.03
+
+        stats = histogram.get_stats()
+        assert stats["count"] == 100000
+        assert stats["max_ms"] == 10000.0
+        assert len(histogram.counts) == len(LatencyHistogram().counts)
+
+    def test_weighted_and_out_of_range_values(self):
+        """Counts weight a value; extremes are clamped to what was observed."""
+        histogram = LatencyHistogram(min_ms=1.0, max_ms=1000.0)
+        histogram.record(0.2, count=98)
+        histogram.record(5000.0, count=2)
+
+        assert histogram.percentile(0.5) == 0.2
+        assert histogram.percentile(0.99) == 5000.0
+        assert histogram.get_stats()["mean_ms"] == round((0.2 * 98 + 10000.0) / 100, 3)
+
+        histogram.reset()
+        assert histogram.get_stats()["p99_ms"] == 0.0
+
+
+class TestPipelineLatency:
+    """Test cases for PipelineLatency."""
+
+    def test_stages_report_in_order_against_target(self):
+        """Each stage records time since receipt; the last is checked against the target."""
+        latency = PipelineLatency(target_ms=500)
+        received = datetime(2030, 1, 1)
+        tick = type("Tick", (), {"timestamp": received})()
+
+        latency.record("normalize", received, now=received + timedelta(milliseconds=1), count=3)
+        latency.record_ticks("db_commit", [tick, tick], now=received + timedelta(milliseconds=40))
+        latency.record("broadcast", received, now=received + timedelta(milliseconds=120))
+        latency.record("fire", None)
+
+        stats = latency.get_stats()
+        assert list(stats["stages"]) == list(PIPELINE_STAGES)
+        assert stats["stages"]["normalize"]["count"] == 3
+        assert stats["stages"]["db_commit"]["p50_ms"] == 40.0
+        assert stats["stages"]["fire"]["count"] == 0
+        assert stats["within_target"] is True
+
+        latency.record("broadcast", received, now=received + timedelta(seconds=2), count=10)
+        assert latency.get_stats()["within_target"] is False
@@ -0,0 +1,131 @@
+"""
+Unit tests for rolling price windows.
+
+Tests window eviction and coverage, and rate-of-change evaluation from
+memory with the database fallback on cold start.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.backend.models.alert_rules import RuleCondition, RuleType
+from src.backend.services.alert_engine import RuleEvaluator
+from src.backend.services.price_windows import PriceWindow, PriceWindowStore
+
+BASE_TIME = datetime(2024, 1, 15, 14, 30)
+
+
+def at(seconds: float) -> datetime:
+    return BASE_TIME + timedelta(seconds=seconds)
+
+
+@pytest.fixture
+def roc_rule(make_rule):
+    """1% rise over 60 seconds on instrument 7."""
+    return make_rule(
+        instrument_id=7,
+        rule_type=RuleType.RATE_OF_CHANGE,
+        condition=RuleCondition.PERCENT_CHANGE_UP,
+        threshold=1.0,
+        time_window_seconds=60,
+    )
+
+
+class TestPriceWindow:
+    """Test cases for PriceWindow."""
+
+    def test_lookup_returns_first_price_in_window(self):
+        """The earliest price at or after the cutoff is returned."""
+        window = PriceWindow(horizon_seconds=60)
+        for second, price in [(0, 100.0), (10, 101.0), (20, 102.0)]:
+            window.append(at(second), price)
+
+        assert window.first_at_or_after(at(5)) == 101.0
+        assert window.first_at_or_after(at(10)) == 101.0
+        assert window.first_at_or_after(at(25)) is None
+
+    def test_horizon_eviction_advances_coverage(self):
+        """Points older than the horizon are evicted and no longer covered."""
+        window = PriceWindow(horizon_seconds=10)
+        for second in range(30):
+            window.append(at(second), float(second))
+
+        assert len(window) == 12  # 10s horizon plus 1s slack, inclusive
+        assert not window.covers(at(17))
+        assert window.covers(at(18))
+        assert window.first_at_or_after(at(18)) == 18.0
+
+    def test_max_points_overflow(self):
+        """Overflow evicts the oldest points and moves coverage past them."""
+        window = PriceWindow(horizon_seconds=3600, max_points=5)
+        for second in range(10):
+            window.append(at(second), float(second))
+
+        assert len(window) == 5
+        assert window.covered_from == at(5)
+        assert window.first_at_or_after(at(5)) == 5.0
+
+    def test_out_of_order_ticks_are_inserted_in_time_order(self):
+        """Late ticks are placed by timestamp."""
+        window = PriceWindow(horizon_seconds=60)
+        window.append(at(0), 1.0)
+        window.append(at(20), 3.0)
+        window.append(at(10), 2.0)
+
+        assert window.first_at_or_after(at(5)) == 2.0
+
+    def test_store_configure_keeps_history(self):
+        """Reconfiguring horizons keeps existing windows and drops unused ones."""
+        store = PriceWindowStore()
+        store.configure({1: 60, 2: 60})
+        store.record(1, at(0), 100.0)
+        store.record(3, at(0), 100.0)  # No window: ignored
+
+        store.configure({1: 300})
+
+        assert store.get(1).first_at_or_after(at(0)) == 100.0
+        assert store.get(2) is None
+        assert store.get(3) is None
+
+
+class TestRateOfChangeEvaluation:
+    """Test cases for rate-of-change evaluation against price windows."""
+
+    @pytest.mark.asyncio
+    async def test_warm_window_evaluates_in_memory(self, roc_rule):
+        """A covering window answers without touching the database."""
+        store = PriceWindowStore()
+        store.configure({7: 60})
+        now = datetime.utcnow()
+        store.record(7, now - timedelta(seconds=90), 90.0)
+        store.record(7, now - timedelta(seconds=30), 100.0)
+
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=AssertionError("database queried"))
+
+        context = await RuleEvaluator(store).evaluate_rate_of_change_rule(roc_rule, 102.0, session)
+
+        assert context is not None
+        assert context.additional_data["historical_price"] == 100.0
+        assert context.trigger_value == pytest.approx(2.0)
+        assert store.memory_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_cold_window_falls_back_to_database(self, roc_rule):
+        """Before the window spans the rule window, the database is queried."""
+        store = PriceWindowStore()
+        store.configure({7: 60})
+        store.record(7, datetime.utcnow(), 102.0)
+
+        result = MagicMock()
+        result.scalar.return_value = 100.0
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=result)
+
+        context = await RuleEvaluator(store).evaluate_rate_of_change_rule(roc_rule, 102.0, session)
+
+        assert context is not None
+        assert session.execute.await_count == 1
+        assert store.db_fallbacks == 1
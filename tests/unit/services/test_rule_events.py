@@ -0,0 +1,118 @@
+"""
+Unit tests for rule change events and incremental rules cache updates.
+
+Engine tests run against a temporary SQLite database.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateTable
+
+from src.backend.database import connection
+from src.backend.models.alert_rules import AlertRule, RuleCondition, RuleType
+from src.backend.models.instruments import Instrument, InstrumentType
+from src.backend.services.alert_engine import AlertEngine
+from src.backend.services.rule_events import RuleChangeAction, RuleChangeEvent, RuleEventBus
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """Point the connection module at a temporary database with one instrument."""
+    path = tmp_path / "rules.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    with sync_engine.begin() as conn:
+        conn.execute(CreateTable(Instrument.__table__))
+        conn.execute(CreateTable(AlertRule.__table__))
+        conn.execute(Instrument.__table__.insert().values(id=1, symbol="ES", name="E-mini", type=InstrumentType.FUTURE.value))
+    sync_engine.dispose()
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    monkeypatch.setattr(connection, "engine", engine)
+    monkeypatch.setattr(connection, "async_session_maker", async_sessionmaker(engine, expire_on_commit=False))
+    return engine
+
+
+async def add_rule(threshold: float) -> int:
+    async with connection.get_db_session() as session:
+        rule = AlertRule(instrument_id=1, rule_type=RuleType.THRESHOLD,
+                         condition=RuleCondition.ABOVE, threshold=threshold)
+        session.add(rule)
+        await session.commit()
+        return rule.id
+
+
+def cached_thresholds(engine: AlertEngine):
+    return sorted(float(rule.threshold) for rules in engine._active_rules_cache.values() for rule in rules)
+
+
+class TestRuleEventBus:
+    """Test cases for RuleEventBus."""
+
+    def test_publish_reaches_subscribers(self):
+        """Every handler gets the event; a failing handler doesn't stop the others."""
+        bus = RuleEventBus()
+        received = []
+
+        def failing(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(failing)
+        bus.subscribe(received.append)
+        bus.publish(RuleChangeEvent(RuleChangeAction.DELETED, 7))
+        bus.unsubscribe(received.append)
+        bus.publish(RuleChangeEvent(RuleChangeAction.DELETED, 8))
+
+        assert [event.rule_id for event in received] == [7]
+        assert bus.get_stats() == {"subscribers": 1, "events_published": 2}
+
+
+class TestIncrementalRulesCache:
+    """Test cases for AlertEngine rule change handling."""
+
+    @pytest.mark.asyncio
+    async def test_events_patch_cache_without_full_reload(self, database):
+        """Created, deactivated and deleted rules are applied from events."""
+        await add_rule(100.0)
+        engine = AlertEngine()
+        await engine._refresh_rules_cache()
+
+        added = await add_rule(105.0)
+        engine._on_rule_change(RuleChangeEvent(RuleChangeAction.UPSERTED, added, 1))
+        await engine._apply_rule_changes()
+        assert cached_thresholds(engine) == [100.0, 105.0]
+        assert engine.threshold_index.get_stats()["indexed_rules"] == 2
+
+        async with connection.get_db_session() as session:
+            await session.execute(update(AlertRule).where(AlertRule.id == added).values(active=False))
+            await session.commit()
+        engine._on_rule_change(RuleChangeEvent(RuleChangeAction.UPSERTED, added, 1))
+        engine._on_rule_change(RuleChangeEvent(RuleChangeAction.DELETED, 999, 1))
+        await engine._apply_rule_changes()
+
+        assert cached_thresholds(engine) == [100.0]
+        assert engine.full_reloads == 1
+        assert engine.rule_changes_applied == 3
+
+    @pytest.mark.asyncio
+    async def test_version_check_reloads_only_on_change(self, database):
+        """Changes made outside the API are picked up by the version check."""
+        await add_rule(100.0)
+        engine = AlertEngine()
+        await engine._refresh_rules_cache()
+
+        await engine._check_rules_version()
+        assert engine.full_reloads == 1
+
+        async with connection.get_db_session() as session:
+            await session.execute(text(
+                "INSERT INTO alert_rules (instrument_id, rule_type, condition, threshold, active, "
+                "cooldown_seconds, created_at, updated_at) "
+                "VALUES (1, 'threshold', 'below', 90, 1, 60, '2030-01-01', '2030-01-01')"
+            ))
+            await session.commit()
+        await engine._check_rules_version()
+
+        assert engine.full_reloads == 2
+        assert cached_thresholds(engine) == [90.0, 100.0]
@@ -0,0 +1,133 @@
+"""
+Unit tests for the sorted threshold index.
+
+Tests crossing detection between consecutive prices, first-tick level
+checks, hysteresis re-arming and rebuild behaviour.
+"""
+
+import pytest
+
+from src.backend.models.alert_rules import RuleCondition, RuleType
+from src.backend.services.threshold_index import ThresholdIndex
+
+
+def ids(rules):
+    return sorted(rule.id for rule in rules)
+
+
+def fire(index, instrument_id, price):
+    """Evaluate a tick and disarm every triggered rule, as the engine does when it fires."""
+    triggered = index.crossed(instrument_id, price)
+    for rule in triggered:
+        index.disarm(rule)
+    return triggered
+
+
+class TestThresholdIndex:
+    """Test cases for ThresholdIndex."""
+
+    @pytest.fixture(autouse=True)
+    def setup_index(self, make_rule):
+        """Set up test fixtures."""
+        self.rules = [
+            make_rule(id=1, threshold=100.0),
+            make_rule(id=2, threshold=105.0),
+            make_rule(id=3, condition=RuleCondition.BELOW, threshold=95.0),
+            make_rule(id=4, condition=RuleCondition.BELOW, threshold=90.0),
+        ]
+        self.index = ThresholdIndex()
+        self.remaining = self.index.build({1: self.rules})
+
+    def test_first_tick_checks_levels(self):
+        """Without a previous price every satisfied rule triggers."""
+        assert ids(self.index.crossed(1, 102.0)) == [1]
+
+    def test_only_newly_crossed_rules_trigger(self):
+        """Rules trigger on the move across their threshold, not while beyond it."""
+        self.index.crossed(1, 98.0)
+
+        assert ids(self.index.crossed(1, 106.0)) == [1, 2]
+        assert self.index.crossed(1, 107.0) == []
+        assert ids(self.index.crossed(1, 89.0)) == [3, 4]
+        assert self.index.crossed(1, 89.0) == []
+
+    def test_touching_threshold_does_not_trigger(self):
+        """ABOVE and BELOW are strict inequalities."""
+        self.index.crossed(1, 98.0)
+
+        assert self.index.crossed(1, 100.0) == []
+        assert ids(self.index.crossed(1, 100.5)) == [1]
+
+    def test_other_rules_are_returned_for_scanning(self, make_rule):
+        """EQUALS and non-threshold rules stay on the per-rule path."""
+        equals = make_rule(id=5, condition=RuleCondition.EQUALS, threshold=100.0)
+        roc = make_rule(id=6, rule_type=RuleType.RATE_OF_CHANGE, condition=RuleCondition.PERCENT_CHANGE_UP, threshold=1.0)
+
+        remaining = self.index.build({1: self.rules + [equals, roc]})
+
+        assert remaining == {1: [equals, roc]}
+        assert self.index.get_stats()["indexed_rules"] == 4
+
+    def test_rebuild_keeps_last_price_and_checks_new_rules(self, make_rule):
+        """Rebuilds don't re-fire existing rules; new rules get one level check."""
+        self.index.crossed(1, 102.0)
+        added = make_rule(id=7, threshold=101.0)
+
+        self.index.build({1: self.rules + [added]})
+
+        assert ids(self.index.crossed(1, 102.5)) == [7]
+        assert self.index.crossed(1, 102.5) == []
+
+    def test_cost_tracks_crossed_rules(self, make_rule):
+        """Thousands of configured rules, only the crossed band is returned."""
+        rules = [make_rule(id=i, threshold=1000.0 + i * 0.25) for i in range(5000)]
+        self.index.build({1: rules})
+        self.index.crossed(1, 1000.0)
+
+        assert ids(self.index.crossed(1, 1001.0)) == [0, 1, 2, 3]
+
+    def test_hysteresis_fires_once_while_price_chops(self, make_rule):
+        """A rule with a band re-arms only after price moves back past its reset level."""
+        banded = [
+            make_rule(id=1, threshold=100.0, hysteresis=2.0),
+            make_rule(id=3, condition=RuleCondition.BELOW, threshold=95.0, hysteresis=1.0),
+        ]
+        self.index.build({1: banded})
+        fire(self.index, 1, 99.0)
+
+        fired = [ids(fire(self.index, 1, price)) for price in (100.5, 99.5, 100.5, 98.5, 100.2)]
+        assert fired == [[1], [], [], [], []]
+
+        fire(self.index, 1, 98.0)  # Reset level reached
+        assert ids(fire(self.index, 1, 100.1)) == [1]
+
+        assert ids(fire(self.index, 1, 94.0)) == [3]
+        assert [ids(fire(self.index, 1, price)) for price in (95.5, 94.5, 96.0, 94.9)] == [[], [], [], [3]]
+
+        stats = self.index.get_stats()
+        assert stats["suppressed_crossings"] == 3
+        assert stats["disarmed_rules"] == 1  # The ABOVE rule re-armed on the drop to 94
+
+    def test_rebuild_keeps_disarmed_unless_band_changes(self, make_rule):
+        """Disarmed state survives refreshes; editing the band re-arms the rule."""
+        self.index.build({1: [make_rule(id=1, threshold=100.0, hysteresis=2.0)]})
+        fire(self.index, 1, 99.0)
+        fire(self.index, 1, 100.5)
+
+        self.index.build({1: [make_rule(id=1, threshold=100.0, hysteresis=2.0)]})
+        self.index.crossed(1, 99.5)
+        assert self.index.crossed(1, 100.5) == []
+
+        self.index.build({1: [make_rule(id=1, threshold=100.0, hysteresis=0.25)]})
+        assert ids(self.index.crossed(1, 100.6)) == [1]
+
+    def test_unfired_crossing_leaves_rule_armed(self, make_rule):
+        """A crossing that is not fired (e.g. during cooldown) does not disarm."""
+        self.index.build({1: [make_rule(id=1, threshold=100.0, hysteresis=2.0)]})
+        self.index.crossed(1, 99.0)
+
+        assert ids(self.index.crossed(1, 100.5)) == [1]  # Not fired
+        self.index.crossed(1, 99.5)
+
+        assert ids(self.index.crossed(1, 100.5)) == [1]
+        assert self.index.get_stats()["disarmed_rules"] == 0
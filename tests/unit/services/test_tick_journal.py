@@ -0,0 +1,206 @@
+"""
+Unit tests for the binary tick journal.
+
+Tests record round-trips, symbol encoding, committed watermark recovery,
+segment rotation, archive retention and watermark handling of failed
+ingestion batches.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.backend.services.data_ingestion import DataIngestionService
+from src.backend.services.tick_journal import RECORD_SIZE, TickJournal
+from src.backend.services.tick_normalizer import TickRecord
+
+
+def make_ticks(count: int, symbol: str = "/ES") -> list:
+    """Create sequential tick records."""
+    base = datetime(2024, 1, 15, 14, 30, 0, 123456)
+    return [
+        TickRecord(symbol, base + timedelta(seconds=i), 4500.0 + i, 100.0 * i,
+                   4499.75 + i, None, 5.0, None, None, 4510.0, None)
+        for i in range(count)
+    ]
+
+
+class TestTickJournal:
+    """Test cases for TickJournal."""
+
+    def test_round_trip_preserves_fields(self, tmp_path):
+        """Ticks read back identical, including None fields and microseconds."""
+        journal = TickJournal(str(tmp_path), segment_records=16)
+        journal.open()
+        ticks = make_ticks(3)
+
+        last_seq = journal.append(ticks)
+
+        assert last_seq == 3
+        assert [tick for _, tick in journal.read()] == ticks
+        journal.close()
+
+    def test_option_symbol_round_trip(self, tmp_path):
+        """Option keys longer than futures symbols are stored in full."""
+        journal = TickJournal(str(tmp_path), segment_records=16)
+        journal.open()
+        ticks = make_ticks(1, symbol="SPXW  240119C04800000")
+
+        journal.append(ticks)
+
+        assert [tick for _, tick in journal.read()] == ticks
+        journal.close()
+
+    def test_unencodable_batch_leaves_journal_unchanged(self, tmp_path):
+        """A batch with an oversized symbol is rejected before any record is written."""
+        journal = TickJournal(str(tmp_path), segment_records=16)
+        journal.open()
+        ticks = make_ticks(2) + make_ticks(1, symbol="X" * 40)
+
+        with pytest.raises(ValueError):
+            journal.append(ticks)
+
+        assert journal.next_seq == 1
+        assert list(journal.read()) == []
+        journal.close()
+
+    def test_uncommitted_survive_reopen(self, tmp_path):
+        """Entries after the committed watermark are returned after a restart."""
+        journal = TickJournal(str(tmp_path), segment_records=16)
+        journal.open()
+        journal.mark_committed(journal.append(make_ticks(4)))
+        journal.append(make_ticks(2, symbol="/NQ"))
+        # Simulate a kill: no close(), mapped pages are already in the file
+        del journal
+
+        reopened = TickJournal(str(tmp_path), segment_records=16)
+        reopened.open()
+        pending = reopened.uncommitted()
+
+        assert [seq for seq, _ in pending] == [5, 6]
+        assert {tick.symbol for _, tick in pending} == {"/NQ"}
+        assert reopened.next_seq == 7
+        reopened.close()
+
+    def test_rotation_and_replay_across_segments(self, tmp_path):
+        """Uncommitted entries spanning a rotation are all replayed."""
+        journal = TickJournal(str(tmp_path), segment_records=4)
+        journal.open()
+        journal.mark_committed(journal.append(make_ticks(3)))
+        journal.append(make_ticks(6))
+        journal.close()
+
+        reopened = TickJournal(str(tmp_path), segment_records=4)
+        reopened.open()
+
+        assert len(reopened.segments()) == 3
+        assert [seq for seq, _ in reopened.uncommitted()] == list(range(4, 10))
+        reopened.close()
+
+    def test_retention_keeps_uncommitted_segments(self, tmp_path):
+        """Old segments are pruned only once fully committed."""
+        journal = TickJournal(str(tmp_path), segment_records=2, max_segments=1)
+        journal.open()
+        journal.append(make_ticks(5))
+        assert len(journal.segments()) == 3
+
+        journal.mark_committed(5)
+        journal.append(make_ticks(2))
+
+        # Segment 5-6 still holds uncommitted seq 6
+        assert [path.name[6:-8].lstrip("0") for path in journal.segments()] == ["5", "7"]
+        journal.close()
+
+    def test_out_of_order_commit_holds_watermark(self, tmp_path):
+        """A range committed ahead of an uncommitted one waits for the gap."""
+        journal = TickJournal(str(tmp_path), segment_records=16)
+        journal.open()
+        journal.append(make_ticks(2))
+        journal.append(make_ticks(3))
+
+        journal.mark_committed(5, first_seq=3)
+        assert journal.committed_seq == 0
+
+        journal.mark_committed(2, first_seq=1)
+        assert journal.committed_seq == 5
+        journal.close()
+
+    def test_mark_committed_after_close_is_noop(self, tmp_path):
+        """Committing once the journal is closed does not raise."""
+        journal = TickJournal(str(tmp_path), segment_records=16)
+        journal.open()
+        last_seq = journal.append(make_ticks(2))
+        journal.close()
+
+        journal.mark_committed(last_seq)
+
+        assert journal.committed_seq == 0
+
+    def test_segment_size(self, tmp_path):
+        """Segments are preallocated fixed-width files."""
+        journal = TickJournal(str(tmp_path), segment_records=8)
+        journal.open()
+
+        assert journal.segments()[0].stat().st_size == 64 + 8 * RECORD_SIZE
+        assert journal.get_stats()["uncommitted"] == 0
+        journal.close()
+
+
+class TestIngestionJournalWatermark:
+    """Test journal watermark handling in DataIngestionService."""
+
+    @pytest.fixture
+    def data_ingestion(self, tmp_path):
+        """Create a service with an open journal and a mocked batch writer."""
+        service = DataIngestionService()
+        service.tick_journal = TickJournal(str(tmp_path), segment_records=16)
+        service.tick_journal.open()
+        service._process_data_batch = AsyncMock()
+        yield service
+        service.tick_journal.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_not_skipped(self, data_ingestion):
+        """A later successful batch does not advance the watermark past a failed one."""
+        journal = data_ingestion.tick_journal
+        data_ingestion._process_data_batch.side_effect = [
+            RuntimeError("database is locked"),  # batch 1
+            RuntimeError("database is locked"),  # batch 1 retry
+            None,                                # batch 2
+            None,                                # batch 1 retry
+            None,                                # batch 3
+        ]
+
+        with pytest.raises(RuntimeError):
+            await data_ingestion._persist_batch(make_ticks(2))
+        await data_ingestion._persist_batch(make_ticks(2, symbol="/NQ"))
+
+        assert journal.committed_seq == 0
+        assert [seq for seq, _ in journal.uncommitted()] == [1, 2, 3, 4]
+
+        await data_ingestion._persist_batch(make_ticks(1, symbol="/YM"))
+
+        assert journal.committed_seq == 5
+        assert data_ingestion._failed_batches == []
+        # The retried batch is stale: stored without broadcast or alert evaluation
+        retry_call = data_ingestion._process_data_batch.call_args_list[3]
+        assert retry_call.kwargs == {"publish": False}
+
+    @pytest.mark.asyncio
+    async def test_unjournaled_batch_is_retried(self, data_ingestion):
+        """A batch the journal rejects is still kept for retry."""
+        journal = data_ingestion.tick_journal
+        ticks = make_ticks(1, symbol="X" * 40)
+
+        with pytest.raises(ValueError):
+            await data_ingestion._persist_batch(ticks)
+
+        assert data_ingestion._failed_batches == [(None, None, ticks)]
+        data_ingestion._process_data_batch.assert_not_called()
+
+        await data_ingestion._persist_batch(make_ticks(2))
+
+        assert data_ingestion._failed_batches == []
+        assert data_ingestion._process_data_batch.call_args_list[0].args == (ticks,)
+        assert journal.committed_seq == 2
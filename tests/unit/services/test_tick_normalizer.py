@@ -0,0 +1,106 @@
+"""
+Unit tests for the compiled tick normalizer.
+
+Tests per-service schema compilation, multi-symbol message normalization,
+price fallbacks and validation.
+"""
+
+from datetime import datetime
+
+from src.backend.services.tick_normalizer import TickNormalizer, TickRecord
+
+
+class TestTickNormalizer:
+    """Test cases for TickNormalizer."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.normalizer = TickNormalizer()
+
+    def test_multi_symbol_message_single_pass(self):
+        """All symbols in a message are normalized in content order."""
+        message = {
+            "service": "LEVELONE_FUTURES",
+            "content": [
+                {"key": "/ES", "LAST_PRICE": 4525.75, "TOTAL_VOLUME": 1000, "BID_PRICE": 4525.5},
+                {"key": "/nq", "LAST_PRICE": "15250.25", "ASK_PRICE": 15250.5},
+            ],
+        }
+
+        ticks = self.normalizer.normalize_message(message)
+
+        assert [tick.symbol for tick in ticks] == ["/ES", "/NQ"]
+        assert isinstance(ticks[0], TickRecord)
+        assert ticks[0].price == 4525.75
+        assert ticks[0].volume == 1000.0
+        assert ticks[0].bid == 4525.5
+        assert ticks[1].price == 15250.25
+        assert ticks[1].volume == 0
+        assert ticks[1].ask == 15250.5
+        assert ticks[0].timestamp is ticks[1].timestamp
+
+    def test_schema_compiled_once_per_service(self):
+        """Schemas are cached per service type."""
+        equities = self.normalizer.schema_for("LEVELONE_EQUITIES")
+
+        assert self.normalizer.schema_for("LEVELONE_EQUITIES") is equities
+        assert self.normalizer.schema_for("LEVELONE_FUTURES") is not equities
+        assert self.normalizer.schema_for("UNKNOWN").service == "GENERIC"
+
+    def test_generic_schema_accepts_legacy_aliases(self):
+        """Unknown services fall back to the legacy alias map."""
+        message = {
+            "content": [{"key": "SPY", "lastPrice": 450.5, "bidSize": 3, "highPrice": 452.0}],
+        }
+
+        ticks = self.normalizer.normalize_message(message)
+
+        assert len(ticks) == 1
+        assert ticks[0].price == 450.5
+        assert ticks[0].bid_size == 3.0
+        assert ticks[0].high_price == 452.0
+
+    def test_quote_only_update_uses_mid_price(self):
+        """Missing last price falls back to the bid/ask midpoint."""
+        message = {
+            "service": "LEVELONE_EQUITIES",
+            "content": [{"key": "SPY", "BID_PRICE": 100.0, "ASK_PRICE": 100.5}],
+        }
+
+        ticks = self.normalizer.normalize_message(message)
+
+        assert ticks[0].price == 100.25
+
+    def test_invalid_items_are_rejected_and_counted(self):
+        """Items without a valid price are dropped and counted."""
+        message = {
+            "service": "LEVELONE_EQUITIES",
+            "content": [
+                {"key": "BAD1", "TOTAL_VOLUME": 100},
+                {"key": "BAD2", "LAST_PRICE": -1.0},
+                {"key": "BAD3", "LAST_PRICE": 10000000.0},
+                {"LAST_PRICE": 10.0},
+                {"key": "GOOD", "LAST_PRICE": "n/a", "BID_PRICE": 10.0},
+            ],
+        }
+
+        ticks = self.normalizer.normalize_message(message)
+        stats = self.normalizer.get_stats()
+
+        assert [tick.symbol for tick in ticks] == ["GOOD"]
+        assert ticks[0].price == 10.0
+        assert stats["ticks_normalized"] == 1
+        assert stats["ticks_rejected"] == 4
+
+    def test_empty_message(self):
+        """Messages without content yield no ticks."""
+        assert self.normalizer.normalize_message({"service": "LEVELONE_EQUITIES"}) == []
+
+    def test_explicit_timestamp(self):
+        """A caller-supplied receive timestamp is used for every tick."""
+        received = datetime(2024, 1, 15, 14, 30)
+        message = {"service": "LEVELONE_EQUITIES", "content": [{"key": "SPY", "LAST_PRICE": 1.0}]}
+
+        ticks = self.normalizer.normalize_message(message, timestamp=received)
+
+        assert ticks[0].timestamp == received
@@ -0,0 +1,117 @@
+"""
+Unit tests for the tick replay engine.
+
+Tests export file parsing, Schwab message construction, timestamp grouping
+and pacing against a recording ingestion callback.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.backend.services.conflating_queue import ConflatingQueue
+from src.backend.services.tick_normalizer import TickNormalizer, TickRecord
+from src.backend.services.tick_replay import TickReplayEngine, build_message, iter_file_ticks
+
+BASE_TIME = datetime(2024, 1, 15, 14, 30)
+
+
+def make_tick(symbol: str, offset_ms: int, price: float) -> TickRecord:
+    """Create a tick record offset from the base time."""
+    return TickRecord(symbol, BASE_TIME + timedelta(milliseconds=offset_ms), price, 10.0,
+                      price - 0.25, None, None, None, None, None, None)
+
+
+async def as_async(ticks):
+    """Wrap a list as an async iterator."""
+    for tick in ticks:
+        yield tick
+
+
+class RecordingIngestion:
+    """Ingestion stand-in recording callback invocations."""
+
+    def __init__(self):
+        self.alert_engine = None
+        self.data_queue = ConflatingQueue()
+        self.ticks_processed = 0
+        self.calls = []
+
+    def _handle_market_data(self, symbol, raw_data):
+        self.calls.append((symbol, raw_data))
+        self.ticks_processed += len(raw_data["content"])
+
+
+class TestTickReplay:
+    """Test cases for tick replay."""
+
+    def test_build_message_round_trips_through_normalizer(self):
+        """Replayed messages normalize back to the recorded values."""
+        tick = make_tick("/ES", 0, 4500.25)
+
+        message = build_message([tick], "LEVELONE_FUTURES")
+        normalized = TickNormalizer().normalize_message(message, timestamp=tick.timestamp)
+
+        assert message["content"][0]["key"] == "/ES"
+        assert "ASK_PRICE" not in message["content"][0]
+        assert normalized == [tick]
+
+    def test_iter_file_ticks_csv_and_jsonl(self, tmp_path):
+        """CSV and JSONL exports parse into tick records."""
+        csv_path = tmp_path / "ticks.csv"
+        csv_path.write_text(
+            "symbol,timestamp,price,volume,bid\n"
+            "/es,2024-01-15T14:30:00,4500.25,100,\n"
+        )
+        jsonl_path = tmp_path / "ticks.jsonl"
+        jsonl_path.write_text(json.dumps(
+            {"symbol": "SPY", "timestamp": "2024-01-15T14:30:00Z", "price": 450.5}
+        ) + "\n")
+
+        csv_ticks = list(iter_file_ticks(str(csv_path)))
+        jsonl_ticks = list(iter_file_ticks(str(jsonl_path)))
+
+        assert csv_ticks[0].symbol == "/ES"
+        assert csv_ticks[0].bid is None
+        assert csv_ticks[0].volume == 100.0
+        assert jsonl_ticks[0].timestamp == BASE_TIME
+        assert jsonl_ticks[0].volume == 0.0
+
+    def test_unsupported_file_format(self, tmp_path):
+        """Unknown export formats are rejected."""
+        with pytest.raises(ValueError):
+            list(iter_file_ticks(str(tmp_path / "ticks.parquet")))
+
+    @pytest.mark.asyncio
+    async def test_replay_groups_equal_timestamps(self):
+        """Ticks sharing a timestamp are sent as one multi-symbol message."""
+        ingestion = RecordingIngestion()
+        engine = TickReplayEngine(ingestion)
+        ticks = [
+            make_tick("/ES", 0, 1.0),
+            make_tick("/NQ", 0, 2.0),
+            make_tick("/ES", 0, 3.0),  # Repeated symbol starts a new message
+            make_tick("/ES", 5, 4.0),
+        ]
+
+        stats = await engine.replay(as_async(ticks), speed=None, drain_timeout=1.0)
+
+        assert [len(raw["content"]) for _, raw in ingestion.calls] == [2, 1, 1]
+        assert stats.messages_sent == 3
+        assert stats.ticks_sent == 4
+        assert stats.ticks_persisted == 4
+        assert stats.drained
+        assert not engine.is_running
+
+    @pytest.mark.asyncio
+    async def test_replay_paces_by_speed(self):
+        """Recorded spacing is compressed by the speed multiplier."""
+        ingestion = RecordingIngestion()
+        engine = TickReplayEngine(ingestion)
+        ticks = [make_tick("/ES", offset, 1.0) for offset in (0, 500, 1000)]
+
+        stats = await engine.replay(as_async(ticks), speed=10.0, drain_timeout=1.0)
+
+        assert stats.data_span_seconds == pytest.approx(1.0)
+        assert 0.09 <= stats.send_seconds < 0.5
@@ -0,0 +1,73 @@
+"""
+Shared fixtures for WebSocket unit tests.
+
+Provides a recording fake WebSocket and ConnectionManager instances whose
+clients and background tasks are cleaned up after each test.
+"""
+
+import json
+
+import pytest
+
+from src.backend.websocket.realtime import ConnectionManager
+
+
+class FakeWebSocket:
+    """Records text frames sent to one client."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        self.sent.append(text)
+
+    def messages(self, message_type):
+        """Payloads of the sent messages of one type, in order."""
+        decoded = (json.loads(text) for text in self.sent)
+        return [message["data"] for message in decoded if message["messageType"] == message_type]
+
+
+def stop_manager(manager: ConnectionManager) -> None:
+    """Disconnect every client and cancel the manager's background tasks."""
+    for client_id in list(manager.active_connections):
+        manager.disconnect(client_id)
+    for task in (manager._heartbeat_task, manager._rate_flush_task, manager._tick_batch_task):
+        if task:
+            task.cancel()
+
+
+@pytest.fixture
+def make_manager():
+    """Factory for ConnectionManagers stopped at teardown."""
+    managers = []
+
+    def factory() -> ConnectionManager:
+        manager = ConnectionManager()
+        manager.max_connections = 100
+        managers.append(manager)
+        return manager
+
+    yield factory
+    for manager in managers:
+        stop_manager(manager)
+
+
+@pytest.fixture
+def manager(make_manager):
+    """A ConnectionManager stopped at teardown."""
+    return make_manager()
+
+
+@pytest.fixture
+def connect_client():
+    """Connect a FakeWebSocket client to a manager and return it."""
+    async def connect(manager: ConnectionManager, client_id: str) -> FakeWebSocket:
+        websocket = FakeWebSocket()
+        accepted, _ = await manager.connect(websocket, client_id)
+        assert accepted
+        return websocket
+
+    return connect
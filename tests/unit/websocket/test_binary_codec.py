@@ -0,0 +1,101 @@
+"""
+Unit tests for the binary WebSocket encoding.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.backend.websocket.binary_codec import BINARY_SUBPROTOCOL, decode_frame, encode_message
+
+
+class NegotiatingWebSocket:
+    """Records frames for a client offering the given subprotocols."""
+
+    def __init__(self, subprotocols=()):
+        self.scope = {"subprotocols": list(subprotocols)}
+        self.accepted_subprotocol = None
+        self.text = []
+        self.binary = []
+
+    async def accept(self, subprotocol=None):
+        self.accepted_subprotocol = subprotocol
+
+    async def send_text(self, text):
+        self.text.append(json.loads(text))
+
+    async def send_bytes(self, data):
+        self.binary.append(data)
+
+
+class TestBinaryCodec:
+    """Test cases for encode_message/decode_frame."""
+
+    def test_tick_and_alert_round_trip(self):
+        """Binary frames decode to the same payload as the JSON message."""
+        tick = {
+            "messageType": "market_data",
+            "timestamp": "2030-01-01T09:30:00.123456",
+            "data": {
+                "instrumentId": 1, "symbol": "ES", "price": 4500.25, "volume": 12.0,
+                "timestamp": "2030-01-01T09:30:00.123456", "bid": 4500.0, "ask": None, "changePercent": None
+            }
+        }
+        alert = {
+            "messageType": "alert",
+            "timestamp": "2030-01-01T09:30:01",
+            "data": {
+                "alertId": None, "ruleId": 7, "instrumentId": 1, "symbol": "ES", "ruleName": "Breakout",
+                "condition": "above", "targetValue": 4500.0, "currentValue": 4500.25, "severity": "medium",
+                "message": "ES above 4500.0", "evaluationTimeMs": 3, "ruleCondition": "above"
+            }
+        }
+
+        tick_frame = encode_message(tick)
+        decoded_tick = decode_frame(tick_frame)["data"]
+        assert decoded_tick == {key: value for key, value in tick["data"].items() if key != "changePercent"}
+        assert decode_frame(encode_message(alert))["data"] == alert["data"]
+        assert len(tick_frame) < len(json.dumps(tick)) / 4
+        assert encode_message({"messageType": "pong", "data": {}}) is None
+
+    def test_batch_round_trip(self):
+        """Columnar batches keep every tick in order."""
+        batch = {
+            "messageType": "market_data_batch",
+            "data": {
+                "count": 2, "instrumentIds": [1, 2], "symbols": ["ES", "NQ"], "prices": [4500.0, 15000.5],
+                "volumes": [1.0, 2.0], "bids": [None, 15000.25], "asks": [4500.25, None],
+                "timestamps": ["2030-01-01T09:30:00", "2030-01-01T09:30:00.050000"]
+            }
+        }
+
+        assert decode_frame(encode_message(batch))["data"] == batch["data"]
+
+
+class TestBinaryNegotiation:
+    """Test cases for per-connection encoding in ConnectionManager."""
+
+    @pytest.fixture(autouse=True)
+    def setup_manager(self, manager):
+        self.manager = manager
+
+    @pytest.mark.asyncio
+    async def test_binary_clients_get_binary_ticks_and_json_control(self):
+        """Only clients offering the subprotocol get binary frames; control messages stay JSON."""
+        binary = NegotiatingWebSocket([BINARY_SUBPROTOCOL])
+        plain = NegotiatingWebSocket()
+        await self.manager.connect(binary, "binary")
+        await self.manager.connect(plain, "plain")
+
+        await self.manager.broadcast_tick_update(1, "ES", 4500.0, volume=3)
+        await self.manager.broadcast_alert_fired(7, 1, "ES", 4500.0, 4490.0, "above")
+        await asyncio.sleep(0.01)
+
+        assert binary.accepted_subprotocol == BINARY_SUBPROTOCOL and plain.accepted_subprotocol is None
+        statuses = [m for m in binary.text + plain.text if m["messageType"] == "connection_status"]
+        assert [m["data"]["encoding"] for m in statuses] == ["binary", "json"]
+        assert [decode_frame(frame)["messageType"] for frame in binary.binary] == ["market_data", "alert"]
+        assert decode_frame(binary.binary[0])["data"]["price"] == plain.text[1]["data"]["price"]
+        assert plain.binary == []
+        assert self.manager.get_client_queue_stats()["binary_clients"] == 1
@@ -0,0 +1,164 @@
+"""
+Unit tests for per-client WebSocket writers and slow-consumer handling.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.backend.websocket.client_writer import ClientWriter, OutboundPolicy
+
+
+class BlockingWebSocket:
+    """WebSocket whose sends wait until released."""
+
+    def __init__(self, blocked: bool = True):
+        self.sent = []
+        self.closed_with = None
+        self.release = asyncio.Event()
+        if not blocked:
+            self.release.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await self.release.wait()
+        self.sent.append(text)
+
+    async def close(self, code=1000, reason=None):
+        self.closed_with = code
+
+
+def make_writer(websocket, policy, max_queue_size=3, max_overflows=2):
+    return ClientWriter("client", websocket, on_failure=lambda client_id: None,
+                        max_queue_size=max_queue_size, policy=policy, max_overflows=max_overflows)
+
+
+class TestClientWriter:
+    """Test cases for ClientWriter queue policies."""
+
+    def test_conflate_replaces_queued_tick_per_instrument(self):
+        """Newer ticks replace queued ones in place; unkeyed messages are kept."""
+        writer = make_writer(BlockingWebSocket(), OutboundPolicy.CONFLATE)
+
+        for price in range(5):
+            writer.enqueue(f"tick-1-{price}", key=1)
+        writer.enqueue("alert")
+        writer.enqueue("tick-2-0", key=2)
+
+        assert [text for _, text in writer._queue] == ["tick-1-4", "alert", "tick-2-0"]
+        assert writer.get_stats()["conflated"] == 4
+
+        # Full: the oldest message goes, and its key is no longer conflated into
+        writer.enqueue("alert-2")
+        writer.enqueue("tick-1-5", key=1)
+        assert [text for _, text in writer._queue] == ["tick-2-0", "alert-2", "tick-1-5"]
+        assert writer.dropped == 2
+
+    def test_disconnect_policy_reports_eviction_after_overflows(self):
+        """New messages are dropped while full; exceeding the limit asks for eviction."""
+        writer = make_writer(BlockingWebSocket(), OutboundPolicy.DISCONNECT)
+
+        accepted = [writer.enqueue(f"m{i}") for i in range(6)]
+
+        assert accepted == [True, True, True, True, True, False]
+        assert [text for _, text in writer._queue] == ["m0", "m1", "m2"]
+
+    def test_rate_cap_holds_latest_value_until_flush(self, monkeypatch):
+        """Updates inside the cap interval are held latest-value-wins; per-key caps override the default."""
+        from src.backend.websocket import client_writer
+        now = [100.0]
+        monkeypatch.setattr(client_writer.time, "monotonic", lambda: now[0])
+        writer = make_writer(BlockingWebSocket(), OutboundPolicy.DROP_OLDEST, max_queue_size=100)
+        writer.set_rate_limit(2)       # Every instrument: 2/s
+        writer.set_rate_limit(10, 2)   # Instrument 2: 10/s
+
+        for price in range(5):
+            writer.publish(f"tick-1-{price}", key=1)
+            writer.publish(f"tick-2-{price}", key=2)
+        writer.publish("alert")
+
+        assert [text for _, text in writer._queue] == ["tick-1-0", "tick-2-0", "alert"]
+        assert writer.get_stats()["held"] == 2 and writer.throttled == 6
+
+        now[0] += 0.15
+        assert writer.flush_held()
+        assert [text for _, text in writer._queue][-1] == "tick-2-4"
+        now[0] += 0.4
+        writer.flush_held()
+        assert [text for _, text in writer._queue][-1] == "tick-1-4"
+        assert not writer.has_held
+
+
+class TestSlowConsumers:
+    """Test cases for ConnectionManager with per-client writers."""
+
+    @pytest.fixture(autouse=True)
+    def setup_manager(self, manager):
+        self.manager = manager
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_delay_others(self):
+        """Broadcast only enqueues; the fast client gets every tick while the slow one is stuck."""
+        fast, slow = BlockingWebSocket(blocked=False), BlockingWebSocket()
+        await self.manager.connect(fast, "fast")
+        await self.manager.connect(slow, "slow")
+
+        for price in range(50):
+            assert await self.manager.broadcast_tick_update(1, "ES", 4500.0 + price) == 2
+            await asyncio.sleep(0)  # Ticks arrive over time
+
+        assert len(fast.sent) == 51  # Welcome message and every tick
+        assert slow.sent == []
+        stats = self.manager.get_client_queue_stats()["clients"]
+        assert stats["slow"]["queue_depth"] == 1  # Welcome in flight, then the latest tick
+        assert stats["slow"]["conflated"] == 49
+
+        slow.release.set()
+        await asyncio.sleep(0.01)
+        assert '"price": 4549.0' in slow.sent[-1]
+
+    @pytest.mark.asyncio
+    async def test_overflowing_client_is_evicted(self, monkeypatch):
+        """Under the disconnect policy a client that keeps overflowing is dropped and closed."""
+        from src.backend.websocket import realtime
+        monkeypatch.setattr(realtime.settings, "WEBSOCKET_CLIENT_QUEUE_POLICY", "disconnect")
+        monkeypatch.setattr(realtime.settings, "WEBSOCKET_CLIENT_QUEUE_SIZE", 5)
+        monkeypatch.setattr(realtime.settings, "WEBSOCKET_CLIENT_MAX_OVERFLOWS", 3)
+        slow = BlockingWebSocket()
+        await self.manager.connect(slow, "slow")
+
+        for price in range(10):
+            await self.manager.broadcast_tick_update(1, "ES", 4500.0 + price)
+        await asyncio.sleep(0)
+
+        assert "slow" not in self.manager.active_connections
+        assert "slow" not in self.manager.client_writers
+        assert self.manager.get_client_queue_stats()["evicted_clients"] == 1
+        assert slow.closed_with == 1013
+
+    @pytest.mark.asyncio
+    async def test_subscribe_negotiates_rate_cap(self, monkeypatch):
+        """maxUpdatesPerSecond in a subscribe caps the instrument; the flush timer delivers the latest tick."""
+        from src.backend.websocket import realtime
+        monkeypatch.setattr(realtime.settings, "WEBSOCKET_RATE_FLUSH_INTERVAL_MS", 5)
+        client = BlockingWebSocket(blocked=False)
+        await self.manager.connect(client, "client")
+        await self.manager.handle_client_message(client, "client", {
+            "messageType": "subscribe",
+            "data": {"subscriptionType": "market_data", "instrumentId": 1, "parameters": {"maxUpdatesPerSecond": 5}}
+        })
+
+        for price in range(20):
+            await self.manager.broadcast_tick_update(1, "ES", 4500.0 + price)
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.25)
+
+        messages = [json.loads(text) for text in client.sent]
+        ack = next(m["data"] for m in messages if m["messageType"] == "subscription_ack")
+        prices = [m["data"]["price"] for m in messages if m["messageType"] == "market_data"]
+        assert ack["maxUpdatesPerSecond"] == 5.0
+        assert prices == [4500.0, 4519.0]
+        assert self.manager.get_client_queue_stats()["clients"]["client"]["throttled"] == 18
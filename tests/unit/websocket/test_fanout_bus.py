@@ -0,0 +1,119 @@
+"""
+Unit tests for the cross-worker WebSocket fan-out bus.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from src.backend.services import last_value_cache
+from src.backend.services.last_value_cache import LastValueCache
+from src.backend.services.rule_events import RuleChangeAction, RuleChangeEvent, RuleEventBus
+from src.backend.websocket.fanout_bus import UnixSocketFanoutBus
+
+
+async def wait_for(condition, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+class TestFanoutBus:
+    """Test cases for UnixSocketFanoutBus between two managers (as two workers)."""
+
+    @pytest.mark.asyncio
+    async def test_owner_fans_ticks_and_alerts_out_to_followers(self, tmp_path, monkeypatch, make_manager, connect_client):
+        """One worker wins the lock; clients of the other get its ticks and alerts."""
+        monkeypatch.setattr(last_value_cache, "_last_value_cache", LastValueCache())
+        owner_manager, follower_manager = make_manager(), make_manager()
+        socket_path, lock_path = str(tmp_path / "bus.sock"), str(tmp_path / "bus.lock")
+        owner = UnixSocketFanoutBus(owner_manager, socket_path, lock_path)
+        follower = UnixSocketFanoutBus(follower_manager, socket_path, lock_path)
+
+        try:
+            assert await owner.start() is True
+            assert await follower.start() is False
+            await wait_for(lambda: owner.get_stats()["followers"] == 1)
+
+            client = await connect_client(follower_manager, "client")
+            await owner_manager.broadcast_tick_update(1, "ES", 4500.25, volume=3, timestamp=datetime(2030, 1, 2, 14, 30))
+            await owner_manager.broadcast_alert_fired(7, 1, "ES", 4500.25, 4500.0, "above", timestamp=datetime(2030, 1, 2, 14, 30))
+            await wait_for(lambda: client.messages("alert"))
+
+            (tick,) = client.messages("market_data")
+            assert tick["price"] == 4500.25 and tick["timestamp"] == "2030-01-02T14:30:00"
+            assert client.messages("alert")[0]["ruleId"] == 7
+            # The follower's last-value cache is fed too, for snapshots it serves
+            assert last_value_cache.get_last_value_cache().get(1).price == 4500.25
+            assert owner.get_stats()["events_published"] == 2
+            assert follower.get_stats() == {**follower.get_stats(), "role": "follower", "events_received": 2}
+
+            # The follower's own broadcasts are local only
+            await follower_manager.broadcast_tick_update(2, "NQ", 15000.0)
+            assert owner.get_stats()["events_published"] == 2
+        finally:
+            await follower.stop()
+            await owner.stop()
+
+        # The lock is released on stop, so another worker can take over
+        successor = UnixSocketFanoutBus(make_manager(), socket_path, lock_path)
+        assert await successor.start() is True
+        await successor.stop()
+
+    @pytest.mark.asyncio
+    async def test_follower_forwards_rule_changes_to_owner(self, tmp_path, make_manager):
+        """Rule changes published on a follower reach the owner's rule event bus."""
+        owner_rules, follower_rules = RuleEventBus(), RuleEventBus()
+        received = []
+        owner_rules.subscribe(received.append)
+        socket_path, lock_path = str(tmp_path / "bus.sock"), str(tmp_path / "bus.lock")
+        owner = UnixSocketFanoutBus(make_manager(), socket_path, lock_path, rule_events=owner_rules)
+        follower = UnixSocketFanoutBus(make_manager(), socket_path, lock_path, rule_events=follower_rules)
+
+        try:
+            await owner.start()
+            await follower.start()
+            await wait_for(lambda: owner.get_stats()["followers"] == 1 and follower._upstream is not None)
+
+            follower_rules.publish(RuleChangeEvent(RuleChangeAction.DELETED, 12, 3))
+            await wait_for(lambda: received)
+
+            (event,) = received
+            assert (event.action, event.rule_id, event.instrument_id) == (RuleChangeAction.DELETED, 12, 3)
+            assert follower.get_stats()["rule_changes_forwarded"] == 1
+            assert owner.get_stats()["rule_changes_received"] == 1
+        finally:
+            await follower.stop()
+            await owner.stop()
+
+    @pytest.mark.asyncio
+    async def test_follower_promoted_when_owner_exits(self, tmp_path, make_manager):
+        """A follower takes the lock once the owner stops and starts the owner services."""
+        socket_path, lock_path = str(tmp_path / "bus.sock"), str(tmp_path / "bus.lock")
+        promoted = asyncio.Event()
+
+        async def start_services():
+            promoted.set()
+
+        owner = UnixSocketFanoutBus(make_manager(), socket_path, lock_path)
+        follower = UnixSocketFanoutBus(make_manager(), socket_path, lock_path, on_promoted=start_services)
+        late_follower = UnixSocketFanoutBus(make_manager(), socket_path, lock_path)
+
+        try:
+            await owner.start()
+            await follower.start()
+            await wait_for(lambda: owner.get_stats()["followers"] == 1)
+
+            await owner.stop()
+            await asyncio.wait_for(promoted.wait(), timeout=2.0)
+
+            assert follower.get_stats()["role"] == "owner" and follower.promotions == 1
+            # The new owner serves followers on the same socket
+            assert await late_follower.start() is False
+            await wait_for(lambda: follower.get_stats()["followers"] == 1)
+        finally:
+            await late_follower.stop()
+            await follower.stop()
+            await owner.stop()
@@ -0,0 +1,129 @@
+"""
+Unit tests for subscription-indexed WebSocket routing.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from src.backend.services import last_value_cache
+from src.backend.services.last_value_cache import LastValueCache
+from src.backend.services.tick_normalizer import TickRecord
+
+
+async def flush(manager):
+    """Let every client writer send its queued frames."""
+    while any(writer.depth for writer in manager.client_writers.values()):
+        await asyncio.sleep(0)
+
+
+async def send(manager, client_id, message_type, subscription_type, instrument_id=None, **parameters):
+    await manager.handle_client_message(
+        manager.active_connections[client_id], client_id,
+        {"messageType": message_type, "data": {
+            "subscriptionType": subscription_type, "instrumentId": instrument_id, "parameters": parameters
+        }}
+    )
+
+
+class TestSubscriptionRouting:
+    """Test cases for ConnectionManager subscription routing."""
+
+    @pytest.fixture(autouse=True)
+    def setup_manager(self, manager, connect_client):
+        self.manager = manager
+        self.connect = connect_client
+
+    @pytest.mark.asyncio
+    async def test_ticks_go_to_subscribers_and_unsubscribed_clients(self):
+        """Subscribed clients get their instruments; clients that never subscribed get everything."""
+        legacy = await self.connect(self.manager, "legacy")
+        es_only = await self.connect(self.manager, "es_only")
+        await send(self.manager, "es_only", "subscribe", "market_data", 1)
+
+        assert await self.manager.broadcast_tick_update(1, "ES", 4500.0) == 2
+        assert await self.manager.broadcast_tick_update(2, "NQ", 15000.0) == 1
+        await self.manager.broadcast_alert_fired(7, 2, "NQ", 15000.0, 14990.0, "above")
+        await flush(self.manager)
+
+        assert [tick["symbol"] for tick in legacy.messages("market_data")] == ["ES", "NQ"]
+        assert [tick["symbol"] for tick in es_only.messages("market_data")] == ["ES"]
+        # Alerts are not filtered for a client that only subscribed to market data
+        assert [alert["ruleId"] for alert in es_only.messages("alert")] == [7]
+        # Serialized once for every recipient
+        es_frames = [text for ws in (legacy, es_only) for text in ws.sent if '"ES"' in text]
+        assert es_frames[0] is es_frames[1]
+        assert self.manager.get_routing_stats()["skipped_sends"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_all_mode_and_disconnect(self):
+        """Unsubscribing keeps the client filtered; "all" restores every message; disconnect cleans up."""
+        client = await self.connect(self.manager, "client")
+        await send(self.manager, "client", "subscribe", "market_data", 1)
+        await send(self.manager, "client", "unsubscribe", "market_data", 1)
+        await flush(self.manager)
+
+        assert self.manager.subscribed_clients("market_data", 1) == set()
+        assert client.messages("subscription_ack")[-1]["status"] == "unsubscribed"
+
+        await send(self.manager, "client", "subscribe", "all")
+        assert self.manager.subscribed_clients("market_data", 2) == {"client"}
+        await send(self.manager, "client", "unsubscribe", "all")
+        assert self.manager.subscribed_clients("market_data", 2) == set()
+
+        await send(self.manager, "client", "subscribe", "market_data", 3)
+        self.manager.disconnect("client")
+        stats = self.manager.get_routing_stats()["subscriptions"]["market_data"]
+        assert stats == {"unfiltered_clients": 0, "instruments": 0, "subscriptions": 0}
+
+    @pytest.mark.asyncio
+    async def test_batched_ticks_arrive_as_columnar_frames(self):
+        """Opted-in clients get one market_data_batch frame per window, filtered to their subscriptions."""
+        per_tick = await self.connect(self.manager, "per_tick")
+        batched = await self.connect(self.manager, "batched")
+        es_batched = await self.connect(self.manager, "es_batched")
+        await send(self.manager, "batched", "subscribe", "all", batchTicks=True)
+        await send(self.manager, "es_batched", "subscribe", "market_data", 1, batchTicks=True)
+
+        for price in range(3):
+            await self.manager.broadcast_tick_update(1, "ES", 4500.0 + price, volume=price)
+            await self.manager.broadcast_tick_update(2, "NQ", 15000.0 + price)
+        assert self.manager._flush_tick_batch() == 2
+        await flush(self.manager)
+
+        # The per-tick client's queued ticks were conflated to the latest per instrument
+        assert [tick["price"] for tick in per_tick.messages("market_data")] == [4502.0, 15002.0]
+        assert batched.messages("market_data") == es_batched.messages("market_data") == []
+        assert batched.messages("subscription_ack")[0]["batchTicks"] is True
+        (batch,) = batched.messages("market_data_batch")
+        assert batch["count"] == 6
+        assert batch["instrumentIds"] == [1, 2, 1, 2, 1, 2]
+        assert batch["prices"][::2] == [4500.0, 4501.0, 4502.0]
+        (es_batch,) = es_batched.messages("market_data_batch")
+        assert es_batch["symbols"] == ["ES"] * 3 and es_batch["volumes"] == [0, 1, 2]
+        assert self.manager.get_routing_stats()["batch_frames"] == 2
+
+    @pytest.mark.asyncio
+    async def test_subscribe_sends_cached_snapshot(self, monkeypatch):
+        """Subscribing delivers the latest cached quote before any new tick."""
+        cache = LastValueCache()
+        monkeypatch.setattr(last_value_cache, "_last_value_cache", cache)
+        cache.update(1, TickRecord("ES", datetime(2030, 1, 2, 14, 30), 4500.0, 7.0,
+                                   4499.75, 4500.25, 3.0, 4.0, None, None, None))
+        cache.update(2, TickRecord("NQ", datetime(2030, 1, 2, 14, 30), 15000.0, 1.0,
+                                   None, None, None, None, None, None, None))
+
+        client = await self.connect(self.manager, "client")
+        await flush(self.manager)
+        # Connecting snapshots every cached instrument
+        assert [quote["symbol"] for quote in client.messages("market_data")] == ["ES", "NQ"]
+
+        client.sent.clear()
+        await send(self.manager, "client", "subscribe", "market_data", 1)
+        await flush(self.manager)
+
+        assert [json.loads(text)["messageType"] for text in client.sent] == ["subscription_ack", "market_data"]
+        (snapshot,) = client.messages("market_data")
+        assert snapshot["price"] == 4500.0 and snapshot["bid"] == 4499.75 and snapshot["openPrice"] == 4500.0